@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Benchmark: OpenClaw admission control under mixed internal and external load.
+
+Reference: src/chimera/openclaw/admission.py, specs/openclaw_integration.md §5.2
+
+Simulates an hour of traffic, with a burst of external jobs halfway
+through, against the §5.2 configuration and against the same fleet with
+no internal reservation. Also times one submit + release.
+"""
+
+from dataclasses import replace
+from typing import Any
+
+from harness import report, time_per_op
+
+from chimera.openclaw import AdmissionController, CapacityConfig
+from chimera.openclaw.simulate import simulate
+
+
+def run(number: int = 50_000) -> dict[str, Any]:
+    config = CapacityConfig()
+    results: dict[str, Any] = {}
+    for label, variant in [
+        ("reserved", config),
+        (
+            "unreserved",
+            replace(config, reserved_capacity_internal=0.0, max_concurrent_external_jobs=20),
+        ),
+    ]:
+        outcome = simulate(variant, capacity=20)
+        external = outcome["external"]
+        results[label] = {
+            "internal_wait_seconds": outcome["internal"]["wait_seconds"],
+            "external_wait_seconds": external["wait_seconds"],
+            "external_started": external["started"],
+            "external_turned_away": external["rejected"] + external["expired"],
+            "retry_after_p50_seconds": external["retry_after_seconds"]["p50"],
+            "utilization": outcome["utilization"],
+        }
+    controller = AdmissionController(config, capacity=20)
+    results["submit_release_us"] = round(
+        time_per_op(lambda: controller.release(controller.submit("job")), number) * 1e6, 3
+    )
+    return results
+
+
+def main() -> None:
+    report("admission", run())
+
+
+if __name__ == "__main__":
+    main()
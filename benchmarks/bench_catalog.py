@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark: provider discovery over a 100k-provider catalog.
+
+Reference: src/chimera/openclaw/catalog.py
+
+Registers ``providers`` services (8 capabilities, each service offering
+about a quarter of them), then times a mix of §3.1 discovery queries:
+- ``uncached``: every query answered from the indexes (cache disabled).
+- ``cached``: repeated query signatures served from the answer cache.
+- ``python_scan``: the same queries as a filter-and-sort over all
+  providers in Python, the way a plain list of dicts would be searched.
+- ``event``: one §6.2 rating applied, followed by a query for a
+  capability the rated agent offers, so the answer is recomputed.
+"""
+
+import time
+from typing import Any
+
+import numpy as np
+from harness import report, time_per_op
+
+from chimera.openclaw import Provider, ProviderCatalog
+
+CAPABILITIES = [f"capability_{i}" for i in range(8)]
+
+
+def _providers(rng: np.random.Generator, n: int) -> list[Provider]:
+    offered = rng.random((n, len(CAPABILITIES))) < 0.25
+    factors = rng.random((n, 5))
+    prices = rng.integers(100, 5000, n) / 100
+    return [
+        Provider(
+            agent_id=f"agent_{i // 2}",
+            service_id=f"svc_{i}",
+            capabilities=tuple(CAPABILITIES[j] for j in np.flatnonzero(offered[i])),
+            base_price=float(prices[i]),
+            completion_rate=float(factors[i, 0]),
+            quality=float(factors[i, 1]),
+            latency_adherence=float(factors[i, 2]),
+            response_time=float(factors[i, 3]),
+            dispute_rate=float(factors[i, 4]) / 5,
+            avg_latency_seconds=float(factors[i, 0] * 100),
+            sla_max_latency_seconds=120.0,
+            sla_availability=0.99,
+        )
+        for i in range(n)
+    ]
+
+
+def _queries(rng: np.random.Generator, n: int) -> list[tuple[str, float, float]]:
+    return [
+        (
+            CAPABILITIES[int(rng.integers(0, len(CAPABILITIES)))],
+            float(rng.choice([0.0, 0.5, 0.7, 0.8])),
+            float(rng.choice([5.0, 15.0, 50.0])),
+        )
+        for _ in range(n)
+    ]
+
+
+def _us_per_item(fn: Any, items: int) -> float:
+    return round(time_per_op(fn, 1, repeat=3) / items * 1e6, 1)
+
+
+def run(providers: int = 100_000, queries: int = 200) -> dict[str, Any]:
+    rng = np.random.default_rng(5)
+    services = _providers(rng, providers)
+    mix = _queries(rng, queries)
+    results: dict[str, Any] = {"providers": providers}
+
+    start = time.perf_counter()
+    catalog = ProviderCatalog(cache_size=0, initial_capacity=providers)
+    catalog.register_many(services)
+    results["register_us_per_provider"] = round((time.perf_counter() - start) / providers * 1e6, 2)
+
+    def discover(c: ProviderCatalog) -> None:
+        for capability, min_reputation, budget_max in mix:
+            c.discover(capability, min_reputation=min_reputation, budget_max=budget_max, limit=10)
+
+    catalog.discover(CAPABILITIES[0])  # sort the indexes
+    results["uncached_us_per_query"] = _us_per_item(lambda: discover(catalog), queries)
+
+    cached = ProviderCatalog(initial_capacity=providers)
+    cached.register_many(services)
+    discover(cached)
+    results["cached_us_per_query"] = _us_per_item(lambda: discover(cached), queries)
+
+    rows = [
+        {
+            "service_id": p.service_id,
+            "capabilities": set(p.capabilities),
+            "price": p.base_price,
+            "score": p.score,
+            "success_rate": p.completion_rate,
+            "latency": p.avg_latency_seconds,
+        }
+        for p in services
+    ]
+
+    def python_scan() -> None:
+        for capability, min_reputation, budget_max in mix[:20]:
+            matches = [
+                row
+                for row in rows
+                if capability in row["capabilities"]
+                and row["score"] >= min_reputation
+                and row["price"] <= budget_max
+            ]
+            matches.sort(key=lambda row: (-row["score"], -row["success_rate"], row["latency"]))
+            matches[:10]
+
+    results["python_scan_us_per_query"] = _us_per_item(python_scan, 20)
+
+    agents = rng.integers(0, providers // 2, queries)
+    rated = [
+        (f"agent_{agent}", services[2 * agent].capabilities or (CAPABILITIES[0],))
+        for agent in agents
+    ]
+
+    def event() -> None:
+        for agent_id, capabilities in rated:
+            cached.record_rating(agent_id, {"rating": {"quality": 5, "speed": 4}})
+            cached.discover(capabilities[0], min_reputation=0.7, budget_max=15.0, limit=10)
+
+    results["event_and_requery_us"] = _us_per_item(event, queries)
+    results["stats"] = cached.stats.as_dict()
+    return results
+
+
+def main() -> None:
+    report("catalog", run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: batched vs. one-at-a-time content generation.
+
+Reference: skills/content_generator/__init__.py (generate_content_batch)
+
+Uses FakeBackend, where every call pays a fixed setup latency (persona and
+prompt prefill) plus a small per-item latency. 200 planner tasks spread over
+4 persona/platform/tier groups.
+"""
+
+import time
+from typing import Any
+
+from harness import report
+
+from skills.content_generator import FakeBackend, generate_content, generate_content_batch
+
+GROUPS = [
+    ("instagram", ["Witty", "Sustainability-focused"], "regular"),
+    ("twitter", ["Witty"], "filler"),
+    ("tiktok", ["Playful"], "regular"),
+    ("linkedin", ["Professional"], "hero"),
+]
+
+
+def make_inputs(count: int) -> list[dict[str, Any]]:
+    inputs = []
+    for i in range(count):
+        platform, persona, tier = GROUPS[i % len(GROUPS)]
+        inputs.append(
+            {
+                "skill_name": "content_generator",
+                "parameters": {
+                    "content_type": "text",
+                    "platform": platform,
+                    "topic": f"Sustainable fashion idea {i}",
+                    "persona_constraints": persona,
+                    "tier": tier,
+                },
+            }
+        )
+    return inputs
+
+
+def run(
+    count: int = 200, setup_latency: float = 0.02, item_latency: float = 0.001
+) -> dict[str, Any]:
+    inputs = make_inputs(count)
+
+    sequential_backend = FakeBackend(setup_latency=setup_latency, item_latency=item_latency)
+    start = time.perf_counter()
+    for input_data in inputs:
+        generate_content(input_data, backend=sequential_backend)
+    sequential = time.perf_counter() - start
+
+    batch_backend = FakeBackend(
+        setup_latency=setup_latency, item_latency=item_latency, max_batch_size=16
+    )
+    start = time.perf_counter()
+    first_item = None
+    for item in generate_content_batch(inputs, backend=batch_backend):
+        if first_item is None:
+            first_item = time.perf_counter() - start
+    batched = time.perf_counter() - start
+
+    return {
+        "requests": count,
+        "sequential": {
+            "seconds": round(sequential, 3),
+            "posts_per_second": round(count / sequential, 1),
+            "backend_calls": sequential_backend.calls,
+        },
+        "batched": {
+            "seconds": round(batched, 3),
+            "posts_per_second": round(count / batched, 1),
+            "backend_calls": batch_backend.calls,
+            "time_to_first_result_ms": round((first_item or 0.0) * 1e3, 1),
+        },
+        "speedup": round(sequential / batched, 2),
+    }
+
+
+def main() -> None:
+    report("content_batch", run())
+
+
+if __name__ == "__main__":
+    main()
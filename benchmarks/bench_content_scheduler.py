@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark: hero latency under a filler burst, FIFO vs. TierScheduler.
+
+Reference: skills/content_generator/scheduler.py
+
+A burst of 300 filler, 30 regular and 5 hero jobs arrives at once, hero
+last. The FIFO baseline runs them in arrival order on the same number of
+concurrent backend calls; the scheduler drains hero first and sends filler
+in bulk batches.
+"""
+
+import asyncio
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+import numpy as np
+from harness import report
+
+from skills.content_generator import FakeBackend, generate_content
+from skills.content_generator.scheduler import TierScheduler
+
+NOON = datetime(2026, 3, 2, 12, 0, tzinfo=UTC).timestamp()
+
+
+def make_burst(filler: int, regular: int, hero: int) -> list[dict[str, Any]]:
+    tiers = ["filler"] * filler + ["regular"] * regular + ["hero"] * hero
+    return [
+        {
+            "skill_name": "content_generator",
+            "parameters": {
+                "content_type": "text",
+                "platform": "twitter",
+                "topic": f"burst topic {i}",
+                "tier": tier,
+            },
+        }
+        for i, tier in enumerate(tiers)
+    ]
+
+
+def _summary(latencies: dict[str, list[float]], elapsed: float) -> dict[str, Any]:
+    result: dict[str, Any] = {"makespan_s": round(elapsed, 3)}
+    for tier, values in latencies.items():
+        ms = np.asarray(values) * 1e3
+        result[f"{tier}_p50_ms"] = round(float(np.percentile(ms, 50)), 1)
+        result[f"{tier}_max_ms"] = round(float(ms.max()), 1)
+    return result
+
+
+async def run_fifo(burst, backend, concurrency: int) -> dict[str, Any]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: dict[str, list[float]] = {"hero": [], "regular": [], "filler": []}
+    start = time.perf_counter()
+
+    async def one(input_data):
+        async with semaphore:
+            await asyncio.to_thread(generate_content, input_data, backend=backend)
+        latencies[input_data["parameters"]["tier"]].append(time.perf_counter() - start)
+
+    # Tasks start in creation order, so the semaphore admits jobs FIFO.
+    await asyncio.gather(*(one(input_data) for input_data in burst))
+    return _summary(latencies, time.perf_counter() - start)
+
+
+async def run_scheduled(burst, backend, concurrency: int) -> dict[str, Any]:
+    latencies: dict[str, list[float]] = {"hero": [], "regular": [], "filler": []}
+    scheduler = TierScheduler(
+        backend=backend,
+        max_concurrency=concurrency,
+        filler_batch_size=32,
+        filler_max_wait=0.05,
+        daily_budget_usdc=1000.0,
+        wall_clock=lambda: NOON,
+    )
+    start = time.perf_counter()
+    futures = []
+    for input_data in burst:
+        tier = input_data["parameters"]["tier"]
+        future = scheduler.submit(input_data, agent_id="bench")
+        future.add_done_callback(
+            lambda _, tier=tier: latencies[tier].append(time.perf_counter() - start)
+        )
+        futures.append(future)
+    await asyncio.gather(*futures)
+    elapsed = time.perf_counter() - start
+    stats = scheduler.stats()
+    await scheduler.close()
+    return {
+        **_summary(latencies, elapsed),
+        "backend_calls": backend.calls,
+        "spend_usdc": {tier: stats[tier]["spend_usdc"] for tier in stats},
+    }
+
+
+def run(
+    filler: int = 300,
+    regular: int = 30,
+    hero: int = 5,
+    concurrency: int = 6,
+    setup_latency: float = 0.01,
+    item_latency: float = 0.001,
+) -> dict[str, Any]:
+    burst = make_burst(filler, regular, hero)
+    fifo_backend = FakeBackend(setup_latency=setup_latency, item_latency=item_latency)
+    tiered_backend = FakeBackend(setup_latency=setup_latency, item_latency=item_latency)
+    fifo = asyncio.run(run_fifo(burst, fifo_backend, concurrency))
+    fifo["backend_calls"] = fifo_backend.calls
+    scheduled = asyncio.run(run_scheduled(burst, tiered_backend, concurrency))
+    return {
+        "jobs": {"filler": filler, "regular": regular, "hero": hero},
+        "fifo": fifo,
+        "tier_scheduler": scheduled,
+        "hero_max_latency_speedup": round(fifo["hero_max_ms"] / scheduled["hero_max_ms"], 1),
+    }
+
+
+def main() -> None:
+    report("content_scheduler", run())
+
+
+if __name__ == "__main__":
+    main()
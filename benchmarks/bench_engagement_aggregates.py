@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark: analyze on streaming aggregates vs. re-scanning every comment.
+
+Reference: skills/engagement_manager/aggregates.py
+
+A viral post with 50k comments and 200k likes. The baseline keeps the raw
+comments and re-classifies them on every analyze call; the aggregator
+classifies each comment once at ingest and answers analyze from counters.
+"""
+
+import random
+from typing import Any
+
+from harness import report, time_per_op
+
+from skills.engagement_manager import EngagementAggregator, EngagementEvent, manage_engagement
+from skills.engagement_manager.sentiment import SENTIMENTS, classify_sentiment
+
+COMMENTS = [
+    "Love this look! Where can I get it?",
+    "Stunning 😍🔥",
+    "Where is this from?",
+    "So overpriced, not worth it",
+    "ok",
+    "This is amazing, obsessed",
+    "meh",
+    "Can you do a tutorial?",
+]
+
+
+def rescan_analyze(comments: list[str], likes: int) -> dict[str, Any]:
+    """Baseline: classify every stored comment on each request."""
+    counts = dict.fromkeys(SENTIMENTS, 0)
+    for text in comments:
+        counts[classify_sentiment(text)] += 1
+    total = len(comments)
+    return {
+        "total_engagement": likes + total,
+        "sentiment_breakdown": {key: value / total for key, value in counts.items()},
+    }
+
+
+def run(comments: int = 50_000, likes: int = 200_000, batch: int = 1000) -> dict[str, Any]:
+    rng = random.Random(3)
+    texts = [rng.choice(COMMENTS) for _ in range(comments)]
+    request = {
+        "skill_name": "engagement_manager",
+        "parameters": {"action": "analyze", "platform": "instagram", "post_id": "viral"},
+    }
+
+    aggregator = EngagementAggregator()
+    events = [EngagementEvent("viral", "comment", text=text) for text in texts]
+
+    def ingest_all():
+        fresh = EngagementAggregator()
+        for start in range(0, len(events), batch):
+            fresh.ingest(events[start : start + batch])
+
+    ingest = time_per_op(ingest_all, 1, 3)
+    aggregator.ingest(events)
+    aggregator.record_like("viral", likes)
+
+    rescan = time_per_op(lambda: rescan_analyze(texts, likes), 1, 3)
+    analyze = time_per_op(lambda: manage_engagement(request, aggregator=aggregator), 1000, 5)
+    return {
+        "comments": comments,
+        "rescan_analyze_ms": round(rescan * 1e3, 2),
+        "aggregate_analyze_us": round(analyze * 1e6, 2),
+        "analyze_speedup": round(rescan / analyze),
+        "aggregate_analyze_per_second": round(1 / analyze),
+        "ingest_comments_per_second": round(comments / ingest),
+    }
+
+
+def main() -> None:
+    report("engagement_aggregates", run())
+
+
+if __name__ == "__main__":
+    main()
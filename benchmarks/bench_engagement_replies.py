@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark: bulk reply pipeline vs. one generator call per comment.
+
+Reference: skills/engagement_manager/replies.py
+
+10k comments on one viral post, answered by one persona: common reactions
+in several spellings, emoji-only reactions, spam, re-delivered comments and
+a long tail of distinct questions. The stand-in generator costs a fixed
+setup latency per call plus a small per-comment latency.
+"""
+
+import random
+import time
+from typing import Any
+
+from harness import report
+
+from skills.engagement_manager import FakeReplyGenerator, ReplyPipeline
+
+COMMON = [
+    "Love this!",
+    "love this 😍",
+    "LOOOVE this!!",
+    "Where can I get it?",
+    "where can i get it",
+    "So pretty",
+    "Need this",
+    "Obsessed 🔥",
+]
+EMOJI = ["😍", "🔥🔥", "❤️❤️❤️", "👏"]
+SPAM = ["Follow me for a giveaway!", "Earn $500 a day, dm me", "cheap bags www.spam.example"]
+
+
+def make_comments(count: int, seed: int = 11) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    comments = []
+    for i in range(count):
+        roll = rng.random()
+        if roll < 0.45:
+            text = rng.choice(COMMON)
+        elif roll < 0.60:
+            text = rng.choice(EMOJI)
+        elif roll < 0.70:
+            text = rng.choice(SPAM)
+        else:
+            text = f"Do you ship to city {rng.randint(1, 1500)}?"
+        # About 5% of deliveries are re-deliveries of an earlier comment.
+        comment_id = f"c{rng.randint(0, i - 1)}" if i and rng.random() < 0.05 else f"c{i}"
+        comments.append(
+            {
+                "skill_name": "engagement_manager",
+                "parameters": {
+                    "action": "reply",
+                    "platform": "instagram",
+                    "post_id": "viral",
+                    "comment_id": comment_id,
+                    "comment_text": text,
+                    "persona_id": "chimera_fashion_001",
+                },
+            }
+        )
+    return comments
+
+
+def run(
+    count: int = 10_000, setup_latency: float = 0.0005, item_latency: float = 0.00005
+) -> dict[str, Any]:
+    comments = make_comments(count)
+
+    baseline = FakeReplyGenerator(setup_latency=setup_latency, item_latency=item_latency)
+    start = time.perf_counter()
+    for input_data in comments:
+        parameters = input_data["parameters"]
+        baseline.generate(
+            parameters["persona_id"], parameters["platform"], [parameters["comment_text"]]
+        )
+    one_by_one = time.perf_counter() - start
+
+    generator = FakeReplyGenerator(setup_latency=setup_latency, item_latency=item_latency)
+    pipeline = ReplyPipeline(generator)
+    start = time.perf_counter()
+    items = list(pipeline.process(comments))
+    pipelined = time.perf_counter() - start
+    assert len(items) == count
+
+    return {
+        "comments": count,
+        "one_call_per_comment": {
+            "seconds": round(one_by_one, 3),
+            "comments_per_second": round(count / one_by_one),
+            "generator_calls": baseline.calls,
+        },
+        "pipeline": {
+            "seconds": round(pipelined, 3),
+            "comments_per_second": round(count / pipelined),
+            "generator_calls": generator.calls,
+            "replies_generated": generator.items,
+            **pipeline.stats.as_dict(),
+        },
+        "speedup": round(one_by_one / pipelined, 1),
+    }
+
+
+def main() -> None:
+    report("engagement_replies", run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark: vectorised Judge routing vs. routing one message at a time.
+
+Reference: src/chimera/judge.py
+
+100k review messages with realistic confidence and validation scores.
+The baseline calls route_one per message; the Judge routes micro-batches
+of 512 with NumPy. A second run pushes the same messages through
+``consume`` from an asyncio queue, the way the Judge service runs.
+"""
+
+import asyncio
+import random
+import time
+from typing import Any
+
+from harness import report
+
+from chimera.judge import Judge, route_one
+
+
+def make_messages(count: int, seed: int = 13) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    messages = []
+    for i in range(count):
+        flags = []
+        roll = rng.random()
+        if roll < 0.02:
+            flags = ["health_advice"]
+        elif roll < 0.05:
+            flags = ["off_brand"]
+        messages.append(
+            {
+                "task_id": str(i),
+                "content_id": str(i),
+                "result": {"text": "post", "media_urls": [], "confidence": rng.betavariate(8, 1.5)},
+                "validation": {
+                    "persona_alignment": rng.betavariate(9, 1.5),
+                    "safety_score": rng.betavariate(20, 1),
+                    "flags": flags,
+                },
+                "worker_id": "w1",
+                "completed_at": "2026-01-01T00:00:00Z",
+            }
+        )
+    return messages
+
+
+async def _consume(judge: Judge, messages: list[dict[str, Any]]) -> float:
+    queue: asyncio.Queue = asyncio.Queue()
+    for message in messages:
+        queue.put_nowait(message)
+    queue.put_nowait(None)
+    start = time.perf_counter()
+    await judge.consume(queue)
+    return time.perf_counter() - start
+
+
+def run(count: int = 100_000, batch_size: int = 512) -> dict[str, Any]:
+    messages = make_messages(count)
+
+    start = time.perf_counter()
+    for message in messages:
+        route_one(message)
+    scalar = time.perf_counter() - start
+
+    judge = Judge(batch_size=batch_size)
+    start = time.perf_counter()
+    for offset in range(0, count, batch_size):
+        judge.route(messages[offset : offset + batch_size])
+    batched = time.perf_counter() - start
+
+    consumer = Judge(batch_size=batch_size, sinks={"approve": len, "hitl": len, "reject": len})
+    consumed = asyncio.run(_consume(consumer, messages))
+
+    return {
+        "messages": count,
+        "per_message_per_second": round(count / scalar),
+        "batched_per_second": round(count / batched),
+        "consume_per_second": round(count / consumed),
+        "speedup": round(scalar / batched, 1),
+        **judge.stats.as_dict(),
+    }
+
+
+def main() -> None:
+    report("judge", run())
+
+
+if __name__ == "__main__":
+    main()
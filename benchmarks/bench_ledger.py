@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark: wallet budget ledger.
+
+Reference: src/chimera/ledger.py
+
+Reported:
+
+- ``check`` cost for one agent (the pre-transaction budget check)
+- reserve + commit cost, in memory and with the journal
+- durable commits (each waits for its fsync) from one thread and from
+  many, to show group commit sharing fsyncs between writers
+- concurrent reservations across 16 threads and 1,000 agents
+"""
+
+import tempfile
+import threading
+import time
+from typing import Any
+
+from harness import report, time_per_op
+
+from chimera.ledger import BudgetExceededError, Ledger
+
+
+def _concurrent(ledger: Ledger, threads: int, per_thread: int, agents: int) -> float:
+    def worker(offset: int) -> None:
+        for i in range(per_thread):
+            agent = f"agent-{(offset + i) % agents}"
+            try:
+                ledger.commit(ledger.reserve(agent, 0.01))
+            except BudgetExceededError:
+                pass
+
+    pool = [threading.Thread(target=worker, args=(n * 7919,)) for n in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return threads * per_thread / (time.perf_counter() - start)
+
+
+def _durable(ledger: Ledger, threads: int, per_thread: int) -> float:
+    def worker(n: int) -> None:
+        for _ in range(per_thread):
+            ledger.spend(f"agent-{n}", 0.001, durable=True)
+
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return threads * per_thread / (time.perf_counter() - start)
+
+
+def run(number: int = 50_000) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    ledger = Ledger(daily_limit_usdc=1e9)
+    ledger.spend("agent-0", 10)
+    check = time_per_op(lambda: ledger.check("agent-0", 1.5), number)
+    results["check_us"] = round(check * 1e6, 3)
+    results["checks_per_second"] = round(1 / check)
+    results["reserve_commit_us"] = round(
+        time_per_op(lambda: ledger.commit(ledger.reserve("agent-0", 0.01)), number) * 1e6, 3
+    )
+    results["concurrent_reserve_commit_per_second"] = round(
+        _concurrent(Ledger(daily_limit_usdc=1e9), 16, number // 16, 1000)
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with Ledger(tmp, daily_limit_usdc=1e9) as journaled:
+            results["journaled_reserve_commit_us"] = round(
+                time_per_op(lambda: journaled.commit(journaled.reserve("agent-0", 0.01)), number)
+                * 1e6,
+                3,
+            )
+            results["durable_commits_per_second_1_thread"] = round(_durable(journaled, 1, 200))
+            before = journaled.stats.journal_syncs
+            results["durable_commits_per_second_32_threads"] = round(_durable(journaled, 32, 50))
+            results["records_per_fsync_32_threads"] = round(
+                32 * 50 / max(journaled.stats.journal_syncs - before, 1), 1
+            )
+    return results
+
+
+def main() -> None:
+    report("ledger", run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark: agent memory search at 100k memories per agent.
+
+Reference: src/chimera/memory/
+
+One agent is loaded with 100,000 clustered 256-d embeddings, about 60MB,
+inside the 100MB budget. Reported:
+
+- ingest rate through ``store_many`` (IVF training included)
+- cold open: a fresh store, first ``recent`` and first ``search``
+  (the inverted lists are rebuilt from the segment files)
+- search latency P50/P95/P99 for an exact scan and for IVF at a few
+  ``nprobe`` values, with recall@10 against the exact scan
+- opening 1,000 small agents, to show that start-up does not load memories
+"""
+
+import tempfile
+import time
+from typing import Any
+
+import numpy as np
+from harness import percentiles, report
+
+from chimera.memory import MemoryStore
+
+
+def clustered(n: int, dim: int, clusters: int, rng: np.random.Generator) -> np.ndarray:
+    centers = rng.standard_normal((clusters, dim))
+    return centers[rng.integers(clusters, size=n)] + 0.5 * rng.standard_normal((n, dim))
+
+
+def _ms(samples: list[float]) -> dict[str, float]:
+    return {k: round(v * 1000, 3) for k, v in percentiles(samples).items()}
+
+
+def run(
+    memories: int = 100_000, dim: int = 256, queries: int = 200, agents: int = 1000
+) -> dict[str, Any]:
+    rng = np.random.default_rng(7)
+    vectors = clustered(memories, dim, 1000, rng)
+    contents = [f"memory {i} about topic {i % 1000}" for i in range(memories)]
+    probes = vectors[rng.choice(memories, queries, replace=False)] + 0.2 * rng.standard_normal(
+        (queries, dim)
+    )
+    results: dict[str, Any] = {"memories": memories, "dim": dim}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with MemoryStore(tmp, dim=dim) as store:
+            start = time.perf_counter()
+            for i in range(0, memories, 10_000):
+                store.store_many(
+                    "agent-0", contents[i : i + 10_000], embeddings=vectors[i : i + 10_000]
+                )
+            results["ingest_per_second"] = round(memories / (time.perf_counter() - start))
+            results["live_mb"] = round(store.usage("agent-0") / 2**20, 1)
+
+        with MemoryStore(tmp, dim=dim) as store:
+            start = time.perf_counter()
+            store.recent("agent-0", 20)
+            results["cold_recent_ms"] = round((time.perf_counter() - start) * 1000, 2)
+            start = time.perf_counter()
+            store.search("agent-0", "", embedding=probes[0])
+            results["cold_first_search_ms"] = round((time.perf_counter() - start) * 1000, 2)
+            results["recent_ms"] = _ms(
+                [_timed(lambda: store.recent("agent-0", 20)) for _ in range(queries)]
+            )
+
+            exact, exact_latency = [], []
+            segment = store._segment("agent-0")
+            for q in probes:
+                start = time.perf_counter()
+                rows, _ = segment.search(
+                    q / np.linalg.norm(q), 10, nprobe=len(segment.centroids) + 1
+                )
+                exact_latency.append(time.perf_counter() - start)
+                exact.append(set(rows.tolist()))
+            results["exact_scan"] = {"latency_ms": _ms(exact_latency)}
+            results["lists"] = len(segment.centroids)
+
+            for nprobe in (8, 16, 32):
+                latency, recall = [], []
+                for q, want in zip(probes, exact, strict=True):
+                    q = q / np.linalg.norm(q)
+                    start = time.perf_counter()
+                    rows, _ = segment.search(q, 10, nprobe=nprobe)
+                    latency.append(time.perf_counter() - start)
+                    recall.append(len(want & set(rows.tolist())) / 10)
+                results[f"ivf_nprobe_{nprobe}"] = {
+                    "latency_ms": _ms(latency),
+                    "recall_at_10": round(float(np.mean(recall)), 3),
+                }
+            # End-to-end through the public API (text embedding and content decoding).
+            results["search_memory_ms"] = _ms(
+                [
+                    _timed(lambda: store.search("agent-0", "what happened with topic 42?"))
+                    for _ in range(queries)
+                ]
+            )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with MemoryStore(tmp, dim=dim, max_open=agents) as store:
+            for a in range(agents):
+                store.store_many(f"agent-{a}", contents[:50], embeddings=vectors[:50])
+        with MemoryStore(tmp, dim=dim, max_open=agents) as store:
+            start = time.perf_counter()
+            for a in range(agents):
+                store.recent(f"agent-{a}", 1)
+            results["open_agents_per_second"] = round(agents / (time.perf_counter() - start))
+    return results
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    report("memory", run())
+
+
+if __name__ == "__main__":
+    main()
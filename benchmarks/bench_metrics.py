@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cost of recording a metric, and of exporting them.
+
+Reference: src/chimera/metrics.py
+
+Each ``*_ns`` figure is the cost per call with the benchmark's own loop and
+call overhead subtracted, measured against an empty function. A timed call
+or stage block reads the clock twice; ``clock_read_ns`` shows what that
+alone costs. The ``threads`` block records from several threads at once, to show that
+recording takes no lock. The export figures are per render of the whole
+registry.
+"""
+
+import threading
+import time
+from typing import Any
+
+from harness import report, time_per_op
+
+from chimera import metrics
+
+
+def _noop() -> None:
+    pass
+
+
+@metrics.timed("bench.timed")
+def _timed_noop() -> None:
+    pass
+
+
+def run(number: int = 200_000, threads: int = 4, series: int = 50) -> dict[str, Any]:
+    registry = metrics.Registry()
+    latency = registry.histogram("bench_seconds", "Benchmark latency.").labels()
+    count = registry.counter("bench_total", "Benchmark calls.").labels()
+    depth = registry.gauge("bench_depth", "Benchmark depth.").labels()
+
+    def staged() -> None:
+        with metrics.stage("bench.stage"):
+            pass
+
+    baseline = time_per_op(_noop, number)
+    costs = {
+        "histogram_observe_ns": time_per_op(lambda: latency.observe(0.00123), number),
+        "clock_read_ns": time_per_op(time.perf_counter_ns, number),
+        "counter_inc_ns": time_per_op(count.inc, number),
+        "gauge_set_ns": time_per_op(lambda: depth.set(3), number),
+        "timed_call_ns": time_per_op(_timed_noop, number),
+        "stage_block_ns": time_per_op(staged, number),
+    }
+
+    shared = registry.histogram("bench_shared_seconds", "Shared across threads.").labels()
+
+    def record() -> None:
+        for _ in range(number):
+            shared.observe(0.00123)
+
+    workers = [threading.Thread(target=record) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    family = registry.histogram("bench_labelled_seconds", "Per label.", ["op"])
+    for i in range(series):
+        for ms in range(1, 101):
+            family.labels(f"op{i}").observe(ms / 1000)
+
+    return {
+        "baseline_call_ns": round(baseline * 1e9, 1),
+        **{name: round((cost - baseline) * 1e9, 1) for name, cost in costs.items()},
+        "threads": {
+            "threads": threads,
+            "observations": shared.summary()["count"],
+            "expected": threads * number,
+            "ns_per_observation": round(elapsed / (threads * number) * 1e9, 1),
+        },
+        "export": {
+            "series": series + 4,
+            "prometheus_ms": round(
+                time_per_op(lambda: metrics.render_prometheus(registry), 5) * 1e3, 2
+            ),
+            "snapshot_ms": round(time_per_op(lambda: metrics.snapshot(registry), 5) * 1e3, 2),
+        },
+    }
+
+
+def main() -> None:
+    report("metrics", run())
+
+
+if __name__ == "__main__":
+    main()
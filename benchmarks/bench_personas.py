@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark: persona_alignment scoring, batched vs. per item.
+
+Reference: src/chimera/personas.py
+
+Scores reply-length texts spread over a few hundred personas three ways:
+- ``rebuild``: the persona's vectors are built again for every text, as
+  when alignment is recomputed from its definition on each call. Timed on
+  a sample of the texts to keep the run short;
+- ``cached``: vectors come from the registry, one text per call;
+- ``batched``: one ``score_pairs`` call for the whole batch.
+
+``register_unchanged_us`` is the cost of registering a persona whose
+definition has not changed.
+"""
+
+import random
+import time
+from typing import Any
+
+from harness import report, time_per_op
+
+from chimera.personas import TRAIT_CUES, Persona, PersonaRegistry
+
+WORDS = "love this look where did you get the jacket so good thank you honestly".split()
+
+
+def run(personas: int = 300, texts: int = 4000) -> dict[str, Any]:
+    rng = random.Random(5)
+    traits = sorted(TRAIT_CUES)
+    catalog = [
+        Persona(
+            f"persona_{n:04d}",
+            tuple(rng.sample(traits, 2)),
+            vocabulary=tuple(rng.sample(WORDS, 3)),
+            avoid=("politics", "crypto"),
+        )
+        for n in range(personas)
+    ]
+    registry = PersonaRegistry()
+    start = time.perf_counter()
+    registry.register_many(catalog)
+    build = time.perf_counter() - start
+
+    ids = [rng.choice(catalog).persona_id for _ in range(texts)]
+    batch = [" ".join(rng.choices(WORDS, k=rng.randint(4, 14))) for _ in range(texts)]
+
+    sample = 200
+    start = time.perf_counter()
+    for persona_id, text in zip(ids[:sample], batch[:sample], strict=True):
+        scratch = PersonaRegistry()
+        scratch.register(registry.get(persona_id) or Persona(persona_id))
+        scratch.score(persona_id, [text])
+    rebuild = (time.perf_counter() - start) / sample
+
+    start = time.perf_counter()
+    for persona_id, text in zip(ids, batch, strict=True):
+        registry.score(persona_id, [text])
+    cached = (time.perf_counter() - start) / texts
+
+    start = time.perf_counter()
+    registry.score_pairs(ids, batch)
+    batched = (time.perf_counter() - start) / texts
+
+    return {
+        "personas": personas,
+        "texts": texts,
+        "build_ms": round(build * 1e3, 1),
+        "register_unchanged_us": round(
+            time_per_op(lambda: registry.register(catalog[0]), 10_000) * 1e6, 2
+        ),
+        "rebuild_us_per_text": round(rebuild * 1e6, 1),
+        "cached_us_per_text": round(cached * 1e6, 1),
+        "batched_us_per_text": round(batched * 1e6, 1),
+        "batched_texts_per_minute": int(60 / batched),
+        "speedup_vs_cached": round(cached / batched, 1),
+        "speedup_vs_rebuild": round(rebuild / batched, 1),
+    }
+
+
+def main() -> None:
+    report("personas", run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark: CPU-bound skill stages on threads vs. a warm process pool.
+
+Reference: src/chimera/runtime/processes.py
+
+Each task runs generate_content or engagement analyze, followed by a
+CPU-heavy stand-in for persona-alignment scoring (pure Python, holds the
+GIL). The persona pack the stage needs is either pickled into every task
+or shared once through shared memory. Throughput is reported for the
+thread executor and for process pools of increasing size. Scaling is
+bounded by the cores on the machine, which are reported as ``cpu_count``.
+"""
+
+import asyncio
+import os
+import pickle
+import time
+from typing import Any
+
+from harness import report
+
+from chimera.runtime import ProcessRunner, SharedRef, Task, WorkerPool, cpu_bound
+from skills.content_generator import FakeBackend, configure_backend, generate_content
+from skills.engagement_manager import manage_engagement
+
+PERSONA = {
+    "persona_id": "chimera_fashion_001",
+    "vocabulary": [f"term{i}" for i in range(20_000)],
+    "weights": [i / 20_000 for i in range(20_000)],
+}
+
+
+def configure_worker() -> None:
+    configure_backend(FakeBackend())
+
+
+def alignment_stage(text: str, persona: dict[str, Any], rounds: int) -> float:
+    """Stand-in persona-alignment scorer: a few ms of GIL-bound work."""
+    score = 0.0
+    vocabulary = persona["vocabulary"]
+    for i in range(rounds):
+        word = vocabulary[(hash(text) + i) % len(vocabulary)]
+        score += sum(ord(ch) for ch in word) % 7
+    return score / rounds
+
+
+def _persona(payload: dict[str, Any]) -> dict[str, Any]:
+    persona = payload["persona"]
+    return persona.resolve() if isinstance(persona, SharedRef) else persona
+
+
+@cpu_bound
+def generate_and_score(payload: dict[str, Any]) -> float:
+    output = generate_content(payload["input"])
+    return alignment_stage(output["content"]["text"], _persona(payload), payload["rounds"])
+
+
+@cpu_bound
+def analyze_and_score(payload: dict[str, Any]) -> float:
+    output = manage_engagement(payload["input"])
+    return alignment_stage(str(output["response"]), _persona(payload), payload["rounds"])
+
+
+def make_tasks(count: int, persona: Any, rounds: int) -> list[Task]:
+    tasks = []
+    for i in range(count):
+        if i % 2:
+            task_input = {
+                "skill_name": "engagement_manager",
+                "parameters": {"action": "analyze", "platform": "instagram", "post_id": f"p{i}"},
+            }
+            tasks.append(
+                Task("analyze", {"input": task_input, "persona": persona, "rounds": rounds})
+            )
+        else:
+            task_input = {
+                "skill_name": "content_generator",
+                "parameters": {"content_type": "text", "platform": "instagram", "topic": f"T{i}"},
+            }
+            tasks.append(
+                Task("generate", {"input": task_input, "persona": persona, "rounds": rounds})
+            )
+    return tasks
+
+
+async def _drive(tasks: list[Task], processes: ProcessRunner | None) -> float:
+    handlers = {"generate": generate_and_score, "analyze": analyze_and_score}
+    async with WorkerPool(handlers, concurrency=32, processes=processes) as pool:
+        start = time.perf_counter()
+        results = await asyncio.gather(*(pool.submit_nowait(task) for task in tasks))
+        elapsed = time.perf_counter() - start
+    assert all(result.ok for result in results), results[0].error
+    return len(tasks) / elapsed
+
+
+def run(count: int = 200, rounds: int = 20_000, max_workers: int | None = None) -> dict[str, Any]:
+    cpu_count = os.cpu_count() or 1
+    max_workers = max_workers or max(2, cpu_count)
+    configure_worker()
+    results: dict[str, Any] = {"cpu_count": cpu_count, "tasks": count}
+    results["threads_per_second"] = round(
+        asyncio.run(_drive(make_tasks(count, PERSONA, rounds), None)), 1
+    )
+
+    sizes = sorted({n for n in (1, 2, 4, 8, 16, max_workers) if n <= max_workers})
+    for workers in sizes:
+        runner = ProcessRunner(workers, initializers=[configure_worker])
+        runner.warm()
+        ref = runner.share(PERSONA)
+        rate = asyncio.run(_drive(make_tasks(count, ref, rounds), runner))
+        results[f"processes_{workers}_per_second"] = round(rate, 1)
+        if workers == sizes[-1]:
+            inline = make_tasks(1, PERSONA, rounds)[0].payload
+            shared = make_tasks(1, ref, rounds)[0].payload
+            results["payload_bytes_inline"] = len(pickle.dumps(inline))
+            results["payload_bytes_shared"] = len(pickle.dumps(shared))
+        runner.close()
+    return results
+
+
+def main() -> None:
+    report("process_pool", run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark: client-side rate limiting vs. hitting 429s and sleeping blindly.
+
+Reference: src/chimera/ratelimit.py
+
+A stand-in platform enforces its own quota and rejects calls over it. The
+baseline workers call it directly and sleep a fixed backoff after every
+rejection; the DelayQueue reserves each call's slot up front and runs it
+when the slot comes due. Also reports the cost of one bucket update per
+store.
+"""
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from harness import report, time_per_op
+
+from chimera.ratelimit import DelayQueue, Limit, RateLimiter, RateLimitError, SQLiteStore
+
+
+class FakePlatform:
+    """Server-side quota: rejects calls with RateLimitError once over it."""
+
+    def __init__(self, limit: Limit):
+        self.limiter = RateLimiter({("*", "*"): limit}, clock=time.monotonic)
+        self.accepted = 0
+        self.rejected = 0
+
+    async def publish(self) -> None:
+        wait = self.limiter.try_acquire("platform", "acct", "publish")
+        if wait > 0:
+            self.rejected += 1
+            raise RateLimitError("429", wait)
+        self.accepted += 1
+
+
+async def blind_retry(platform: FakePlatform, actions: int, workers: int, backoff: float) -> None:
+    remaining = iter(range(actions))
+
+    async def worker():
+        for _ in remaining:
+            while True:
+                try:
+                    await platform.publish()
+                    break
+                except RateLimitError:
+                    await asyncio.sleep(backoff)
+
+    await asyncio.gather(*(worker() for _ in range(workers)))
+
+
+async def delay_queued(platform: FakePlatform, limit: Limit, actions: int) -> None:
+    queue = DelayQueue(RateLimiter({("*", "*"): limit}), max_delay=60)
+    await asyncio.gather(
+        *(queue.submit("platform", "acct", "publish", platform.publish) for _ in range(actions))
+    )
+
+
+def run(actions: int = 400, rate: float = 400.0, burst: int = 20) -> dict[str, Any]:
+    limit = Limit(rate, burst)
+    ideal = (actions - burst) / rate
+
+    baseline = FakePlatform(limit)
+    start = time.perf_counter()
+    backoff = 0.05
+    asyncio.run(blind_retry(baseline, actions, workers=8, backoff=backoff))
+    blind = time.perf_counter() - start
+
+    # The client reserves slightly below the platform quota to absorb clock skew.
+    queued_platform = FakePlatform(limit)
+    start = time.perf_counter()
+    asyncio.run(delay_queued(queued_platform, Limit(rate * 0.98, burst), actions))
+    queued = time.perf_counter() - start
+
+    memory = RateLimiter({("*", "*"): Limit(1e9, 10**9)})
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteStore(Path(tmp) / "buckets.db")
+        shared = RateLimiter({("*", "*"): Limit(1e9, 10**9)}, store=store)
+        memory_cost = time_per_op(lambda: memory.try_acquire("x", "a", "like"), 10_000)
+        sqlite_cost = time_per_op(lambda: shared.try_acquire("x", "a", "like"), 1000)
+        store.close()
+
+    return {
+        "actions": actions,
+        "ideal_seconds": round(ideal, 3),
+        "blind_retry": {
+            "seconds": round(blind, 3),
+            "rejected_calls": baseline.rejected,
+            "worker_seconds_asleep": round(baseline.rejected * backoff, 2),
+        },
+        "delay_queue": {
+            "seconds": round(queued, 3),
+            "rejected_calls": queued_platform.rejected,
+        },
+        "memory_acquire_us": round(memory_cost * 1e6, 2),
+        "sqlite_acquire_us": round(sqlite_cost * 1e6, 2),
+    }
+
+
+def main() -> None:
+    report("ratelimit", run())
+
+
+if __name__ == "__main__":
+    main()
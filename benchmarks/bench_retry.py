@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark: retry executor overhead and load amplification during an outage.
+
+Reference: src/chimera/retry.py, specs/openclaw_integration.md §9.2
+
+Reported:
+
+- cost of a call through the executor when the dependency is healthy
+- upstream calls per request while a dependency is down, for plain
+  retries and for retries behind a circuit breaker and a retry budget
+- how many retries can wait at once, and the tasks they hold
+"""
+
+import asyncio
+import time
+from typing import Any
+
+from harness import report
+
+from chimera.retry import CircuitBreaker, RetryBudget, RetryExecutor, RetryPolicy
+
+POLICY = RetryPolicy(initial_delay_seconds=0.001, max_delay_seconds=0.01)
+
+
+class _Upstream:
+    def __init__(self, down: bool):
+        self.down = down
+        self.calls = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        if self.down:
+            raise ConnectionError("upstream down")
+        return "ok"
+
+
+async def _healthy(number: int) -> float:
+    executor = RetryExecutor(POLICY)
+    upstream = _Upstream(down=False)
+    start = time.perf_counter()
+    for _ in range(number):
+        await executor.call("source", upstream)
+    return (time.perf_counter() - start) / number
+
+
+async def _outage(executor: RetryExecutor, requests: int) -> float:
+    upstream = _Upstream(down=True)
+    futures = [executor.submit("source", upstream) for _ in range(requests)]
+    await asyncio.gather(*futures, return_exceptions=True)
+    return upstream.calls / requests
+
+
+async def _pending(count: int) -> dict[str, int]:
+    executor = RetryExecutor(
+        RetryPolicy(initial_delay_seconds=1.0, max_delay_seconds=1.0),
+        budget=RetryBudget(1.0, burst=count),
+        breaker_factory=lambda name: CircuitBreaker(name, failure_threshold=10**9),
+    )
+    upstream = _Upstream(down=True)
+    futures = [executor.submit("source", upstream) for _ in range(count)]
+    await asyncio.sleep(0.05)
+    waiting = {"pending_retries": len(executor), "tasks": len(asyncio.all_tasks())}
+    upstream.down = False
+    await asyncio.gather(*futures)
+    return waiting
+
+
+def run(number: int = 5_000, requests: int = 2_000) -> dict[str, Any]:
+    naive = RetryExecutor(
+        POLICY,
+        budget=RetryBudget(1.0, burst=10**9),
+        breaker_factory=lambda name: CircuitBreaker(name, failure_threshold=10**9),
+    )
+    return {
+        "healthy_call_us": round(asyncio.run(_healthy(number)) * 1e6, 3),
+        "outage_upstream_calls_per_request": {
+            "plain_retries": round(asyncio.run(_outage(naive, requests)), 3),
+            "breaker_and_budget": round(asyncio.run(_outage(RetryExecutor(POLICY), requests)), 3),
+        },
+        "waiting_retries": asyncio.run(_pending(10_000)),
+    }
+
+
+def main() -> None:
+    report("retry", run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: one automaton pass vs. a regex search per rule.
+
+Reference: src/chimera/safety.py
+
+Scans a batch of reply-length texts, one in ten containing a blocked term,
+against rule sets of increasing size. The baseline runs one compiled
+``\\b<term>\\b`` search per rule per text, which grows with the number of
+rules; the engine's cost depends on text length only. The baseline is
+timed on a sample of the texts to keep the run short.
+"""
+
+import random
+import re
+import time
+from typing import Any
+
+from harness import report
+
+from chimera.safety import Rule, SafetyEngine
+
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+SENTENCE = "Loving the shift towards sustainable fashion, these pieces prove it!"
+
+
+def _texts(terms: list[str], count: int, rng: random.Random) -> list[str]:
+    return [
+        f"{SENTENCE} {rng.choice(terms) if i % 10 == 0 else 'thank you'} {SENTENCE}"
+        for i in range(count)
+    ]
+
+
+def run(rule_counts: tuple[int, ...] = (100, 1000, 10_000), texts: int = 2000) -> dict[str, Any]:
+    rng = random.Random(11)
+    results: dict[str, Any] = {}
+    for count in rule_counts:
+        terms = list(
+            {"".join(rng.choice(LETTERS) for _ in range(rng.randint(5, 12))) for _ in range(count)}
+        )
+        batch = _texts(terms, texts, rng)
+
+        start = time.perf_counter()
+        engine = SafetyEngine(Rule("blocked", term) for term in terms)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scanned = engine.scan_many(batch)
+        engine_seconds = time.perf_counter() - start
+
+        patterns = [re.compile(rf"\b{re.escape(term)}\b") for term in terms]
+        sample = batch[: max(10, 200_000 // count)]
+        start = time.perf_counter()
+        for text in sample:
+            folded = text.lower()
+            for pattern in patterns:
+                pattern.search(folded)
+        per_rule_seconds = (time.perf_counter() - start) / len(sample)
+
+        per_text = engine_seconds / texts
+        results[f"rules_{count}"] = {
+            "build_ms": round(build * 1e3, 1),
+            "engine_us_per_text": round(per_text * 1e6, 1),
+            "engine_texts_per_minute": int(60 / per_text),
+            "per_rule_regex_us_per_text": round(per_rule_seconds * 1e6, 1),
+            "speedup": round(per_rule_seconds / per_text, 1),
+            "flagged": sum(1 for result in scanned if result.flags),
+        }
+    return results
+
+
+def main() -> None:
+    report("safety", run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark: worker cold start, eager skill imports vs the lazy registry.
+
+Reference: src/chimera/skills.py
+
+Each scenario runs in a fresh interpreter, ``runs`` times, keeping the
+fastest run. Three numbers are reported per scenario:
+- ``import_ms``: the sum of ``python -X importtime`` self times, i.e.
+  everything start-up imported.
+- ``ready_ms``: from interpreter start to being ready to take tasks.
+- ``first_task_ms``: from interpreter start to the end of the first task,
+  an engagement_manager ``like``.
+
+Scenarios:
+- ``eager``: imports all three skill packages, as the tests and a naive
+  worker do.
+- ``registry_cold``: ``SkillRegistry.discover`` reads and compiles every
+  schema, then imports only engagement_manager for the task.
+- ``registry_warm``: ``SkillRegistry.warm_start`` from a current snapshot.
+``interpreter_ms`` is ``python -c pass``, the floor under every scenario.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any
+
+from harness import ROOT, report
+
+TASK = {
+    "skill_name": "engagement_manager",
+    "parameters": {"action": "like", "platform": "instagram", "post_id": "post_1"},
+}
+# ``ready`` and ``done`` are perf_counter offsets printed by the script; the
+# parent adds the time from spawn to the script's first line.
+PRELUDE = "import time; _t0 = time.perf_counter()\n"
+SCENARIOS = {
+    "eager": """
+import skills.trend_fetcher, skills.content_generator, skills.engagement_manager
+from chimera.validation import validate_input
+ready = time.perf_counter()
+validate_input("engagement_manager", TASK)
+skills.engagement_manager.manage_engagement(TASK)
+""",
+    "registry_cold": """
+from chimera.skills import SkillRegistry, configure_registry
+registry = SkillRegistry.discover()
+configure_registry(registry)
+ready = time.perf_counter()
+registry.invoke("engagement_manager", TASK)
+""",
+    "registry_warm": """
+from chimera.skills import SkillRegistry, configure_registry
+registry = SkillRegistry.warm_start(SNAPSHOT)
+configure_registry(registry)
+ready = time.perf_counter()
+registry.invoke("engagement_manager", TASK)
+""",
+}
+EPILOGUE = "print(time.perf_counter() - _t0, ready - _t0)\n"
+
+
+def _env() -> dict[str, str]:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(ROOT / "src"), str(ROOT)])}
+    # Measure with .pyc files, as a built worker image has them.
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def _wall(args: list[str]) -> tuple[float, str, str]:
+    start = time.perf_counter()
+    result = subprocess.run(args, capture_output=True, text=True, env=_env(), check=True)
+    return time.perf_counter() - start, result.stdout, result.stderr
+
+
+def _import_ms(stderr: str) -> float:
+    total = 0
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "self [us]" not in line:
+            total += int(line.split("|")[0].split(":")[1])
+    return round(total / 1e3, 1)
+
+
+def run(runs: int = 5) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    results["interpreter_ms"] = round(
+        min(_wall([sys.executable, "-c", "pass"])[0] for _ in range(runs)) * 1e3, 1
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot = os.path.join(tmp, "skills.snapshot")
+        for name, body in SCENARIOS.items():
+            script = f"TASK = {TASK!r}\nSNAPSHOT = {snapshot!r}\n" + PRELUDE + body + EPILOGUE
+            best: dict[str, float] = {}
+            for _ in range(runs + 1):  # the first run writes .pyc files and the snapshot
+                wall, stdout, _ = _wall([sys.executable, "-c", script])
+                in_script, ready = map(float, stdout.split())
+                startup = wall - in_script
+                sample = {"ready_ms": (startup + ready) * 1e3, "first_task_ms": wall * 1e3}
+                best = {k: min(v, best.get(k, v)) for k, v in sample.items()}
+            _, _, stderr = _wall([sys.executable, "-X", "importtime", "-c", script])
+            results[name] = {
+                "import_ms": _import_ms(stderr),
+                **{k: round(v, 1) for k, v in best.items()},
+            }
+    return results
+
+
+def main() -> None:
+    report("skill_startup", run())
+
+
+if __name__ == "__main__":
+    main()
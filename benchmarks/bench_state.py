@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark: optimistic state transitions vs. row-locking read-modify-write.
+
+Reference: src/chimera/state.py
+
+16 workers cycle agents through idle -> planning -> working -> judging,
+first on 1,000 agents (little contention), then on 4 hot agents. Each
+worker has its own SQLite connection to one file, as the replicas would
+each have their own Postgres connection. Compared:
+
+- locked: BEGIN IMMEDIATE, SELECT, UPDATE, COMMIT per transition
+  (the row-lock pattern; the lock is held across the read)
+- optimistic: StateStore.transition (conditional UPDATE on version)
+- batched: StateStore.transition_many, 100 agents per commit
+- memory: StateStore over MemoryBackend, for reference
+"""
+
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from harness import report
+
+from chimera.state import (
+    MemoryBackend,
+    SQLiteBackend,
+    StateStore,
+    TransitionRequest,
+    VersionConflictError,
+)
+
+CYCLE = {"idle": "planning", "planning": "working", "working": "judging", "judging": "idle"}
+
+
+def _threads(count: int, target) -> float:
+    workers = [threading.Thread(target=target, args=(n,)) for n in range(count)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def _seed(store: StateStore, agents: int) -> None:
+    for i in range(agents):
+        store.create("agents", f"a{i}")
+
+
+def locked(path: Path, agents: int, workers: int, per_worker: int) -> float:
+    def work(n: int) -> None:
+        db = sqlite3.connect(str(path), timeout=30, isolation_level=None)
+        rng = random.Random(n)
+        for _ in range(per_worker):
+            agent = f"a{rng.randrange(agents)}"
+            db.execute("BEGIN IMMEDIATE")
+            (status,) = db.execute(
+                "SELECT status FROM states WHERE kind = 'agents' AND id = ?", (agent,)
+            ).fetchone()
+            db.execute(
+                "UPDATE states SET status = ?, version = version + 1, updated_at = ?"
+                " WHERE kind = 'agents' AND id = ?",
+                (CYCLE[status], time.time(), agent),
+            )
+            db.execute("COMMIT")
+        db.close()
+
+    return _threads(workers, work)
+
+
+def optimistic(stores: list[StateStore], agents: int, per_worker: int) -> float:
+    def work(n: int) -> None:
+        store, rng = stores[n], random.Random(n)
+        for _ in range(per_worker):
+            agent = f"a{rng.randrange(agents)}"
+            while True:
+                record = store.get("agents", agent)
+                try:
+                    store.transition("agents", agent, CYCLE[record.status], expect=record.status)
+                    break
+                except VersionConflictError:
+                    continue
+
+    return _threads(len(stores), work)
+
+
+def batched(stores: list[StateStore], agents: int, per_worker: int, batch: int) -> float:
+    def work(n: int) -> None:
+        store, rng = stores[n], random.Random(n)
+        for _ in range(per_worker // batch):
+            ids = [f"a{rng.randrange(agents)}" for _ in range(batch)]
+            ids = list(dict.fromkeys(ids))
+            records = store.backend.get_many("agents", ids)
+            store.transition_many(
+                [
+                    TransitionRequest("agents", r.id, CYCLE[r.status], expect={r.status})
+                    for r in records
+                ]
+            )
+
+    return _threads(len(stores), work)
+
+
+def scenario(agents: int, workers: int, per_worker: int, batch: int) -> dict[str, Any]:
+    total = workers * per_worker
+    results: dict[str, Any] = {"agents": agents, "transitions": total}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "state.db"
+        stores = [StateStore(SQLiteBackend(path)) for _ in range(workers)]
+        _seed(stores[0], agents)
+        results["locked_per_second"] = round(total / locked(path, agents, workers, per_worker))
+        results["optimistic_per_second"] = round(total / optimistic(stores, agents, per_worker))
+        results["optimistic_conflicts"] = sum(store.stats.conflicts for store in stores)
+        # Duplicate agents within a batch collapse, so count what was applied.
+        before = sum(store.stats.transitions for store in stores)
+        elapsed = batched(stores, agents, per_worker, batch)
+        applied = sum(store.stats.transitions for store in stores) - before
+        results["batched_per_second"] = round(applied / elapsed)
+        for store in stores:
+            store.backend.close()
+
+    memory = StateStore(MemoryBackend())
+    _seed(memory, agents)
+    elapsed = optimistic([memory] * workers, agents, per_worker)
+    results["memory_per_second"] = round(total / elapsed)
+    return results
+
+
+def run(workers: int = 16, per_worker: int = 500, batch: int = 100) -> dict[str, Any]:
+    return {
+        "workers": workers,
+        "spread": scenario(1000, workers, per_worker, batch),
+        "hot": scenario(4, workers, per_worker, batch),
+    }
+
+
+def main() -> None:
+    report("state", run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark: range aggregations over a 10M-row contents store.
+
+Reference: src/chimera/timeseries.py
+
+Fills a store with ``rows`` contents rows spread over 90 days (daily
+chunks, 200 agents, 4 platforms), then times typical dashboard queries:
+the whole range by platform, a week by agent, a day in hourly buckets
+for one platform, and a month in daily buckets by platform. Each query
+is run once to warm the page cache and then timed. ``in_memory_unique_ms``
+is the whole-range query done with ``np.unique`` on arrays already in
+memory, for comparison.
+"""
+
+import tempfile
+import time
+from typing import Any
+
+import numpy as np
+from harness import report
+
+from chimera.timeseries import CONTENTS_COLUMNS, DAY, TimeSeriesStore
+
+START = 1_767_225_600.0  # 2026-01-01
+DAYS = 90
+PLATFORMS = ["twitter", "instagram", "tiktok", "threads"]
+
+
+def _batch(rng: np.random.Generator, n: int) -> dict[str, Any]:
+    agents = np.array([f"agent_{i:03d}" for i in range(200)])
+    return {
+        "created_at": START + rng.random(n) * DAYS * DAY,
+        "agent_id": agents[rng.integers(0, len(agents), n)].tolist(),
+        "platform": np.array(PLATFORMS)[rng.integers(0, len(PLATFORMS), n)].tolist(),
+        "type": ["text"] * n,
+        "confidence": rng.random(n, dtype=np.float32),
+        "persona_alignment": rng.random(n, dtype=np.float32),
+        "safety_score": np.ones(n, dtype=np.float32),
+        "likes": rng.integers(0, 5000, n),
+        "comments": rng.integers(0, 200, n),
+        "shares": rng.integers(0, 100, n),
+        "cost_usdc": np.full(n, 0.02),
+    }
+
+
+def _timed(query: Any, repeat: int = 3) -> tuple[float, Any]:
+    result = query()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = query()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def run(rows: int = 10_000_000, batch: int = 500_000) -> dict[str, Any]:
+    rng = np.random.default_rng(3)
+    results: dict[str, Any] = {"rows": rows}
+    with tempfile.TemporaryDirectory() as tmp:
+        store = TimeSeriesStore(tmp, CONTENTS_COLUMNS, initial_capacity=1 << 16)
+        append = 0.0
+        for offset in range(0, rows, batch):
+            data = _batch(rng, min(batch, rows - offset))
+            start = time.perf_counter()
+            store.append(data)
+            append += time.perf_counter() - start
+        store.flush()
+        results["append_rows_per_second"] = int(rows / append)
+        results["chunks"] = store.chunk_count
+
+        end = START + DAYS * DAY
+        queries = {
+            "all_by_platform": lambda: store.aggregate(
+                START,
+                end,
+                by=["platform"],
+                aggregates=[("mean", "persona_alignment"), ("sum", "likes")],
+            ),
+            "week_by_agent": lambda: store.aggregate(
+                START + 30 * DAY,
+                START + 37 * DAY,
+                by=["agent_id"],
+                aggregates=[("mean", "persona_alignment"), ("max", "likes")],
+            ),
+            "day_hourly_one_platform": lambda: store.aggregate(
+                START + 45.5 * DAY,
+                START + 46.5 * DAY,
+                bucket=3600,
+                aggregates=[("sum", "cost_usdc")],
+                where={"platform": "tiktok"},
+            ),
+            "month_daily_by_platform": lambda: store.aggregate(
+                START,
+                START + 30 * DAY,
+                by=["platform"],
+                bucket=DAY,
+                aggregates=[("mean", "confidence")],
+            ),
+        }
+        for name, query in queries.items():
+            seconds, groups = _timed(query)
+            scanned = sum(group["count"] for group in groups)
+            results[name] = {
+                "ms": round(seconds * 1e3, 1),
+                "groups": len(groups),
+                "rows_scanned": scanned,
+                "rows_per_second": int(scanned / seconds),
+            }
+
+        columns = store.scan(START, end, ["platform", "persona_alignment", "likes"])
+        codes = np.unique(columns["platform"], return_inverse=True)[1]
+        alignment, likes = columns["persona_alignment"], columns["likes"]
+
+        def in_memory() -> None:
+            keys, inverse = np.unique(codes, return_inverse=True)
+            np.bincount(inverse, weights=alignment) / np.bincount(inverse)
+            np.bincount(inverse, weights=likes)
+
+        results["in_memory_unique_ms"] = round(_timed(in_memory)[0] * 1e3, 1)
+    return results
+
+
+def main() -> None:
+    report("timeseries", run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark: vectorised trend merging/scoring vs. a per-dict Python loop.
+
+Reference: skills/trend_fetcher/scoring.py
+
+Generates 10k and 100k raw observations over a few thousand distinct topics
+(each spelled several ways: hashtag, camelCase, lower case) spread across
+three sources and a 24h window.
+"""
+
+import math
+import random
+import re
+import time
+from typing import Any
+
+from harness import report, time_per_op
+
+from skills.trend_fetcher.scoring import TopicBatch, score_topics
+from skills.trend_fetcher.sources import RawTopic
+
+SOURCES = ["twitter://trending/ethiopia", "news://fashion/latest", "reddit://r/fashion/hot"]
+_CAMEL = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+
+
+def make_observations(count: int, distinct: int = 5000, seed: int = 7) -> list[RawTopic]:
+    rng = random.Random(seed)
+    words = ["sustainable", "fashion", "habesha", "kemis", "style", "eco", "street", "vintage"]
+    bases = [f"{rng.choice(words)} {rng.choice(words)} {i}" for i in range(distinct)]
+    now = time.time()
+    observations = []
+    for _ in range(count):
+        base = rng.choice(bases)
+        spelling = rng.choice(
+            [base, base.title(), "#" + "".join(part.title() for part in base.split())]
+        )
+        observations.append(
+            RawTopic(
+                spelling,
+                rng.randint(1, 50_000),
+                rng.choice(SOURCES),
+                now - rng.uniform(0, 24 * 3600),
+            )
+        )
+    return observations
+
+
+def merge_per_dict(topics: list[RawTopic], timeframe_hours: int, limit: int) -> list[dict]:
+    """Baseline: one Python dict per topic group, scored in a loop, fully sorted."""
+    now = time.time()
+    cutoff = now - timeframe_hours * 3600
+    midpoint = now - timeframe_hours * 1800
+    groups: dict[str, dict[str, Any]] = {}
+    for raw in topics:
+        if raw.observed_at < cutoff:
+            continue
+        key = " ".join(re.sub(r"[\W_]+", " ", _CAMEL.sub(" ", raw.topic)).split()).lower()
+        group = groups.setdefault(
+            key, {"topic": raw.topic, "volume": 0, "recent": 0, "sources": set(), "peak": 0}
+        )
+        group["volume"] += raw.volume
+        if raw.observed_at >= midpoint:
+            group["recent"] += raw.volume
+        if raw.volume > group["peak"]:
+            group["peak"], group["topic"] = raw.volume, raw.topic
+        group["sources"].add(raw.source)
+
+    top_volume = math.log1p(max(g["volume"] for g in groups.values()))
+    trends = []
+    for group in groups.values():
+        engagement = math.log1p(group["volume"]) / top_volume
+        growth = (2 * group["recent"] - group["volume"]) / group["volume"]
+        agreement = len(group["sources"]) / len(SOURCES)
+        relevance = 0.6 * engagement + 0.25 * agreement + 0.15 * (growth + 1) / 2
+        trends.append(
+            {
+                "topic": group["topic"].lstrip("#"),
+                "engagement_score": round(engagement, 4),
+                "growth_rate": f"{growth:+.0%}",
+                "sources": sorted(group["sources"]),
+                "relevance_score": round(relevance, 4),
+            }
+        )
+    trends.sort(key=lambda trend: trend["relevance_score"], reverse=True)
+    return trends[:limit]
+
+
+def run(sizes: tuple[int, ...] = (10_000, 100_000), limit: int = 100) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    for size in sizes:
+        observations = make_observations(size)
+        repeat = 3 if size > 10_000 else 5
+        # Warm the normalisation cache the way a long-running worker would.
+        TopicBatch.from_raw(observations)
+        batch = TopicBatch.from_raw(observations)
+
+        loop = time_per_op(lambda: merge_per_dict(observations, 24, limit), 1, repeat)
+        columns = time_per_op(lambda: TopicBatch.from_raw(observations), 1, repeat)
+        scoring = time_per_op(lambda: score_topics(batch, 24, limit=limit), 1, repeat)
+        full_sort = time_per_op(lambda: score_topics(batch, 24), 1, repeat)
+        results[f"{size}_topics"] = {
+            "per_dict_loop_ms": round(loop * 1e3, 2),
+            "vectorised_total_ms": round((columns + scoring) * 1e3, 2),
+            "vectorised_score_top_k_ms": round(scoring * 1e3, 2),
+            "vectorised_score_all_ms": round(full_sort * 1e3, 2),
+            "column_build_ms": round(columns * 1e3, 2),
+            "speedup_total": round(loop / (columns + scoring), 2),
+        }
+    return results
+
+
+def main() -> None:
+    report("trend_scoring", run())
+
+
+if __name__ == "__main__":
+    main()
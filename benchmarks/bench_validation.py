@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: compiled vs. interpreted skill contract validation.
+
+Reference: specs/technical.md §6.2 (100 tasks/s, burst 500)
+
+The interpreted baseline walks the schema dictionary on every call, the way
+a generic draft-07 validator does. If ``jsonschema`` is installed it is
+measured as well.
+"""
+
+from typing import Any
+
+from harness import report, time_per_op
+
+from chimera import validation
+
+PAYLOADS: dict[str, dict[str, Any]] = {
+    "trend_fetcher": {
+        "skill_name": "trend_fetcher",
+        "parameters": {
+            "region": "ethiopia",
+            "category": "fashion",
+            "timeframe_hours": 24,
+            "relevance_threshold": 0.75,
+        },
+    },
+    "content_generator": {
+        "skill_name": "content_generator",
+        "parameters": {
+            "content_type": "multimodal",
+            "platform": "instagram",
+            "topic": "Sustainable Fashion Trends",
+            "persona_constraints": ["Witty", "Sustainability-focused"],
+            "tier": "hero",
+            "budget_limit_usdc": 25.0,
+        },
+    },
+    "engagement_manager": {
+        "skill_name": "engagement_manager",
+        "parameters": {
+            "action": "reply",
+            "platform": "instagram",
+            "post_id": "post_12345",
+            "comment_text": "Love this!",
+            "persona_id": "chimera_001",
+        },
+    },
+}
+
+_TYPES = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "boolean": bool,
+    "integer": int,
+    "number": (int, float),
+}
+
+
+def interpret(schema: dict[str, Any], instance: Any) -> bool:
+    """Reference validator that re-reads the schema on every call."""
+    if "type" in schema and not isinstance(instance, _TYPES[schema["type"]]):
+        return False
+    if "const" in schema and instance != schema["const"]:
+        return False
+    if "enum" in schema and instance not in schema["enum"]:
+        return False
+    if "minimum" in schema and instance < schema["minimum"]:
+        return False
+    if "maximum" in schema and instance > schema["maximum"]:
+        return False
+    if isinstance(instance, dict):
+        for name in schema.get("required", []):
+            if name not in instance:
+                return False
+        for name, sub in schema.get("properties", {}).items():
+            if name in instance and not interpret(sub, instance[name]):
+                return False
+    if isinstance(instance, list) and "items" in schema:
+        return all(interpret(schema["items"], item) for item in instance)
+    return True
+
+
+def run(number: int = 20_000) -> dict[str, Any]:
+    """Measure per-message validation cost for every skill input schema."""
+    try:
+        import jsonschema
+    except ImportError:
+        jsonschema = None
+
+    results: dict[str, Any] = {}
+    for skill_name, payload in PAYLOADS.items():
+        schema = validation.get_schema(skill_name, "input")
+        compiled = time_per_op(lambda: validation.check(skill_name, "input", payload), number)
+        naive = time_per_op(lambda: interpret(schema, payload), number)
+        batch = time_per_op(
+            lambda: validation.validate_batch(skill_name, [payload] * 100), number // 100
+        )
+        entry = {
+            "compiled_us": round(compiled * 1e6, 3),
+            "compiled_batch_us_per_item": round(batch / 100 * 1e6, 3),
+            "interpreted_us": round(naive * 1e6, 3),
+            "speedup_vs_interpreted": round(naive / compiled, 2),
+        }
+        if jsonschema is not None:
+            draft7 = jsonschema.Draft7Validator(schema)
+            generic = time_per_op(lambda: draft7.is_valid(payload), number)
+            entry["jsonschema_us"] = round(generic * 1e6, 3)
+            entry["speedup_vs_jsonschema"] = round(generic / compiled, 2)
+        results[skill_name] = entry
+    return results
+
+
+def main() -> None:
+    report("validation", run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Shared helpers for the Chimera microbenchmarks.
+
+Benchmarks are plain scripts, run from the repository root:
+
+    python benchmarks/bench_validation.py
+
+Importing this module puts the repository root and ``src/`` on ``sys.path``
+so the scripts can import ``skills`` and ``chimera`` without installation.
+"""
+
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+for _path in (ROOT / "src", ROOT):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+
+def time_per_op(fn: Callable[[], Any], number: int, repeat: int = 5) -> float:
+    """
+    Time ``fn`` and return the best observed cost per call in seconds.
+
+    Taking the minimum over ``repeat`` runs filters out scheduler noise.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """Return P50/P95/P99 of ``samples`` (any unit, same unit out)."""
+    if not samples:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+    if len(samples) == 1:
+        return {"p50": samples[0], "p95": samples[0], "p99": samples[0]}
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {"p50": cuts[49], "p95": cuts[94], "p99": cuts[98]}
+
+
+def report(name: str, results: dict[str, Any]) -> None:
+    """Print a benchmark result block as indented JSON."""
+    print(f"== {name}")
+    print(json.dumps(results, indent=2, sort_keys=True))
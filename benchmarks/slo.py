@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite gated on the technical spec's latency and throughput targets.
+
+Reference: specs/technical.md §6.1 (latency targets), §6.2 (throughput targets)
+
+Each skill entry point is called from ``concurrency`` threads against
+stand-in sources and backends. The task pipeline (a WorkerPool running the
+skill handlers) is driven by the load generator at the §6.2 rate, with its
+500-task burst. Every scenario reports P50/P95/P99 latency in milliseconds
+and throughput.
+
+    make bench                                # run, check, compare
+    make bench-baseline                       # the same, then save as the baseline
+    python benchmarks/slo.py --concurrency 32 --scenarios trend_fetch pipeline
+
+The run exits with status 1 when:
+- a request fails;
+- a scenario misses its §6.1 latency target, the pipeline falls short of
+  100 tasks/s, or it rejects part of the burst;
+- compared with the baseline, a percentile is more than ``--threshold``
+  (25% by default) and over 5ms slower, or throughput is more than
+  ``--threshold`` lower.
+
+Stand-in latencies are set per scenario and multiplied by
+``--latency-scale``. Results are written to benchmarks/results/latest.json.
+Baselines depend on the machine, so benchmarks/results/ is not committed.
+Runs made with different options are not compared.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from harness import report
+
+from chimera.runtime import TaskQueue, WorkerPool, latency_summary
+from chimera.runtime.loadgen import generate_load, skill_handlers
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# §6.1 latency targets, in milliseconds.
+LATENCY_TARGETS_MS: dict[str, dict[str, float]] = {
+    "trend_fetch": {"p50": 500, "p95": 1000, "p99": 2000},
+    "text_generation": {"p50": 2000, "p95": 5000, "p99": 10000},
+    "image_generation": {"p50": 10000, "p95": 30000, "p99": 60000},
+}
+# §6.2: tasks/s sustained, and a burst taken without rejecting any task.
+PIPELINE_RATE = 100.0
+PIPELINE_BURST = 500
+# Latency regressions smaller than this are treated as noise.
+SLACK_MS = 5.0
+
+
+def _measure(call: Callable[[int], Any], requests: int, concurrency: int) -> dict[str, Any]:
+    """Make ``requests`` calls from ``concurrency`` threads; time each one."""
+
+    def timed(i: int) -> float | None:
+        start = time.perf_counter()
+        try:
+            call(i)
+        except Exception:
+            return None
+        return (time.perf_counter() - start) * 1e3
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(timed, range(requests)))
+    elapsed = time.perf_counter() - start
+    samples = [latency for latency in latencies if latency is not None]
+    return {
+        "requests": requests,
+        "errors": requests - len(samples),
+        "latency_ms": latency_summary(samples),
+        "throughput_per_second": round(len(samples) / elapsed, 1),
+    }
+
+
+def trend_fetch(requests: int, concurrency: int, scale: float) -> dict[str, Any]:
+    from skills.trend_fetcher import StaticSource, configure_sources, fetch_trends
+
+    topics = [(f"#topic{i}", 1000 * (i + 1)) for i in range(200)]
+    configure_sources(
+        [
+            StaticSource(
+                name, f"{name}://trending/{{region}}/{{category}}", topics, latency=delay * scale
+            )
+            for name, delay in (("twitter", 0.05), ("tiktok", 0.08), ("news", 0.12))
+        ]
+    )
+    # A region per request, so every call misses the cache and fans out.
+    return _measure(
+        lambda i: fetch_trends(
+            {
+                "skill_name": "trend_fetcher",
+                "parameters": {"region": f"region-{i}", "category": "fashion"},
+            }
+        ),
+        requests,
+        concurrency,
+    )
+
+
+def _generation(content_type: str, setup: float, item: float) -> Callable[[int], None]:
+    from skills.content_generator import FakeBackend, generate_content
+
+    backend = FakeBackend(setup_latency=setup, item_latency=item)
+
+    def call(i: int) -> None:
+        generate_content(
+            {
+                "skill_name": "content_generator",
+                "parameters": {
+                    "content_type": content_type,
+                    "platform": "instagram",
+                    "topic": f"Benchmark Topic {i}",
+                    "persona_constraints": ["Witty"],
+                    "tier": "regular",
+                },
+            },
+            backend=backend,
+        )
+
+    return call
+
+
+def text_generation(requests: int, concurrency: int, scale: float) -> dict[str, Any]:
+    return _measure(_generation("text", 0.2 * scale, 0.05 * scale), requests, concurrency)
+
+
+def image_generation(requests: int, concurrency: int, scale: float) -> dict[str, Any]:
+    return _measure(_generation("image", 0.5 * scale, 0.2 * scale), requests, concurrency)
+
+
+def engagement_reply(requests: int, concurrency: int, scale: float) -> dict[str, Any]:
+    from skills.engagement_manager import FakeReplyGenerator, ReplyPipeline, manage_engagement
+
+    pipeline = ReplyPipeline(
+        FakeReplyGenerator(setup_latency=0.1 * scale, item_latency=0.01 * scale)
+    )
+    return _measure(
+        lambda i: manage_engagement(
+            {
+                "skill_name": "engagement_manager",
+                "parameters": {
+                    "action": "reply",
+                    "platform": "instagram",
+                    "post_id": f"post_{i}",
+                    "comment_text": "Where did you get that jacket?",
+                    "persona_id": "chimera_fashion_001",
+                },
+            },
+            pipeline=pipeline,
+        ),
+        requests,
+        concurrency,
+    )
+
+
+def pipeline(duration: float, workers: int, scale: float) -> dict[str, Any]:
+    pool = WorkerPool(skill_handlers(0.002 * scale), queue=TaskQueue(), concurrency=workers)
+    outcome = asyncio.run(
+        generate_load(
+            pool, rate=PIPELINE_RATE, burst=PIPELINE_BURST, duration=duration, use_skills=True
+        )
+    )
+    return {
+        "requests": outcome["submitted"],
+        "errors": outcome["failed"],
+        "rejected": outcome["rejected"],
+        "latency_ms": outcome["queue_ms"],
+        "run_ms": outcome["run_ms"],
+        "throughput_per_second": outcome["throughput_per_second"],
+    }
+
+
+SKILL_SCENARIOS = {
+    "trend_fetch": trend_fetch,
+    "text_generation": text_generation,
+    "image_generation": image_generation,
+    "engagement_reply": engagement_reply,
+}
+SCENARIOS = [*SKILL_SCENARIOS, "pipeline"]
+
+
+def run(
+    scenarios: list[str] | None = None,
+    *,
+    requests: int = 100,
+    concurrency: int = 16,
+    workers: int = 64,
+    duration: float = 5.0,
+    latency_scale: float = 1.0,
+) -> dict[str, Any]:
+    """
+    Run ``scenarios`` (all by default) and return the results document.
+
+    The pipeline scenario's ``latency_ms`` is time spent queued; its
+    handler run time is reported separately as ``run_ms``.
+    """
+    options = {
+        "requests": requests,
+        "concurrency": concurrency,
+        "workers": workers,
+        "duration": duration,
+        "latency_scale": latency_scale,
+    }
+    results: dict[str, Any] = {}
+    for name in scenarios or SCENARIOS:
+        if name == "pipeline":
+            results[name] = pipeline(duration, workers, latency_scale)
+        else:
+            results[name] = SKILL_SCENARIOS[name](requests, concurrency, latency_scale)
+        report(f"slo.{name}", results[name])
+    return {
+        "created_at": datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "options": options,
+        "scenarios": results,
+    }
+
+
+def check_targets(results: dict[str, Any]) -> list[str]:
+    """Return one message per failed request count or missed spec target."""
+    failures = []
+    for name, result in results["scenarios"].items():
+        if result["errors"]:
+            failures.append(f"{name}: {result['errors']} of {result['requests']} requests failed")
+        for key, target in LATENCY_TARGETS_MS.get(name, {}).items():
+            value = result["latency_ms"][key]
+            if value > target:
+                failures.append(f"{name}: {key} {value}ms misses the §6.1 target of {target}ms")
+    piped = results["scenarios"].get("pipeline")
+    if piped is not None:
+        if piped["throughput_per_second"] < PIPELINE_RATE:
+            failures.append(
+                f"pipeline: {piped['throughput_per_second']} tasks/s misses the §6.2 "
+                f"target of {PIPELINE_RATE:g}"
+            )
+        if piped["rejected"]:
+            failures.append(f"pipeline: {piped['rejected']} tasks rejected during the burst")
+    return failures
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Return one message per regression of ``current`` against ``baseline``."""
+    failures = []
+    for name, result in current["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            continue
+        for key in ("p50", "p95", "p99"):
+            now, then = result["latency_ms"][key], before["latency_ms"][key]
+            if now > then * (1 + threshold) and now - then > SLACK_MS:
+                failures.append(f"{name}: {key} regressed from {then}ms to {now}ms")
+        now, then = result["throughput_per_second"], before["throughput_per_second"]
+        if now < then * (1 - threshold):
+            failures.append(f"{name}: throughput regressed from {then}/s to {now}/s")
+    return failures
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, help="default: all")
+    parser.add_argument("--requests", type=int, default=100, help="calls per skill scenario")
+    parser.add_argument("--concurrency", type=int, default=16, help="threads calling skills")
+    parser.add_argument("--workers", type=int, default=64, help="pipeline worker coroutines")
+    parser.add_argument("--duration", type=float, default=5.0, help="pipeline seconds of load")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="stand-in latency x")
+    parser.add_argument("--threshold", type=float, default=0.25, help="regression tolerance")
+    parser.add_argument("--output", type=Path, default=RESULTS_DIR / "latest.json")
+    parser.add_argument("--baseline", type=Path, default=RESULTS_DIR / "baseline.json")
+    parser.add_argument("--save-baseline", action="store_true", help="save this run as baseline")
+    args = parser.parse_args(argv)
+
+    results = run(
+        args.scenarios,
+        requests=args.requests,
+        concurrency=args.concurrency,
+        workers=args.workers,
+        duration=args.duration,
+        latency_scale=args.latency_scale,
+    )
+    failures = check_targets(results)
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+        if baseline["options"] == results["options"]:
+            failures += compare(results, baseline, args.threshold)
+        else:
+            print(f"-- {args.baseline} was run with other options; not compared")
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    print(f"-- {len(failures)} failures; results in {args.output}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,8 @@ import json
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
 # Required specification files
 SPEC_FILES = [
     "specs/_meta.md",
@@ -74,15 +76,19 @@ def check_skill_schemas() -> bool:
             else:
                 print(f"  ✓ Found: {schema_file}")
                 
-        # Validate JSON schemas
-        for schema_file in [input_schema, output_schema]:
-            if schema_file.exists():
-                try:
-                    with open(schema_file, 'r') as f:
-                        json.load(f)
-                except json.JSONDecodeError as e:
-                    print(f"  ✗ Invalid JSON in {schema_file}: {e}")
-                    all_valid = False
+    # Validate JSON schemas: chimera.validation parses them all on first lookup
+    from chimera.validation import get_schema
+
+    for skill in SKILLS:
+        for kind in ("input", "output"):
+            try:
+                get_schema(skill, kind)
+            except json.JSONDecodeError as e:
+                print(f"  ✗ Invalid JSON in skill schemas: {e}")
+                return False
+            except KeyError as e:
+                print(f"  ✗ {e.args[0]}")
+                all_valid = False
     
     return all_valid
 
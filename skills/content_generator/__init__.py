@@ -1,21 +1,327 @@
 """
-Content Generator Skill - Work in Progress
+Content Generator Skill
 
-This module will implement content generation functionality.
-Currently a stub for TDD development.
+Generates platform content for one request or for many at once. Batches are
+grouped by (platform, persona_constraints, tier, content_type) so the
+persona/voice prompt context is built once per group and each backend call
+carries many requests. An optional GenerationCache answers exact and
+near-duplicate requests without calling the backend.
+
+Reference: skills/content_generator/README.md, specs/functional.md US-005, US-006
 """
 
-def generate_content(input_data):
+import copy
+import itertools
+import time
+import uuid
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from chimera.metrics import stage, timed
+from chimera.personas import get_registry
+from chimera.safety import SafetyResult, get_engine
+from chimera.validation import check, validate_input
+
+from .backends import (
+    FakeBackend,
+    GenerationBackend,
+    GroupKey,
+    PromptContext,
+    build_prompt_context,
+    group_key,
+)
+from .cache import CacheLookup, GenerationCache, cache_key
+
+__all__ = [
+    "BatchItem",
+    "FakeBackend",
+    "GenerationBackend",
+    "GenerationCache",
+    "PromptContext",
+    "configure_backend",
+    "configure_cache",
+    "generate_content",
+    "generate_content_batch",
+]
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+_backend: GenerationBackend | None = None
+_cache: GenerationCache | None = None
+
+
+@dataclass
+class BatchItem:
+    """Outcome of one request in a batch: an output dict or the error it raised."""
+
+    index: int
+    output: dict[str, Any] | None = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def configure_backend(backend: GenerationBackend | None) -> None:
+    """Set the process-wide generation backend."""
+    global _backend
+    _backend = backend
+
+
+def configure_cache(cache: GenerationCache | None) -> None:
+    """Set the process-wide generation cache (``None`` disables caching)."""
+    global _cache
+    _cache = cache
+
+
+def _resolve_backend(backend: GenerationBackend | None) -> GenerationBackend:
+    backend = backend if backend is not None else _backend
+    if backend is None:
+        raise RuntimeError("No generation backend configured; call configure_backend()")
+    return backend
+
+
+def _safety_text(result: dict[str, Any]) -> str:
+    return " ".join([result.get("text", ""), *result.get("hashtags", [])])
+
+
+def _build_output(
+    result: dict[str, Any],
+    elapsed_ms: int,
+    batch_size: int,
+    safety: SafetyResult,
+    alignment: float | None,
+) -> dict[str, Any]:
+    content = {"text": result["text"], "hashtags": result.get("hashtags", [])}
+    if result.get("media_urls"):
+        content["media_urls"] = result["media_urls"]
+        content["media_type"] = result["media_type"]
+    return {
+        "content": content,
+        "metadata": {
+            "generation_id": f"gen_{uuid.uuid4().hex[:12]}",
+            "persona_alignment": (
+                result["persona_alignment"]
+                if alignment is None
+                else min(result["persona_alignment"], alignment)
+            ),
+            "safety_score": min(result["safety_score"], safety.score),
+            "safety_flags": safety.flags,
+            "cost_usdc": result.get("cost_usdc", 0.0),
+            "generation_time_ms": elapsed_ms,
+            "batch_size": batch_size,
+        },
+    }
+
+
+def _cached_output(lookup: CacheLookup, elapsed_ms: int) -> dict[str, Any]:
+    assert lookup.output is not None, "hits and near matches carry the prior output"
+    source = lookup.output["metadata"]
+    metadata = {key: value for key, value in source.items() if key != "batch_size"}
+    metadata.update(
+        generation_id=f"gen_{uuid.uuid4().hex[:12]}",
+        cost_usdc=0.0,
+        generation_time_ms=elapsed_ms,
+        cache={
+            "status": lookup.status,
+            "similarity": round(lookup.similarity, 4),
+            "source_generation_id": source["generation_id"],
+            "saved_usdc": source.get("cost_usdc", 0.0),
+        },
+    )
+    return {"content": copy.deepcopy(lookup.output["content"]), "metadata": metadata}
+
+
+def _run_chunk(
+    backend: GenerationBackend, context: PromptContext, chunk: list[tuple[int, dict[str, Any]]]
+) -> dict[int, BatchItem]:
+    started = time.perf_counter()
+    try:
+        with stage("content_generator.backend"):
+            results = backend.generate(context, [parameters for _, parameters in chunk])
+        if len(results) != len(chunk):
+            raise ValueError(
+                f"generation backend returned {len(results)} results for {len(chunk)} requests"
+            )
+    except Exception as exc:
+        return {index: BatchItem(index, error=exc) for index, _ in chunk}
+    elapsed_ms = int((time.perf_counter() - started) * 1000)
+
+    items: dict[int, BatchItem] = {}
+    pending: list[tuple[int, dict[str, Any]]] = []
+    texts: list[str] = []
+    for (index, _), result in zip(chunk, results, strict=True):
+        if isinstance(result, BaseException):
+            items[index] = BatchItem(index, error=result)
+            continue
+        try:
+            texts.append(_safety_text(result))
+        except Exception as exc:
+            items[index] = BatchItem(index, error=ValueError(f"invalid backend output: {exc!r}"))
+            continue
+        pending.append((index, result))
+    with stage("content_generator.safety"):
+        scans = get_engine().scan_many(texts)
+    alignments: Iterable[float | None] = itertools.repeat(None)
+    if context.persona_constraints and texts:
+        with stage("content_generator.persona"):
+            registry = get_registry()
+            persona_id = registry.for_constraints(context.persona_constraints)
+            alignments = registry.score(persona_id, texts).round(4).tolist()
+
+    for (index, result), scan, alignment in zip(pending, scans, alignments):
+        # One malformed result fails only its own item.
+        try:
+            output = _build_output(result, elapsed_ms, len(chunk), scan, alignment)
+            error = check("content_generator", "output", output)
+        except Exception as exc:
+            error = repr(exc)
+        if error is not None:
+            items[index] = BatchItem(index, error=ValueError(f"invalid backend output: {error}"))
+        else:
+            items[index] = BatchItem(index, output=output)
+    return items
+
+
+def generate_content_batch(
+    inputs: Iterable[dict[str, Any]],
+    *,
+    backend: GenerationBackend | None = None,
+    cache: GenerationCache | None = None,
+    batch_size: int | None = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> Iterator[BatchItem]:
+    """
+    Generate content for many requests, grouped to amortise prompt setup.
+
+    Requests are grouped by (platform, persona_constraints, tier,
+    content_type); each group's prompt context is built once and its
+    requests are sent to the backend in chunks of ``batch_size``. Chunks run
+    concurrently and results are yielded as soon as they are available, in
+    input order. A failing request (invalid input, backend error, invalid
+    output) only fails its own item.
+
+    With a cache, exact and near-duplicate requests are answered from it
+    with ``cost_usdc: 0`` and ``metadata.cache`` describing the match,
+    repeated requests within the batch are generated once, related prior
+    results are passed to the backend as ``seed``, and fresh outputs are
+    stored.
+
+    Args:
+        inputs: content_generator input dicts.
+        backend: Backend to use; defaults to the configured backend.
+        cache: Cache to use; defaults to the configured cache, if any.
+        batch_size: Requests per backend call; defaults to the backend's
+            ``max_batch_size``.
+        max_concurrency: Backend calls in flight at once.
+
+    Yields:
+        One BatchItem per input, in input order.
+    """
+    backend = _resolve_backend(backend)
+    cache = cache if cache is not None else _cache
+    size = max(1, batch_size or backend.max_batch_size)
+
+    ready: dict[int, BatchItem] = {}
+    groups: dict[GroupKey, list[tuple[int, dict[str, Any]]]] = {}
+    # Cache bookkeeping: parameters and lookup status of each generated
+    # request, and the request each in-batch duplicate waits on.
+    generated: dict[int, tuple[dict[str, Any], str]] = {}
+    leaders: dict[str, int] = {}
+    followers: dict[int, int] = {}
+    count = 0
+    for index, input_data in enumerate(inputs):
+        count += 1
+        error = check("content_generator", "input", input_data)
+        if error is not None:
+            ready[index] = BatchItem(index, error=ValueError(error))
+            continue
+        parameters = input_data["parameters"]
+        if cache is not None:
+            key = cache_key(parameters)
+            if key in leaders:
+                followers[index] = leaders[key]
+                continue
+            started = time.perf_counter()
+            with stage("content_generator.cache_lookup"):
+                lookup = cache.lookup(parameters)
+            if lookup.status in ("hit", "near"):
+                elapsed_ms = int((time.perf_counter() - started) * 1000)
+                ready[index] = BatchItem(index, output=_cached_output(lookup, elapsed_ms))
+                continue
+            leaders[key] = index
+            generated[index] = (parameters, lookup.status)
+            if lookup.status == "seed" and lookup.output is not None:
+                seed = {key: lookup.output["content"][key] for key in ("text", "hashtags")}
+                parameters = {**parameters, "seed": seed}
+        groups.setdefault(group_key(parameters), []).append((index, parameters))
+
+    chunks = [
+        (build_prompt_context(key), members[start : start + size])
+        for key, members in groups.items()
+        for start in range(0, len(members), size)
+    ]
+    # Submit in order of each chunk's first input so early items are not
+    # stuck behind later ones.
+    chunks.sort(key=lambda chunk: chunk[1][0][0])
+
+    leader_items: dict[int, BatchItem] = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as pool:
+        pending: dict[int, Future[dict[int, BatchItem]]] = {}
+        for context, chunk in chunks:
+            future = pool.submit(_run_chunk, backend, context, chunk)
+            for index, _ in chunk:
+                pending[index] = future
+        for index in range(count):
+            if index in followers:
+                assert cache is not None  # duplicates are only tracked with a cache
+                yield _follow(index, leader_items[followers[index]], cache)
+                continue
+            if index not in ready:
+                ready.update(pending.pop(index).result())
+            item = ready.pop(index)
+            if index in generated:
+                assert cache is not None
+                parameters, status = generated[index]
+                if item.output is not None:
+                    item.output["metadata"]["cache"] = {"status": status}
+                    cache.store(parameters, item.output)
+                leader_items[index] = item
+            yield item
+
+
+def _follow(index: int, leader: BatchItem, cache: GenerationCache) -> BatchItem:
+    """Result for an in-batch duplicate of an already generated request."""
+    if leader.output is None:
+        return BatchItem(index, error=leader.error)
+    cache.record_hit(leader.output)
+    lookup = CacheLookup("hit", "", leader.output, 1.0)
+    return BatchItem(index, output=_cached_output(lookup, 0))
+
+
+@timed("generate_content")
+def generate_content(
+    input_data: dict[str, Any], *, backend: GenerationBackend | None = None
+) -> dict[str, Any]:
     """
     Generate content based on input parameters.
-    
+
     Args:
         input_data: Dict with skill_name, parameters (content_type, platform, topic, etc.)
-        
+        backend: Backend to use; defaults to the configured backend.
+
     Returns:
         Dict with generated content and metadata
-        
+
     Raises:
-        NotImplementedError: This skill is not yet implemented
+        SchemaValidationError: If input_data violates input_schema.json
+        RuntimeError: If no generation backend is configured
     """
-    raise NotImplementedError("generate_content is not yet implemented")
+    validate_input("content_generator", input_data)
+    (item,) = generate_content_batch([input_data], backend=backend, max_concurrency=1)
+    if item.output is None:
+        raise item.error or RuntimeError("content generation produced no output")
+    return item.output
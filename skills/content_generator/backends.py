@@ -0,0 +1,154 @@
+"""
+Prompt context and generation backends for the content_generator skill.
+
+Reference: skills/content_generator/README.md, specs/technical.md §1.2
+(Generate Text / Generate Image), §4.3 (persona_voice prompt)
+
+A ``PromptContext`` holds everything derived from (platform, persona, tier,
+content_type): the persona voice instructions, platform limits and tier
+settings. It is built once per group and shared by every request in it, so
+backends can reuse the same prefix across a batch instead of re-deriving it
+per post.
+"""
+
+import time
+import uuid
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Protocol
+
+# Caption limits per platform (characters).
+PLATFORM_LIMITS = {"twitter": 280, "instagram": 2200, "tiktok": 2200, "linkedin": 3000}
+# Typical cost per item in USDC, from the README's content tier table.
+TIER_COSTS = {"filler": 0.05, "regular": 0.50, "hero": 5.00}
+HASHTAGS_PER_TIER = {"filler": 1, "regular": 3, "hero": 5}
+
+GroupKey = tuple[str, tuple[str, ...], str, str]
+
+
+@dataclass(frozen=True)
+class PromptContext:
+    """Generation settings shared by all requests in one group."""
+
+    platform: str
+    persona_constraints: tuple[str, ...]
+    tier: str
+    content_type: str
+    system_prompt: str
+    max_length: int
+    hashtag_count: int
+
+    @property
+    def key(self) -> GroupKey:
+        return (self.platform, self.persona_constraints, self.tier, self.content_type)
+
+
+def group_key(parameters: Mapping[str, Any]) -> GroupKey:
+    """Grouping key for a validated content_generator ``parameters`` dict."""
+    return (
+        parameters["platform"],
+        tuple(parameters.get("persona_constraints", ())),
+        parameters.get("tier", "regular"),
+        parameters["content_type"],
+    )
+
+
+@lru_cache(maxsize=4096)
+def build_prompt_context(key: GroupKey) -> PromptContext:
+    """Build (once per distinct key) the shared prompt context for a group."""
+    platform, persona_constraints, tier, content_type = key
+    voice = ", ".join(persona_constraints) if persona_constraints else "on-brand"
+    limit = PLATFORM_LIMITS[platform]
+    system_prompt = (
+        f"You are a {voice} influencer writing {content_type} posts for {platform}. "
+        f"Keep captions under {limit} characters and match the persona voice exactly. "
+        f"Quality tier: {tier}. Disclose AI generation where the platform requires it."
+    )
+    return PromptContext(
+        platform=platform,
+        persona_constraints=persona_constraints,
+        tier=tier,
+        content_type=content_type,
+        system_prompt=system_prompt,
+        max_length=limit,
+        hashtag_count=HASHTAGS_PER_TIER[tier],
+    )
+
+
+class GenerationBackend(Protocol):
+    """
+    Generates content for a batch of requests that share one prompt context.
+
+    ``generate`` returns one entry per request, in order: either a result
+    dict (``text``, ``hashtags``, optional ``media_urls``/``media_type``,
+    ``persona_alignment``, ``safety_score``, ``cost_usdc``) or the exception
+    that request failed with.
+    """
+
+    max_batch_size: int
+
+    def generate(
+        self, context: PromptContext, requests: Sequence[Mapping[str, Any]]
+    ) -> list[dict[str, Any] | BaseException]: ...
+
+
+class FakeBackend:
+    """
+    Offline stand-in backend with configurable latency.
+
+    Each call costs ``setup_latency`` (persona/prompt prefill) plus
+    ``item_latency`` per request, so batching gains can be measured.
+
+    Args:
+        setup_latency: Seconds per call, independent of batch size.
+        item_latency: Seconds per request in the call.
+        max_batch_size: Largest batch accepted per call.
+        fail_topics: Topics that fail with ValueError, for error isolation tests.
+    """
+
+    def __init__(
+        self,
+        *,
+        setup_latency: float = 0.0,
+        item_latency: float = 0.0,
+        max_batch_size: int = 16,
+        fail_topics: Sequence[str] = (),
+    ):
+        self.setup_latency = setup_latency
+        self.item_latency = item_latency
+        self.max_batch_size = max_batch_size
+        self.fail_topics = frozenset(fail_topics)
+        self.calls = 0
+        self.items = 0
+
+    def generate(
+        self, context: PromptContext, requests: Sequence[Mapping[str, Any]]
+    ) -> list[dict[str, Any] | BaseException]:
+        self.calls += 1
+        self.items += len(requests)
+        time.sleep(self.setup_latency + self.item_latency * len(requests))
+        results: list[dict[str, Any] | BaseException] = []
+        for request in requests:
+            topic = request["topic"]
+            if topic in self.fail_topics:
+                results.append(ValueError(f"generation failed for {topic!r}"))
+                continue
+            tag = "#" + "".join(word.title() for word in topic.split())
+            result: dict[str, Any] = {
+                "text": f"{topic}: our take, in a {context.tier} post."[: context.max_length],
+                "hashtags": [tag][: context.hashtag_count],
+                "persona_alignment": 0.9,
+                "safety_score": 0.99,
+                "cost_usdc": TIER_COSTS[context.tier],
+            }
+            if context.content_type in ("image", "multimodal"):
+                media_id = uuid.uuid4().hex[:12]
+                result["media_urls"] = [f"https://storage.chimera.ai/images/gen_{media_id}.png"]
+                result["media_type"] = "image"
+            elif context.content_type == "video":
+                media_id = uuid.uuid4().hex[:12]
+                result["media_urls"] = [f"https://storage.chimera.ai/videos/gen_{media_id}.mp4"]
+                result["media_type"] = "video"
+            results.append(result)
+        return results
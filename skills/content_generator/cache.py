@@ -0,0 +1,394 @@
+"""
+Generation cache for the content_generator skill.
+
+Reference: skills/content_generator/README.md, specs/functional.md US-005,
+specs/technical.md §1.2 (budget_limit_usdc)
+
+Agents in the same niche keep asking for nearly identical posts
+("Sustainable Fashion Trends" vs "sustainable fashion trends 2026"), and
+every generation spends budget. Results are cached in two ways:
+
+- Exact: keyed on a SHA-256 of the canonical, normalised parameters.
+- Near-duplicate: within one partition (same content_type, platform, tier,
+  persona constraints and character reference) topics are compared by
+  character-shingle Jaccard similarity. MinHash/LSH finds candidates and the
+  exact Jaccard decides. Close matches are reused; looser ones are handed to
+  the backend as a seed draft.
+
+Entries live in a bounded in-memory LRU and, optionally, in a SQLite file so
+the cache survives restarts and is shared by workers on one host.
+"""
+
+import copy
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+import numpy as np
+
+DEFAULT_MAXSIZE = 4096
+DEFAULT_MAX_DISK_ENTRIES = 100_000
+DEFAULT_REUSE_THRESHOLD = 0.8
+DEFAULT_SEED_THRESHOLD = 0.5
+
+SHINGLE_SIZE = 3
+NUM_PERM = 128
+BANDS = 32  # 4 rows per band: candidates from roughly 0.4 similarity upwards.
+
+_PRIME = (1 << 31) - 1
+_rng = np.random.default_rng(0x5EED)
+_PERM_A = _rng.integers(1, _PRIME, NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.integers(0, _PRIME, NUM_PERM, dtype=np.uint64)
+_NON_WORD = re.compile(r"[\W_]+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS generations (
+    key TEXT PRIMARY KEY,
+    bucket TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    signature BLOB NOT NULL,
+    output TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS generations_last_used ON generations (last_used);
+"""
+
+LookupStatus = Literal["hit", "near", "seed", "miss"]
+
+
+def normalise_text(text: str) -> str:
+    """Fold case, drop punctuation and hashtags, and collapse whitespace."""
+    return " ".join(_NON_WORD.sub(" ", text).split()).casefold()
+
+
+def _digest(value: Any) -> str:
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _partition(parameters: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        "content_type": parameters["content_type"],
+        "platform": parameters["platform"],
+        "tier": parameters.get("tier", "regular"),
+        "persona_constraints": sorted(
+            {normalise_text(trait) for trait in parameters.get("persona_constraints", ())}
+        ),
+        "character_reference_id": parameters.get("character_reference_id"),
+    }
+
+
+def cache_key(parameters: Mapping[str, Any]) -> str:
+    """
+    Canonical hash of the parameters that determine the generated post.
+
+    ``budget_limit_usdc`` is a spending cap, not a content parameter, and is
+    left out so requests that differ only in budget share an entry.
+    """
+    return _digest({**_partition(parameters), "topic": normalise_text(parameters["topic"])})
+
+
+def shingles(text: str) -> frozenset[str]:
+    """Character ``SHINGLE_SIZE``-grams of a normalised text, padded at both ends."""
+    padded = f" {text} "
+    if len(padded) <= SHINGLE_SIZE:
+        return frozenset([padded])
+    return frozenset(padded[i : i + SHINGLE_SIZE] for i in range(len(padded) - SHINGLE_SIZE + 1))
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    """Jaccard similarity of two shingle sets."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def minhash(shingle_set: frozenset[str]) -> np.ndarray:
+    """MinHash signature (``NUM_PERM`` uint32 values) of a shingle set."""
+    hashes = np.fromiter(
+        (zlib.crc32(shingle.encode()) for shingle in shingle_set),
+        dtype=np.uint64,
+        count=len(shingle_set),
+    )
+    hashes %= _PRIME
+    permuted = (_PERM_A[:, None] * hashes[None, :] + _PERM_B[:, None]) % _PRIME
+    return np.asarray(permuted.min(axis=1), dtype=np.uint32)
+
+
+@dataclass
+class GenerationCacheStats:
+    """Counters describing cache behaviour since creation."""
+
+    hits: int = 0
+    near_hits: int = 0
+    seeded: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    saved_usdc: float = 0.0
+
+    def as_dict(self) -> dict[str, int | float]:
+        stats = asdict(self)
+        stats["saved_usdc"] = round(self.saved_usdc, 4)
+        return stats
+
+
+@dataclass(frozen=True)
+class CacheLookup:
+    """
+    Result of a cache lookup.
+
+    ``status`` is ``hit`` (exact match), ``near`` (close enough to reuse),
+    ``seed`` (related prior result worth seeding the backend with) or
+    ``miss``. ``output`` is the prior output for every status but ``miss``.
+    """
+
+    status: LookupStatus
+    key: str
+    output: dict[str, Any] | None = None
+    similarity: float = 0.0
+
+
+@dataclass(frozen=True)
+class _IndexEntry:
+    bucket: str
+    shingles: frozenset[str]
+    signature: np.ndarray
+
+
+class GenerationCache:
+    """
+    Content-addressed generation cache with near-duplicate lookup.
+
+    Without ``path`` the cache is purely in memory and holds ``maxsize``
+    entries. With ``path`` every entry is written to SQLite (up to
+    ``max_disk_entries``, least recently used evicted first), the in-memory
+    LRU keeps the hot outputs, and the near-duplicate index covers the whole
+    file. Other processes' writes are visible to exact lookups immediately
+    and to near-duplicate lookups after a reopen.
+
+    Args:
+        maxsize: Outputs kept in memory.
+        path: Optional SQLite file backing the cache.
+        max_disk_entries: Entries kept in the SQLite file.
+        reuse_threshold: Topic similarity at which a prior result is reused.
+        seed_threshold: Topic similarity at which a prior result is offered
+            to the backend as a seed. Set it to ``reuse_threshold`` or above
+            to disable seeding.
+        clock: Wall clock, for ``last_used`` bookkeeping.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = DEFAULT_MAXSIZE,
+        path: str | Path | None = None,
+        max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+        reuse_threshold: float = DEFAULT_REUSE_THRESHOLD,
+        seed_threshold: float = DEFAULT_SEED_THRESHOLD,
+        clock: Callable[[], float] = time.time,
+    ):
+        if maxsize < 1 or max_disk_entries < 1:
+            raise ValueError("maxsize and max_disk_entries must be at least 1")
+        self.maxsize = maxsize
+        self.max_disk_entries = max_disk_entries
+        self.reuse_threshold = reuse_threshold
+        self.seed_threshold = seed_threshold
+        self.stats = GenerationCacheStats()
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._memory: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._index: dict[str, _IndexEntry] = {}
+        self._bands: dict[tuple[str, int, bytes], set[str]] = {}
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            self._db = sqlite3.connect(str(path), check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(_SCHEMA)
+            rows = self._db.execute("SELECT key, bucket, topic, signature FROM generations")
+            for key, bucket, topic, signature in rows:
+                self._add_to_index(
+                    key, bucket, shingles(topic), np.frombuffer(signature, dtype=np.uint32)
+                )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._index)
+
+    def lookup(self, parameters: Mapping[str, Any]) -> CacheLookup:
+        """
+        Find a cached output for validated content_generator ``parameters``.
+
+        Returns:
+            CacheLookup; see its docstring for the statuses.
+        """
+        key = cache_key(parameters)
+        with self._lock:
+            output = self._load(key)
+            if output is not None:
+                self.stats.hits += 1
+                self.stats.saved_usdc += output["metadata"].get("cost_usdc", 0.0)
+                return CacheLookup("hit", key, output, 1.0)
+
+            similarity, nearest = self._nearest(
+                _digest(_partition(parameters)), shingles(normalise_text(parameters["topic"]))
+            )
+            if nearest is not None and similarity >= self.seed_threshold:
+                output = self._load(nearest)
+                if output is not None and similarity >= self.reuse_threshold:
+                    self.stats.near_hits += 1
+                    self.stats.saved_usdc += output["metadata"].get("cost_usdc", 0.0)
+                    return CacheLookup("near", key, output, similarity)
+                if output is not None:
+                    self.stats.seeded += 1
+                    self.stats.misses += 1
+                    return CacheLookup("seed", key, output, similarity)
+            self.stats.misses += 1
+            return CacheLookup("miss", key)
+
+    def record_hit(self, output: Mapping[str, Any]) -> None:
+        """Count a reuse of ``output`` that bypassed ``lookup`` (an in-batch duplicate)."""
+        with self._lock:
+            self.stats.hits += 1
+            self.stats.saved_usdc += output["metadata"].get("cost_usdc", 0.0)
+
+    def store(self, parameters: Mapping[str, Any], output: dict[str, Any]) -> str:
+        """
+        Cache a freshly generated output.
+
+        Returns:
+            The entry's cache key.
+        """
+        output = copy.deepcopy(output)
+        key = cache_key(parameters)
+        bucket = _digest(_partition(parameters))
+        topic = normalise_text(parameters["topic"])
+        topic_shingles = shingles(topic)
+        signature = minhash(topic_shingles)
+        with self._lock:
+            self.stats.stores += 1
+            self._remember(key, output)
+            if key not in self._index:
+                self._add_to_index(key, bucket, topic_shingles, signature)
+            if self._db is not None:
+                now = self._clock()
+                self._db.execute(
+                    "INSERT OR REPLACE INTO generations VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, bucket, topic, signature.tobytes(), json.dumps(output), now, now),
+                )
+                self._trim_disk()
+                self._db.commit()
+        return key
+
+    def clear(self) -> None:
+        """Drop every entry, in memory and on disk."""
+        with self._lock:
+            self._memory.clear()
+            self._index.clear()
+            self._bands.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM generations")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Close the backing SQLite file, if any."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _load(self, key: str) -> dict[str, Any] | None:
+        output = self._memory.get(key)
+        if output is not None:
+            self._memory.move_to_end(key)
+            self._touch(key)
+            return output
+        if self._db is None:
+            return None
+        row = self._db.execute(
+            "SELECT bucket, topic, signature, output FROM generations WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        bucket, topic, signature, payload = row
+        self._touch(key)
+        if key not in self._index:
+            self._add_to_index(
+                key, bucket, shingles(topic), np.frombuffer(signature, dtype=np.uint32)
+            )
+        stored: dict[str, Any] = json.loads(payload)
+        self._remember(key, stored)
+        return stored
+
+    def _touch(self, key: str) -> None:
+        if self._db is not None:
+            self._db.execute(
+                "UPDATE generations SET last_used = ? WHERE key = ?", (self._clock(), key)
+            )
+            self._db.commit()
+
+    def _remember(self, key: str, output: dict[str, Any]) -> None:
+        self._memory[key] = output
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            evicted, _ = self._memory.popitem(last=False)
+            if self._db is None:
+                self.stats.evictions += 1
+                self._remove_from_index(evicted)
+
+    def _trim_disk(self) -> None:
+        excess = len(self._index) - self.max_disk_entries
+        if self._db is None or excess <= 0:
+            return
+        rows = self._db.execute(
+            "SELECT key FROM generations ORDER BY last_used LIMIT ?", (excess,)
+        ).fetchall()
+        for (key,) in rows:
+            self._db.execute("DELETE FROM generations WHERE key = ?", (key,))
+            self._memory.pop(key, None)
+            self._remove_from_index(key)
+            self.stats.evictions += 1
+
+    def _bands_of(self, bucket: str, signature: np.ndarray) -> Iterator[tuple[str, int, bytes]]:
+        for band, values in enumerate(signature.reshape(BANDS, -1)):
+            yield (bucket, band, values.tobytes())
+
+    def _add_to_index(
+        self, key: str, bucket: str, topic_shingles: frozenset[str], signature: np.ndarray
+    ) -> None:
+        self._index[key] = _IndexEntry(bucket, topic_shingles, signature)
+        for band_key in self._bands_of(bucket, signature):
+            self._bands.setdefault(band_key, set()).add(key)
+
+    def _remove_from_index(self, key: str) -> None:
+        entry = self._index.pop(key, None)
+        if entry is None:
+            return
+        for band_key in self._bands_of(entry.bucket, entry.signature):
+            members = self._bands.get(band_key)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del self._bands[band_key]
+
+    def _nearest(self, bucket: str, topic_shingles: frozenset[str]) -> tuple[float, str | None]:
+        candidates: set[str] = set()
+        for band_key in self._bands_of(bucket, minhash(topic_shingles)):
+            candidates.update(self._bands.get(band_key, ()))
+        best, best_key = 0.0, None
+        for candidate in candidates:
+            similarity = jaccard(topic_shingles, self._index[candidate].shingles)
+            if similarity > best:
+                best, best_key = similarity, candidate
+        return best, best_key
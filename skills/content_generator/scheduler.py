@@ -0,0 +1,359 @@
+"""
+Tier-aware scheduler for content_generator jobs.
+
+Reference: skills/content_generator/README.md (Content Tiers),
+specs/technical.md §6.3 (daily budget per agent: $50 USDC, block
+transactions), §6.1 (latency targets)
+
+Jobs are queued per tier (hero, regular, filler), each queue ordered by
+priority then arrival. The dispatcher:
+
+- always offers free slots to hero first, then regular, then filler, within
+  a per-tier concurrency cap and a global cap;
+- holds filler work and sends it in bulk batches: during off-peak hours, once
+  a full batch is waiting, or once the oldest filler job has waited
+  ``filler_max_wait`` seconds;
+- reserves each job's cost against its agent's daily budget in a
+  ``chimera.ledger.Ledger`` before running it, and commits the reservation
+  at the actual ``cost_usdc`` afterwards (cache hits cost nothing). Jobs
+  that would exceed the budget are blocked with BudgetExceededError.
+"""
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import time
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+import numpy as np
+
+from chimera.ledger import DAILY_LIMIT_USDC, BudgetExceededError, Ledger, Reservation
+from chimera.validation import validate_input
+
+from . import BatchItem, generate_content_batch
+from .backends import TIER_COSTS, GenerationBackend
+from .cache import GenerationCache
+
+TIERS = ("hero", "regular", "filler")
+DAILY_BUDGET_USDC = DAILY_LIMIT_USDC
+DEFAULT_CONCURRENCY = {"hero": 4, "regular": 4, "filler": 2}
+DEFAULT_MAX_CONCURRENCY = 6
+DEFAULT_FILLER_BATCH_SIZE = 32
+DEFAULT_FILLER_MAX_WAIT = 900.0
+DEFAULT_OFF_PEAK_HOURS = (0, 6)
+# Upper bound on how long the dispatcher sleeps, so off-peak windows and
+# day boundaries are noticed without any new submissions.
+_MAX_IDLE = 60.0
+_WAIT_SAMPLES = 1024
+
+
+@dataclass
+class TierStats:
+    """Counters for one tier since the scheduler was created."""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    spend_usdc: float = 0.0
+    waits: deque = field(default_factory=lambda: deque(maxlen=_WAIT_SAMPLES))
+
+    def as_dict(self, queue_depth: int, running: int) -> dict[str, Any]:
+        waits_ms = np.asarray(self.waits, dtype=float) * 1000
+        p50, p95 = np.percentile(waits_ms, [50, 95]) if len(waits_ms) else (0.0, 0.0)
+        return {
+            "queue_depth": queue_depth,
+            "running": running,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "spend_usdc": round(self.spend_usdc, 4),
+            "wait_ms": {
+                "p50": round(float(p50), 1),
+                "p95": round(float(p95), 1),
+                "max": round(float(waits_ms.max()), 1) if len(waits_ms) else 0.0,
+            },
+        }
+
+
+@dataclass(order=True)
+class _Job:
+    sort_key: tuple[int, int]
+    input_data: dict[str, Any] = field(compare=False)
+    agent_id: str = field(compare=False)
+    tier: str = field(compare=False)
+    reserve: float = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    reservation: Reservation | None = field(default=None, compare=False)
+
+
+class TierScheduler:
+    """
+    Schedules content_generator jobs by tier, concurrency and budget.
+
+    Must be used from a running asyncio event loop; generation runs in
+    worker threads through ``generate_content_batch``.
+
+    Args:
+        backend: Generation backend; defaults to the configured backend.
+        cache: Generation cache; defaults to the configured cache, if any.
+        concurrency: Per-tier cap on backend calls in flight.
+        max_concurrency: Cap on backend calls in flight across all tiers.
+        daily_budget_usdc: Spend allowed per agent per UTC day, when no
+            ledger is given.
+        ledger: Budget ledger shared with other spenders (transfers, other
+            schedulers); defaults to an in-memory one.
+        filler_batch_size: Filler jobs sent per backend batch.
+        filler_max_wait: Longest a filler job is held outside off-peak
+            hours, in seconds.
+        off_peak_hours: ``(start, end)`` UTC hours in which filler is sent
+            as soon as it arrives.
+        clock: Monotonic clock for wait times and filler deadlines.
+        wall_clock: Wall clock for budget days and off-peak hours.
+    """
+
+    def __init__(
+        self,
+        *,
+        backend: GenerationBackend | None = None,
+        cache: GenerationCache | None = None,
+        concurrency: Mapping[str, int] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        daily_budget_usdc: float = DAILY_BUDGET_USDC,
+        ledger: Ledger | None = None,
+        filler_batch_size: int = DEFAULT_FILLER_BATCH_SIZE,
+        filler_max_wait: float = DEFAULT_FILLER_MAX_WAIT,
+        off_peak_hours: tuple[int, int] = DEFAULT_OFF_PEAK_HOURS,
+        clock=time.monotonic,
+        wall_clock=time.time,
+    ):
+        self.backend = backend
+        self.cache = cache
+        self.concurrency = {**DEFAULT_CONCURRENCY, **(concurrency or {})}
+        self.max_concurrency = max_concurrency
+        self.ledger = ledger or Ledger(daily_limit_usdc=daily_budget_usdc, clock=wall_clock)
+        self.filler_batch_size = max(1, filler_batch_size)
+        self.filler_max_wait = filler_max_wait
+        self.off_peak_hours = off_peak_hours
+        self._clock = clock
+        self._wall_clock = wall_clock
+
+        self._queues: dict[str, list[_Job]] = {tier: [] for tier in TIERS}
+        self._running = dict.fromkeys(TIERS, 0)
+        self._stats = {tier: TierStats() for tier in TIERS}
+        self._filler_since: float | None = None
+        self._seq = itertools.count()
+        self._closing = False
+        self._stopping = False
+        self._wake: asyncio.Event | None = None
+        self._dispatcher: asyncio.Task | None = None
+        self._inflight: set[asyncio.Task] = set()
+
+    async def __aenter__(self) -> "TierScheduler":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        """Start the dispatcher on the running event loop (idempotent)."""
+        if self._dispatcher is None:
+            self._closing = self._stopping = False
+            self._wake = asyncio.Event()
+            self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch_loop())
+
+    async def close(self) -> None:
+        """Flush held filler work, wait for every queued job, then stop."""
+        if self._dispatcher is None:
+            return
+        self._closing = True
+        self._wake.set()
+        while self._inflight or any(self._queues.values()):
+            if self._inflight:
+                await asyncio.wait(set(self._inflight))
+            else:
+                await asyncio.sleep(0)
+        self._stopping = True
+        self._wake.set()
+        await self._dispatcher
+        self._dispatcher = None
+
+    def submit(
+        self, input_data: dict[str, Any], *, agent_id: str, priority: int = 0
+    ) -> asyncio.Future:
+        """
+        Queue a content_generator job.
+
+        Args:
+            input_data: content_generator input dict.
+            agent_id: Agent whose daily budget pays for the job.
+            priority: Higher runs earlier within the job's tier.
+
+        Returns:
+            Future resolving to the generate_content output dict.
+
+        Raises:
+            SchemaValidationError: If input_data violates input_schema.json
+            BudgetExceededError: If the job alone exceeds what the agent has left
+        """
+        validate_input("content_generator", input_data)
+        self.start()
+        parameters = input_data["parameters"]
+        tier = parameters.get("tier", "regular")
+        reserve = float(parameters.get("budget_limit_usdc", TIER_COSTS[tier]))
+        stats = self._stats[tier]
+        remaining = self.remaining_budget(agent_id)
+        if reserve > remaining:
+            stats.rejected += 1
+            raise BudgetExceededError(agent_id, reserve, remaining)
+
+        now = self._clock()
+        job = _Job(
+            (-priority, next(self._seq)),
+            input_data,
+            agent_id,
+            tier,
+            reserve,
+            asyncio.get_running_loop().create_future(),
+            now,
+        )
+        queue = self._queues[tier]
+        if tier == "filler" and not queue:
+            self._filler_since = now
+        heapq.heappush(queue, job)
+        stats.submitted += 1
+        self._wake.set()
+        return job.future
+
+    def spent_today(self, agent_id: str) -> float:
+        """Settled spend for ``agent_id`` in the current UTC day."""
+        return self.ledger.spent_today(agent_id)
+
+    def remaining_budget(self, agent_id: str) -> float:
+        """Budget left for ``agent_id`` today after settled and reserved spend."""
+        return self.ledger.remaining(agent_id)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Queue depth, running calls, wait times and spend per tier."""
+        return {
+            tier: self._stats[tier].as_dict(len(self._queues[tier]), self._running[tier])
+            for tier in TIERS
+        }
+
+    def _off_peak(self) -> bool:
+        start, end = self.off_peak_hours
+        hour = datetime.fromtimestamp(self._wall_clock(), tz=UTC).hour
+        return start <= hour < end if start <= end else hour >= start or hour < end
+
+    def _has_slot(self, tier: str) -> bool:
+        return (
+            self._running[tier] < self.concurrency[tier]
+            and sum(self._running.values()) < self.max_concurrency
+        )
+
+    async def _dispatch_loop(self) -> None:
+        while not self._stopping:
+            self._wake.clear()
+            timeout = self._dispatch()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except TimeoutError:
+                pass
+
+    def _dispatch(self) -> float:
+        """Launch whatever may run now; return how long to sleep at most."""
+        for tier in ("hero", "regular"):
+            queue = self._queues[tier]
+            while queue and self._has_slot(tier):
+                self._launch(tier, [heapq.heappop(queue)])
+
+        queue = self._queues["filler"]
+        if not queue:
+            return _MAX_IDLE
+        waited = self._clock() - self._filler_since
+        flush = self._closing or self._off_peak() or waited >= self.filler_max_wait
+        launched = False
+        while queue and self._has_slot("filler"):
+            if not flush and len(queue) < self.filler_batch_size:
+                break
+            batch = [heapq.heappop(queue) for _ in range(min(self.filler_batch_size, len(queue)))]
+            self._launch("filler", batch)
+            launched = True
+        if queue and launched:
+            self._filler_since = min(job.enqueued_at for job in queue)
+        if queue and not flush:
+            waited = self._clock() - self._filler_since
+            return max(0.0, min(self.filler_max_wait - waited, _MAX_IDLE))
+        return _MAX_IDLE
+
+    def _launch(self, tier: str, jobs: list[_Job]) -> None:
+        now = self._clock()
+        stats = self._stats[tier]
+        accepted = []
+        for job in jobs:
+            if job.future.done():  # cancelled by the caller while queued
+                continue
+            try:
+                job.reservation = self.ledger.reserve(job.agent_id, job.reserve)
+            except BudgetExceededError as exc:
+                stats.rejected += 1
+                job.future.set_exception(exc)
+                continue
+            stats.waits.append(now - job.enqueued_at)
+            accepted.append(job)
+        if not accepted:
+            return
+        self._running[tier] += 1
+        task = asyncio.get_running_loop().create_task(self._run(tier, accepted))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _run(self, tier: str, jobs: list[_Job]) -> None:
+        try:
+            inputs = [job.input_data for job in jobs]
+            try:
+                items = await asyncio.to_thread(
+                    lambda: list(
+                        generate_content_batch(inputs, backend=self.backend, cache=self.cache)
+                    )
+                )
+            except Exception as exc:
+                items = [BatchItem(index, error=exc) for index in range(len(jobs))]
+
+            stats = self._stats[tier]
+            for job, item in zip(jobs, items, strict=True):
+                # A job that fails to settle fails alone; the rest still settle.
+                try:
+                    self._settle(stats, job, item)
+                except Exception as exc:
+                    stats.failed += 1
+                    with contextlib.suppress(KeyError):
+                        self.ledger.release(job.reservation)
+                    if not job.future.done():
+                        job.future.set_exception(exc)
+        finally:
+            self._running[tier] -= 1
+            self._wake.set()
+
+    def _settle(self, stats: TierStats, job: _Job, item: BatchItem) -> None:
+        if not item.ok:
+            with contextlib.suppress(KeyError):
+                self.ledger.release(job.reservation)
+            stats.failed += 1
+            if not job.future.done():
+                job.future.set_exception(item.error)
+            return
+        cost = float(item.output["metadata"].get("cost_usdc", 0.0))
+        self.ledger.commit(job.reservation, cost)
+        stats.spend_usdc += cost
+        stats.completed += 1
+        if not job.future.done():
+            job.future.set_result(item.output)
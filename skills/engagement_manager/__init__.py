@@ -1,21 +1,219 @@
 """
-Engagement Manager Skill - Work in Progress
+Engagement Manager Skill
 
-This module will implement engagement management functionality.
-Currently a stub for TDD development.
+Manages audience engagement for a persona. Engagement analysis is served
+from streaming per-post aggregates; likes and comments are fed in through
+``get_aggregator()`` as they arrive. Replies go through a triage, template
+reuse and batching pipeline (``reply_batch`` for bulk work); DMs are drafted
+by the same pipeline and held for human approval.
+
+Reference: skills/engagement_manager/README.md, specs/functional.md
 """
 
-def manage_engagement(input_data):
+import time
+import uuid
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from chimera.metrics import timed
+from chimera.validation import validate_input
+
+from .aggregates import EngagementAggregator, EngagementEvent, PostAggregate
+from .replies import FakeReplyGenerator, ReplyGenerator, ReplyItem, ReplyPipeline, triage
+from .sentiment import classify_sentiment
+
+__all__ = [
+    "EngagementAggregator",
+    "EngagementEvent",
+    "FakeReplyGenerator",
+    "PostAggregate",
+    "ReplyGenerator",
+    "ReplyItem",
+    "ReplyPipeline",
+    "classify_sentiment",
+    "configure_reply_generator",
+    "get_aggregator",
+    "manage_engagement",
+    "reply_batch",
+]
+
+# Share of negative comments at which analyze asks for human review.
+NEGATIVE_REVIEW_SHARE = 0.4
+
+_aggregator = EngagementAggregator()
+_reply_pipeline: ReplyPipeline | None = None
+
+
+def get_aggregator() -> EngagementAggregator:
+    """The process-wide aggregator that analyze reads from."""
+    return _aggregator
+
+
+def configure_reply_generator(generator: ReplyGenerator | None, **options) -> None:
+    """
+    Set the process-wide reply generator.
+
+    ``options`` are passed to ReplyPipeline (batch_size, max_concurrency, ...).
+    """
+    global _reply_pipeline
+    _reply_pipeline = ReplyPipeline(generator, **options) if generator is not None else None
+
+
+def _resolve_pipeline(pipeline: ReplyPipeline | None) -> ReplyPipeline:
+    pipeline = pipeline if pipeline is not None else _reply_pipeline
+    if pipeline is None:
+        raise RuntimeError("No reply generator configured; call configure_reply_generator()")
+    return pipeline
+
+
+def reply_batch(
+    inputs: Iterable[dict[str, Any]], *, pipeline: ReplyPipeline | None = None
+) -> Iterator[ReplyItem]:
+    """
+    Handle many ``reply`` requests with triage, template reuse and batching.
+
+    Args:
+        inputs: engagement_manager ``reply`` input dicts.
+        pipeline: Pipeline to use; defaults to the configured one.
+
+    Yields:
+        One ReplyItem per input, in input order.
+    """
+    return _resolve_pipeline(pipeline).process(inputs)
+
+
+def _platform_id(prefix: str) -> str:
+    return f"{prefix}_{uuid.uuid4().hex[:12]}"
+
+
+def _metadata(started: float, **fields: Any) -> dict[str, Any]:
+    return {**fields, "response_time_ms": int((time.perf_counter() - started) * 1000)}
+
+
+def _analyze(parameters, aggregator: EngagementAggregator, started: float) -> dict:
+    """
+    Engagement totals for a post.
+
+    analyze publishes nothing, so its scores describe the post's reception:
+    ``safety_score`` is the share of comments that are not negative and
+    ``persona_alignment`` maps the positive-minus-negative balance onto [0, 1].
+    """
+    post_id = parameters.get("post_id")
+    if not post_id:
+        raise ValueError("analyze requires parameters.post_id")
+    aggregate = aggregator.totals(post_id)
+    breakdown = aggregate.sentiment_breakdown()
+    negative = breakdown["negative"]
+    return {
+        "response": {"action_taken": "analyze", "analysis_data": aggregate.as_analysis()},
+        "metadata": _metadata(
+            started,
+            sentiment_detected=aggregate.sentiment,
+            persona_alignment=round((1.0 + breakdown["positive"] - negative) / 2, 4),
+            safety_score=round(1.0 - negative, 4),
+            requires_hitl=negative >= NEGATIVE_REVIEW_SHARE,
+        ),
+    }
+
+
+def _like(parameters, started: float) -> dict:
+    """Like a post or comment; spam and negative comments are skipped, as in reply triage."""
+    if not (parameters.get("post_id") or parameters.get("comment_id")):
+        raise ValueError("like requires parameters.post_id or parameters.comment_id")
+    text = parameters.get("comment_text", "")
+    sentiment = classify_sentiment(text) if text else "neutral"
+    action, reason = triage(text) if text else ("like", None)
+    if action == "skipped" or sentiment == "negative":
+        metadata = _metadata(
+            started,
+            sentiment_detected=sentiment,
+            persona_alignment=1.0,
+            safety_score=1.0,
+            triage_reason=reason or "negative",
+        )
+        return {"response": {"action_taken": "skipped"}, "metadata": metadata}
+    return {
+        "response": {"action_taken": "like", "platform_response_id": _platform_id("like")},
+        "metadata": _metadata(
+            started, sentiment_detected=sentiment, persona_alignment=1.0, safety_score=1.0
+        ),
+    }
+
+
+def _follow(parameters, started: float) -> dict:
+    if not parameters.get("user_id"):
+        raise ValueError("follow requires parameters.user_id")
+    return {
+        "response": {"action_taken": "follow", "platform_response_id": _platform_id("follow")},
+        "metadata": _metadata(started, persona_alignment=1.0, safety_score=1.0),
+    }
+
+
+def _dm(input_data, pipeline: ReplyPipeline) -> dict:
+    """
+    Draft a DM answering ``comment_text``; DMs are never sent without HITL approval.
+
+    The draft is generated by the reply pipeline, scoped to the recipient so
+    one user's reply is never reused for another.
+    """
+    parameters = input_data["parameters"]
+    if not parameters.get("user_id"):
+        raise ValueError("dm requires parameters.user_id")
+    request = {
+        **input_data,
+        "parameters": {**parameters, "action": "reply", "post_id": f"dm:{parameters['user_id']}"},
+    }
+    (item,) = pipeline.process([request])
+    if item.error is not None:
+        raise item.error
+    assert item.output is not None
+    output = item.output
+    # Nothing is sent until the DM is approved, so there is no platform ID yet.
+    response = dict(output["response"])
+    response.pop("platform_response_id", None)
+    if response["action_taken"] == "reply":
+        response["action_taken"] = "dm"
+    return {"response": response, "metadata": {**output["metadata"], "requires_hitl": True}}
+
+
+@timed("manage_engagement")
+def manage_engagement(
+    input_data,
+    *,
+    aggregator: EngagementAggregator | None = None,
+    pipeline: ReplyPipeline | None = None,
+):
     """
     Manage engagement based on input parameters.
-    
+
     Args:
         input_data: Dict with skill_name, parameters (action, platform, etc.)
-        
+        aggregator: Aggregates to analyze; defaults to ``get_aggregator()``.
+        pipeline: Reply pipeline; defaults to the configured one.
+
     Returns:
         Dict with engagement response and metadata
-        
+
     Raises:
-        NotImplementedError: This skill is not yet implemented
+        SchemaValidationError: If input_data violates input_schema.json
+        ValueError: If a parameter the action needs is missing: post_id (analyze),
+            post_id or comment_id (like), user_id (follow, dm), comment_text and
+            persona_id (reply, dm)
+        RuntimeError: If a reply or DM is requested and no reply generator is configured
     """
-    raise NotImplementedError("manage_engagement is not yet implemented")
+    started = time.perf_counter()
+    validate_input("engagement_manager", input_data)
+    parameters = input_data["parameters"]
+    action = parameters["action"]
+    if action == "analyze":
+        return _analyze(parameters, aggregator if aggregator is not None else _aggregator, started)
+    if action == "like":
+        return _like(parameters, started)
+    if action == "follow":
+        return _follow(parameters, started)
+    if action == "dm":
+        return _dm(input_data, _resolve_pipeline(pipeline))
+    (item,) = _resolve_pipeline(pipeline).process([input_data])
+    if item.error is not None:
+        raise item.error
+    return item.output
@@ -0,0 +1,313 @@
+"""
+Incremental per-post engagement aggregates for the engagement_manager skill.
+
+Reference: skills/engagement_manager/output_schema.json (analysis_data),
+specs/technical.md §6.2 (1000 API requests/second)
+
+Likes and comments are fed in as a stream. Each post owns one row in a set
+of NumPy arrays:
+
+- lifetime counters (likes and comments by sentiment),
+- a ring of ``window_buckets`` time buckets of ``bucket_seconds`` each, and
+- the running sum of the live buckets (the sliding window).
+
+Ingesting an event updates its row in place; comment sentiment is
+classified once, at ingest. ``analyze`` reads the counters instead of
+re-scanning comments, and expiring old buckets touches at most
+``window_buckets`` slots, so a read costs the same for a post with ten
+comments or fifty thousand.
+"""
+
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from .sentiment import SENTIMENTS, Sentiment, classify_sentiment, dominant_sentiment
+
+DEFAULT_BUCKET_SECONDS = 60
+DEFAULT_WINDOW_BUCKETS = 60
+_INITIAL_ROWS = 64
+
+# Counter columns.
+LIKES, POSITIVE, NEUTRAL, NEGATIVE = range(4)
+_COLUMNS = 4
+_SENTIMENT_COLUMN = {"positive": POSITIVE, "neutral": NEUTRAL, "negative": NEGATIVE}
+
+
+@dataclass(frozen=True)
+class EngagementEvent:
+    """
+    One engagement event.
+
+    ``kind`` is ``like`` or ``comment``. Comments carry ``text`` (classified
+    on ingest) or an already known ``sentiment``. ``count`` lets platforms
+    that report like deltas send them as one event.
+    """
+
+    post_id: str
+    kind: str
+    timestamp: float | None = None
+    text: str | None = None
+    sentiment: Sentiment | None = None
+    count: int = 1
+
+
+@dataclass(frozen=True)
+class PostAggregate:
+    """Counters for one post: likes and comments by sentiment."""
+
+    likes: int
+    positive: int
+    neutral: int
+    negative: int
+
+    @classmethod
+    def from_row(cls, row: np.ndarray) -> "PostAggregate":
+        return cls(*(int(value) for value in row))
+
+    @property
+    def comments(self) -> int:
+        return self.positive + self.neutral + self.negative
+
+    @property
+    def total_engagement(self) -> int:
+        return self.likes + self.comments
+
+    def sentiment_breakdown(self) -> dict[str, float]:
+        """Share of comments per sentiment; all zero when there are none."""
+        comments = self.comments
+        counts = (self.positive, self.neutral, self.negative)
+        if comments == 0:
+            return dict.fromkeys(SENTIMENTS, 0.0)
+        return {
+            sentiment: round(count / comments, 4)
+            for sentiment, count in zip(SENTIMENTS, counts, strict=True)
+        }
+
+    @property
+    def sentiment(self) -> str:
+        return dominant_sentiment((self.positive, self.neutral, self.negative))
+
+    def as_analysis(self) -> dict[str, Any]:
+        """The ``analysis_data`` shape from output_schema.json."""
+        return {
+            "total_engagement": self.total_engagement,
+            "sentiment_breakdown": self.sentiment_breakdown(),
+        }
+
+
+class EngagementAggregator:
+    """
+    Streaming per-post engagement counters with sliding and tumbling windows.
+
+    The sliding window covers the last ``window_buckets`` buckets (one hour
+    by default); the tumbling window is the current bucket. Events older
+    than the sliding window still count towards lifetime totals.
+
+    Args:
+        bucket_seconds: Width of one time bucket.
+        window_buckets: Buckets in the sliding window.
+        clock: Wall clock used for events without a timestamp and for reads.
+    """
+
+    def __init__(
+        self,
+        *,
+        bucket_seconds: int = DEFAULT_BUCKET_SECONDS,
+        window_buckets: int = DEFAULT_WINDOW_BUCKETS,
+        clock=time.time,
+    ):
+        if bucket_seconds <= 0 or window_buckets <= 0:
+            raise ValueError("bucket_seconds and window_buckets must be positive")
+        self.bucket_seconds = bucket_seconds
+        self.window_buckets = window_buckets
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rows: dict[str, int] = {}
+        self._free: list[int] = []
+        self._totals = np.zeros((_INITIAL_ROWS, _COLUMNS), dtype=np.int64)
+        self._window = np.zeros((_INITIAL_ROWS, _COLUMNS), dtype=np.int64)
+        self._ring = np.zeros((_INITIAL_ROWS, window_buckets, _COLUMNS), dtype=np.int64)
+        self._head = np.full(_INITIAL_ROWS, -1, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, post_id: str) -> bool:
+        return post_id in self._rows
+
+    def record_like(self, post_id: str, count: int = 1, *, timestamp: float | None = None) -> None:
+        """Add ``count`` likes to a post."""
+        self.ingest([EngagementEvent(post_id, "like", timestamp, count=count)])
+
+    def record_comment(
+        self,
+        post_id: str,
+        text: str | None = None,
+        *,
+        sentiment: Sentiment | None = None,
+        timestamp: float | None = None,
+    ) -> Sentiment:
+        """
+        Add one comment to a post.
+
+        Returns:
+            The comment's sentiment (classified from ``text`` unless given).
+        """
+        sentiment = sentiment or classify_sentiment(text or "")
+        self.ingest([EngagementEvent(post_id, "comment", timestamp, sentiment=sentiment)])
+        return sentiment
+
+    def ingest(self, events: Iterable[EngagementEvent]) -> int:
+        """
+        Apply a batch of events.
+
+        Counters are updated with one vectorised scatter-add per array, so
+        feeding a stream in batches is much cheaper than event by event.
+
+        Returns:
+            Number of events applied.
+        """
+        now = self._clock()
+        post_ids, columns, buckets, counts = [], [], [], []
+        for event in events:
+            if event.kind == "like":
+                column = LIKES
+            elif event.kind == "comment":
+                sentiment = event.sentiment or classify_sentiment(event.text or "")
+                column = _SENTIMENT_COLUMN[sentiment]
+            else:
+                raise ValueError(f"Unknown engagement event kind: {event.kind!r}")
+            post_ids.append(event.post_id)
+            columns.append(column)
+            timestamp = now if event.timestamp is None else event.timestamp
+            buckets.append(int(timestamp // self.bucket_seconds))
+            counts.append(event.count)
+        if not post_ids:
+            return 0
+
+        with self._lock:
+            rows = np.fromiter(
+                (self._row(post_id) for post_id in post_ids), dtype=np.intp, count=len(post_ids)
+            )
+            self._apply(
+                rows,
+                np.asarray(columns, dtype=np.intp),
+                np.asarray(buckets, dtype=np.int64),
+                np.asarray(counts, dtype=np.int64),
+            )
+        return len(post_ids)
+
+    def totals(self, post_id: str) -> PostAggregate:
+        """Lifetime counters for a post (all zero for an unknown post)."""
+        with self._lock:
+            row = self._rows.get(post_id)
+            if row is None:
+                return PostAggregate(0, 0, 0, 0)
+            return PostAggregate.from_row(self._totals[row])
+
+    def window(self, post_id: str) -> PostAggregate:
+        """Counters for the sliding window ending now."""
+        with self._lock:
+            row = self._rows.get(post_id)
+            if row is None:
+                return PostAggregate(0, 0, 0, 0)
+            self._advance(row, self._bucket(self._clock()))
+            return PostAggregate.from_row(self._window[row])
+
+    def current_bucket(self, post_id: str) -> PostAggregate:
+        """Counters for the current tumbling bucket."""
+        with self._lock:
+            row = self._rows.get(post_id)
+            if row is None:
+                return PostAggregate(0, 0, 0, 0)
+            bucket = self._bucket(self._clock())
+            self._advance(row, bucket)
+            return PostAggregate.from_row(self._ring[row, bucket % self.window_buckets])
+
+    def forget(self, post_id: str) -> bool:
+        """Drop a post's counters and recycle its row. Returns whether it existed."""
+        with self._lock:
+            row = self._rows.pop(post_id, None)
+            if row is None:
+                return False
+            self._totals[row] = 0
+            self._window[row] = 0
+            self._ring[row] = 0
+            self._head[row] = -1
+            self._free.append(row)
+            return True
+
+    def forget_idle(self, idle_seconds: float) -> int:
+        """Drop posts with no events in the last ``idle_seconds``. Returns how many."""
+        cutoff = self._bucket(self._clock() - idle_seconds)
+        with self._lock:
+            idle = [post_id for post_id, row in self._rows.items() if self._head[row] < cutoff]
+        return sum(self.forget(post_id) for post_id in idle)
+
+    def _bucket(self, timestamp: float) -> int:
+        return int(timestamp // self.bucket_seconds)
+
+    def _row(self, post_id: str) -> int:
+        row = self._rows.get(post_id)
+        if row is not None:
+            return row
+        if self._free:
+            row = self._free.pop()
+        else:
+            row = len(self._rows)
+            if row == len(self._totals):
+                self._grow()
+        self._rows[post_id] = row
+        return row
+
+    def _grow(self) -> None:
+        size = len(self._totals) * 2
+        self._totals = np.resize(self._totals, (size, _COLUMNS))
+        self._totals[size // 2 :] = 0
+        self._window = np.resize(self._window, (size, _COLUMNS))
+        self._window[size // 2 :] = 0
+        ring = np.zeros((size, self.window_buckets, _COLUMNS), dtype=np.int64)
+        ring[: size // 2] = self._ring
+        self._ring = ring
+        head = np.full(size, -1, dtype=np.int64)
+        head[: size // 2] = self._head
+        self._head = head
+
+    def _advance(self, row: int, bucket: int) -> None:
+        """Move a post's newest bucket forward, expiring buckets that leave the window."""
+        head = int(self._head[row])
+        if bucket <= head:
+            return
+        if head < 0 or bucket - head >= self.window_buckets:
+            self._ring[row] = 0
+            self._window[row] = 0
+        else:
+            slots = np.arange(head + 1, bucket + 1) % self.window_buckets
+            self._window[row] -= self._ring[row, slots].sum(axis=0)
+            self._ring[row, slots] = 0
+        self._head[row] = bucket
+
+    def _apply(
+        self, rows: np.ndarray, columns: np.ndarray, buckets: np.ndarray, counts: np.ndarray
+    ) -> None:
+        np.add.at(self._totals, (rows, columns), counts)
+
+        # Advance each touched post to its newest bucket, then drop events
+        # that fall outside the window before scattering into the ring.
+        order = np.lexsort((buckets, rows))
+        sorted_rows = rows[order]
+        last = np.r_[sorted_rows[1:] != sorted_rows[:-1], True]
+        for row, bucket in zip(sorted_rows[last], buckets[order][last], strict=True):
+            self._advance(int(row), int(bucket))
+
+        live = buckets > self._head[rows] - self.window_buckets
+        if not live.all():
+            rows, columns, buckets, counts = rows[live], columns[live], buckets[live], counts[live]
+        slots = buckets % self.window_buckets
+        np.add.at(self._ring, (rows, slots, columns), counts)
+        np.add.at(self._window, (rows, columns), counts)
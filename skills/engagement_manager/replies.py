@@ -0,0 +1,467 @@
+"""
+Bulk reply pipeline for the engagement_manager skill.
+
+Reference: skills/engagement_manager/README.md (Safety Considerations),
+specs/technical.md §6.2 (throughput targets)
+
+When a post goes viral thousands of ``reply`` actions arrive for the same
+post and persona. Handling them one generator call at a time is slow and
+expensive, so replies go through three stages:
+
+1. Triage, with no generator call. Re-delivered comments and spam are
+   ``skipped``, and emoji-only reactions get a ``like``.
+2. Template reuse. Comments are reduced to a normalised key (case,
+   punctuation and emoji removed, stretched letters such as "loooove"
+   shortened). Comments with the same key on the same post, for the same
+   persona and platform, share one generated reply, within a batch and
+   across batches.
+3. Batching. The remaining comments are grouped per (persona, platform)
+   and sent to the reply generator in batches.
+"""
+
+import itertools
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Literal, Protocol
+
+from chimera.metrics import stage
+from chimera.personas import get_registry
+from chimera.safety import get_engine
+from chimera.validation import check
+
+from .sentiment import classify_sentiment
+
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_TEMPLATE_CACHE_SIZE = 10_000
+DEFAULT_SEEN_SIZE = 100_000
+
+TriageAction = Literal["reply", "like", "skipped"]
+# (post_id, normalised comment text): the unit one generated reply is shared across.
+_Template = tuple[str, str]
+
+_URL = re.compile(r"https?://|www\.|\b\w+\.(?:com|net|io|ly|me)/", re.IGNORECASE)
+_SPAM_PHRASES = re.compile(
+    r"\b(?:follow (?:me|back)|check (?:out )?my (?:page|profile|bio|channel)|dm me|"
+    r"promo code|giveaway|crypto|bitcoin|forex|earn \$|f4f|l4l|sub4sub|"
+    r"link in my bio)\b",
+    re.IGNORECASE,
+)
+_MENTION = re.compile(r"@\w+")
+_HASHTAG = re.compile(r"#\w+")
+_WORD = re.compile(r"[^\W_]")
+_NON_WORD = re.compile(r"[\W_]+")
+# Three or more of one letter: "loooove". Doubles ("good") and digits ("100") are kept.
+_STRETCHED = re.compile(r"([^\W\d_])\1{2,}")
+MAX_MENTIONS = 3
+MAX_HASHTAGS = 5
+
+
+def template_key(text: str) -> str:
+    """
+    Normalised comment text used to share one reply between comments.
+
+    "Love this!!", "love this 😍" and "LOOOVE this" all map to "love this".
+    """
+    folded = " ".join(_NON_WORD.sub(" ", text.casefold()).split())
+    return _STRETCHED.sub(r"\1", folded)
+
+
+def triage(text: str) -> tuple[TriageAction, str | None]:
+    """
+    Classify a comment without calling the generator.
+
+    Returns:
+        ``(action, reason)``: ``("skipped", "empty"|"spam")``,
+        ``("like", "emoji_only")`` or ``("reply", None)``.
+    """
+    if not text.strip():
+        return "skipped", "empty"
+    if (
+        _URL.search(text)
+        or _SPAM_PHRASES.search(text)
+        or len(_MENTION.findall(text)) >= MAX_MENTIONS
+        or len(_HASHTAG.findall(text)) >= MAX_HASHTAGS
+    ):
+        return "skipped", "spam"
+    if not _WORD.search(text):
+        return "like", "emoji_only"
+    return "reply", None
+
+
+class ReplyGenerator(Protocol):
+    """
+    Writes persona replies for a batch of comments.
+
+    ``generate`` returns one entry per comment, in order: a dict with
+    ``text`` and optionally ``persona_alignment`` and ``safety_score``, or
+    the exception generating that reply failed with.
+    """
+
+    max_batch_size: int
+
+    def generate(
+        self, persona_id: str, platform: str, comments: Sequence[str]
+    ) -> list[dict[str, Any] | BaseException]: ...
+
+
+class FakeReplyGenerator:
+    """
+    Offline stand-in reply generator with configurable latency.
+
+    Args:
+        setup_latency: Seconds per call, independent of batch size.
+        item_latency: Seconds per comment in the call.
+        max_batch_size: Largest batch accepted per call.
+    """
+
+    def __init__(
+        self,
+        *,
+        setup_latency: float = 0.0,
+        item_latency: float = 0.0,
+        max_batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self.setup_latency = setup_latency
+        self.item_latency = item_latency
+        self.max_batch_size = max_batch_size
+        self.calls = 0
+        self.items = 0
+        self._lock = threading.Lock()
+
+    def generate(
+        self, persona_id: str, platform: str, comments: Sequence[str]
+    ) -> list[dict[str, Any] | BaseException]:
+        with self._lock:
+            self.calls += 1
+            self.items += len(comments)
+        time.sleep(self.setup_latency + self.item_latency * len(comments))
+        replies: list[dict[str, Any] | BaseException] = []
+        for comment in comments:
+            if classify_sentiment(comment) == "negative":
+                text = "Sorry to hear that. We'd love to make it right, check your DMs."
+            elif "?" in comment:
+                text = "Great question! All the details are in the link in bio 💕"
+            else:
+                text = "Thank you so much! 💕"
+            replies.append({"text": text, "persona_alignment": 0.9, "safety_score": 0.99})
+        return replies
+
+
+@dataclass
+class ReplyItem:
+    """Outcome of one reply request: an output dict or the error it raised."""
+
+    index: int
+    output: dict[str, Any] | None = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class ReplyStats:
+    """Counters describing pipeline behaviour since creation."""
+
+    comments: int = 0
+    skipped: int = 0
+    liked: int = 0
+    template_hits: int = 0
+    generated: int = 0
+    generator_calls: int = 0
+    failed: int = 0
+
+    @property
+    def calls_avoided(self) -> int:
+        """Generator calls saved versus one call per comment."""
+        return self.comments - self.failed - self.generator_calls
+
+    def as_dict(self) -> dict[str, int]:
+        return {**asdict(self), "calls_avoided": self.calls_avoided}
+
+
+class ReplyPipeline:
+    """
+    Triage, template reuse and batched generation for ``reply`` actions.
+
+    Args:
+        generator: Reply generator used for comments that need a reply.
+        batch_size: Comments per generator call; defaults to the
+            generator's ``max_batch_size``.
+        max_concurrency: Generator calls in flight at once.
+        template_cache_size: Generated replies kept for reuse.
+        seen_size: Comment IDs remembered for re-delivery detection.
+    """
+
+    def __init__(
+        self,
+        generator: ReplyGenerator,
+        *,
+        batch_size: int | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        template_cache_size: int = DEFAULT_TEMPLATE_CACHE_SIZE,
+        seen_size: int = DEFAULT_SEEN_SIZE,
+    ):
+        self.generator = generator
+        self.batch_size = max(1, batch_size or generator.max_batch_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.template_cache_size = template_cache_size
+        self.seen_size = seen_size
+        self.stats = ReplyStats()
+        self._templates: OrderedDict[tuple[str, str, _Template], dict[str, Any]] = OrderedDict()
+        self._seen: OrderedDict[str, None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def process(self, inputs: Iterable[dict[str, Any]]) -> Iterator[ReplyItem]:
+        """
+        Reply to many comments.
+
+        Each input is an engagement_manager ``reply`` request with
+        ``comment_text`` and ``persona_id``. A failing request (invalid
+        input, generator error) only fails its own item and the comments
+        that shared its reply.
+
+        Yields:
+            One ReplyItem per input, in input order.
+        """
+        ready: dict[int, ReplyItem] = {}
+        # (persona_id, platform) -> (post_id, template key) -> indices sharing that reply.
+        waiting: dict[tuple[str, str], dict[_Template, list[int]]] = {}
+        comment_texts: dict[tuple[str, str, _Template], str] = {}
+        sentiments: dict[int, str] = {}
+        comment_ids: dict[int, str] = {}
+        started: dict[int, float] = {}
+        count = 0
+
+        with self._lock:
+            for index, input_data in enumerate(inputs):
+                count += 1
+                self.stats.comments += 1
+                started[index] = time.perf_counter()
+                with stage("engagement_manager.triage"):
+                    item = self._triage(index, input_data, sentiments, comment_ids)
+                if item is not None:
+                    ready[index] = item
+                    continue
+                parameters = input_data["parameters"]
+                group = (parameters["persona_id"], parameters["platform"])
+                key = (parameters.get("post_id", ""), template_key(parameters["comment_text"]))
+                template = self._templates.get((*group, key))
+                if template is not None:
+                    self._templates.move_to_end((*group, key))
+                    self.stats.template_hits += 1
+                    output = self._output(template, sentiments[index], started[index], True)
+                    ready[index] = ReplyItem(index, output)
+                    continue
+                keys = waiting.setdefault(group, {})
+                if key in keys:
+                    self.stats.template_hits += 1
+                else:
+                    comment_texts[(*group, key)] = parameters["comment_text"]
+                keys.setdefault(key, []).append(index)
+
+        chunks: list[_Chunk] = []
+        for (persona_id, platform), keys in waiting.items():
+            ordered = list(keys)
+            for start in range(0, len(ordered), self.batch_size):
+                chunk_keys = ordered[start : start + self.batch_size]
+                chunks.append(
+                    _Chunk(
+                        persona_id,
+                        platform,
+                        [comment_texts[(persona_id, platform, key)] for key in chunk_keys],
+                        {key: keys[key] for key in chunk_keys},
+                    )
+                )
+        # Submit in order of each chunk's first input so early items are not
+        # stuck behind later ones.
+        chunks.sort(key=lambda chunk: chunk.first_index)
+        chunk_of = {index: chunk for chunk in chunks for index in chunk.indices()}
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            for chunk in chunks:
+                chunk.future = pool.submit(self._generate, chunk)
+            for index in range(count):
+                if index not in ready:
+                    self._resolve(chunk_of[index], sentiments, comment_ids, started, ready)
+                yield ready.pop(index)
+
+    def _generate(self, chunk: "_Chunk") -> list[dict[str, Any] | BaseException]:
+        with stage("engagement_manager.generate"):
+            return self.generator.generate(chunk.persona_id, chunk.platform, chunk.comments)
+
+    def _triage(
+        self,
+        index: int,
+        input_data: dict[str, Any],
+        sentiments: dict[int, str],
+        comment_ids: dict[int, str],
+    ) -> ReplyItem | None:
+        """Settle a request without the generator, or return None if it needs a reply."""
+        error = check("engagement_manager", "input", input_data)
+        parameters = input_data.get("parameters", {}) if isinstance(input_data, dict) else {}
+        if error is None and parameters.get("action") != "reply":
+            error = "parameters.action: must be 'reply'"
+        if error is None and not (parameters.get("comment_text") and parameters.get("persona_id")):
+            error = "parameters: reply requires comment_text and persona_id"
+        if error is not None:
+            self.stats.failed += 1
+            return ReplyItem(index, error=ValueError(error))
+
+        comment_id = parameters.get("comment_id")
+        if comment_id is not None:
+            if comment_id in self._seen:
+                self.stats.skipped += 1
+                return ReplyItem(index, self._short_circuit("skipped", "duplicate", "neutral"))
+            self._seen[comment_id] = None
+            comment_ids[index] = comment_id
+            if len(self._seen) > self.seen_size:
+                self._seen.popitem(last=False)
+
+        text = parameters["comment_text"]
+        action, reason = triage(text)
+        sentiment = classify_sentiment(text)
+        sentiments[index] = sentiment
+        if action == "like" and sentiment == "negative":
+            action = "skipped"
+        if action == "skipped":
+            self.stats.skipped += 1
+            return ReplyItem(index, self._short_circuit("skipped", reason, sentiment))
+        if action == "like":
+            self.stats.liked += 1
+            return ReplyItem(index, self._short_circuit("like", reason, sentiment))
+        return None
+
+    def _resolve(
+        self,
+        chunk: "_Chunk",
+        sentiments: dict[int, str],
+        comment_ids: dict[int, str],
+        started: dict[int, float],
+        ready: dict[int, ReplyItem],
+    ) -> None:
+        try:
+            results = chunk.future.result()
+            if len(results) != len(chunk.waiting):
+                raise ValueError(
+                    f"reply generator returned {len(results)} replies for "
+                    f"{len(chunk.waiting)} comments"
+                )
+        except Exception as exc:
+            results = [exc] * len(chunk.waiting)
+        results = self._review(results, chunk.persona_id)
+
+        with self._lock:
+            self.stats.generator_calls += 1
+            for (key, indices), result in zip(chunk.waiting.items(), results, strict=True):
+                if isinstance(result, BaseException):
+                    self.stats.failed += len(indices)
+                    for index in indices:
+                        # Let a redelivery of a failed comment through.
+                        self._seen.pop(comment_ids.get(index), None)
+                        ready[index] = ReplyItem(index, error=result)
+                    continue
+                self.stats.generated += 1
+                self._remember((chunk.persona_id, chunk.platform, key), result)
+                for position, index in enumerate(indices):
+                    output = self._output(result, sentiments[index], started[index], position > 0)
+                    ready[index] = ReplyItem(index, output)
+
+    @staticmethod
+    def _review(
+        results: list[dict[str, Any] | BaseException], persona_id: str
+    ) -> list[dict[str, Any] | BaseException]:
+        """
+        Safety-scan each reply and, for a registered persona, score its alignment.
+
+        The reply's safety_score and persona_alignment are lowered to the
+        scan's and the persona registry's scores.
+        """
+        replies = [result for result in results if not isinstance(result, BaseException)]
+        texts = [reply["text"] for reply in replies]
+        with stage("engagement_manager.safety"):
+            scans = iter(get_engine().scan_many(texts))
+        alignments: Iterator[float | None] = itertools.repeat(None)
+        registry = get_registry()
+        if texts and persona_id in registry:
+            with stage("engagement_manager.persona"):
+                alignments = iter(registry.score(persona_id, texts).round(4).tolist())
+        reviewed: list[dict[str, Any] | BaseException] = []
+        for result in results:
+            if not isinstance(result, BaseException):
+                scan, alignment = next(scans), next(alignments)
+                result = {
+                    **result,
+                    "safety_score": min(result.get("safety_score", 1.0), scan.score),
+                    "safety_flags": scan.flags,
+                }
+                if alignment is not None:
+                    result["persona_alignment"] = min(
+                        result.get("persona_alignment", 1.0), alignment
+                    )
+            reviewed.append(result)
+        return reviewed
+
+    def _remember(self, key: tuple[str, str, _Template], reply: dict[str, Any]) -> None:
+        self._templates[key] = reply
+        self._templates.move_to_end(key)
+        while len(self._templates) > self.template_cache_size:
+            self._templates.popitem(last=False)
+
+    @staticmethod
+    def _output(
+        reply: Mapping[str, Any], sentiment: str, started: float, reused: bool
+    ) -> dict[str, Any]:
+        return {
+            "response": {
+                "text": reply["text"],
+                "action_taken": "reply",
+                "platform_response_id": f"resp_{uuid.uuid4().hex[:12]}",
+            },
+            "metadata": {
+                "sentiment_detected": sentiment,
+                "persona_alignment": reply.get("persona_alignment", 1.0),
+                "safety_score": reply.get("safety_score", 1.0),
+                "safety_flags": reply.get("safety_flags", []),
+                "response_time_ms": int((time.perf_counter() - started) * 1000),
+                "template_reused": reused,
+            },
+        }
+
+    @staticmethod
+    def _short_circuit(action: str, reason: str, sentiment: str) -> dict[str, Any]:
+        return {
+            "response": {"action_taken": action},
+            "metadata": {
+                "sentiment_detected": sentiment,
+                "persona_alignment": 1.0,
+                "safety_score": 1.0,
+                "response_time_ms": 0,
+                "triage_reason": reason,
+            },
+        }
+
+
+@dataclass
+class _Chunk:
+    persona_id: str
+    platform: str
+    comments: list[str]
+    waiting: dict[_Template, list[int]]
+    future: Future | None = None
+
+    @property
+    def first_index(self) -> int:
+        return min(indices[0] for indices in self.waiting.values())
+
+    def indices(self) -> Iterator[int]:
+        for indices in self.waiting.values():
+            yield from indices
@@ -0,0 +1,81 @@
+"""
+Lexicon sentiment for engagement_manager comments.
+
+Reference: skills/engagement_manager/output_schema.json (sentiment_detected),
+specs/functional.md (engagement analysis)
+
+A deliberately cheap classifier: a word and emoji lexicon with simple
+negation handling. It runs once per comment at ingest time, so it has to
+keep up with viral comment streams; replies themselves are written by the
+persona-aware generator, not by this module.
+"""
+
+import re
+from collections.abc import Iterable
+from typing import Literal
+
+Sentiment = Literal["positive", "neutral", "negative"]
+SENTIMENTS: tuple[Sentiment, ...] = ("positive", "neutral", "negative")
+
+POSITIVE_WORDS = frozenset(
+    """
+    love loved loving lovely amazing awesome beautiful best brilliant cool cute
+    excellent fantastic fire gorgeous great happy incredible like liked nice
+    obsessed perfect pretty slay stunning stylish super thanks thank wonderful
+    wow yes yay gem goals iconic
+    """.split()
+)
+NEGATIVE_WORDS = frozenset(
+    """
+    angry awful bad boring cheap disappointed disappointing disgusting fake
+    gross hate hated horrible meh overpriced poor sad scam terrible trash ugly
+    unfollow worse worst waste wrong ripoff cringe
+    """.split()
+)
+NEGATIONS = frozenset("not no never dont don't isnt isn't wasnt wasn't cant can't".split())
+POSITIVE_EMOJI = frozenset("😍🥰❤💕💖💯🔥👏🙌😊😁👍✨🤩💗💜💙💚🧡")
+NEGATIVE_EMOJI = frozenset("😡🤮👎😒😤💩😞😢😠🙄")
+
+_TOKEN = re.compile(r"[a-z']+|[^\w\s]", re.IGNORECASE)
+
+
+def sentiment_score(text: str) -> int:
+    """Positive minus negative lexicon hits, with negation flipping the next word."""
+    score = 0
+    negate = False
+    for token in _TOKEN.findall(text.lower()):
+        if token in NEGATIONS:
+            negate = True
+            continue
+        if token in POSITIVE_WORDS or token in POSITIVE_EMOJI:
+            score += -1 if negate else 1
+        elif token in NEGATIVE_WORDS or token in NEGATIVE_EMOJI:
+            score += 1 if negate else -1
+        negate = False
+    return score
+
+
+def classify_sentiment(text: str) -> Sentiment:
+    """Classify one comment as positive, neutral or negative."""
+    score = sentiment_score(text)
+    if score > 0:
+        return "positive"
+    if score < 0:
+        return "negative"
+    return "neutral"
+
+
+def dominant_sentiment(counts: Iterable[float]) -> str:
+    """
+    Overall sentiment of a (positive, neutral, negative) tally.
+
+    Returns ``mixed`` when positive and negative each hold at least 30%,
+    otherwise the largest share; ``neutral`` for an empty tally.
+    """
+    positive, neutral, negative = counts
+    total = positive + neutral + negative
+    if total == 0:
+        return "neutral"
+    if positive / total >= 0.3 and negative / total >= 0.3:
+        return "mixed"
+    return max(zip((positive, neutral, negative), SENTIMENTS, strict=True))[1]
@@ -1,21 +1,179 @@
 """
-Trend Fetcher Skill - Work in Progress
+Trend Fetcher Skill
 
-This module will implement trend analysis functionality.
-Currently a stub for TDD development.
+Fetches trending topics for a region/category from every configured source
+concurrently, served through a TTL cache.
+
+Reference: skills/trend_fetcher/README.md, specs/functional.md US-003
 """
 
-def fetch_trends(input_data):
+import asyncio
+from collections.abc import Coroutine, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from functools import partial
+from typing import Any, TypeVar
+
+from chimera.metrics import stage, timed
+from chimera.runtime.processes import run_cpu_stage
+from chimera.validation import validate_input
+
+from .cache import TrendCache, TrendKey, trend_key
+from .scoring import TopicBatch, score_topics
+from .sources import (
+    DEFAULT_DEADLINE_SECONDS,
+    DEFAULT_SOURCE_TIMEOUT_SECONDS,
+    RawTopic,
+    StaticSource,
+    TrendSource,
+    fan_out,
+)
+
+__all__ = [
+    "RawTopic",
+    "StaticSource",
+    "TrendCache",
+    "TrendSource",
+    "configure_sources",
+    "fetch_trends",
+    "get_cache",
+]
+
+DEFAULT_RELEVANCE_THRESHOLD = 0.75
+# Trends kept per cached snapshot; the long tail is never materialised.
+MAX_TRENDS = 100
+# Smaller batches are scored inline: pickling them to a worker process and
+# back costs more than scoring them.
+PROCESS_MIN_TOPICS = 2000
+
+_T = TypeVar("_T")
+
+_cache: TrendCache | None = None
+_sources: list[TrendSource] = []
+_source_timeout = DEFAULT_SOURCE_TIMEOUT_SECONDS
+_deadline = DEFAULT_DEADLINE_SECONDS
+
+
+def configure_sources(
+    sources: Sequence[TrendSource],
+    *,
+    source_timeout: float = DEFAULT_SOURCE_TIMEOUT_SECONDS,
+    deadline: float = DEFAULT_DEADLINE_SECONDS,
+) -> None:
+    """
+    Replace the sources queried by fetch_trends and clear cached results.
+
+    Args:
+        sources: Sources to fan out to on every cache miss.
+        source_timeout: Default per-source timeout in seconds.
+        deadline: Overall fan-out deadline in seconds.
+    """
+    global _sources, _source_timeout, _deadline
+    _sources = list(sources)
+    _source_timeout = source_timeout
+    _deadline = deadline
+    get_cache().invalidate()
+
+
+def _run(coro: Coroutine[Any, Any, _T]) -> _T:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # Called from inside an event loop: run the fan-out on a private loop.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+def _fetch_upstream(key: TrendKey) -> dict[str, Any]:
+    """
+    Fan out to every configured source, then merge and score what answers in time.
+
+    Confidence is the weighted fraction of sources that answered, so a
+    partial result is reported with proportionally lower confidence.
+    Scoring is CPU-bound. Batches of PROCESS_MIN_TOPICS observations or more
+    are scored in the configured process runner, if any.
+
+    Returns:
+        Dict with ``trends`` (sorted by relevance_score, descending),
+        ``fetched_at``, ``source_count``, ``confidence`` and
+        ``missing_sources``.
+    """
+    region, category, timeframe_hours = key
+    with stage("trend_fetcher.fan_out"):
+        result = _run(
+            fan_out(
+                _sources,
+                region,
+                category,
+                timeframe_hours,
+                source_timeout=_source_timeout,
+                deadline=_deadline,
+            )
+        )
+    batch = TopicBatch.from_raw(result.topics)
+    score = partial(
+        score_topics,
+        batch,
+        timeframe_hours,
+        answered_sources=len(result.answered),
+        limit=MAX_TRENDS,
+    )
+    with stage("trend_fetcher.score"):
+        trends = run_cpu_stage(score) if len(batch) >= PROCESS_MIN_TOPICS else score()
+    return {
+        "trends": trends,
+        "fetched_at": datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "source_count": len(result.answered),
+        "confidence": round(result.coverage, 4),
+        "missing_sources": result.missing,
+    }
+
+
+def get_cache() -> TrendCache:
+    """Return the process-wide trend cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        _cache = TrendCache(_fetch_upstream)
+    return _cache
+
+
+@timed("fetch_trends")
+def fetch_trends(input_data, *, cache: TrendCache | None = None):
     """
     Fetch trends based on input parameters.
-    
+
+    Upstream results are cached per (region, category, timeframe_hours);
+    relevance_threshold is applied after the cache lookup so callers with
+    different thresholds share one entry.
+
     Args:
         input_data: Dict with skill_name, parameters (region, category, etc.)
-        
+        cache: Cache to read through; defaults to the process-wide cache.
+
     Returns:
-        Dict with trends and metadata
-        
+        Dict with trends and metadata. ``metadata.cache`` carries the lookup
+        status and the cache's hit/miss/coalesced counters.
+
     Raises:
-        NotImplementedError: This skill is not yet implemented
+        SchemaValidationError: If input_data violates input_schema.json
     """
-    raise NotImplementedError("fetch_trends is not yet implemented")
+    validate_input("trend_fetcher", input_data)
+    parameters = input_data["parameters"]
+    cache = cache if cache is not None else get_cache()
+
+    snapshot, status = cache.get(trend_key(parameters))
+
+    threshold = parameters.get("relevance_threshold", DEFAULT_RELEVANCE_THRESHOLD)
+    trends = [trend for trend in snapshot["trends"] if trend["relevance_score"] >= threshold]
+    return {
+        "trends": trends,
+        "metadata": {
+            "fetched_at": snapshot["fetched_at"],
+            "source_count": snapshot["source_count"],
+            "confidence": snapshot["confidence"],
+            "missing_sources": snapshot.get("missing_sources", {}),
+            "cache_ttl": int(cache.ttl),
+            "cache": {"status": status, **cache.stats.as_dict()},
+        },
+    }
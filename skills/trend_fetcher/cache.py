@@ -0,0 +1,232 @@
+"""
+Trend result cache for the trend_fetcher skill.
+
+Reference: specs/functional.md US-003 ("Results cached for 15 minutes"),
+specs/technical.md §1.1 (cache_ttl: 900)
+
+Entries are keyed on the normalised (region, category, timeframe_hours)
+triple and hold the *unfiltered* trend snapshot, so callers with different
+relevance thresholds share one entry. The cache is a bounded LRU with:
+
+- TTL expiry (fresh for ``ttl`` seconds),
+- stale-while-revalidate (served for a further ``stale_ttl`` seconds while a
+  single background refresh runs),
+- single-flight loading (concurrent misses for one key wait on one upstream
+  fetch instead of each issuing their own),
+- degraded results kept briefly: a snapshot where some sources are listed in
+  ``missing_sources`` is fresh for only ``partial_ttl`` seconds, and one where
+  every source failed is returned to its caller but never stored.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 900.0
+DEFAULT_STALE_SECONDS = 300.0
+DEFAULT_PARTIAL_TTL_SECONDS = 60.0
+DEFAULT_MAXSIZE = 1024
+DEFAULT_TIMEFRAME_HOURS = 24
+
+TrendKey = tuple[str, str, int]
+Snapshot = dict[str, Any]
+Loader = Callable[[TrendKey], Snapshot]
+
+
+def trend_key(parameters: Mapping[str, Any]) -> TrendKey:
+    """
+    Normalise trend_fetcher parameters into a cache key.
+
+    Region and category are case- and whitespace-insensitive; a missing
+    timeframe_hours takes the schema default of 24.
+    """
+    return (
+        " ".join(str(parameters["region"]).split()).lower(),
+        " ".join(str(parameters["category"]).split()).lower(),
+        int(parameters.get("timeframe_hours", DEFAULT_TIMEFRAME_HOURS)),
+    )
+
+
+@dataclass
+class CacheStats:
+    """Monotonic counters describing cache behaviour since creation."""
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    stale: int = 0
+    refreshes: int = 0
+    refresh_failures: int = 0
+    evictions: int = 0
+    uncached: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+@dataclass
+class _Entry:
+    value: Snapshot
+    loaded_at: float
+    ttl: float
+
+
+class TrendCache:
+    """
+    Bounded LRU cache with TTL, stale-while-revalidate and single-flight loads.
+
+    Args:
+        loader: Fetches a fresh snapshot for a key. Called at most once at a
+            time per key.
+        maxsize: Maximum number of cached keys; least recently used keys are
+            evicted first.
+        ttl: Seconds an entry is served as fresh.
+        stale_ttl: Seconds after ``ttl`` during which the stale entry is still
+            served while a background refresh runs. 0 disables.
+        partial_ttl: Seconds a partial snapshot (some ``missing_sources``) is
+            served as fresh; capped at ``ttl``.
+        clock: Monotonic time source, injectable for tests.
+        executor: Runs background refreshes; a small private pool by default.
+    """
+
+    def __init__(
+        self,
+        loader: Loader,
+        *,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        stale_ttl: float = DEFAULT_STALE_SECONDS,
+        partial_ttl: float = DEFAULT_PARTIAL_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        executor: ThreadPoolExecutor | None = None,
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.loader = loader
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.partial_ttl = partial_ttl
+        self.stats = CacheStats()
+        self._clock = clock
+        self._executor = executor
+        self._entries: OrderedDict[TrendKey, _Entry] = OrderedDict()
+        self._inflight: dict[TrendKey, Future[Snapshot]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: TrendKey) -> tuple[Snapshot, str]:
+        """
+        Return the snapshot for ``key``, loading it if necessary.
+
+        Returns:
+            ``(snapshot, status)`` where status is one of ``"hit"``,
+            ``"stale"`` (served while refreshing), ``"coalesced"`` (waited on
+            another caller's load) or ``"miss"`` (this caller loaded it).
+
+        Raises:
+            Exception: Whatever the loader raised, for misses and coalesced
+                waits. Failed loads are not cached, and neither are snapshots
+                where every source failed.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = self._clock() - entry.loaded_at
+                if age < entry.ttl:
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return entry.value, "hit"
+                if age < entry.ttl + self.stale_ttl:
+                    self._entries.move_to_end(key)
+                    self.stats.stale += 1
+                    if key not in self._inflight:
+                        self._start_refresh(key)
+                    return entry.value, "stale"
+                del self._entries[key]
+
+            pending = self._inflight.get(key)
+            if pending is None:
+                self.stats.misses += 1
+                pending = Future()
+                self._inflight[key] = pending
+                owner = True
+            else:
+                self.stats.coalesced += 1
+                owner = False
+        if owner:
+            return self._load(key, pending), "miss"
+        return pending.result(), "coalesced"
+
+    def invalidate(self, key: TrendKey | None = None) -> None:
+        """Drop one key, or every entry when ``key`` is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def close(self) -> None:
+        """Wait for background refreshes and release the refresh pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def _load(self, key: TrendKey, pending: Future[Snapshot]) -> Snapshot:
+        try:
+            value = self.loader(key)
+        except BaseException as exc:
+            with self._lock:
+                self._inflight.pop(key, None)
+            pending.set_exception(exc)
+            raise
+        with self._lock:
+            self._store(key, value)
+            self._inflight.pop(key, None)
+        pending.set_result(value)
+        return value
+
+    def _start_refresh(self, key: TrendKey) -> None:
+        # Caller holds self._lock.
+        pending: Future[Snapshot] = Future()
+        self._inflight[key] = pending
+        self.stats.refreshes += 1
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="trend-refresh")
+        self._executor.submit(self._refresh, key, pending)
+
+    def _refresh(self, key: TrendKey, pending: Future[Snapshot]) -> None:
+        try:
+            self._load(key, pending)
+        except Exception:
+            with self._lock:
+                self.stats.refresh_failures += 1
+            logger.warning("Background trend refresh failed for %s", key, exc_info=True)
+
+    def _ttl_for(self, value: Snapshot) -> float:
+        if not value.get("missing_sources"):
+            return self.ttl
+        if not value.get("source_count"):
+            return 0.0
+        return min(self.partial_ttl, self.ttl)
+
+    def _store(self, key: TrendKey, value: Snapshot) -> None:
+        # Caller holds self._lock.
+        ttl = self._ttl_for(value)
+        if ttl <= 0:
+            # Nothing answered: keep any older entry and retry on the next get.
+            self.stats.uncached += 1
+            return
+        self._entries[key] = _Entry(value, self._clock(), ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
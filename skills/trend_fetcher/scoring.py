@@ -0,0 +1,191 @@
+"""
+Vectorised trend merging, de-duplication and scoring.
+
+Reference: skills/trend_fetcher/output_schema.json,
+skills/trend_fetcher/README.md (Output Contract)
+
+Raw observations from every source are held as parallel NumPy columns.
+Topics are normalised ("#SustainableFashion" and "sustainable fashion" map
+to the same key) and hashed once per distinct string; after that, grouping,
+volume totals, growth, source agreement and scores are computed in bulk.
+Only the top-k trends are materialised as dicts, selected with
+``argpartition`` rather than a full sort.
+"""
+
+import re
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from hashlib import blake2b
+
+import numpy as np
+
+from chimera.runtime.processes import cpu_bound
+
+from .sources import RawTopic
+
+# relevance_score = weighted blend of the normalised signals below.
+ENGAGEMENT_WEIGHT = 0.6
+AGREEMENT_WEIGHT = 0.25
+GROWTH_WEIGHT = 0.15
+
+_CAMEL_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+@lru_cache(maxsize=65536)
+def normalise_topic(topic: str) -> str:
+    """
+    Canonical form used to detect duplicate topics.
+
+    Strips hashtags and punctuation, splits camelCase and folds case, e.g.
+    ``"#SustainableFashion"`` -> ``"sustainable fashion"``.
+    """
+    text = _CAMEL_BOUNDARY.sub(" ", topic.replace("#", " "))
+    return " ".join(_NON_WORD.sub(" ", text).split()).lower()
+
+
+@lru_cache(maxsize=65536)
+def topic_hash(topic: str) -> int:
+    """Stable 63-bit hash of a topic's normalised form."""
+    digest = blake2b(normalise_topic(topic).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little") >> 1
+
+
+@dataclass
+class TopicBatch:
+    """Raw topic observations as parallel columns."""
+
+    topics: list[str]
+    hashes: np.ndarray
+    volumes: np.ndarray
+    observed_at: np.ndarray
+    source_ids: np.ndarray
+    source_uris: list[str]
+
+    def __len__(self) -> int:
+        return len(self.topics)
+
+    @classmethod
+    def from_raw(cls, raw: Sequence[RawTopic]) -> "TopicBatch":
+        """Build columns from source observations."""
+        uri_ids: dict[str, int] = {}
+        topics = [item.topic for item in raw]
+        return cls(
+            topics=topics,
+            hashes=np.fromiter(map(topic_hash, topics), dtype=np.int64, count=len(raw)),
+            volumes=np.fromiter((item.volume for item in raw), dtype=np.float64, count=len(raw)),
+            observed_at=np.fromiter(
+                (item.observed_at for item in raw), dtype=np.float64, count=len(raw)
+            ),
+            source_ids=np.fromiter(
+                (uri_ids.setdefault(item.source, len(uri_ids)) for item in raw),
+                dtype=np.int64,
+                count=len(raw),
+            ),
+            source_uris=list(uri_ids),
+        )
+
+
+def _format_growth(rate: float) -> str:
+    return f"{rate:+.0%}"
+
+
+@cpu_bound
+def score_topics(
+    batch: TopicBatch,
+    timeframe_hours: int,
+    *,
+    answered_sources: int | None = None,
+    limit: int | None = None,
+    now: float | None = None,
+) -> list[dict]:
+    """
+    Merge duplicate topics and score them.
+
+    Signals per merged topic:
+
+    - engagement_score: log-scaled total volume relative to the top topic.
+    - growth_rate: volume share in the recent half of the window versus the
+      older half, in [-100%, +100%].
+    - source agreement: fraction of answering sources reporting the topic.
+
+    Args:
+        batch: Raw observations.
+        timeframe_hours: Observations older than this are ignored.
+        answered_sources: Denominator for source agreement; defaults to the
+            number of distinct sources in the batch.
+        limit: Return only the ``limit`` most relevant trends.
+        now: Reference epoch time, for tests.
+
+    Returns:
+        Trend dicts matching output_schema.json, sorted by relevance_score
+        descending.
+    """
+    if limit is not None and limit <= 0:
+        return []
+    now = time.time() if now is None else now
+    window = timeframe_hours * 3600.0
+    keep = np.flatnonzero(batch.observed_at >= now - window)
+    if keep.size == 0:
+        return []
+
+    hashes = batch.hashes[keep]
+    volumes = batch.volumes[keep]
+    recent = batch.observed_at[keep] >= now - window / 2
+    source_ids = batch.source_ids[keep]
+
+    _, groups = np.unique(hashes, return_inverse=True)
+    n_groups = int(groups.max()) + 1
+
+    total = np.bincount(groups, weights=volumes, minlength=n_groups)
+    recent_volume = np.bincount(groups, weights=volumes * recent, minlength=n_groups)
+    older_volume = total - recent_volume
+    growth = np.divide(
+        recent_volume - older_volume,
+        total,
+        out=np.zeros(n_groups),
+        where=total > 0,
+    )
+
+    n_sources = len(batch.source_uris)
+    pairs = np.unique(groups * n_sources + source_ids)
+    pair_groups, pair_sources = np.divmod(pairs, n_sources)
+    agreement = np.bincount(pair_groups, minlength=n_groups) / max(answered_sources or n_sources, 1)
+
+    peak = np.log1p(total.max())
+    engagement = np.log1p(total) / peak if peak > 0 else np.zeros(n_groups)
+    relevance = (
+        ENGAGEMENT_WEIGHT * engagement
+        + AGREEMENT_WEIGHT * np.minimum(agreement, 1.0)
+        + GROWTH_WEIGHT * (growth + 1.0) / 2.0
+    )
+
+    if limit is not None and limit < n_groups:
+        top = np.argpartition(-relevance, limit - 1)[:limit]
+        top = top[np.argsort(-relevance[top], kind="stable")]
+    else:
+        top = np.argsort(-relevance, kind="stable")
+
+    # Display form: the highest-volume spelling within each group.
+    order = np.lexsort((-volumes, groups))
+    starts = np.r_[0, np.flatnonzero(np.diff(groups[order])) + 1]
+    representative = keep[order[starts]]
+    pair_starts = np.searchsorted(pair_groups, top)
+    pair_ends = np.searchsorted(pair_groups, top, side="right")
+
+    engagement = np.round(np.clip(engagement, 0.0, 1.0), 4)
+    relevance = np.round(np.clip(relevance, 0.0, 1.0), 4)
+    trends = []
+    for group, start, end in zip(top.tolist(), pair_starts.tolist(), pair_ends.tolist()):
+        trends.append(
+            {
+                "topic": batch.topics[representative[group]].lstrip("#"),
+                "engagement_score": float(engagement[group]),
+                "growth_rate": _format_growth(float(growth[group])),
+                "sources": sorted(batch.source_uris[i] for i in pair_sources[start:end].tolist()),
+                "relevance_score": float(relevance[group]),
+            }
+        )
+    return trends
@@ -0,0 +1,187 @@
+"""
+Trend sources and concurrent fan-out for the trend_fetcher skill.
+
+Reference: skills/trend_fetcher/README.md (MCP Resources Used, Error Handling),
+specs/technical.md §4.1 (Resources), §6.1 (Trend fetch P95 1s / P99 2s)
+
+All configured sources are queried concurrently on one event loop, so the
+fan-out costs the latency of the slowest source rather than the sum. Each
+source gets its own timeout and the whole fan-out is capped by an overall
+deadline; sources that fail or miss their deadline are reported as missing
+and the caller scales confidence down accordingly.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Protocol
+
+# P95 trend-fetch target: no single upstream may hold a request longer.
+DEFAULT_SOURCE_TIMEOUT_SECONDS = 1.0
+# P99 trend-fetch target: hard cap for the whole fan-out.
+DEFAULT_DEADLINE_SECONDS = 2.0
+
+
+@dataclass(frozen=True, slots=True)
+class RawTopic:
+    """A single topic observation reported by one source."""
+
+    topic: str
+    volume: int
+    source: str
+    observed_at: float
+
+
+class TrendSource(Protocol):
+    """
+    An upstream that reports raw topics for a region/category.
+
+    ``weight`` expresses how much the source contributes to confidence;
+    ``timeout`` overrides the fan-out's per-source timeout when set.
+    """
+
+    name: str
+    weight: float
+    timeout: float | None
+
+    def uri(self, region: str, category: str) -> str: ...
+
+    async def fetch(self, region: str, category: str, timeframe_hours: int) -> list[RawTopic]: ...
+
+
+@dataclass
+class FanOutResult:
+    """Topics gathered from the sources that answered in time."""
+
+    topics: list[RawTopic] = field(default_factory=list)
+    answered: list[str] = field(default_factory=list)
+    missing: dict[str, str] = field(default_factory=dict)
+    answered_weight: float = 0.0
+    total_weight: float = 0.0
+
+    @property
+    def coverage(self) -> float:
+        """Weighted fraction of sources that answered (0.0 when none configured)."""
+        return self.answered_weight / self.total_weight if self.total_weight else 0.0
+
+
+class StaticSource:
+    """
+    Local stand-in source returning canned topics after a simulated latency.
+
+    Used offline in tests and benchmarks in place of an MCP resource.
+
+    Args:
+        name: Source name, e.g. ``"twitter"``.
+        uri_template: MCP resource URI with ``{region}``/``{category}`` fields.
+        topics: ``(topic, volume)`` or ``(topic, volume, age_seconds)``
+            tuples, or a callable ``(region, category, timeframe_hours)``
+            returning them.
+        latency: Seconds to wait before answering.
+        error: Exception raised instead of answering, for fault injection.
+        weight: Contribution to confidence.
+        timeout: Per-source timeout override.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        uri_template: str,
+        topics: Sequence[tuple] | Callable[[str, str, int], Iterable[tuple]] = (),
+        *,
+        latency: float = 0.0,
+        error: BaseException | None = None,
+        weight: float = 1.0,
+        timeout: float | None = None,
+    ):
+        self.name = name
+        self.uri_template = uri_template
+        self.topics = topics
+        self.latency = latency
+        self.error = error
+        self.weight = weight
+        self.timeout = timeout
+        self.calls = 0
+
+    def uri(self, region: str, category: str) -> str:
+        return self.uri_template.format(region=region, category=category)
+
+    async def fetch(self, region: str, category: str, timeframe_hours: int) -> list[RawTopic]:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.error is not None:
+            raise self.error
+        rows = self.topics
+        if callable(rows):
+            rows = rows(region, category, timeframe_hours)
+        uri = self.uri(region, category)
+        now = time.time()
+        return [
+            RawTopic(row[0], int(row[1]), uri, now - (row[2] if len(row) > 2 else 0.0))
+            for row in rows
+        ]
+
+
+async def _fetch_one(
+    source: TrendSource, region: str, category: str, timeframe_hours: int, timeout: float
+) -> list[RawTopic]:
+    limit = source.timeout if source.timeout is not None else timeout
+    return await asyncio.wait_for(source.fetch(region, category, timeframe_hours), limit)
+
+
+async def fan_out(
+    sources: Sequence[TrendSource],
+    region: str,
+    category: str,
+    timeframe_hours: int,
+    *,
+    source_timeout: float = DEFAULT_SOURCE_TIMEOUT_SECONDS,
+    deadline: float = DEFAULT_DEADLINE_SECONDS,
+) -> FanOutResult:
+    """
+    Query every source concurrently and keep whatever answers in time.
+
+    Args:
+        sources: Sources to query.
+        region: Normalised region.
+        category: Normalised category.
+        timeframe_hours: Trend window.
+        source_timeout: Default per-source timeout in seconds.
+        deadline: Overall cap in seconds; sources still running are cancelled.
+
+    Returns:
+        FanOutResult with the gathered topics and, per missing source, the
+        reason (``"timeout"``, ``"deadline"`` or the error type).
+    """
+    result = FanOutResult(total_weight=sum(source.weight for source in sources))
+    if not sources:
+        return result
+
+    tasks = {
+        asyncio.ensure_future(
+            _fetch_one(source, region, category, timeframe_hours, source_timeout)
+        ): source
+        for source in sources
+    }
+    done, pending = await asyncio.wait(tasks, timeout=deadline)
+    for task in pending:
+        task.cancel()
+        result.missing[tasks[task].name] = "deadline"
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    for task, source in tasks.items():
+        if task not in done:
+            continue
+        error = task.exception()
+        if isinstance(error, asyncio.TimeoutError):
+            result.missing[source.name] = "timeout"
+        elif error is not None:
+            result.missing[source.name] = type(error).__name__
+        else:
+            result.topics.extend(task.result())
+            result.answered.append(source.name)
+            result.answered_weight += source.weight
+    return result
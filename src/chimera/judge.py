@@ -0,0 +1,315 @@
+"""
+Judge fast path: confidence routing over the Review Queue.
+
+Reference: specs/functional.md US-011, specs/technical.md §3.2 (Review Queue Message),
+docs/SRS.md §5.1 (NFR 1.1, 1.2)
+
+Routing rules:
+- confidence > 0.90: approve
+- 0.70 <= confidence <= 0.90: hitl
+- confidence < 0.70: reject (the Planner retries)
+- Sensitive topics always go to HITL.
+
+Clear approvals are also held back for a human when their safety score
+or persona alignment is weak, or when the validator raised any flag.
+Messages that cannot be read go to HITL rather than being dropped.
+
+Review messages are judged in micro-batches. The numeric fields are
+pulled into NumPy arrays, and every rule is evaluated for the whole batch
+at once with ``np.select``. The only per-message Python work is reading
+the fields. ``route_one`` is the scalar form of the same rules, for
+single messages and as the reference in tests.
+"""
+
+import asyncio
+import math
+import time
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+ROUTES = ("approve", "hitl", "reject")
+APPROVE, HITL, REJECT = range(3)
+
+REASONS = (
+    "confident",
+    "review_band",
+    "low_confidence",
+    "low_safety",
+    "low_alignment",
+    "flagged",
+    "sensitive",
+    "invalid",
+)
+(
+    CONFIDENT,
+    REVIEW_BAND,
+    LOW_CONFIDENCE,
+    LOW_SAFETY,
+    LOW_ALIGNMENT,
+    FLAGGED,
+    SENSITIVE,
+    INVALID,
+) = range(len(REASONS))
+
+# Flags that always need a human, whatever the confidence (SRS NFR 1.2).
+SENSITIVE_FLAGS = frozenset(
+    {"sensitive_topic", "politics", "health_advice", "financial_advice", "legal_claims"}
+)
+
+Sink = Callable[[list[dict[str, Any]]], Any]
+
+
+@dataclass(frozen=True)
+class Thresholds:
+    """Routing thresholds; the confidence bands follow US-011."""
+
+    auto_approve: float = 0.90
+    reject_below: float = 0.70
+    min_safety: float = 0.90
+    min_alignment: float = 0.70
+    sensitive_flags: frozenset[str] = SENSITIVE_FLAGS
+
+
+# Value types the batch path converts directly; anything else (bool, numeric
+# strings, numpy scalars, None) goes through _number one message at a time.
+_REAL_TYPES = frozenset({int, float})
+
+
+def _number(value: Any) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return math.nan
+
+
+def _fields(message: Any) -> tuple[float, float, float, Any]:
+    try:
+        validation = message.get("validation") or {}
+        return (
+            _number(message["result"]["confidence"]),
+            _number(validation.get("safety_score")),
+            _number(validation.get("persona_alignment")),
+            validation.get("flags") or (),
+        )
+    except (AttributeError, KeyError, TypeError):
+        return math.nan, math.nan, math.nan, ()
+
+
+def route_one(message: dict[str, Any], thresholds: Thresholds = Thresholds()) -> tuple[str, str]:
+    """
+    Route a single review message.
+
+    Returns:
+        ``(route, reason)``, e.g. ``("hitl", "review_band")``.
+    """
+    confidence, safety, alignment, flags = _fields(message)
+    if not set(flags).isdisjoint(thresholds.sensitive_flags):
+        return "hitl", "sensitive"
+    if math.isnan(confidence):
+        return "hitl", "invalid"
+    if confidence < thresholds.reject_below:
+        return "reject", "low_confidence"
+    if confidence <= thresholds.auto_approve:
+        return "hitl", "review_band"
+    if not safety >= thresholds.min_safety:
+        return "hitl", "low_safety"
+    if not alignment >= thresholds.min_alignment:
+        return "hitl", "low_alignment"
+    if flags:
+        return "hitl", "flagged"
+    return "approve", "confident"
+
+
+@dataclass
+class RoutedBatch:
+    """Routes for one micro-batch, as arrays aligned with ``messages``."""
+
+    messages: Sequence[dict[str, Any]]
+    routes: np.ndarray
+    reasons: np.ndarray
+
+    def indices(self, route: str) -> np.ndarray:
+        """Positions of the messages sent to ``route``."""
+        return np.flatnonzero(self.routes == ROUTES.index(route))
+
+    def select(self, route: str) -> list[dict[str, Any]]:
+        """The messages sent to ``route``, in batch order."""
+        return [self.messages[i] for i in self.indices(route)]
+
+    def decisions(self) -> list[dict[str, Any]]:
+        """Per-message ``{task_id, route, reason}`` records."""
+        return [
+            {
+                "task_id": message.get("task_id") if isinstance(message, dict) else None,
+                "route": ROUTES[route],
+                "reason": REASONS[reason],
+            }
+            for message, route, reason in zip(
+                self.messages, self.routes.tolist(), self.reasons.tolist(), strict=True
+            )
+        ]
+
+
+@dataclass
+class JudgeStats:
+    """Per-route and per-reason counters since creation."""
+
+    batches: int = 0
+    messages: int = 0
+    routes: dict[str, int] = field(default_factory=lambda: dict.fromkeys(ROUTES, 0))
+    reasons: dict[str, int] = field(default_factory=lambda: dict.fromkeys(REASONS, 0))
+    busy_seconds: float = 0.0
+
+    @property
+    def hitl_rate(self) -> float:
+        return self.routes["hitl"] / self.messages if self.messages else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "messages": self.messages,
+            "routes": dict(self.routes),
+            "reasons": dict(self.reasons),
+            "hitl_rate": round(self.hitl_rate, 4),
+            "messages_per_busy_second": (
+                round(self.messages / self.busy_seconds) if self.busy_seconds else 0
+            ),
+        }
+
+
+class Judge:
+    """
+    Routes Review Queue messages in micro-batches.
+
+    Args:
+        thresholds: Routing thresholds.
+        sinks: Route name to a callable receiving that route's messages as
+            a list, once per batch (sync or async). Routes without a sink
+            are only counted.
+        batch_size: Largest micro-batch.
+        max_wait: Seconds ``consume`` waits for a small batch to fill.
+    """
+
+    def __init__(
+        self,
+        thresholds: Thresholds = Thresholds(),
+        *,
+        sinks: Mapping[str, Sink] | None = None,
+        batch_size: int = 512,
+        max_wait: float = 0.002,
+    ):
+        unknown = set(sinks or ()) - set(ROUTES)
+        if unknown:
+            raise ValueError(f"Unknown routes: {sorted(unknown)}")
+        self.thresholds = thresholds
+        self.sinks = dict(sinks or {})
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.stats = JudgeStats()
+
+    def route(self, messages: Sequence[dict[str, Any]]) -> RoutedBatch:
+        """Route a batch of review messages and update the counters."""
+        started = time.perf_counter()
+        count = len(messages)
+        confidence, safety, alignment, flags = self._columns(messages)
+        flagged = np.fromiter(map(bool, flags), bool, count)
+        sensitive = np.zeros(count, dtype=bool)
+        sensitive_flags = self.thresholds.sensitive_flags
+        for i in np.flatnonzero(flagged):
+            sensitive[i] = not sensitive_flags.isdisjoint(flags[i])
+
+        t = self.thresholds
+        # NaN compares false everywhere, so unreadable fields never approve.
+        reasons = np.select(
+            [
+                sensitive,
+                np.isnan(confidence),
+                confidence < t.reject_below,
+                confidence <= t.auto_approve,
+                ~(safety >= t.min_safety),
+                ~(alignment >= t.min_alignment),
+                flagged,
+            ],
+            [SENSITIVE, INVALID, LOW_CONFIDENCE, REVIEW_BAND, LOW_SAFETY, LOW_ALIGNMENT, FLAGGED],
+            default=CONFIDENT,
+        ).astype(np.int8)
+        routes = np.full(count, HITL, dtype=np.int8)
+        routes[reasons == CONFIDENT] = APPROVE
+        routes[reasons == LOW_CONFIDENCE] = REJECT
+
+        self.stats.batches += 1
+        self.stats.messages += count
+        for route, n in enumerate(np.bincount(routes, minlength=len(ROUTES)).tolist()):
+            self.stats.routes[ROUTES[route]] += n
+        for reason, n in enumerate(np.bincount(reasons, minlength=len(REASONS)).tolist()):
+            self.stats.reasons[REASONS[reason]] += n
+        self.stats.busy_seconds += time.perf_counter() - started
+        return RoutedBatch(messages, routes, reasons)
+
+    @staticmethod
+    def _columns(
+        messages: Sequence[dict[str, Any]],
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, list[Any]]:
+        count = len(messages)
+        try:
+            validations = [message["validation"] for message in messages]
+            values = [
+                [message["result"]["confidence"] for message in messages],
+                [v["safety_score"] for v in validations],
+                [v["persona_alignment"] for v in validations],
+            ]
+            # np.float64 would accept "0.99" and True; _number rejects both.
+            if not all(_REAL_TYPES.issuperset(map(type, column)) for column in values):
+                raise TypeError("non-numeric score")
+            confidence, safety, alignment = np.array(values, dtype=np.float64).reshape(3, count)
+            flags = [v.get("flags") or () for v in validations]
+            return confidence, safety, alignment, flags
+        except (AttributeError, KeyError, TypeError, ValueError):
+            # Some message is malformed: read them one by one instead.
+            columns = [_fields(message) for message in messages]
+            numbers = np.array([c[:3] for c in columns], dtype=np.float64).reshape(count, 3)
+            return (*numbers.T, [c[3] for c in columns])
+
+    async def dispatch(self, batch: RoutedBatch) -> None:
+        """Hand each route's messages to its sink."""
+        for name, sink in self.sinks.items():
+            selected = batch.select(name)
+            if selected:
+                result = sink(selected)
+                if asyncio.iscoroutine(result):
+                    await result
+
+    async def consume(self, queue: asyncio.Queue[dict[str, Any] | None]) -> None:
+        """
+        Judge messages from ``queue`` until it yields ``None``.
+
+        Whatever is already queued is taken as one batch, up to
+        ``batch_size``. A small batch waits up to ``max_wait`` for more
+        messages.
+        """
+        while True:
+            first = await queue.get()
+            if first is None:
+                return
+            batch, stop = self._drain(queue, [first])
+            if not stop and len(batch) < self.batch_size and self.max_wait > 0:
+                await asyncio.sleep(self.max_wait)
+                batch, stop = self._drain(queue, batch)
+            await self.dispatch(self.route(batch))
+            if stop:
+                return
+
+    def _drain(
+        self, queue: asyncio.Queue[dict[str, Any] | None], batch: list[dict[str, Any]]
+    ) -> tuple[list[dict[str, Any]], bool]:
+        while len(batch) < self.batch_size:
+            try:
+                message = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if message is None:
+                return batch, True
+            batch.append(message)
+        return batch, False
@@ -0,0 +1,487 @@
+"""
+Per-agent wallet budget ledger with in-memory running totals.
+
+Reference: specs/technical.md §1.4 (get_balance: daily_spend, daily_limit),
+§1.2 (budget_limit_usdc), §6.3 (daily budget per agent: $50 USDC, block
+transactions), docs/SRS.md §4.5 (budget_check)
+
+Content generation and transfers check the agent's daily spend against
+its limit before they run. Asking the chain or a database each time
+would add a round trip to every check. The ledger keeps each agent's
+spend for the current UTC day in memory, so a check is a dict lookup.
+
+Concurrent tasks are kept from jointly overspending by reserve, then
+commit or release:
+
+    reservation = ledger.reserve(agent_id, 2.50)  # raises BudgetExceededError
+    try:
+        receipt = await send_payment(...)
+    except Exception:
+        ledger.release(reservation)
+        raise
+    ledger.commit(reservation, receipt.amount, ref=receipt.tx_hash)
+
+Reserved amounts count against the limit until they are committed or
+released. Amounts are held as integer micro-USDC (USDC has 6 decimals),
+so totals do not drift.
+
+Committed spend is appended to a journal, one JSON-lines file per UTC
+day. A background thread writes and fsyncs pending lines in batches
+(group commit). ``commit(durable=True)`` waits until the record is on
+disk. On start-up, only today's file is replayed. Reservations are not
+journaled: a reservation that was open at a crash belongs to a task
+that died with the process.
+"""
+
+import itertools
+import json
+import os
+import threading
+import time
+import zlib
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from decimal import ROUND_HALF_UP, Decimal
+from pathlib import Path
+from typing import Any
+
+DAILY_LIMIT_USDC = 50.0
+MICROS = 1_000_000
+
+Amount = float | int | str | Decimal
+
+
+class BudgetExceededError(RuntimeError):
+    """Raised when spending would take an agent over its daily budget."""
+
+    def __init__(self, agent_id: str, requested: float, remaining: float):
+        self.agent_id = agent_id
+        self.requested = requested
+        self.remaining = remaining
+        super().__init__(
+            f"Agent {agent_id!r} daily budget exceeded: job needs ${requested:.2f}, "
+            f"${max(remaining, 0.0):.2f} left"
+        )
+
+
+def to_micros(amount: Amount) -> int:
+    """USDC amount (number or decimal string) as integer micro-USDC."""
+    if isinstance(amount, int):
+        return amount * MICROS
+    value = Decimal(str(amount)) if isinstance(amount, float) else Decimal(amount)
+    return int((value * MICROS).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def _usdc(micros: int) -> float:
+    return micros / MICROS
+
+
+def _format(micros: int) -> str:
+    return f"{Decimal(micros) / MICROS:.2f}"
+
+
+@dataclass(frozen=True)
+class Reservation:
+    """A hold on part of an agent's budget for one UTC day."""
+
+    id: int
+    agent_id: str
+    micros: int
+    day: str
+
+    @property
+    def amount_usdc(self) -> float:
+        return _usdc(self.micros)
+
+
+@dataclass
+class LedgerStats:
+    """Ledger counters since creation."""
+
+    checks: int = 0
+    reservations: int = 0
+    rejected: int = 0
+    commits: int = 0
+    releases: int = 0
+    journal_syncs: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class _Account:
+    __slots__ = ("day", "spent", "reserved", "open")
+
+    def __init__(self, day: str):
+        self.day = day
+        self.spent = 0
+        self.reserved = 0
+        self.open: dict[int, int] = {}
+
+
+class Journal:
+    """
+    Append-only spend journal, one JSON-lines file per UTC day.
+
+    Args:
+        directory: Journal directory; created if missing.
+        sync_interval: Longest a record waits before its batch is fsynced.
+        sync_batch: Pending records that trigger a sync straight away.
+    """
+
+    def __init__(
+        self, directory: str | Path, *, sync_interval: float = 0.01, sync_batch: int = 512
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.sync_interval = sync_interval
+        self.sync_batch = sync_batch
+        self.syncs = 0
+        self._pending: list[tuple[str, bytes]] = []
+        self._appended = 0
+        self._synced = 0
+        # (first seq, last seq, error) of batches that failed to write.
+        self._failures: list[tuple[int, int, Exception]] = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self._files: dict[str, Any] = {}
+        self._thread = threading.Thread(target=self._sync_loop, name="ledger-journal", daemon=True)
+        self._thread.start()
+
+    def path(self, day: str) -> Path:
+        return self.directory / f"spend-{day}.jsonl"
+
+    def append(self, day: str, record: Mapping[str, Any]) -> int:
+        """Queue a record for ``day``; returns its sequence number."""
+        line = json.dumps(record, separators=(",", ":")).encode() + b"\n"
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Journal is closed")
+            self._pending.append((day, line))
+            self._appended += 1
+            # Wake the sync thread to open a batch, or to flush a full one.
+            if len(self._pending) in (1, self.sync_batch):
+                self._cond.notify_all()
+            return self._appended
+
+    def wait(self, seq: int, timeout: float | None = None) -> bool:
+        """
+        Block until record ``seq`` is fsynced; False on timeout.
+
+        Raises:
+            OSError: If the batch holding the record failed to write.
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._synced >= seq, timeout):
+                return False
+            for first, last, error in self._failures:
+                if first <= seq <= last:
+                    raise OSError(f"journal write failed for record {seq}") from error
+            return True
+
+    def replay(self, day: str) -> Iterator[dict[str, Any]]:
+        """Records journaled for ``day``; a torn final line is skipped."""
+        path = self.path(day)
+        if not path.exists():
+            return
+        with open(path, "rb") as file:
+            for line in file:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+    def _sync_loop(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._closed or self._pending)
+                # Group commit: gather records for up to sync_interval.
+                self._cond.wait_for(
+                    lambda: self._closed or len(self._pending) >= self.sync_batch,
+                    self.sync_interval,
+                )
+                batch, self._pending = self._pending, []
+                target, closed = self._appended, self._closed
+            error = None
+            if batch:
+                try:
+                    self._write(batch)
+                except Exception as exc:
+                    # Not retried: a partly written batch would be counted
+                    # twice on replay. Waiters get the error instead.
+                    error = exc
+                    self._close_files()
+            with self._cond:
+                if error is not None:
+                    self._failures.append((self._synced + 1, target, error))
+                self._synced = max(self._synced, target)
+                self._cond.notify_all()
+            if closed:
+                return
+
+    def _write(self, batch: list[tuple[str, bytes]]) -> None:
+        days: dict[str, list[bytes]] = {}
+        for day, line in batch:
+            days.setdefault(day, []).append(line)
+        for day, lines in days.items():
+            file = self._files.get(day)
+            if file is None:
+                for old in self._files.values():
+                    old.close()
+                self._files = {day: open(self.path(day), "ab")}  # noqa: SIM115
+                file = self._files[day]
+            file.write(b"".join(lines))
+            file.flush()
+            os.fsync(file.fileno())
+        self.syncs += 1
+
+    def close(self) -> None:
+        """Sync everything pending and stop the sync thread."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        self._close_files()
+
+    def _close_files(self) -> None:
+        files, self._files = self._files, {}
+        for file in files.values():
+            try:
+                file.close()
+            except OSError:
+                pass
+
+
+class Ledger:
+    """
+    Daily spend per agent: O(1) budget checks, reservations and a journal.
+
+    Thread-safe; agents are spread over striped locks, so checks for
+    different agents rarely contend.
+
+    Args:
+        journal: Directory for the spend journal (or a Journal); None keeps
+            the ledger in memory only.
+        daily_limit_usdc: Default per-agent daily limit.
+        limits: Per-agent limits overriding the default.
+        clock: Wall clock; days roll over at UTC midnight.
+        stripes: Number of account locks.
+    """
+
+    def __init__(
+        self,
+        journal: str | Path | Journal | None = None,
+        *,
+        daily_limit_usdc: Amount = DAILY_LIMIT_USDC,
+        limits: Mapping[str, Amount] | None = None,
+        clock: Callable[[], float] = time.time,
+        stripes: int = 64,
+    ):
+        self.journal = journal if isinstance(journal, Journal | None) else Journal(journal)
+        self.daily_limit = to_micros(daily_limit_usdc)
+        self._limits = {agent: to_micros(limit) for agent, limit in (limits or {}).items()}
+        self.clock = clock
+        self.stats = LedgerStats()
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._accounts: dict[str, _Account] = {}
+        self._ids = itertools.count(1)
+        self._replayed_day = ""
+        self._replay_lock = threading.Lock()
+
+    def _today(self) -> str:
+        return datetime.fromtimestamp(self.clock(), tz=UTC).date().isoformat()
+
+    def _day(self) -> str:
+        """Today's date, replaying today's journal the first time it is seen."""
+        day = self._today()
+        if day != self._replayed_day:
+            self._replay(day)
+        return day
+
+    def _lock(self, agent_id: str) -> threading.Lock:
+        return self._locks[zlib.crc32(agent_id.encode()) % len(self._locks)]
+
+    def _account(self, agent_id: str, day: str) -> _Account:
+        """The agent's current account; the caller holds the agent's lock."""
+        account = self._accounts.get(agent_id)
+        if account is None:
+            account = self._accounts[agent_id] = _Account(day)
+        elif account.day < day:
+            # Day boundary: yesterday's spend and holds no longer count.
+            account.day, account.spent, account.reserved = day, 0, 0
+            account.open.clear()
+        return account
+
+    def _replay(self, day: str) -> None:
+        with self._replay_lock:
+            if day <= self._replayed_day:
+                return
+            totals: dict[str, int] = {}
+            for record in self.journal.replay(day) if self.journal is not None else ():
+                totals[record["agent"]] = totals.get(record["agent"], 0) + record["micros"]
+            for lock in self._locks:
+                lock.acquire()
+            try:
+                for agent_id, spent in totals.items():
+                    self._account(agent_id, day).spent = spent
+                self._replayed_day = day
+            finally:
+                for lock in self._locks:
+                    lock.release()
+
+    def limit(self, agent_id: str) -> float:
+        return _usdc(self._limits.get(agent_id, self.daily_limit))
+
+    def set_limit(self, agent_id: str, daily_limit_usdc: Amount) -> None:
+        self._limits[agent_id] = to_micros(daily_limit_usdc)
+
+    def _remaining(self, agent_id: str, account: _Account) -> int:
+        return self._limits.get(agent_id, self.daily_limit) - account.spent - account.reserved
+
+    def check(self, agent_id: str, amount: Amount) -> bool:
+        """Whether ``amount`` fits in what the agent has left today (nothing is held)."""
+        micros, day = to_micros(amount), self._day()
+        with self._lock(agent_id):
+            self.stats.checks += 1
+            return micros <= self._remaining(agent_id, self._account(agent_id, day))
+
+    def remaining(self, agent_id: str) -> float:
+        """Budget left today after committed and reserved spend."""
+        day = self._day()
+        with self._lock(agent_id):
+            return _usdc(self._remaining(agent_id, self._account(agent_id, day)))
+
+    def spent_today(self, agent_id: str) -> float:
+        """Committed spend today."""
+        day = self._day()
+        with self._lock(agent_id):
+            return _usdc(self._account(agent_id, day).spent)
+
+    def reserve(self, agent_id: str, amount: Amount) -> Reservation:
+        """
+        Hold ``amount`` of today's budget.
+
+        Raises:
+            BudgetExceededError: If it does not fit in what is left.
+            ValueError: If ``amount`` is negative.
+        """
+        micros = to_micros(amount)
+        if micros < 0:
+            raise ValueError("amount must not be negative")
+        day = self._day()
+        with self._lock(agent_id):
+            account = self._account(agent_id, day)
+            remaining = self._remaining(agent_id, account)
+            if micros > remaining:
+                self.stats.rejected += 1
+                raise BudgetExceededError(agent_id, _usdc(micros), _usdc(remaining))
+            reservation = Reservation(next(self._ids), agent_id, micros, account.day)
+            account.reserved += micros
+            account.open[reservation.id] = micros
+            self.stats.reservations += 1
+        return reservation
+
+    def _close(self, reservation: Reservation, day: str) -> _Account | None:
+        """Drop the hold; None if the reservation's day has rolled over."""
+        account = self._account(reservation.agent_id, day)
+        micros = account.open.pop(reservation.id, None)
+        if micros is None:
+            if account.day == reservation.day:
+                raise KeyError(f"Reservation {reservation.id} is not open")
+            return None
+        account.reserved -= micros
+        return account
+
+    def commit(
+        self,
+        reservation: Reservation,
+        amount: Amount | None = None,
+        *,
+        ref: str | None = None,
+        durable: bool = False,
+    ) -> None:
+        """
+        Settle a reservation at the actual ``amount`` (default: the amount held).
+
+        Spend is charged to the reservation's day, even after a rollover.
+
+        Args:
+            ref: Transaction hash or task id recorded in the journal.
+            durable: Return only once the journal record is fsynced.
+
+        Raises:
+            BudgetExceededError: If ``amount`` is above the hold and the excess
+                does not fit in what the agent has left; the reservation stays
+                open.
+            KeyError: If the reservation was already committed or released.
+            ValueError: If ``amount`` is negative.
+            OSError: If ``durable`` and the journal failed to write the record.
+        """
+        micros = reservation.micros if amount is None else to_micros(amount)
+        if micros < 0:
+            raise ValueError("amount must not be negative")
+        agent_id = reservation.agent_id
+        day = self._day()
+        with self._lock(agent_id):
+            current = self._account(agent_id, day)
+            held = current.open.get(reservation.id)
+            if held is not None and micros > held:
+                remaining = self._remaining(agent_id, current) + held
+                if micros > remaining:
+                    self.stats.rejected += 1
+                    raise BudgetExceededError(agent_id, _usdc(micros), _usdc(remaining))
+            account = self._close(reservation, day)
+            if account is not None:
+                account.spent += micros
+            self.stats.commits += 1
+            seq = self._journal(agent_id, reservation.day, micros, ref)
+        if self.journal is not None:
+            if durable and seq:
+                self.journal.wait(seq)
+            self.stats.journal_syncs = self.journal.syncs
+
+    def release(self, reservation: Reservation) -> None:
+        """Return a reservation's hold unspent (the task failed or was skipped)."""
+        day = self._day()
+        with self._lock(reservation.agent_id):
+            self._close(reservation, day)
+            self.stats.releases += 1
+
+    def spend(
+        self, agent_id: str, amount: Amount, *, ref: str | None = None, durable: bool = False
+    ) -> None:
+        """Reserve and commit in one step, e.g. for an already-confirmed transfer."""
+        self.commit(self.reserve(agent_id, amount), ref=ref, durable=durable)
+
+    def _journal(self, agent_id: str, day: str, micros: int, ref: str | None) -> int:
+        if self.journal is None:
+            return 0
+        record = {"t": round(self.clock(), 6), "agent": agent_id, "micros": micros}
+        if ref is not None:
+            record["ref"] = ref
+        return self.journal.append(day, record)
+
+    def balance(self, agent_id: str) -> dict[str, str]:
+        """The budget fields of a get_balance response (spec §1.4)."""
+        day = self._day()
+        with self._lock(agent_id):
+            account = self._account(agent_id, day)
+            return {
+                "pending_out": _format(account.reserved),
+                "daily_spend": _format(account.spent),
+                "daily_limit": _format(self._limits.get(agent_id, self.daily_limit)),
+            }
+
+    def close(self) -> None:
+        if self.journal is not None:
+            self.journal.close()
+            self.stats.journal_syncs = self.journal.syncs
+
+    def __enter__(self) -> "Ledger":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
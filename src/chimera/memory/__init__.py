@@ -0,0 +1,52 @@
+"""
+Agent long-term memory.
+
+Reference: specs/technical.md §4.1, §4.2, §6.3
+
+Backs the MCP ``store_memory`` / ``search_memory`` tools and the
+``memory://{agent_id}/recent`` resource. Each agent's memories live in a
+memory-mapped segment, searched through a NumPy IVF index and pruned to
+a per-agent byte budget (100MB by default).
+
+    store = MemoryStore("/var/lib/chimera/memory")
+    store.store(agent_id, "Followers loved the sunrise reel", ["engagement"], importance=0.8)
+    hits = store.search(agent_id, "what content did followers like?", limit=5)
+"""
+
+from .embedding import Embedder, HashingEmbedder, normalize, stable_hash
+from .index import InvertedLists, assign, kmeans, probe_lists
+from .segment import META_DTYPE, Segment, tag_mask
+from .store import (
+    DEFAULT_BUDGET_BYTES,
+    Memory,
+    MemoryStats,
+    MemoryStore,
+    configure_memory_store,
+    recent_memories,
+    retention,
+    search_memory,
+    store_memory,
+)
+
+__all__ = [
+    "DEFAULT_BUDGET_BYTES",
+    "META_DTYPE",
+    "Embedder",
+    "HashingEmbedder",
+    "InvertedLists",
+    "Memory",
+    "MemoryStats",
+    "MemoryStore",
+    "Segment",
+    "assign",
+    "configure_memory_store",
+    "kmeans",
+    "normalize",
+    "probe_lists",
+    "recent_memories",
+    "retention",
+    "search_memory",
+    "stable_hash",
+    "store_memory",
+    "tag_mask",
+]
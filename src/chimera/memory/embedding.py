@@ -0,0 +1,68 @@
+"""
+Text embeddings for agent memory.
+
+Reference: specs/technical.md §4.2 (store_memory, search_memory)
+
+``HashingEmbedder`` is the dependency-free default. Words and word pairs
+are hashed into a fixed number of signed buckets, and each row is
+L2-normalised. Any callable that maps a list of strings to an
+``(n, dim)`` float array can replace it (a sentence-embedding model, for
+instance), provided ``dim`` matches the store's.
+"""
+
+import hashlib
+import re
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+
+import numpy as np
+
+Embedder = Callable[[Sequence[str]], np.ndarray]
+
+_TOKEN = re.compile(r"[\w#@']+")
+
+
+def stable_hash(text: str) -> int:
+    """32-bit hash that is stable across processes (unlike ``hash``)."""
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=4).digest(), "little")
+
+
+# Word frequencies are heavily skewed, so most features are repeats.
+_feature_hash = lru_cache(maxsize=1 << 16)(stable_hash)
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """Rows scaled to unit length, as float32; zero rows stay zero."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors[None, :]
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms > 0, norms, 1)
+
+
+class HashingEmbedder:
+    """
+    Feature-hashing embedder over words and adjacent word pairs.
+
+    Args:
+        dim: Embedding width.
+    """
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+
+    def __call__(self, texts: Sequence[str]) -> np.ndarray:
+        # All features of the batch are hashed and summed in one pass.
+        features: list[str] = []
+        counts: list[int] = []
+        for text in texts:
+            words = _TOKEN.findall(text.lower())
+            features += words
+            features += [f"{a} {b}" for a, b in zip(words, words[1:], strict=False)]
+            counts.append(max(0, 2 * len(words) - 1))
+        hashes = np.fromiter(map(_feature_hash, features), np.uint32, len(features))
+        signs = 1.0 - 2.0 * (hashes >> 31).astype(np.float64)
+        rows = np.repeat(np.arange(len(texts)), counts)
+        cells = rows * self.dim + hashes % self.dim
+        out = np.bincount(cells, weights=signs, minlength=len(texts) * self.dim)
+        return normalize(out.reshape(len(texts), self.dim))
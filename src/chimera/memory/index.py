@@ -0,0 +1,75 @@
+"""
+Inverted-file (IVF) approximate nearest-neighbour index in NumPy.
+
+Reference: src/chimera/memory/segment.py
+
+Vectors are clustered with spherical k-means, and each row records its
+nearest centroid (its "list"). A query is compared with the centroids
+first. Only the rows in the ``nprobe`` closest lists are then scored
+exactly. With about sqrt(n) lists, a query scores roughly
+``nprobe * sqrt(n)`` rows instead of n.
+
+The index itself is just the centroids plus one int32 per row, so it
+lives in the segment's files. The per-list row order is rebuilt from
+those with one argsort when a segment is opened.
+"""
+
+import numpy as np
+
+# Rows per matrix product, bounding temporary memory while assigning.
+CHUNK_ROWS = 32_768
+
+
+def assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Nearest centroid (by inner product) for each row, as int32."""
+    out = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), CHUNK_ROWS):
+        chunk = np.asarray(vectors[start : start + CHUNK_ROWS], dtype=np.float32)
+        out[start : start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+    return out
+
+
+def kmeans(
+    sample: np.ndarray, k: int, *, iterations: int = 10, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Spherical k-means over unit-length rows.
+
+    Returns:
+        ``(k, dim)`` float32 unit-length centroids. A cluster that empties
+        keeps its previous centroid.
+    """
+    centroids = sample[rng.choice(len(sample), k, replace=False)].copy()
+    for _ in range(iterations):
+        labels = assign(sample, centroids)
+        order = np.argsort(labels, kind="stable")
+        starts = np.searchsorted(labels[order], np.arange(k))
+        sums = np.add.reduceat(sample[order], starts, axis=0)
+        present = np.bincount(labels, minlength=k) > 0
+        norms = np.linalg.norm(sums, axis=1)
+        update = present & (norms > 0)
+        centroids[update] = sums[update] / norms[update, None]
+    return centroids
+
+
+class InvertedLists:
+    """Row ids grouped by list, built from a per-row list column."""
+
+    def __init__(self, lists: np.ndarray, nlist: int):
+        self.built = len(lists)
+        self.order = np.argsort(lists, kind="stable")
+        self.bounds = np.searchsorted(lists[self.order], np.arange(nlist + 1))
+
+    def rows(self, probe: np.ndarray) -> np.ndarray:
+        """Row ids in the probed lists."""
+        return np.concatenate(
+            [self.order[self.bounds[i] : self.bounds[i + 1]] for i in probe.tolist()]
+        )
+
+
+def probe_lists(centroids: np.ndarray, query: np.ndarray, nprobe: int) -> np.ndarray:
+    """The ``nprobe`` lists whose centroids are closest to ``query``."""
+    scores = centroids @ query
+    if nprobe >= len(scores):
+        return np.arange(len(scores))
+    return np.argpartition(-scores, nprobe - 1)[:nprobe]
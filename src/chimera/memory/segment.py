@@ -0,0 +1,356 @@
+"""
+On-disk segment holding one agent's memories.
+
+Reference: src/chimera/memory/store.py
+
+A segment is a directory of flat files mapped with ``np.memmap``:
+
+- ``vectors.f16``: one float16 embedding per row
+- ``meta.bin``: one fixed-size ``META_DTYPE`` record per row
+- ``content.jsonl``: memory text and tags, appended; rows point into it
+- ``centroids.npy``: IVF centroids, once the segment is large enough
+
+Opening a segment maps the files and counts the rows. No Python object is
+created per memory, so opening costs the same whatever the segment holds.
+Rows are appended in time order and do not move until compaction, so the
+newest memories are the last rows. A row counts as written once its
+``created_at`` is set, which is done last. That means the row count is
+recovered from the metadata and there is no header to keep in sync.
+
+Evicted rows are tombstoned (``alive = 0``). ``compact`` reclaims them by
+writing a new generation directory and switching ``CURRENT`` to it.
+
+A segment is not safe for concurrent use. Callers hold ``lock``.
+"""
+
+import json
+import math
+import os
+import shutil
+import threading
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .embedding import stable_hash
+from .index import InvertedLists, assign, kmeans, probe_lists
+
+META_DTYPE = np.dtype(
+    [
+        ("created_at", "<f8"),
+        ("seq", "<u8"),
+        ("tags", "<u8"),
+        ("offset", "<u8"),
+        ("length", "<u4"),
+        ("importance", "<f4"),
+        ("list", "<i4"),
+        ("alive", "u1"),
+    ],
+    align=True,
+)
+FORMAT_VERSION = 1
+
+# IVF sizing: about sqrt(n) lists, trained on a sample of this many rows per list.
+MIN_LISTS, MAX_LISTS = 16, 1024
+SAMPLE_PER_LIST = 32
+
+# Rows scored per matrix product during a search.
+SCORE_CHUNK = 65_536
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+
+def tag_mask(tags: Iterable[str]) -> int:
+    """64-bit Bloom mask of ``tags``; rows carrying all of them match it."""
+    mask = 0
+    for tag in tags:
+        mask |= 1 << (stable_hash(tag) % 64)
+    return mask
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
+class Segment:
+    """
+    One agent's memories on disk.
+
+    Args:
+        path: Segment directory; created if missing.
+        dim: Embedding width. Reopening with another width raises ValueError.
+        initial_capacity: Rows preallocated in a new segment. The files
+            double when full; unused rows are sparse on disk.
+        train_threshold: Live rows before an IVF index is trained.
+            Smaller segments are searched exactly.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        dim: int,
+        *,
+        initial_capacity: int = 1024,
+        train_threshold: int = 4096,
+    ):
+        self.path = Path(path)
+        self.dim = dim
+        self.initial_capacity = initial_capacity
+        self.train_threshold = train_threshold
+        self.lock = threading.RLock()
+        self.closed = False
+        current = self.path / "CURRENT"
+        if current.exists():
+            self.generation = current.read_text().strip()
+        else:
+            self.generation = "gen-000001"
+            self._directory().mkdir(parents=True, exist_ok=True)
+            self._write_header(trained_at=0)
+            _write_atomic(current, self.generation)
+        self._open()
+
+    def _directory(self) -> Path:
+        return self.path / self.generation
+
+    def _write_header(self, *, trained_at: int) -> None:
+        header = {"format": FORMAT_VERSION, "dim": self.dim, "trained_at": trained_at}
+        _write_atomic(self._directory() / "segment.json", json.dumps(header))
+
+    def _open(self) -> None:
+        directory = self._directory()
+        header = json.loads((directory / "segment.json").read_text())
+        if header["dim"] != self.dim:
+            raise ValueError(f"{self.path} holds {header['dim']}-d vectors, not {self.dim}-d")
+        self.trained_at = header["trained_at"]
+        self._content = open(directory / "content.jsonl", "a+b")  # noqa: SIM115
+        meta_file = directory / "meta.bin"
+        rows = meta_file.stat().st_size // META_DTYPE.itemsize if meta_file.exists() else 0
+        self._map(max(rows, self.initial_capacity))
+
+        empty = np.flatnonzero(self.meta["created_at"] == 0)
+        self.count = int(empty[0]) if len(empty) else self.capacity
+        meta = self.meta[: self.count]
+        alive = meta["alive"].astype(bool)
+        self.alive_count = int(alive.sum())
+        self.live_bytes = int(self.row_bytes(meta["length"][alive]).sum())
+        self.dead_bytes = int(self.row_bytes(meta["length"][~alive]).sum())
+        self.next_seq = int(meta["seq"].max()) + 1 if self.count else 1
+        centroids = directory / "centroids.npy"
+        self.centroids = np.load(centroids) if centroids.exists() else None
+        self._lists: InvertedLists | None = None
+
+    def _map(self, capacity: int) -> None:
+        directory = self._directory()
+        for name, size in (
+            ("vectors.f16", capacity * self.dim * 2),
+            ("meta.bin", capacity * META_DTYPE.itemsize),
+        ):
+            file = directory / name
+            file.touch()
+            if file.stat().st_size < size:
+                os.truncate(file, size)
+        self.vectors = np.memmap(
+            directory / "vectors.f16", np.float16, "r+", shape=(capacity, self.dim)
+        )
+        self.meta = np.memmap(directory / "meta.bin", META_DTYPE, "r+", shape=(capacity,))
+        self.capacity = capacity
+
+    def row_bytes(self, lengths: np.ndarray) -> np.ndarray:
+        """Bytes a row takes on disk: vector, metadata and content."""
+        return np.asarray(lengths, dtype=np.int64) + (self.dim * 2 + META_DTYPE.itemsize)
+
+    def append(
+        self,
+        vectors: np.ndarray,
+        payloads: Sequence[bytes],
+        tags: Sequence[int],
+        importance: np.ndarray,
+        created_at: float,
+    ) -> np.ndarray:
+        """
+        Append rows and return their sequence numbers.
+
+        Args:
+            vectors: ``(n, dim)`` unit-length embeddings.
+            payloads: Encoded content, one line per row.
+            tags: ``tag_mask`` of each row.
+            importance: Per-row importance in [0, 1].
+            created_at: Timestamp for every row; must be positive.
+        """
+        n = len(payloads)
+        if self.count + n > self.capacity:
+            self.flush()
+            self._map(max(self.capacity * 2, self.count + n))
+        lengths = np.fromiter(map(len, payloads), np.uint32, n)
+        self._content.seek(0, os.SEEK_END)
+        base = self._content.tell()
+        self._content.write(b"".join(payloads))
+        self._content.flush()
+
+        rows = slice(self.count, self.count + n)
+        self.vectors[rows] = vectors
+        meta = self.meta[rows]
+        seqs = np.arange(self.next_seq, self.next_seq + n, dtype=np.uint64)
+        meta["seq"] = seqs
+        meta["tags"] = np.asarray(tags, dtype=np.uint64)
+        meta["offset"] = base + np.concatenate(([0], np.cumsum(lengths[:-1], dtype=np.uint64)))
+        meta["length"] = lengths
+        meta["importance"] = importance
+        meta["list"] = -1 if self.centroids is None else assign(vectors, self.centroids)
+        meta["alive"] = 1
+        meta["created_at"] = created_at
+
+        self.count += n
+        self.next_seq += n
+        self.alive_count += n
+        self.live_bytes += int(self.row_bytes(lengths).sum())
+        if self.alive_count >= self.train_threshold and self.count >= 2 * self.trained_at:
+            self.train()
+        return seqs
+
+    def train(self) -> None:
+        """(Re)train the IVF centroids on live rows and reassign every row."""
+        rows = self.alive_rows()
+        nlist = int(min(MAX_LISTS, max(MIN_LISTS, math.isqrt(len(rows)))))
+        rng = np.random.default_rng(len(rows))
+        sample = np.sort(rng.choice(rows, min(len(rows), nlist * SAMPLE_PER_LIST), replace=False))
+        self.centroids = kmeans(self.vectors[sample].astype(np.float32), nlist, rng=rng)
+        self.meta["list"][: self.count] = assign(self.vectors[: self.count], self.centroids)
+        tmp = self._directory() / "centroids.tmp.npy"
+        np.save(tmp, self.centroids)
+        os.replace(tmp, self._directory() / "centroids.npy")
+        self.trained_at = self.count
+        self._write_header(trained_at=self.count)
+        self._lists = None
+
+    def alive_rows(self) -> np.ndarray:
+        return np.flatnonzero(self.meta["alive"][: self.count])
+
+    def _filter(self, rows: np.ndarray, mask: int) -> np.ndarray:
+        meta = self.meta[rows]
+        keep = meta["alive"].astype(bool)
+        if mask:
+            keep &= (meta["tags"] & np.uint64(mask)) == np.uint64(mask)
+        kept: np.ndarray = rows[keep]
+        return kept
+
+    def _candidates(self, query: np.ndarray, nprobe: int) -> np.ndarray:
+        if self.centroids is None:
+            return np.arange(self.count)
+        lists = self._lists
+        if lists is None or self.count - lists.built > max(1024, lists.built // 8):
+            lists = self._lists = InvertedLists(
+                np.asarray(self.meta["list"][: self.count]), len(self.centroids)
+            )
+        probe = probe_lists(self.centroids, query, nprobe)
+        # Rows appended since the lists were built are checked directly.
+        tail = lists.built + np.flatnonzero(
+            np.isin(self.meta["list"][lists.built : self.count], probe)
+        )
+        return np.sort(np.concatenate([lists.rows(probe), tail]))
+
+    def search(
+        self, query: np.ndarray, limit: int, *, nprobe: int, mask: int = 0
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Nearest live rows to a unit-length ``query``.
+
+        Returns:
+            ``(rows, similarities)``, best first.
+        """
+        rows = self._filter(self._candidates(query, nprobe), mask)
+        best_rows, best_sims = [_EMPTY], [np.empty(0, dtype=np.float32)]
+        for start in range(0, len(rows), SCORE_CHUNK):
+            chunk = rows[start : start + SCORE_CHUNK]
+            sims = self.vectors[chunk].astype(np.float32) @ query
+            if len(sims) > limit:
+                top = np.argpartition(-sims, limit - 1)[:limit]
+                chunk, sims = chunk[top], sims[top]
+            best_rows.append(chunk)
+            best_sims.append(sims)
+        rows, sims = np.concatenate(best_rows), np.concatenate(best_sims)
+        order = np.argsort(-sims, kind="stable")[:limit]
+        return rows[order], sims[order]
+
+    def recent(self, limit: int, *, mask: int = 0) -> np.ndarray:
+        """Newest live rows, newest first."""
+        found, total, end, step = [_EMPTY], 0, self.count, max(64, 2 * limit)
+        while end > 0 and total < limit:
+            start = max(0, end - step)
+            rows = self._filter(np.arange(end - 1, start - 1, -1), mask)
+            found.append(rows)
+            total += len(rows)
+            end, step = start, step * 2
+        return np.concatenate(found)[:limit]
+
+    def read(self, rows: np.ndarray) -> list[dict[str, Any]]:
+        """Decoded content of ``rows``: ``{"content", "tags"}`` dicts."""
+        out = []
+        for offset, length in self.meta[["offset", "length"]][rows].tolist():
+            self._content.seek(offset)
+            out.append(json.loads(self._content.read(length)))
+        return out
+
+    def evict(self, rows: np.ndarray) -> int:
+        """Tombstone live ``rows``; returns the bytes freed."""
+        rows = rows[self.meta["alive"][rows] == 1]
+        self.meta["alive"][rows] = 0
+        freed = int(self.row_bytes(self.meta["length"][rows]).sum())
+        self.alive_count -= len(rows)
+        self.live_bytes -= freed
+        self.dead_bytes += freed
+        return freed
+
+    def compact(self) -> None:
+        """Rewrite the live rows into a new generation and drop the old one."""
+        rows = self.alive_rows()
+        n = len(rows)
+        old, self.generation = self.generation, f"gen-{int(self.generation[4:]) + 1:06d}"
+        target = self._directory()
+        target.mkdir()
+        capacity = max(n, self.initial_capacity)
+
+        meta = np.zeros(capacity, dtype=META_DTYPE)
+        meta[:n] = self.meta[rows]
+        with open(target / "content.jsonl", "wb") as out:
+            offset = 0
+            for i, (start, length) in enumerate(meta[["offset", "length"]][:n].tolist()):
+                self._content.seek(start)
+                out.write(self._content.read(length))
+                meta["offset"][i] = offset
+                offset += length
+        meta.tofile(target / "meta.bin")
+        vectors = np.memmap(target / "vectors.f16", np.float16, "w+", shape=(capacity, self.dim))
+        for start in range(0, n, SCORE_CHUNK):
+            chunk = rows[start : start + SCORE_CHUNK]
+            vectors[start : start + len(chunk)] = self.vectors[chunk]
+        vectors.flush()
+        del vectors
+        if self.centroids is not None:
+            np.save(target / "centroids.npy", self.centroids)
+        self._write_header(trained_at=n if self.centroids is not None else 0)
+
+        self._release()
+        _write_atomic(self.path / "CURRENT", self.generation)
+        shutil.rmtree(self.path / old)
+        self._open()
+
+    def flush(self) -> None:
+        self.vectors.flush()
+        self.meta.flush()
+        self._content.flush()
+
+    def _release(self) -> None:
+        self.flush()
+        self._content.close()
+        del self.vectors, self.meta
+        self._lists = None
+
+    def close(self) -> None:
+        if not self.closed:
+            self._release()
+            self.closed = True
@@ -0,0 +1,391 @@
+"""
+Per-agent long-term memory with a byte budget.
+
+Reference: specs/technical.md §4.1 (memory://{agent_id}/recent),
+§4.2 (store_memory, search_memory), §6.3 (Memory per agent: 100MB)
+
+Each agent has its own on-disk Segment. The store keeps at most
+``max_open`` segments mapped, in LRU order, so thousands of agents cost
+only their open files. Opening an agent's segment does not load its
+memories.
+
+Searches are by cosine similarity. Small segments are scanned exactly.
+Larger ones use the segment's IVF index, probing ``nprobe`` lists.
+
+The budget is enforced as memories are stored. When an agent's live
+bytes (vector, metadata and content) exceed ``budget_bytes``, the
+lowest-retention memories are evicted until usage is ``prune_fraction``
+below the budget. Retention is importance halved every ``half_life``
+seconds of age, so old, unimportant memories go first. Each eviction
+round is small, which keeps the cost of any one ``store`` bounded.
+Evicted rows are reclaimed by compaction once they add up to
+``compact_fraction`` of the budget.
+"""
+
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .embedding import Embedder, HashingEmbedder, normalize
+from .segment import Segment, tag_mask
+
+DEFAULT_BUDGET_BYTES = 100 * 1024 * 1024
+
+_AGENT_ID = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.-]{0,127}")
+
+
+def retention(
+    importance: np.ndarray, created_at: np.ndarray, now: float, half_life: float
+) -> np.ndarray:
+    """Importance halved for every ``half_life`` seconds of age."""
+    return importance * np.exp2(-(now - created_at) / half_life)
+
+
+@dataclass(frozen=True)
+class Memory:
+    """One stored memory; ``score`` is the similarity on search results."""
+
+    id: int
+    content: str
+    tags: tuple[str, ...]
+    importance: float
+    created_at: float
+    score: float | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        out = asdict(self)
+        out["tags"] = list(self.tags)
+        if self.score is None:
+            del out["score"]
+        return out
+
+
+@dataclass
+class MemoryStats:
+    """Store counters since creation."""
+
+    stored: int = 0
+    searches: int = 0
+    pruned: int = 0
+    compactions: int = 0
+    segments_opened: int = 0
+    segments_closed: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class MemoryStore:
+    """
+    Long-term memory for many agents under one directory.
+
+    Args:
+        root: Directory holding one segment directory per agent.
+        dim: Embedding width.
+        embedder: Maps texts to ``(n, dim)`` vectors; defaults to
+            ``HashingEmbedder(dim)``.
+        budget_bytes: Live bytes allowed per agent (spec §6.3: 100MB).
+        half_life: Seconds for a memory's retention to halve.
+        prune_fraction: How far below the budget one eviction round goes.
+        compact_fraction: Tombstoned bytes, as a fraction of the budget,
+            that trigger compaction.
+        max_open: Segments kept mapped at once.
+        nprobe: IVF lists probed per search.
+        train_threshold: Live memories before an agent's IVF index is built.
+        clock: Wall-clock time source.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        dim: int = 256,
+        embedder: Embedder | None = None,
+        budget_bytes: int = DEFAULT_BUDGET_BYTES,
+        half_life: float = 7 * 86400.0,
+        prune_fraction: float = 0.05,
+        compact_fraction: float = 0.25,
+        max_open: int = 256,
+        nprobe: int = 16,
+        train_threshold: int = 4096,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.dim = dim
+        self.embedder = embedder or HashingEmbedder(dim)
+        self.budget_bytes = budget_bytes
+        self.half_life = half_life
+        self.prune_fraction = prune_fraction
+        self.compact_fraction = compact_fraction
+        self.max_open = max_open
+        self.nprobe = nprobe
+        self.train_threshold = train_threshold
+        self.clock = clock
+        self.stats = MemoryStats()
+        self._open: OrderedDict[str, Segment] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, agent_id: str) -> Path:
+        if not _AGENT_ID.fullmatch(agent_id):
+            raise ValueError(f"Invalid agent id: {agent_id!r}")
+        return self.root / agent_id
+
+    def _segment(self, agent_id: str) -> Segment:
+        with self._lock:
+            segment = self._open.get(agent_id)
+            if segment is not None:
+                self._open.move_to_end(agent_id)
+                return segment
+            segment = Segment(self._path(agent_id), self.dim, train_threshold=self.train_threshold)
+            self._open[agent_id] = segment
+            self.stats.segments_opened += 1
+            evicted = []
+            while len(self._open) > self.max_open:
+                evicted.append(self._open.popitem(last=False)[1])
+        for old in evicted:
+            with old.lock:
+                old.close()
+            self.stats.segments_closed += 1
+        return segment
+
+    @contextmanager
+    def _use(self, agent_id: str) -> Iterator[Segment]:
+        while True:
+            segment = self._segment(agent_id)
+            with segment.lock:
+                if segment.closed:
+                    # Closed by LRU eviction between lookup and lock; reopen.
+                    with self._lock:
+                        if self._open.get(agent_id) is segment:
+                            del self._open[agent_id]
+                    continue
+                yield segment
+                return
+
+    def _exists(self, agent_id: str) -> bool:
+        return agent_id in self._open or (self._path(agent_id) / "CURRENT").exists()
+
+    def store(
+        self,
+        agent_id: str,
+        content: str,
+        tags: Sequence[str] = (),
+        *,
+        importance: float = 0.5,
+        embedding: np.ndarray | None = None,
+    ) -> int:
+        """
+        Store one memory and return its id.
+
+        Raises:
+            ValueError: Invalid agent id, importance outside [0, 1], or an
+                embedding of the wrong width.
+        """
+        embeddings = None if embedding is None else np.asarray(embedding)[None, :]
+        return self.store_many(
+            agent_id, [content], [tags], importance=[importance], embeddings=embeddings
+        )[0]
+
+    def store_many(
+        self,
+        agent_id: str,
+        contents: Sequence[str],
+        tags: Sequence[Sequence[str]] | None = None,
+        *,
+        importance: Sequence[float] | None = None,
+        embeddings: np.ndarray | None = None,
+    ) -> list[int]:
+        """Store several memories in one append; returns their ids."""
+        n = len(contents)
+        tags = [tuple(t) for t in tags] if tags is not None else [()] * n
+        weights = np.full(n, 0.5, np.float32) if importance is None else np.asarray(importance)
+        if len(tags) != n or len(weights) != n:
+            raise ValueError("tags and importance must match contents")
+        if n and not (weights.min() >= 0 and weights.max() <= 1):
+            raise ValueError("importance must be within [0, 1]")
+        vectors = normalize(self.embedder(contents) if embeddings is None else embeddings)
+        if vectors.shape != (n, self.dim):
+            raise ValueError(f"Expected embeddings of shape {(n, self.dim)}, got {vectors.shape}")
+        payloads = [
+            json.dumps({"content": c, "tags": list(t)}, ensure_ascii=False).encode() + b"\n"
+            for c, t in zip(contents, tags, strict=True)
+        ]
+        now = self.clock()
+        with self._use(agent_id) as segment:
+            ids = segment.append(vectors, payloads, [tag_mask(t) for t in tags], weights, now)
+            if segment.live_bytes > self.budget_bytes:
+                self._prune(segment, self.budget_bytes * (1 - self.prune_fraction), now)
+        self.stats.stored += n
+        stored: list[int] = ids.tolist()
+        return stored
+
+    def search(
+        self,
+        agent_id: str,
+        query: str,
+        limit: int = 10,
+        *,
+        tags: Sequence[str] = (),
+        embedding: np.ndarray | None = None,
+        nprobe: int | None = None,
+    ) -> list[Memory]:
+        """
+        The agent's memories most similar to ``query``, best first.
+
+        Args:
+            tags: Only memories carrying all of these tags.
+            embedding: Query vector, instead of embedding ``query``.
+            nprobe: IVF lists to probe; more is slower and more exact.
+        """
+        self.stats.searches += 1
+        vector = normalize(self.embedder([query]) if embedding is None else embedding)[0]
+        if limit <= 0 or not vector.any() or not self._exists(agent_id):
+            return []
+        # The tag mask can admit false positives, so over-fetch and check.
+        fetch = limit * 2 if tags else limit
+        with self._use(agent_id) as segment:
+            rows, sims = segment.search(
+                vector, fetch, nprobe=nprobe or self.nprobe, mask=tag_mask(tags)
+            )
+            memories = self._memories(segment, rows, sims)
+        if tags:
+            memories = [m for m in memories if set(tags) <= set(m.tags)]
+        return memories[:limit]
+
+    def recent(self, agent_id: str, limit: int = 20, *, tags: Sequence[str] = ()) -> list[Memory]:
+        """The agent's newest memories, newest first."""
+        if limit <= 0 or not self._exists(agent_id):
+            return []
+        with self._use(agent_id) as segment:
+            memories = self._memories(
+                segment, segment.recent(limit * 2 if tags else limit, mask=tag_mask(tags))
+            )
+        if tags:
+            memories = [m for m in memories if set(tags) <= set(m.tags)]
+        return memories[:limit]
+
+    def usage(self, agent_id: str) -> int:
+        """Live bytes held for the agent."""
+        if not self._exists(agent_id):
+            return 0
+        with self._use(agent_id) as segment:
+            return segment.live_bytes
+
+    def prune(self, agent_id: str, target_bytes: int | None = None) -> int:
+        """Evict lowest-retention memories down to ``target_bytes``; returns the count."""
+        if not self._exists(agent_id):
+            return 0
+        target = self.budget_bytes if target_bytes is None else target_bytes
+        with self._use(agent_id) as segment:
+            return self._prune(segment, target, self.clock())
+
+    def _prune(self, segment: Segment, target: float, now: float) -> int:
+        excess = segment.live_bytes - target
+        if excess <= 0:
+            return 0
+        rows = segment.alive_rows()
+        meta = segment.meta[rows]
+        order = np.argsort(
+            retention(meta["importance"], meta["created_at"], now, self.half_life), kind="stable"
+        )
+        freed = np.cumsum(segment.row_bytes(meta["length"][order]))
+        cut = int(np.searchsorted(freed, excess)) + 1
+        segment.evict(rows[order[:cut]])
+        self.stats.pruned += min(cut, len(rows))
+        if segment.dead_bytes > self.compact_fraction * self.budget_bytes:
+            segment.compact()
+            self.stats.compactions += 1
+        return min(cut, len(rows))
+
+    @staticmethod
+    def _memories(
+        segment: Segment, rows: np.ndarray, sims: np.ndarray | None = None
+    ) -> list[Memory]:
+        meta = segment.meta[rows]
+        scores = [None] * len(rows) if sims is None else sims.tolist()
+        return [
+            Memory(
+                id=seq,
+                content=payload["content"],
+                tags=tuple(payload["tags"]),
+                importance=round(importance, 6),
+                created_at=created_at,
+                score=score,
+            )
+            for seq, importance, created_at, payload, score in zip(
+                meta["seq"].tolist(),
+                meta["importance"].tolist(),
+                meta["created_at"].tolist(),
+                segment.read(rows),
+                scores,
+                strict=True,
+            )
+        ]
+
+    def flush(self) -> None:
+        """Write every open segment's mapped pages back to disk."""
+        with self._lock:
+            segments = list(self._open.values())
+        for segment in segments:
+            with segment.lock:
+                if not segment.closed:
+                    segment.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            segments = list(self._open.values())
+            self._open.clear()
+        for segment in segments:
+            with segment.lock:
+                segment.close()
+            self.stats.segments_closed += 1
+
+    def __enter__(self) -> "MemoryStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+_store: MemoryStore | None = None
+
+
+def configure_memory_store(store: MemoryStore | None) -> None:
+    """Set the process-wide store behind the MCP memory tools."""
+    global _store
+    _store = store
+
+
+def _configured() -> MemoryStore:
+    if _store is None:
+        raise RuntimeError("No memory store configured; call configure_memory_store()")
+    return _store
+
+
+def store_memory(
+    agent_id: str, content: str, tags: Sequence[str] = (), importance: float = 0.5
+) -> dict[str, Any]:
+    """MCP tool ``store_memory``: save to long-term memory."""
+    store = _configured()
+    memory_id = store.store(agent_id, content, tags, importance=importance)
+    return {"memory_id": memory_id, "bytes_used": store.usage(agent_id)}
+
+
+def search_memory(agent_id: str, query: str, limit: int = 10) -> list[dict[str, Any]]:
+    """MCP tool ``search_memory``: the memories most similar to ``query``."""
+    return [memory.as_dict() for memory in _configured().search(agent_id, query, limit)]
+
+
+def recent_memories(agent_id: str, limit: int = 20) -> list[dict[str, Any]]:
+    """MCP resource ``memory://{agent_id}/recent``."""
+    return [memory.as_dict() for memory in _configured().recent(agent_id, limit)]
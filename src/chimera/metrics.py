@@ -0,0 +1,545 @@
+"""
+Low-overhead metrics: latency histograms, counters and gauges.
+
+Reference: specs/technical.md §6.1 (P50/P95/P99 latency targets), §7.1
+(request rate, error rate, latency)
+
+Recording never takes a lock. Each histogram and counter keeps one
+preallocated array per thread. An observation increments one slot of the
+calling thread's array. Arrays are merged only when a snapshot or an
+export is taken. When a thread exits, its counts are folded into a retired
+array, so short-lived executor threads do not accumulate.
+
+Histograms bucket integer microseconds HDR-style, log-linear:
+- below 64µs, one bucket per microsecond;
+- above that, 32 buckets per power of two, so any value is within about
+  3% of its bucket;
+- values up to about 2.4 hours are kept, and longer ones go in the last bucket.
+
+Metrics are families: a name, fixed label names, and one child per set of
+label values. The skills and the task runtime record into the default
+registry:
+
+    chimera_operation_seconds{operation=...}      skill entry points and stages
+    chimera_operation_errors_total{operation=...}
+    chimera_task_queue_seconds{type=...}          WorkerPool queue wait
+    chimera_task_run_seconds{type=...}            WorkerPool handler run time
+    chimera_tasks_total{type=...,status=...}
+
+Usage:
+
+    @timed("fetch_trends")
+    def fetch_trends(input_data): ...
+
+    with stage("trend_fetcher.score"):
+        ...
+
+    render_prometheus()  # text exposition format
+    snapshot()           # JSON-ready dict, P50/P95/P99 per histogram series
+"""
+
+import functools
+import inspect
+import itertools
+import math
+import threading
+import weakref
+from bisect import bisect_left
+from collections.abc import Callable, Iterator, Sequence
+from time import perf_counter_ns
+from typing import Any, Generic, TypeVar
+
+SUB_BITS = 5
+_SUB = 1 << SUB_BITS
+_DIRECT = 2 * _SUB  # values below this have a bucket each
+_SHIFT_BASE = SUB_BITS + 1
+_MAX_SHIFT = 27
+BUCKETS = (_MAX_SHIFT + 2) * _SUB
+_LAST = BUCKETS - 1
+_SUM = BUCKETS  # extra slot holding the total in microseconds
+
+# Cumulative ``le`` bounds in Prometheus output. They include the §6.1 targets.
+EXPORT_BOUNDS: tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.0,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+M = TypeVar("M", "Histogram", "Counter", "Gauge")
+
+
+def bucket_index(micros: int) -> int:
+    """Return the histogram bucket holding ``micros``."""
+    if micros < _DIRECT:
+        return micros if micros > 0 else 0
+    shift = micros.bit_length() - _SHIFT_BASE
+    return shift * _SUB + (micros >> shift) if shift <= _MAX_SHIFT else _LAST
+
+
+def bucket_bounds(index: int) -> tuple[int, int]:
+    """Return the ``[lower, upper)`` microsecond range of bucket ``index``."""
+    shift = max(index // _SUB - 1, 0)
+    top = index - shift * _SUB
+    return top << shift, (top + 1) << shift
+
+
+class _Owner:
+    """Held in a thread's local storage; collected when the thread exits."""
+
+    __slots__ = ("__weakref__",)
+
+
+class _Shards:
+    """Per-thread arrays of ``size`` slots, merged on read."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.local = threading.local()
+        self._lock = threading.Lock()
+        self._live: dict[int, list[int]] = {}
+        self._retired = [0] * size
+        self._ids = itertools.count()
+
+    def attach(self) -> list[int]:
+        """Give the calling thread its array and return it."""
+        cells = [0] * self.size
+        key = next(self._ids)
+        owner = _Owner()
+        self.local.owner = owner
+        self.local.cells = cells
+        with self._lock:
+            self._live[key] = cells
+        weakref.finalize(owner, self._retire, key)
+        return cells
+
+    def _retire(self, key: int) -> None:
+        with self._lock:
+            cells = self._live.pop(key)
+            self._retired = [a + b for a, b in zip(self._retired, cells, strict=True)]
+
+    def merged(self) -> list[int]:
+        with self._lock:
+            arrays = [self._retired, *self._live.values()]
+        return [sum(column) for column in zip(*arrays, strict=True)]
+
+    def reset(self) -> None:
+        with self._lock:
+            for cells in self._live.values():
+                cells[:] = [0] * self.size
+            self._retired = [0] * self.size
+
+
+class Histogram:
+    """Latency histogram in seconds, recorded at microsecond resolution."""
+
+    def __init__(self) -> None:
+        self._shards = _Shards(BUCKETS + 1)
+        self._local = self._shards.local
+
+    # observe() and observe_micros() repeat the bucketing inline: a helper
+    # call would add a sizeable fraction of their cost.
+
+    def observe(self, seconds: float) -> None:
+        """Record one duration in seconds."""
+        try:
+            cells = self._local.cells
+        except AttributeError:
+            cells = self._shards.attach()
+        micros = int(seconds * 1e6)
+        if micros < _DIRECT:
+            index = micros if micros > 0 else 0
+        else:
+            shift = micros.bit_length() - _SHIFT_BASE
+            index = shift * _SUB + (micros >> shift) if shift <= _MAX_SHIFT else _LAST
+        cells[index] += 1
+        cells[_SUM] += micros
+
+    def observe_micros(self, micros: int) -> None:
+        """Record one duration in whole microseconds."""
+        try:
+            cells = self._local.cells
+        except AttributeError:
+            cells = self._shards.attach()
+        if micros < _DIRECT:
+            index = micros if micros > 0 else 0
+        else:
+            shift = micros.bit_length() - _SHIFT_BASE
+            index = shift * _SUB + (micros >> shift) if shift <= _MAX_SHIFT else _LAST
+        cells[index] += 1
+        cells[_SUM] += micros
+
+    def time(self) -> "Timer":
+        """Return a context manager recording the duration of its block."""
+        return Timer(self)
+
+    def counts(self) -> list[int]:
+        """Return merged bucket counts followed by the total in microseconds."""
+        return self._shards.merged()
+
+    def summary(self) -> dict[str, float]:
+        """
+        Summarise all observations so far.
+
+        Returns:
+            Dict with count, sum, mean, p50, p95, p99 and max; durations in
+            seconds. Percentiles and max are bucket midpoints.
+        """
+        counts = self.counts()
+        total, count = counts[_SUM], sum(counts[:_SUM])
+        if not count:
+            return {"count": 0, **dict.fromkeys(("sum", "mean", "p50", "p95", "p99", "max"), 0.0)}
+        cumulative = list(itertools.accumulate(counts[:_SUM]))
+        highest = max(i for i, c in enumerate(counts[:_SUM]) if c)
+        return {
+            "count": count,
+            "sum": total / 1e6,
+            "mean": total / count / 1e6,
+            "p50": _midpoint(bisect_left(cumulative, math.ceil(count * 0.50))),
+            "p95": _midpoint(bisect_left(cumulative, math.ceil(count * 0.95))),
+            "p99": _midpoint(bisect_left(cumulative, math.ceil(count * 0.99))),
+            "max": _midpoint(highest),
+        }
+
+    def reset(self) -> None:
+        self._shards.reset()
+
+
+def _midpoint(index: int) -> float:
+    lower, upper = bucket_bounds(index)
+    if upper - lower == 1:
+        return lower / 1e6
+    return (lower + upper) / 2e6
+
+
+class Timer:
+    """Context manager timing its block into a histogram, counting exceptions."""
+
+    __slots__ = ("_histogram", "_errors", "_started")
+
+    def __init__(self, histogram: Histogram, errors: "Counter | None" = None):
+        self._histogram = histogram
+        self._errors = errors
+        self._started = 0
+
+    def __enter__(self) -> "Timer":
+        self._started = perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: object, *exc_info: object) -> None:
+        self._histogram.observe_micros((perf_counter_ns() - self._started) // 1000)
+        if exc_type is not None and self._errors is not None:
+            self._errors.inc()
+
+
+class Counter:
+    """Monotonic counter."""
+
+    def __init__(self) -> None:
+        self._shards = _Shards(1)
+        self._local = self._shards.local
+
+    def inc(self, amount: int = 1) -> None:
+        if amount < 0:
+            raise ValueError("counters only go up")
+        try:
+            cells = self._local.cells
+        except AttributeError:
+            cells = self._shards.attach()
+        cells[0] += amount
+
+    @property
+    def value(self) -> int:
+        return self._shards.merged()[0]
+
+    def reset(self) -> None:
+        self._shards.reset()
+
+
+class Gauge:
+    """Value that goes up and down, or is read from a callback at export."""
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._lock = threading.Lock()
+        self._function: Callable[[], float] | None = None
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def set_function(self, function: Callable[[], float] | None) -> None:
+        """Report ``function()`` instead of the stored value."""
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        return self._function() if self._function is not None else self._value
+
+    def reset(self) -> None:
+        self._value = 0.0
+
+
+_KINDS: dict[type, str] = {Histogram: "histogram", Counter: "counter", Gauge: "gauge"}
+
+
+class Family(Generic[M]):
+    """
+    One metric name with a child per set of label values.
+
+    Args:
+        name: Prometheus metric name.
+        help: One-line description for ``# HELP``.
+        kind: Histogram, Counter or Gauge.
+        labelnames: Label names; children are keyed by their values.
+    """
+
+    def __init__(self, name: str, help: str, kind: type[M], labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.kind: type[M] = kind
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], M] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def type(self) -> str:
+        return _KINDS[self.kind]
+
+    def labels(self, *values: str) -> M:
+        """Return the child for ``values``, creating it on first use."""
+        try:
+            return self._children[values]
+        except KeyError:
+            pass
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} takes labels {self.labelnames}, got {values}")
+        with self._lock:
+            child = self._children.get(values)
+            if child is None:
+                child = self._children[values] = self.kind()
+            return child
+
+    def children(self) -> list[tuple[dict[str, str], M]]:
+        """Return ``(labels, child)`` pairs in creation order."""
+        with self._lock:
+            items = list(self._children.items())
+        return [(dict(zip(self.labelnames, values, strict=True)), child) for values, child in items]
+
+    def reset(self) -> None:
+        for _, child in self.children():
+            child.reset()
+
+
+class Registry:
+    """Named metric families, exported together."""
+
+    def __init__(self) -> None:
+        self._families: dict[str, Family[Any]] = {}
+        self._lock = threading.Lock()
+
+    def _family(self, name: str, help: str, kind: type[M], labelnames: Sequence[str]) -> Family[M]:
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = self._families[name] = Family(name, help, kind, labelnames)
+            elif family.kind is not kind or family.labelnames != tuple(labelnames):
+                raise ValueError(f"metric {name} is already registered differently")
+        return family
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Family[Histogram]:
+        return self._family(name, help, Histogram, labelnames)
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Family[Counter]:
+        return self._family(name, help, Counter, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Family[Gauge]:
+        return self._family(name, help, Gauge, labelnames)
+
+    def families(self) -> list[Family[Any]]:
+        with self._lock:
+            return list(self._families.values())
+
+    def reset(self) -> None:
+        """Zero every series, keeping the families and children."""
+        for family in self.families():
+            family.reset()
+
+
+REGISTRY = Registry()
+
+OPERATION_SECONDS = REGISTRY.histogram(
+    "chimera_operation_seconds",
+    "Latency of skill entry points and pipeline stages.",
+    ["operation"],
+)
+OPERATION_ERRORS = REGISTRY.counter(
+    "chimera_operation_errors_total",
+    "Skill entry points and pipeline stages that raised.",
+    ["operation"],
+)
+
+
+def histogram(name: str, help: str, labelnames: Sequence[str] = ()) -> Family[Histogram]:
+    """Return the default registry's histogram family ``name``, creating it if needed."""
+    return REGISTRY.histogram(name, help, labelnames)
+
+
+def counter(name: str, help: str, labelnames: Sequence[str] = ()) -> Family[Counter]:
+    """Return the default registry's counter family ``name``, creating it if needed."""
+    return REGISTRY.counter(name, help, labelnames)
+
+
+def gauge(name: str, help: str, labelnames: Sequence[str] = ()) -> Family[Gauge]:
+    """Return the default registry's gauge family ``name``, creating it if needed."""
+    return REGISTRY.gauge(name, help, labelnames)
+
+
+_operations: dict[str, tuple[Histogram, Counter]] = {}
+
+
+def _operation(name: str) -> tuple[Histogram, Counter]:
+    try:
+        return _operations[name]
+    except KeyError:
+        pair = _operations[name] = (OPERATION_SECONDS.labels(name), OPERATION_ERRORS.labels(name))
+        return pair
+
+
+def stage(operation: str) -> Timer:
+    """Return a context manager timing ``operation`` into chimera_operation_seconds."""
+    return Timer(*_operation(operation))
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def timed(operation: str) -> Callable[[F], F]:
+    """
+    Decorate a function or coroutine function to time each call as ``operation``.
+
+    Calls that raise are also counted in chimera_operation_errors_total.
+    """
+    latency, errors = _operation(operation)
+
+    def decorate(function: F) -> F:
+        if inspect.iscoroutinefunction(function):
+
+            @functools.wraps(function)
+            async def timed_coroutine(*args: Any, **kwargs: Any) -> Any:
+                started = perf_counter_ns()
+                try:
+                    return await function(*args, **kwargs)
+                except BaseException:
+                    errors.inc()
+                    raise
+                finally:
+                    latency.observe_micros((perf_counter_ns() - started) // 1000)
+
+            return timed_coroutine  # type: ignore[return-value]
+
+        @functools.wraps(function)
+        def timed_function(*args: Any, **kwargs: Any) -> Any:
+            started = perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            except BaseException:
+                errors.inc()
+                raise
+            finally:
+                latency.observe_micros((perf_counter_ns() - started) // 1000)
+
+        return timed_function  # type: ignore[return-value]
+
+    return decorate
+
+
+def _label_text(labels: dict[str, str], extra: str = "") -> str:
+    pairs = [f'{key}="{_escape(value)}"' for key, value in labels.items()]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+# For each histogram bucket, the first EXPORT_BOUNDS entry it fits under.
+_EXPORT_SLOT = [bisect_left(EXPORT_BOUNDS, bucket_bounds(i)[1] / 1e6) for i in range(BUCKETS)]
+
+
+def _prometheus_lines(family: Family[Any]) -> Iterator[str]:
+    yield f"# HELP {family.name} {family.help}"
+    yield f"# TYPE {family.name} {family.type}"
+    for labels, child in family.children():
+        if isinstance(child, Histogram):
+            counts = child.counts()
+            per_bound = [0] * (len(EXPORT_BOUNDS) + 1)
+            for index, count in enumerate(counts[:_SUM]):
+                if count:
+                    per_bound[_EXPORT_SLOT[index]] += count
+            cumulative = list(itertools.accumulate(per_bound))
+            for bound, count in zip(EXPORT_BOUNDS, cumulative, strict=False):
+                le = _label_text(labels, f'le="{_number(bound)}"')
+                yield f"{family.name}_bucket{le} {count}"
+            inf = _label_text(labels, 'le="+Inf"')
+            yield f"{family.name}_bucket{inf} {cumulative[-1]}"
+            yield f"{family.name}_sum{_label_text(labels)} {counts[_SUM] / 1e6!r}"
+            yield f"{family.name}_count{_label_text(labels)} {cumulative[-1]}"
+        else:
+            yield f"{family.name}{_label_text(labels)} {_number(child.value)}"
+
+
+def render_prometheus(registry: Registry | None = None) -> str:
+    """Render every family in the Prometheus text exposition format (0.0.4)."""
+    registry = registry or REGISTRY
+    lines = [line for family in registry.families() for line in _prometheus_lines(family)]
+    return "\n".join(lines) + "\n"
+
+
+def snapshot(registry: Registry | None = None) -> dict[str, Any]:
+    """
+    Return every series as a JSON-ready dict.
+
+    Returns:
+        ``{name: {"type", "help", "series": [...]}}``. Histogram series carry
+        their labels and ``summary()``; counters and gauges their ``value``.
+    """
+    registry = registry or REGISTRY
+    report: dict[str, Any] = {}
+    for family in registry.families():
+        series = []
+        for labels, child in family.children():
+            if isinstance(child, Histogram):
+                series.append({"labels": labels, **child.summary()})
+            else:
+                series.append({"labels": labels, "value": child.value})
+        report[family.name] = {"type": family.type, "help": family.help, "series": series}
+    return report
@@ -0,0 +1,58 @@
+"""
+OpenClaw agent-to-agent marketplace integration.
+
+Reference: specs/openclaw_integration.md
+
+``AdmissionController`` decides which hired jobs run, next to the fleet's
+own tasks, under the §5.2 ``capacity_config``:
+
+    controller = AdmissionController(CapacityConfig.from_dict(config))
+    ticket = await controller.admit(request.job_id)  # raises AdmissionError
+    ...
+    controller.release(ticket)
+
+``ProviderCatalog`` answers §3.1 ``discover_services`` requests from a
+local index of providers, kept current by §4.2 job updates and §6.2
+ratings:
+
+    catalog.discover("video_generation", min_reputation=0.85, budget_max=15.0)
+
+``python -m chimera.openclaw.simulate`` replays mixed internal and external
+arrivals against the controller and reports waits and rejections.
+"""
+
+from .admission import (
+    DEFAULT_SERVICE_SECONDS,
+    AdmissionController,
+    AdmissionError,
+    AdmissionStats,
+    CapacityConfig,
+    LoadSignal,
+    Ticket,
+)
+from .catalog import (
+    REPUTATION_WEIGHTS,
+    CatalogStats,
+    Provider,
+    ProviderCatalog,
+    configure_catalog,
+    discover_services,
+    reputation_score,
+)
+
+__all__ = [
+    "DEFAULT_SERVICE_SECONDS",
+    "REPUTATION_WEIGHTS",
+    "AdmissionController",
+    "AdmissionError",
+    "AdmissionStats",
+    "CapacityConfig",
+    "CatalogStats",
+    "LoadSignal",
+    "Provider",
+    "ProviderCatalog",
+    "Ticket",
+    "configure_catalog",
+    "discover_services",
+    "reputation_score",
+]
@@ -0,0 +1,484 @@
+"""
+Admission control for jobs hired through OpenClaw.
+
+Reference: specs/openclaw_integration.md §5.1 (capacity check, retry_after),
+§5.2 (capacity_config), §9.1 (OC001 PROVIDER_UNAVAILABLE)
+
+The fleet has ``capacity`` job slots, shared by our own tasks and by
+external jobs. ``reserved_capacity_internal`` of the slots are held back
+for internal work:
+- External jobs run only in slots that internal demand (running plus
+  waiting) leaves free beyond the reservation.
+- At most ``max_concurrent_external_jobs`` external jobs run at once.
+- Internal tasks are never rejected. When every slot is busy they wait,
+  and they are started before any waiting external job.
+
+An external job that cannot start at once waits in a queue ordered by
+deadline (``queue_timeout_seconds`` after arrival unless the caller gives
+an earlier one). Start times are predicted from the observed external
+service time:
+- A job is rejected up front if it would not start before its deadline.
+- A queued job whose deadline passes is dropped.
+- Both carry a ``retry_after`` computed from the same prediction, rather
+  than a fixed 300 seconds.
+
+Load (running plus waiting work over capacity) crossing
+``auto_scale_threshold`` is reported to ``on_load``, once upwards and once
+back down.
+
+    controller = AdmissionController(CapacityConfig.from_dict(config), capacity=20)
+    ticket = await controller.admit(request.job_id)  # raises AdmissionError
+    try:
+        result = await execute_task(task)
+    finally:
+        controller.release(ticket)
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from dataclasses import asdict, dataclass, field
+from typing import Any, Literal
+
+# Service time assumed for external jobs until some have completed.
+DEFAULT_SERVICE_SECONDS = 60.0
+# Weight of each completed job in the service time estimate.
+SERVICE_EWMA_ALPHA = 0.2
+# Load must fall this far below auto_scale_threshold before the
+# scale-down signal, so load hovering at the threshold does not flap.
+SCALE_DOWN_MARGIN = 0.1
+
+TicketState = Literal["queued", "running", "done", "expired"]
+
+
+class AdmissionError(RuntimeError):
+    """Raised when an external job is turned away; ``retry_after`` is in seconds."""
+
+    code = "OC001"
+    name = "PROVIDER_UNAVAILABLE"
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.message = message
+        self.retry_after = retry_after
+
+    def to_error(self) -> dict[str, Any]:
+        """The ``reject_job`` error, as in specs/openclaw_integration.md §9.1."""
+        return {
+            "code": self.code,
+            "message": self.message,
+            "retry_after": math.ceil(self.retry_after),
+        }
+
+
+@dataclass(frozen=True)
+class CapacityConfig:
+    """The ``capacity_config`` block of specs/openclaw_integration.md §5.2."""
+
+    max_concurrent_external_jobs: int = 10
+    reserved_capacity_internal: float = 0.3
+    queue_timeout_seconds: float = 300.0
+    auto_scale_threshold: float = 0.8
+
+    def __post_init__(self) -> None:
+        if self.max_concurrent_external_jobs < 0 or self.queue_timeout_seconds < 0:
+            raise ValueError("max_concurrent_external_jobs and queue_timeout_seconds must be >= 0")
+        if not 0.0 <= self.reserved_capacity_internal < 1.0:
+            raise ValueError("reserved_capacity_internal must be in [0, 1)")
+        if self.auto_scale_threshold <= 0:
+            raise ValueError("auto_scale_threshold must be positive")
+
+    @classmethod
+    def from_dict(cls, config: Mapping[str, Any]) -> "CapacityConfig":
+        """Read the block itself or a document containing ``capacity_config``."""
+        block = config.get("capacity_config", config)
+        return cls(**{key: block[key] for key in cls.__dataclass_fields__ if key in block})
+
+    def default_capacity(self) -> int:
+        """Slots that give external jobs their full share beside the reservation."""
+        share = 1.0 - self.reserved_capacity_internal
+        return max(math.ceil(self.max_concurrent_external_jobs / share), 1)
+
+
+@dataclass(frozen=True)
+class LoadSignal:
+    """Load crossing the auto-scale threshold; ``scale_up`` is False on the way back down."""
+
+    load: float
+    scale_up: bool
+    internal: int
+    external: int
+    queued: int
+    at: float
+
+
+@dataclass(eq=False)
+class Ticket:
+    """One job's place in the controller; pass it back to ``release``."""
+
+    job_id: str
+    internal: bool
+    submitted_at: float
+    deadline: float
+    state: TicketState = "queued"
+    started_at: float | None = None
+    notify: Callable[["Ticket"], None] | None = field(default=None, repr=False)
+
+    @property
+    def waited(self) -> float | None:
+        """Seconds between submission and start, once started."""
+        return None if self.started_at is None else self.started_at - self.submitted_at
+
+
+@dataclass
+class AdmissionStats:
+    """Controller counters since creation."""
+
+    internal_started: int = 0
+    internal_queued: int = 0
+    external_started: int = 0
+    external_queued: int = 0
+    rejected: int = 0
+    expired: int = 0
+    completed: int = 0
+    scale_signals: int = 0
+    max_queue_depth: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class AdmissionController:
+    """
+    Shares job slots between internal tasks and external OpenClaw jobs.
+
+    Thread-safe. ``notify`` and ``on_load`` callbacks run after the lock is
+    released, on the thread that caused the change.
+
+    Args:
+        config: Capacity settings.
+        capacity: Job slots in the fleet; by default just enough for
+            ``max_concurrent_external_jobs`` beside the reservation.
+        service_seconds: Initial estimate of an external job's run time.
+        on_load: Called with a LoadSignal when load crosses the threshold.
+        clock: Monotonic clock in seconds.
+    """
+
+    def __init__(
+        self,
+        config: CapacityConfig | None = None,
+        *,
+        capacity: int | None = None,
+        service_seconds: float = DEFAULT_SERVICE_SECONDS,
+        on_load: Callable[[LoadSignal], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.config = config if config is not None else CapacityConfig()
+        self.capacity = capacity if capacity is not None else self.config.default_capacity()
+        if self.capacity < 1 or service_seconds <= 0:
+            raise ValueError("capacity must be at least 1 and service_seconds positive")
+        self.reserved = math.ceil(self.capacity * self.config.reserved_capacity_internal)
+        self.service_seconds = service_seconds
+        self.on_load = on_load
+        self.stats = AdmissionStats()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._internal = 0
+        self._external = 0
+        self._internal_waiting: deque[Ticket] = deque()
+        self._external_waiting: list[tuple[float, int, Ticket]] = []
+        self._seq = itertools.count()
+        self._above = False
+
+    def _external_slots(self) -> int:
+        internal_demand = self._internal + len(self._internal_waiting)
+        return max(
+            min(
+                self.config.max_concurrent_external_jobs,
+                self.capacity - max(self.reserved, internal_demand),
+            ),
+            0,
+        )
+
+    def _free(self) -> int:
+        return self.capacity - self._internal - self._external
+
+    def _queued(self) -> int:
+        return len(self._internal_waiting) + len(self._external_waiting)
+
+    def _load(self) -> float:
+        return (self._internal + self._external + self._queued()) / self.capacity
+
+    @property
+    def load(self) -> float:
+        """Running plus waiting jobs over capacity."""
+        with self._lock:
+            return self._load()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Live counts for metrics and ``update_availability``."""
+        with self._lock:
+            return {
+                "capacity": self.capacity,
+                "internal_running": self._internal,
+                "external_running": self._external,
+                "internal_waiting": len(self._internal_waiting),
+                "external_waiting": len(self._external_waiting),
+                "external_slots": self._external_slots(),
+                "load": round(self._load(), 4),
+                "service_seconds": round(self.service_seconds, 3),
+            }
+
+    def _predicted_wait(self, ahead: int) -> float:
+        """Seconds until an external job with ``ahead`` jobs queued before it starts."""
+        slots = self._external_slots()
+        if not ahead and not self._internal_waiting and self._external < slots and self._free():
+            return 0.0
+        # Each start needs a running external job to finish first. With
+        # ``running`` of them, one finishes every service/running seconds.
+        running = max(slots, self._external, 1)
+        needed = ahead + 1 + max(self._external - slots, 0)
+        return needed * self.service_seconds / running
+
+    def _retry_after(self, wait: float, budget: float) -> float:
+        # Once the backlog has shrunk by ``wait - budget``, a new job fits its
+        # deadline. Suggest no less than the time for one slot to free up.
+        # Beyond one queue timeout, internal load will have changed enough
+        # that the prediction is not worth more.
+        floor = self.service_seconds / max(self._external_slots(), self._external, 1)
+        return min(max(wait - budget, floor), max(self.config.queue_timeout_seconds, floor))
+
+    def retry_after(self) -> float:
+        """Seconds a turned-away external job should wait (0.0 if it would be queued now)."""
+        with self._lock:
+            wait = self._predicted_wait(len(self._external_waiting))
+            if wait <= self.config.queue_timeout_seconds:
+                return 0.0
+            return self._retry_after(wait, self.config.queue_timeout_seconds)
+
+    def submit(
+        self,
+        job_id: str,
+        *,
+        internal: bool = False,
+        deadline: float | None = None,
+        notify: Callable[[Ticket], None] | None = None,
+    ) -> Ticket:
+        """
+        Ask for a slot.
+
+        Args:
+            job_id: Job or task ID, for reporting.
+            internal: An internal task: never rejected and never expired.
+            deadline: Latest start time on the controller's clock; external
+                jobs default to ``queue_timeout_seconds`` from now and are
+                capped at it.
+            notify: Called with the ticket when a queued ticket starts or expires.
+
+        Returns:
+            A ticket that is ``running``, or ``queued`` until a slot frees up.
+
+        Raises:
+            AdmissionError: If an external job would not start before its deadline.
+        """
+        now = self._clock()
+        if internal:
+            deadline = math.inf
+        else:
+            latest = now + self.config.queue_timeout_seconds
+            deadline = latest if deadline is None else min(deadline, latest)
+        ticket = Ticket(job_id, internal, now, deadline, notify=notify)
+        error = None
+        with self._lock:
+            expired = self._expire(now)
+            if internal:
+                self._enqueue_internal(ticket, now)
+            else:
+                wait = self._predicted_wait(len(self._external_waiting))
+                if now + wait > deadline:
+                    self.stats.rejected += 1
+                    error = AdmissionError(
+                        f"At capacity: job {job_id} would wait {wait:.0f}s",
+                        self._retry_after(wait, deadline - now),
+                    )
+                else:
+                    self._enqueue_external(ticket, now)
+            signal = self._signal(now)
+        self._fire(expired, signal)
+        if error is not None:
+            raise error
+        return ticket
+
+    def _enqueue_internal(self, ticket: Ticket, now: float) -> None:
+        if not self._internal_waiting and self._free() > 0:
+            self._start(ticket, now)
+            return
+        self.stats.internal_queued += 1
+        self._internal_waiting.append(ticket)
+        self._note_depth()
+
+    def _enqueue_external(self, ticket: Ticket, now: float) -> None:
+        if self._predicted_wait(len(self._external_waiting)) == 0.0:
+            self._start(ticket, now)
+            return
+        self.stats.external_queued += 1
+        heapq.heappush(self._external_waiting, (ticket.deadline, next(self._seq), ticket))
+        self._note_depth()
+
+    def _note_depth(self) -> None:
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, self._queued())
+
+    def _start(self, ticket: Ticket, now: float) -> None:
+        ticket.state = "running"
+        ticket.started_at = now
+        if ticket.internal:
+            self._internal += 1
+            self.stats.internal_started += 1
+        else:
+            self._external += 1
+            self.stats.external_started += 1
+
+    def release(self, ticket: Ticket) -> None:
+        """
+        Give back a running ticket's slot and start whatever can use it.
+
+        Raises:
+            ValueError: If the ticket is not running.
+        """
+        now = self._clock()
+        with self._lock:
+            if ticket.state != "running":
+                raise ValueError(f"ticket for {ticket.job_id} is {ticket.state}, not running")
+            ticket.state = "done"
+            self.stats.completed += 1
+            if ticket.internal:
+                self._internal -= 1
+            else:
+                self._external -= 1
+                assert ticket.started_at is not None
+                self.service_seconds += SERVICE_EWMA_ALPHA * (
+                    now - ticket.started_at - self.service_seconds
+                )
+            changed = self._expire(now) + self._promote(now)
+            signal = self._signal(now)
+        self._fire(changed, signal)
+
+    def withdraw(self, ticket: Ticket) -> bool:
+        """Take a queued ticket out of the queue; False if it is no longer queued."""
+        with self._lock:
+            if ticket.state != "queued":
+                return False
+            ticket.state = "expired"
+            if ticket.internal:
+                self._internal_waiting.remove(ticket)
+            else:
+                self._external_waiting = [e for e in self._external_waiting if e[2] is not ticket]
+                heapq.heapify(self._external_waiting)
+            now = self._clock()
+            changed = self._promote(now)
+            signal = self._signal(now)
+        self._fire(changed, signal)
+        return True
+
+    def expire(self) -> list[Ticket]:
+        """Drop queued external jobs whose deadline has passed; returns them."""
+        now = self._clock()
+        with self._lock:
+            expired = self._expire(now)
+            changed = expired + self._promote(now)
+            signal = self._signal(now)
+        self._fire(changed, signal)
+        return expired
+
+    def _expire(self, now: float) -> list[Ticket]:
+        expired = []
+        while self._external_waiting and self._external_waiting[0][0] < now:
+            ticket = heapq.heappop(self._external_waiting)[2]
+            ticket.state = "expired"
+            self.stats.expired += 1
+            expired.append(ticket)
+        return expired
+
+    def _promote(self, now: float) -> list[Ticket]:
+        started = []
+        while self._internal_waiting and self._free() > 0:
+            ticket = self._internal_waiting.popleft()
+            self._start(ticket, now)
+            started.append(ticket)
+        while (
+            self._external_waiting
+            and not self._internal_waiting
+            and self._free() > 0
+            and self._external < self._external_slots()
+        ):
+            ticket = heapq.heappop(self._external_waiting)[2]
+            self._start(ticket, now)
+            started.append(ticket)
+        return started
+
+    def _signal(self, now: float) -> LoadSignal | None:
+        load = self._load()
+        threshold = self.config.auto_scale_threshold
+        above = load > threshold - SCALE_DOWN_MARGIN if self._above else load >= threshold
+        if above == self._above:
+            return None
+        self._above = above
+        self.stats.scale_signals += 1
+        return LoadSignal(
+            round(load, 4), above, self._internal, self._external, self._queued(), now
+        )
+
+    def _fire(self, changed: list[Ticket], signal: LoadSignal | None) -> None:
+        for ticket in changed:
+            if ticket.notify is not None:
+                ticket.notify(ticket)
+        if signal is not None and self.on_load is not None:
+            self.on_load(signal)
+
+    async def admit(
+        self, job_id: str, *, internal: bool = False, deadline: float | None = None
+    ) -> Ticket:
+        """
+        Wait for a slot; the returned ticket is running.
+
+        Raises:
+            AdmissionError: If an external job is rejected or its deadline
+                passes while it waits.
+        """
+        loop = asyncio.get_running_loop()
+        changed: asyncio.Future[None] = loop.create_future()
+
+        def wake(_: Ticket) -> None:
+            loop.call_soon_threadsafe(_resolve, changed)
+
+        ticket = self.submit(job_id, internal=internal, deadline=deadline, notify=wake)
+        if ticket.state == "running":
+            return ticket
+        timeout = None if internal else max(ticket.deadline - self._clock(), 0.0)
+        try:
+            await asyncio.wait_for(changed, timeout)
+        except TimeoutError:
+            pass
+        except BaseException:
+            if not self.withdraw(ticket) and ticket.started_at is not None:
+                self.release(ticket)
+            raise
+        if self.withdraw(ticket):
+            # The deadline passed between events, so ``_expire`` has not seen it.
+            with self._lock:
+                self.stats.expired += 1
+        elif ticket.started_at is not None:
+            return ticket
+        raise AdmissionError(
+            f"Job {job_id} was not started before its deadline", self.retry_after()
+        )
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
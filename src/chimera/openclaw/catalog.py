@@ -0,0 +1,565 @@
+"""
+Local catalog of OpenClaw providers behind ``discover_services``.
+
+Reference: specs/openclaw_integration.md §3.1 (discovery request), §3.2
+(discovery response), §4.2 (job status), §6.1 (reputation factors), §6.2
+(reputation update), §8.2 (``discover_services`` tool)
+
+The Planner asks for providers of a capability, filtered by
+``min_reputation`` and ``budget_max``. Asking the network registry and
+re-ranking its answer on every planning step costs seconds, so the
+catalog keeps the providers locally:
+- Every offering is a row of one NumPy structured array (``ROW_DTYPE``).
+- An inverted index maps each capability to its rows.
+- Price and reputation score have sorted indexes for range filters. A row
+  whose value changed since an index was sorted is kept in a small dirty
+  set and checked directly. The index is re-sorted once that set grows
+  past a fraction of the catalog.
+- A query starts from whichever of the capability list and the two
+  ranges holds the fewest rows, and filters those rows on the others.
+- The top ``limit`` rows are ranked by the §6.1 weighted score, then
+  success rate, average latency, SLA availability and price.
+- Answers are cached per query signature. A reputation event only
+  invalidates cached answers for the capabilities of the provider it is
+  about.
+
+Reputation events update the §6.1 factors as running means. Job status
+updates (§4.2) feed completion, latency adherence and disputes. Ratings
+(§6.2) feed quality and response time.
+
+    catalog = ProviderCatalog()
+    catalog.register(Provider.from_dict(entry))
+    catalog.discover("video_generation", min_reputation=0.85, budget_max=15.0, limit=5)
+    catalog.record_job("videomaster_001", {"status": "completed", "metrics": {...}})
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import numpy as np
+
+# §6.1 reputation factor weights.
+REPUTATION_WEIGHTS: dict[str, float] = {
+    "completion_rate": 0.30,
+    "quality": 0.25,
+    "latency_adherence": 0.20,
+    "response_time": 0.15,
+    "dispute_rate": 0.10,  # counted as 1 - dispute_rate
+}
+# §6.2 ratings are out of 5.
+RATING_SCALE = 5.0
+# Re-sort an index once more than this fraction of rows changed since.
+RESORT_FRACTION = 1 / 16
+DEFAULT_LIMIT = 10
+
+ROW_DTYPE = np.dtype(
+    [
+        ("price", "<f8"),
+        ("score", "<f8"),
+        ("completion_rate", "<f8"),
+        ("quality", "<f8"),
+        ("latency_adherence", "<f8"),
+        ("response_time", "<f8"),
+        ("dispute_rate", "<f8"),
+        ("avg_latency", "<f8"),
+        ("sla_latency", "<f8"),
+        ("availability", "<f8"),
+        ("total_jobs", "<i8"),
+        ("ratings", "<i8"),
+        ("alive", "u1"),
+    ]
+)
+
+
+@dataclass(frozen=True)
+class Provider:
+    """
+    One service offered by an OpenClaw agent.
+
+    Reputation belongs to the agent: events about ``agent_id`` update every
+    service it offers.
+    """
+
+    agent_id: str
+    service_id: str
+    capabilities: tuple[str, ...]
+    base_price: float
+    agent_name: str = ""
+    currency: str = "USDC"
+    completion_rate: float = 0.5
+    quality: float = 0.5
+    latency_adherence: float = 0.5
+    response_time: float = 0.5
+    dispute_rate: float = 0.0
+    total_jobs: int = 0
+    avg_latency_seconds: float = 0.0
+    sla_max_latency_seconds: float = 0.0
+    sla_availability: float = 0.0
+
+    @property
+    def score(self) -> float:
+        score: float = reputation_score(
+            self.completion_rate,
+            self.quality,
+            self.latency_adherence,
+            self.response_time,
+            self.dispute_rate,
+        )
+        return score
+
+    @classmethod
+    def from_dict(cls, entry: Mapping[str, Any]) -> "Provider":
+        """
+        Read a §3.2 provider entry, plus ``capabilities``.
+
+        Factors missing from ``reputation`` are taken from its ``score``
+        (and ``success_rate`` for completion), so the §6.1 score of a
+        provider listed with a score alone is that score.
+        """
+        reputation = entry.get("reputation", {})
+        sla = entry.get("sla", {})
+        score = float(reputation.get("score", 0.5))
+        return cls(
+            agent_id=entry["agent_id"],
+            service_id=entry["service_id"],
+            capabilities=tuple(entry["capabilities"]),
+            base_price=float(entry["pricing"]["base_price"]),
+            agent_name=entry.get("agent_name", ""),
+            currency=entry["pricing"].get("currency", "USDC"),
+            completion_rate=float(reputation.get("success_rate", score)),
+            quality=float(reputation.get("quality", score)),
+            latency_adherence=float(reputation.get("latency_adherence", score)),
+            response_time=float(reputation.get("response_time", score)),
+            dispute_rate=float(reputation.get("dispute_rate", 1.0 - score)),
+            total_jobs=int(reputation.get("total_jobs", 0)),
+            avg_latency_seconds=float(reputation.get("avg_latency_seconds", 0.0)),
+            sla_max_latency_seconds=float(sla.get("max_latency_seconds", 0.0)),
+            sla_availability=float(sla.get("availability", 0.0)),
+        )
+
+
+def reputation_score(
+    completion_rate: Any,
+    quality: Any,
+    latency_adherence: Any,
+    response_time: Any,
+    dispute_rate: Any,
+) -> Any:
+    """§6.1 weighted score, for scalars or arrays of factors."""
+    weights = REPUTATION_WEIGHTS
+    return (
+        weights["completion_rate"] * completion_rate
+        + weights["quality"] * quality
+        + weights["latency_adherence"] * latency_adherence
+        + weights["response_time"] * response_time
+        + weights["dispute_rate"] * (1.0 - dispute_rate)
+    )
+
+
+@dataclass
+class CatalogStats:
+    """Catalog counters since creation."""
+
+    queries: int = 0
+    cache_hits: int = 0
+    events: int = 0
+    resorts: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class _SortedIndex:
+    """Rows sorted by one column, plus the rows changed since the sort."""
+
+    def __init__(self, column: str):
+        self.column = column
+        self.rows = np.empty(0, dtype=np.int64)
+        self.keys = np.empty(0, dtype=np.float64)
+        self.dirty: set[int] = set()
+
+    def rebuild(self, table: np.ndarray, count: int) -> None:
+        alive = np.flatnonzero(table["alive"][:count])
+        values = table[self.column][alive]
+        order = np.argsort(values, kind="stable")
+        self.rows, self.keys = alive[order], values[order]
+        self.dirty.clear()
+
+    def span(self, low: float, high: float) -> tuple[int, int]:
+        """Positions of sorted rows with ``low <= value <= high``, as sorted."""
+        return (
+            int(np.searchsorted(self.keys, low, "left")),
+            int(np.searchsorted(self.keys, high, "right")),
+        )
+
+    def select(self, table: np.ndarray, low: float, high: float) -> np.ndarray:
+        """Live rows whose current value is in [low, high]."""
+        start, stop = self.span(low, high)
+        rows = self.rows[start:stop]
+        if not self.dirty:
+            return rows
+        dirty = np.fromiter(self.dirty, np.int64, len(self.dirty))
+        rows = rows[~np.isin(rows, dirty)]
+        values = table[self.column][dirty]
+        fresh = dirty[(values >= low) & (values <= high) & (table["alive"][dirty] == 1)]
+        return np.concatenate([rows, fresh])
+
+
+class ProviderCatalog:
+    """
+    Providers indexed by capability, price and reputation.
+
+    Thread-safe.
+
+    Args:
+        cache_size: Query answers kept, least recently used first out.
+        initial_capacity: Rows preallocated; the array doubles when full.
+    """
+
+    def __init__(self, *, cache_size: int = 1024, initial_capacity: int = 1024):
+        self.cache_size = cache_size
+        self.stats = CatalogStats()
+        self._table = np.zeros(max(1, initial_capacity), dtype=ROW_DTYPE)
+        self._count = 0
+        self._free: list[int] = []
+        self._providers: list[Provider | None] = []
+        self._by_service: dict[str, int] = {}
+        self._by_agent: dict[str, set[int]] = {}
+        self._by_capability: dict[str, set[int]] = {}
+        self._capability_rows: dict[str, np.ndarray] = {}
+        self._price = _SortedIndex("price")
+        self._score = _SortedIndex("score")
+        # Bumped on any change to a capability's rows; cached answers
+        # carry the version they were computed at.
+        self._versions: dict[str | None, int] = {None: 0}
+        self._cache: OrderedDict[tuple[Any, ...], tuple[int, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._by_service)
+
+    def __contains__(self, service_id: object) -> bool:
+        return service_id in self._by_service
+
+    def register(self, provider: Provider) -> None:
+        """Add a provider, or replace the one with the same ``service_id``."""
+        with self._lock:
+            if provider.service_id in self._by_service:
+                self._remove(provider.service_id)
+            row = self._free.pop() if self._free else self._allocate()
+            self._table[row] = (
+                provider.base_price,
+                provider.score,
+                provider.completion_rate,
+                provider.quality,
+                provider.latency_adherence,
+                provider.response_time,
+                provider.dispute_rate,
+                provider.avg_latency_seconds,
+                provider.sla_max_latency_seconds,
+                provider.sla_availability,
+                provider.total_jobs,
+                0,
+                1,
+            )
+            self._providers[row] = provider
+            self._by_service[provider.service_id] = row
+            self._by_agent.setdefault(provider.agent_id, set()).add(row)
+            for capability in provider.capabilities:
+                self._by_capability.setdefault(capability, set()).add(row)
+                self._capability_rows.pop(capability, None)
+            self._changed([row], price=True)
+
+    def register_many(self, providers: Iterable[Provider]) -> None:
+        with self._lock:
+            for provider in providers:
+                self.register(provider)
+
+    def remove(self, service_id: str) -> bool:
+        with self._lock:
+            if service_id not in self._by_service:
+                return False
+            self._remove(service_id)
+            return True
+
+    def _remove(self, service_id: str) -> None:
+        row = self._by_service.pop(service_id)
+        provider = self._providers[row]
+        assert provider is not None
+        self._changed([row], price=True)
+        self._table[row]["alive"] = 0
+        self._providers[row] = None
+        self._free.append(row)
+        self._by_agent[provider.agent_id].discard(row)
+        if not self._by_agent[provider.agent_id]:
+            del self._by_agent[provider.agent_id]
+        for capability in provider.capabilities:
+            self._by_capability[capability].discard(row)
+            self._capability_rows.pop(capability, None)
+
+    def _allocate(self) -> int:
+        row = self._count
+        if row == len(self._table):
+            grown = np.zeros(2 * row, dtype=ROW_DTYPE)
+            grown[:row] = self._table
+            self._table = grown
+        self._count += 1
+        self._providers.append(None)
+        return row
+
+    def _changed(self, rows: Sequence[int], *, price: bool = False) -> None:
+        """Mark rows dirty and invalidate cached answers that could include them."""
+        self._score.dirty.update(rows)
+        if price:
+            self._price.dirty.update(rows)
+        self._versions[None] += 1
+        for row in rows:
+            provider = self._providers[row]
+            if provider is None:
+                continue
+            for capability in provider.capabilities:
+                self._versions[capability] = self._versions.get(capability, 0) + 1
+
+    def record_job(self, agent_id: str, update: Mapping[str, Any]) -> None:
+        """
+        Apply a §4.2 job status update for a job done by ``agent_id``.
+
+        ``completed`` and ``failed`` count towards completion rate;
+        ``disputed`` counts as a job and a dispute. Latency adherence uses
+        ``metrics.actual_latency_seconds`` against each service's SLA, and
+        ``metrics.quality_score`` (0-1) feeds quality.
+        """
+        status = update["status"]
+        if status not in ("completed", "failed", "disputed"):
+            return
+        metrics = update.get("metrics", {})
+        latency = metrics.get("actual_latency_seconds")
+        with self._lock:
+            rows = self._agent_rows(agent_id)
+            table = self._table
+            jobs = table["total_jobs"][rows] + 1
+
+            def mean(column: str, value: Any) -> None:
+                current = table[column][rows]
+                table[column][rows] = current + (value - current) / jobs
+
+            mean("completion_rate", float(status == "completed"))
+            mean("dispute_rate", float(status == "disputed"))
+            if latency is not None:
+                latency = float(latency)
+                sla = table["sla_latency"][rows]
+                mean("latency_adherence", ((sla <= 0) | (latency <= sla)).astype(np.float64))
+                mean("avg_latency", latency)
+            if "quality_score" in metrics:
+                self._rate(rows, "quality", float(metrics["quality_score"]))
+            table["total_jobs"][rows] = jobs
+            self._rescore(rows)
+
+    def record_rating(self, agent_id: str, params: Mapping[str, Any]) -> None:
+        """Apply §6.2 ``update_reputation`` params: ``rating.quality`` and ``rating.speed``."""
+        rating = params["rating"]
+        with self._lock:
+            rows = self._agent_rows(agent_id)
+            if "quality" in rating:
+                self._rate(rows, "quality", float(rating["quality"]) / RATING_SCALE)
+            if "speed" in rating:
+                self._rate(rows, "response_time", float(rating["speed"]) / RATING_SCALE)
+            self._table["ratings"][rows] += 1
+            self._rescore(rows)
+
+    def _agent_rows(self, agent_id: str) -> np.ndarray:
+        rows = self._by_agent.get(agent_id)
+        if not rows:
+            raise KeyError(f"unknown provider agent {agent_id!r}")
+        self.stats.events += 1
+        return np.fromiter(rows, np.int64, len(rows))
+
+    def _rate(self, rows: np.ndarray, column: str, value: float) -> None:
+        table = self._table
+        weight = table["ratings"][rows] + table["total_jobs"][rows] + 1
+        current = table[column][rows]
+        table[column][rows] = current + (value - current) / weight
+
+    def _rescore(self, rows: np.ndarray) -> None:
+        table = self._table
+        table["score"][rows] = reputation_score(
+            table["completion_rate"][rows],
+            table["quality"][rows],
+            table["latency_adherence"][rows],
+            table["response_time"][rows],
+            table["dispute_rate"][rows],
+        )
+        self._changed(rows.tolist())
+
+    def discover(
+        self,
+        capability: str | None = None,
+        *,
+        min_reputation: float = 0.0,
+        budget_max: float | None = None,
+        limit: int = DEFAULT_LIMIT,
+    ) -> dict[str, Any]:
+        """
+        The best ``limit`` providers matching the filters.
+
+        Returns:
+            The §3.2 ``data`` object: ``providers`` (best first) and
+            ``total_results`` (all matches, before ``limit``). It is the
+            caller's copy; editing it does not touch the cache.
+
+        Raises:
+            ValueError: If ``limit`` is below 1.
+        """
+        if limit < 1:
+            raise ValueError(f"limit must be at least 1, got {limit}")
+        signature = (capability, min_reputation, budget_max, limit)
+        with self._lock:
+            self.stats.queries += 1
+            version = self._versions.get(capability, 0) if capability else self._versions[None]
+            cached = self._cache.get(signature)
+            if cached is not None and cached[0] == version:
+                self._cache.move_to_end(signature)
+                self.stats.cache_hits += 1
+                return _copy(cached[1])
+            data = self._query(capability, min_reputation, budget_max, limit)
+            self._cache[signature] = (version, data)
+            self._cache.move_to_end(signature)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return _copy(data)
+
+    def _query(
+        self, capability: str | None, min_reputation: float, budget_max: float | None, limit: int
+    ) -> dict[str, Any]:
+        table = self._table
+        for index in (self._price, self._score):
+            if len(index.dirty) > max(64, len(self) * RESORT_FRACTION):
+                index.rebuild(table, self._count)
+                self.stats.resorts += 1
+        high_price = np.inf if budget_max is None else budget_max
+
+        # Start from the smallest candidate set; filter it on the rest.
+        sizes = {
+            "price": self._estimate(self._price, -np.inf, high_price),
+            "score": self._estimate(self._score, min_reputation, np.inf),
+        }
+        if capability is not None:
+            sizes["capability"] = len(self._by_capability.get(capability, ()))
+        driver = min(sizes, key=sizes.__getitem__)
+        if driver == "capability":
+            assert capability is not None
+            rows = self._capability(capability)
+        elif driver == "price":
+            rows = self._price.select(table, -np.inf, high_price)
+        else:
+            rows = self._score.select(table, min_reputation, np.inf)
+
+        # Gather single fields: copying whole records costs 5x more.
+        score = table["score"][rows]
+        keep = (table["alive"][rows] == 1) & (score >= min_reputation)
+        keep &= table["price"][rows] <= high_price
+        if capability is not None and driver != "capability":
+            keep &= np.isin(rows, self._capability(capability))
+        rows, score = rows[keep], score[keep]
+
+        total = len(rows)
+        if total > 4 * limit:
+            # Anything tied with the limit-th best score stays in for ranking.
+            cutoff = np.partition(score, total - limit)[total - limit]
+            rows = rows[score >= cutoff]
+        columns = table[rows]
+        order = np.lexsort(
+            (
+                columns["price"],
+                -columns["availability"],
+                columns["avg_latency"],
+                -columns["completion_rate"],
+                -columns["score"],
+            )
+        )[:limit]
+        return {
+            "providers": [self._entry(int(rows[i]), columns[i]) for i in order],
+            "total_results": total,
+        }
+
+    def _estimate(self, index: _SortedIndex, low: float, high: float) -> int:
+        start, stop = index.span(low, high)
+        return stop - start + len(index.dirty)
+
+    def _capability(self, capability: str) -> np.ndarray:
+        rows = self._capability_rows.get(capability)
+        if rows is None:
+            members = self._by_capability.get(capability, set())
+            rows = np.sort(np.fromiter(members, np.int64, len(members)))
+            self._capability_rows[capability] = rows
+        return rows
+
+    def _entry(self, row: int, values: np.void) -> dict[str, Any]:
+        provider = self._providers[row]
+        assert provider is not None
+        entry: dict[str, Any] = {
+            "agent_id": provider.agent_id,
+            "agent_name": provider.agent_name,
+            "service_id": provider.service_id,
+            "pricing": {"base_price": f"{values['price']:.2f}", "currency": provider.currency},
+            "reputation": {
+                "score": round(float(values["score"]), 4),
+                "total_jobs": int(values["total_jobs"]),
+                "success_rate": round(float(values["completion_rate"]), 4),
+                "avg_latency_seconds": round(float(values["avg_latency"]), 1),
+            },
+        }
+        if values["sla_latency"] or values["availability"]:
+            entry["sla"] = {
+                "max_latency_seconds": float(values["sla_latency"]),
+                "availability": float(values["availability"]),
+            }
+        return entry
+
+
+def _copy(data: dict[str, Any]) -> dict[str, Any]:
+    """A copy of a ``discover`` answer down to the nested entry dicts."""
+    providers = [
+        {key: dict(value) if isinstance(value, dict) else value for key, value in entry.items()}
+        for entry in data["providers"]
+    ]
+    return {"providers": providers, "total_results": data["total_results"]}
+
+
+_catalog: ProviderCatalog | None = None
+
+
+def configure_catalog(catalog: ProviderCatalog | None) -> None:
+    """Set the process-wide catalog behind ``discover_services``."""
+    global _catalog
+    _catalog = catalog
+
+
+def discover_services(params: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    MCP tool ``discover_services``, answered from the local catalog.
+
+    Args:
+        params: §3.1 ``params``: ``capability``, ``requirements.min_reputation``,
+            ``budget_max`` (a decimal string), and optionally ``limit``.
+
+    Returns:
+        The §3.2 response.
+
+    Raises:
+        ValueError: If ``limit`` is below 1.
+    """
+    if _catalog is None:
+        raise RuntimeError("No provider catalog configured; call configure_catalog()")
+    requirements = params.get("requirements", {})
+    budget = params.get("budget_max")
+    data = _catalog.discover(
+        params.get("capability"),
+        min_reputation=float(requirements.get("min_reputation", 0.0)),
+        budget_max=None if budget is None else float(budget),
+        limit=int(params.get("limit", DEFAULT_LIMIT)),
+    )
+    return {"success": True, "data": data}
@@ -0,0 +1,189 @@
+"""
+Discrete-event simulation of OpenClaw admission control.
+
+Reference: specs/openclaw_integration.md §5.2 (capacity_config)
+
+Internal tasks and external jobs arrive as Poisson streams. A burst of
+external jobs arrives halfway through the run. Each job holds a slot for
+an exponentially distributed time. The controller runs on a simulated
+clock, so hours of traffic take well under a second.
+
+    python -m chimera.openclaw.simulate --internal-rate 0.3 --external-rate 0.2
+    python -m chimera.openclaw.simulate --compare  # also run with no reservation
+
+The report covers:
+- internal and external start waits (P50/P95/P99, in seconds)
+- rejections and expiries, and the ``retry_after`` values handed out
+- slot utilisation and auto-scale signals
+"""
+
+import argparse
+import heapq
+import itertools
+import json
+import random
+from dataclasses import replace
+from typing import Any
+
+from chimera.runtime import latency_summary
+
+from .admission import AdmissionController, AdmissionError, CapacityConfig, LoadSignal, Ticket
+
+
+class _SimClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def simulate(
+    config: CapacityConfig | None = None,
+    *,
+    capacity: int = 20,
+    internal_rate: float = 0.3,
+    external_rate: float = 0.2,
+    internal_service: float = 30.0,
+    external_service: float = 60.0,
+    burst: int = 40,
+    duration: float = 3600.0,
+    seed: int = 7,
+) -> dict[str, Any]:
+    """
+    Run one simulated period and report what happened.
+
+    Args:
+        config: Capacity settings; the §5.2 defaults if omitted.
+        capacity: Job slots in the fleet.
+        internal_rate: Internal task arrivals per second.
+        external_rate: External job arrivals per second.
+        internal_service: Mean internal run time in seconds.
+        external_service: Mean external run time in seconds.
+        burst: External jobs arriving at once halfway through.
+        duration: Seconds of arrivals; running and queued work then drains.
+        seed: Seed for arrivals and run times.
+
+    Returns:
+        Dict with internal and external counts and waits, retry_after
+        statistics, utilization, scale_signals and max_queue_depth.
+    """
+    rng = random.Random(seed)
+    clock = _SimClock()
+    signals: list[LoadSignal] = []
+    controller = AdmissionController(
+        config,
+        capacity=capacity,
+        service_seconds=external_service,
+        on_load=signals.append,
+        clock=clock,
+    )
+    events: list[tuple[float, int, str, Ticket | None]] = []
+    seq = itertools.count()
+    internal: list[Ticket] = []
+    external: list[Ticket] = []
+    retry_after: list[float] = []
+    hired = 0
+    busy = 0.0
+
+    def at(when: float, kind: str, ticket: Ticket | None = None) -> None:
+        heapq.heappush(events, (when, next(seq), kind, ticket))
+
+    def started(ticket: Ticket) -> None:
+        if ticket.state == "running":
+            mean = internal_service if ticket.internal else external_service
+            at(clock.now + rng.expovariate(1 / mean), "finish", ticket)
+
+    def hire() -> None:
+        nonlocal hired
+        hired += 1
+        try:
+            ticket = controller.submit(f"ext-{hired}", notify=started)
+        except AdmissionError as exc:
+            retry_after.append(exc.retry_after)
+            return
+        external.append(ticket)
+        if ticket.state == "running":
+            started(ticket)
+        else:
+            at(ticket.deadline, "expire")
+
+    at(rng.expovariate(internal_rate), "internal")
+    at(rng.expovariate(external_rate), "external")
+    at(duration / 2, "burst")
+    while events:
+        clock.now, _, kind, ticket = heapq.heappop(events)
+        if kind == "internal":
+            task = controller.submit(f"int-{len(internal)}", internal=True, notify=started)
+            internal.append(task)
+            started(task)
+            if clock.now < duration:
+                at(clock.now + rng.expovariate(internal_rate), "internal")
+        elif kind == "external":
+            hire()
+            if clock.now < duration:
+                at(clock.now + rng.expovariate(external_rate), "external")
+        elif kind == "burst":
+            for _ in range(burst):
+                hire()
+        elif kind == "expire":
+            controller.expire()
+        elif ticket is not None and ticket.started_at is not None:
+            busy += clock.now - ticket.started_at
+            controller.release(ticket)
+
+    external_waits = [t.waited for t in external if t.waited is not None]
+    return {
+        "capacity": controller.capacity,
+        "reserved_slots": controller.reserved,
+        "internal": {
+            "arrived": len(internal),
+            "wait_seconds": latency_summary([t.waited or 0.0 for t in internal]),
+        },
+        "external": {
+            "arrived": hired,
+            "started": len(external_waits),
+            "rejected": controller.stats.rejected,
+            "expired": controller.stats.expired,
+            "wait_seconds": latency_summary(external_waits),
+            "retry_after_seconds": latency_summary(retry_after),
+        },
+        "utilization": round(busy / (controller.capacity * clock.now), 4) if clock.now else 0.0,
+        "scale_signals": [(round(s.at, 1), s.scale_up) for s in signals][:20],
+        "max_queue_depth": controller.stats.max_queue_depth,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--capacity", type=int, default=20, help="job slots in the fleet")
+    parser.add_argument("--internal-rate", type=float, default=0.3, help="internal tasks/s")
+    parser.add_argument("--external-rate", type=float, default=0.2, help="external jobs/s")
+    parser.add_argument("--internal-service", type=float, default=30.0, help="mean seconds")
+    parser.add_argument("--external-service", type=float, default=60.0, help="mean seconds")
+    parser.add_argument("--burst", type=int, default=40, help="external jobs at once mid-run")
+    parser.add_argument("--duration", type=float, default=3600.0, help="seconds of arrivals")
+    parser.add_argument("--compare", action="store_true", help="also run with no reservation")
+    args = parser.parse_args(argv)
+
+    options = {
+        "capacity": args.capacity,
+        "internal_rate": args.internal_rate,
+        "external_rate": args.external_rate,
+        "internal_service": args.internal_service,
+        "external_service": args.external_service,
+        "burst": args.burst,
+        "duration": args.duration,
+    }
+    config = CapacityConfig()
+    report = {"reserved": simulate(config, **options)}
+    if args.compare:
+        unreserved = replace(
+            config, reserved_capacity_internal=0.0, max_concurrent_external_jobs=args.capacity
+        )
+        report["unreserved"] = simulate(unreserved, **options)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+"""
+Persona registry and batched ``persona_alignment`` scoring.
+
+Reference: specs/technical.md §1.2 (Generate Text ``persona_alignment``),
+skills/*/output_schema.json (``metadata.persona_alignment``),
+src/chimera/judge.py (``Thresholds.min_alignment``)
+
+Each persona is reduced once to two unit vectors, kept as one row of a
+contiguous ``(capacity, 2, dim)`` float32 array:
+- the voice profile: cue words for each voice trait (``TRAIT_CUES``) and
+  the persona's own vocabulary;
+- the avoid profile: topics the persona must stay away from.
+
+Scoring a batch embeds the texts once and takes both cosines for every
+text with a single matrix product. The score is
+
+    clip(NEUTRAL + VOICE_GAIN * voice_cos - AVOID_GAIN * max(avoid_cos, 0), 0, 1)
+
+so text that is neither on nor off voice scores NEUTRAL (0.75, above the
+Judge's 0.70 ``min_alignment``), text using the persona's vocabulary
+scores higher, and text touching an avoided topic drops below the review
+threshold.
+
+Registering a persona again with the same definition is a dictionary
+lookup and an equality test; its vectors are only rebuilt when the
+definition changes.
+
+    registry = get_registry()
+    registry.register(Persona("chimera_fashion_001", ("witty", "sustainability-focused")))
+    scores = registry.score("chimera_fashion_001", texts)
+"""
+
+import re
+import threading
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import numpy as np
+
+from chimera.memory import Embedder, HashingEmbedder, normalize
+
+# Wide, so that a one-word avoid topic rarely shares a hash bucket with
+# an unrelated word (at 512, "politics" and "eco" do).
+DEFAULT_DIM = 2048
+NEUTRAL = 0.75
+VOICE_GAIN = 1.0
+AVOID_GAIN = 2.0
+
+# Cue words per voice trait; unknown traits contribute their own words.
+TRAIT_CUES: dict[str, tuple[str, ...]] = {
+    "witty": ("lol", "haha", "clever", "pun", "joke", "wink", "plot twist", "honestly"),
+    "funny": ("lol", "haha", "joke", "hilarious", "lmao"),
+    "empathetic": ("feel", "understand", "sorry", "hear you", "support", "here for you", "care"),
+    "professional": ("pleased", "announce", "thank you", "details", "available", "team"),
+    "casual": ("hey", "tbh", "kinda", "gonna", "love", "cute", "vibes"),
+    "enthusiastic": ("love", "amazing", "excited", "obsessed", "can't wait", "so good"),
+    "technical": ("spec", "specs", "data", "performance", "benchmark", "details", "how it works"),
+    "gen-z slang": ("lowkey", "highkey", "slay", "vibe", "no cap", "fr", "bestie", "iconic"),
+    "sustainability-focused": (
+        "sustainable",
+        "sustainability",
+        "eco",
+        "ethical",
+        "thrift",
+        "thrifted",
+        "recycled",
+        "upcycled",
+        "planet",
+        "conscious",
+        "secondhand",
+    ),
+}
+
+_AVOID = re.compile(
+    r"^\s*(?:never|avoid|no|don't|do not)\s+"
+    r"(?:(?:discuss|discussing|mention|mentioning|use|using|talk about)\s+)?(.+?)\s*$",
+    re.IGNORECASE,
+)
+_CAMEL = re.compile(r"(?<=[a-z])(?=[A-Z])")
+_HASHTAG = re.compile(r"#(\w+)")
+
+
+def _split_hashtags(text: str) -> str:
+    """'#SustainableFashion' -> ' Sustainable Fashion', so its words are features."""
+    return _HASHTAG.sub(lambda match: " " + _CAMEL.sub(" ", match.group(1)), text)
+
+
+@dataclass(frozen=True)
+class Persona:
+    """
+    What a persona's text should sound like, and stay away from.
+
+    Attributes:
+        persona_id: Registry key (``persona_id`` in engagement requests).
+        voice_traits: Traits such as "witty"; see ``TRAIT_CUES``.
+        vocabulary: Words and phrases the persona uses.
+        avoid: Topics and words the persona must not use.
+    """
+
+    persona_id: str
+    voice_traits: tuple[str, ...] = ()
+    vocabulary: tuple[str, ...] = ()
+    avoid: tuple[str, ...] = ()
+
+    @classmethod
+    def from_constraints(cls, constraints: Sequence[str]) -> "Persona":
+        """
+        Build a persona from content_generator ``persona_constraints``.
+
+        "Never discuss politics" and similar constraints become avoid
+        topics; the others are voice traits. The id is derived from the
+        constraints, so equal constraints give the same persona.
+        """
+        traits: list[str] = []
+        avoid: list[str] = []
+        for constraint in constraints:
+            match = _AVOID.match(constraint)
+            if match:
+                avoid.append(match.group(1).lower())
+            else:
+                traits.append(constraint.strip().lower())
+        key = "|".join(sorted(c.strip().lower() for c in constraints))
+        return cls(f"constraints:{key}", tuple(traits), avoid=tuple(avoid))
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Persona":
+        """Build a persona from a mapping with the attribute names as keys."""
+        return cls(
+            data["persona_id"],
+            tuple(data.get("voice_traits", ())),
+            tuple(data.get("vocabulary", ())),
+            tuple(data.get("avoid", ())),
+        )
+
+    def voice_cues(self) -> list[str]:
+        cues: list[str] = []
+        for trait in self.voice_traits:
+            key = trait.strip().lower()
+            cues.extend(TRAIT_CUES.get(key, (re.sub(r"[\W_]+", " ", key),)))
+        cues.extend(self.vocabulary)
+        return cues
+
+
+@dataclass
+class PersonaStats:
+    """Registry counters since creation."""
+
+    builds: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    batches: int = 0
+    texts_scored: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class PersonaRegistry:
+    """
+    Personas and their precomputed voice and avoid vectors.
+
+    Args:
+        dim: Embedding width.
+        embedder: Maps texts to ``(n, dim)`` unit vectors; defaults to
+            ``HashingEmbedder(dim)``.
+        capacity: Initial number of rows; the array doubles when full.
+    """
+
+    def __init__(
+        self, dim: int = DEFAULT_DIM, embedder: Embedder | None = None, capacity: int = 64
+    ):
+        self.dim = dim
+        self.embedder = embedder or HashingEmbedder(dim)
+        self.stats = PersonaStats()
+        self._vectors = np.zeros((max(1, capacity), 2, dim), dtype=np.float32)
+        self._rows: dict[str, int] = {}
+        self._personas: dict[str, Persona] = {}
+        self._free: list[int] = []
+        self._constraint_ids: dict[tuple[str, ...], str] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, persona_id: object) -> bool:
+        return persona_id in self._rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get(self, persona_id: str) -> Persona | None:
+        return self._personas.get(persona_id)
+
+    def register(self, persona: Persona) -> bool:
+        """
+        Add or update a persona.
+
+        Returns:
+            True if its vectors were (re)built, False if an identical
+            definition was already registered.
+        """
+        with self._lock:
+            if self._personas.get(persona.persona_id) == persona:
+                self.stats.unchanged += 1
+                return False
+        vectors = self._embed_profile(persona)
+        with self._lock:
+            row = self._rows.get(persona.persona_id)
+            if row is None:
+                row = self._free.pop() if self._free else self._allocate()
+                self._rows[persona.persona_id] = row
+            self._vectors[row] = vectors
+            self._personas[persona.persona_id] = persona
+            self.stats.builds += 1
+        return True
+
+    def register_many(self, personas: Iterable[Persona]) -> int:
+        """Register each persona; return how many were (re)built."""
+        return sum(self.register(persona) for persona in personas)
+
+    def for_constraints(self, constraints: Sequence[str]) -> str:
+        """Register the persona for ``persona_constraints`` once; return its id."""
+        key = tuple(constraints)
+        persona_id = self._constraint_ids.get(key)
+        if persona_id is None or persona_id not in self._rows:
+            persona = Persona.from_constraints(key)
+            self.register(persona)
+            persona_id = self._constraint_ids[key] = persona.persona_id
+        return persona_id
+
+    def remove(self, persona_id: str) -> bool:
+        """Drop a persona; its row is reused by the next one registered."""
+        with self._lock:
+            row = self._rows.pop(persona_id, None)
+            if row is None:
+                return False
+            del self._personas[persona_id]
+            self._vectors[row] = 0
+            self._free.append(row)
+            self.stats.removed += 1
+        return True
+
+    def score(self, persona_id: str, texts: Sequence[str]) -> np.ndarray:
+        """
+        Alignment of each text with one persona.
+
+        Raises:
+            KeyError: If the persona is not registered.
+        """
+        with self._lock:
+            profile = self._vectors[self._rows[persona_id]].copy()
+        return self._alignment(self._embed(texts) @ profile.T)
+
+    def score_pairs(self, persona_ids: Sequence[str], texts: Sequence[str]) -> np.ndarray:
+        """
+        Alignment of ``texts[i]`` with ``persona_ids[i]``, for mixed batches.
+
+        Texts are grouped by persona and each group takes one matrix product
+        with that persona's row, rather than copying a row per text.
+
+        Raises:
+            KeyError: If a persona is not registered.
+        """
+        if len(persona_ids) != len(texts):
+            raise ValueError(f"{len(persona_ids)} persona ids for {len(texts)} texts")
+        with self._lock:
+            rows = np.fromiter((self._rows[p] for p in persona_ids), np.intp, len(persona_ids))
+            used, groups = np.unique(rows, return_inverse=True)
+            profiles = self._vectors[used]
+        vectors = self._embed(texts)
+        cosines = np.empty((len(texts), 2), dtype=np.float32)
+        order = np.argsort(groups, kind="stable")
+        bounds = np.searchsorted(groups[order], np.arange(len(used) + 1))
+        for group, profile in enumerate(profiles):
+            members = order[bounds[group] : bounds[group + 1]]
+            cosines[members] = vectors[members] @ profile.T
+        return self._alignment(cosines)
+
+    def _embed(self, texts: Sequence[str]) -> np.ndarray:
+        self.stats.batches += 1
+        self.stats.texts_scored += len(texts)
+        return self.embedder([_split_hashtags(text) for text in texts])
+
+    def _embed_profile(self, persona: Persona) -> np.ndarray:
+        profile = np.zeros((2, self.dim), dtype=np.float32)
+        for side, cues in enumerate((persona.voice_cues(), list(persona.avoid))):
+            if cues:
+                # Sum of per-cue vectors: no word pairs spanning two cues.
+                profile[side] = normalize(self.embedder(cues).sum(axis=0))[0]
+        return profile
+
+    def _allocate(self) -> int:
+        row = len(self._rows) + len(self._free)
+        if row == len(self._vectors):
+            grown = np.zeros((2 * row, 2, self.dim), dtype=np.float32)
+            grown[:row] = self._vectors
+            self._vectors = grown
+        return row
+
+    @staticmethod
+    def _alignment(cosines: np.ndarray) -> np.ndarray:
+        voice, avoid = cosines[:, 0], np.maximum(cosines[:, 1], 0)
+        scores: np.ndarray = np.clip(NEUTRAL + VOICE_GAIN * voice - AVOID_GAIN * avoid, 0.0, 1.0)
+        return scores
+
+
+_registry: PersonaRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def configure_registry(registry: PersonaRegistry | None) -> None:
+    """Set the process-wide registry; None starts an empty one on next use."""
+    global _registry
+    _registry = registry
+
+
+def get_registry() -> PersonaRegistry:
+    """Return the process-wide registry, creating it on first use."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = PersonaRegistry()
+    return _registry
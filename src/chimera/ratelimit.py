@@ -0,0 +1,487 @@
+"""
+Per-platform rate limiting for publishing and engagement actions.
+
+Reference: specs/technical.md §1.1 (RATE_LIMITED error with retry_after),
+§6.2 (60 publications/minute, burst 120), deployment (5 worker replicas)
+
+Every (platform, account, action) has its own token bucket. Buckets are
+kept in the generic cell rate algorithm (GCRA) form: one float per key, the
+"theoretical arrival time" (TAT). That is equivalent to a token bucket with
+``rate`` tokens per second and ``burst`` capacity. Because the state is a
+single number, a shared store can update it atomically, and a caller can
+reserve a future slot instead of failing.
+
+- ``MemoryStore``: one worker process.
+- ``SQLiteStore``: shared by every worker process on a host, through one
+  SQLite file. Any store implementing ``RateLimitStore`` atomically (for
+  example a Redis script) can replace it for multi-host deployments.
+- ``DelayQueue``: runs actions at the earliest permitted time rather than
+  failing. It backs off for everyone when a platform still answers with a
+  rate-limit error.
+"""
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import math
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+WILDCARD = "*"
+
+
+class RateLimitError(Exception):
+    """Raised when an action is over its rate limit; ``retry_after`` is in seconds."""
+
+    code = "RATE_LIMITED"
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.message = message
+        self.retry_after = retry_after
+
+    def to_error(self) -> dict[str, Any]:
+        """The error object from specs/technical.md §1.1."""
+        return {
+            "code": self.code,
+            "message": self.message,
+            "retry_after": math.ceil(self.retry_after),
+        }
+
+
+@dataclass(frozen=True)
+class Limit:
+    """``rate`` actions per second with bursts of up to ``burst`` actions."""
+
+    rate: float
+    burst: int
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0 or self.burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+
+    @classmethod
+    def per(cls, count: int, seconds: float, burst: int | None = None) -> "Limit":
+        """``count`` actions per ``seconds``; the burst defaults to ``count``."""
+        return cls(count / seconds, burst if burst is not None else count)
+
+    @property
+    def interval(self) -> float:
+        """Seconds per token."""
+        return 1.0 / self.rate
+
+    @property
+    def capacity(self) -> float:
+        """The burst expressed in seconds of TAT slack."""
+        return self.burst * self.interval
+
+
+_MINUTE, _HOUR, _DAY = 60, 3600, 86400
+
+# Per-account defaults, looked up as (platform, action), then
+# (platform, "*"), ("*", action), ("*", "*"). The platform figures are
+# conservative stand-ins for the published API quotas; deployments
+# override them per account tier.
+DEFAULT_LIMITS: dict[tuple[str, str], Limit] = {
+    (WILDCARD, "publish"): Limit.per(60, _MINUTE, burst=120),
+    (WILDCARD, WILDCARD): Limit.per(60, _MINUTE),
+    ("twitter", "publish"): Limit.per(300, 3 * _HOUR, burst=50),
+    ("twitter", "reply"): Limit.per(300, 3 * _HOUR, burst=50),
+    ("twitter", "like"): Limit.per(1000, _DAY, burst=50),
+    ("twitter", "follow"): Limit.per(400, _DAY, burst=20),
+    ("twitter", "dm"): Limit.per(500, _DAY, burst=20),
+    ("instagram", "publish"): Limit.per(25, _DAY, burst=5),
+    ("instagram", WILDCARD): Limit.per(200, _HOUR, burst=30),
+    ("tiktok", "publish"): Limit.per(15, _DAY, burst=3),
+    ("tiktok", WILDCARD): Limit.per(600, _HOUR, burst=60),
+    ("linkedin", "publish"): Limit.per(100, _DAY, burst=10),
+    ("linkedin", WILDCARD): Limit.per(300, _HOUR, burst=30),
+}
+
+
+def gcra(tat: float, now: float, limit: Limit, cost: int, reserve: bool) -> tuple[float, float]:
+    """
+    One GCRA step.
+
+    Args:
+        tat: Stored theoretical arrival time (0 for an unused key).
+        now: Current time.
+        limit: The bucket's limit.
+        cost: Tokens requested.
+        reserve: Take the slot even if it lies in the future.
+
+    Returns:
+        ``(new_tat, wait)``. ``wait <= 0`` means the action may run now.
+        Otherwise the action must wait ``wait`` seconds, and ``new_tat``
+        equals ``tat`` unless ``reserve`` was set.
+    """
+    new_tat = max(tat, now) + cost * limit.interval
+    wait = new_tat - now - limit.capacity
+    if wait > 0 and not reserve:
+        return tat, wait
+    return new_tat, wait
+
+
+def hold_tat(tat: float, now: float, limit: Limit, retry_after: float) -> float:
+    """TAT that makes the next action wait until ``now + retry_after``."""
+    return max(tat, now + retry_after + limit.capacity - limit.interval)
+
+
+class RateLimitStore(Protocol):
+    """
+    Atomic storage for bucket state.
+
+    ``step`` applies ``gcra`` to a key atomically and returns ``wait``.
+    ``hold`` applies ``hold_tat`` atomically.
+    """
+
+    def step(self, key: str, now: float, limit: Limit, cost: int, reserve: bool) -> float: ...
+
+    def hold(self, key: str, now: float, limit: Limit, retry_after: float) -> None: ...
+
+
+class MemoryStore:
+    """
+    In-process bucket state.
+
+    Each update is a few float operations under one lock, which is held for
+    about a microsecond. Contention is negligible next to the network calls
+    being limited.
+    """
+
+    def __init__(self) -> None:
+        self._tats: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def step(self, key: str, now: float, limit: Limit, cost: int, reserve: bool) -> float:
+        with self._lock:
+            new_tat, wait = gcra(self._tats.get(key, 0.0), now, limit, cost, reserve)
+            self._tats[key] = new_tat
+        return wait
+
+    def hold(self, key: str, now: float, limit: Limit, retry_after: float) -> None:
+        with self._lock:
+            self._tats[key] = hold_tat(self._tats.get(key, 0.0), now, limit, retry_after)
+
+    def prune(self, now: float) -> int:
+        """Forget fully refilled buckets; returns how many were dropped."""
+        with self._lock:
+            idle = [key for key, tat in self._tats.items() if tat <= now]
+            for key in idle:
+                del self._tats[key]
+        return len(idle)
+
+
+class SQLiteStore:
+    """
+    Bucket state in a SQLite file, shared by every process that opens it.
+
+    Each update runs in a ``BEGIN IMMEDIATE`` transaction, so concurrent
+    workers serialise on the file lock instead of racing.
+    """
+
+    def __init__(self, path: str | Path, *, timeout: float = 5.0):
+        self._db = sqlite3.connect(
+            str(path), timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tat REAL)")
+        self._lock = threading.Lock()
+
+    def _update(self, key: str, apply: Callable[[float], tuple[float, float]]) -> float:
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._db.execute("SELECT tat FROM buckets WHERE key = ?", (key,)).fetchone()
+                new_tat, result = apply(row[0] if row else 0.0)
+                self._db.execute(
+                    "INSERT INTO buckets (key, tat) VALUES (?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET tat = excluded.tat",
+                    (key, new_tat),
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return result
+
+    def step(self, key: str, now: float, limit: Limit, cost: int, reserve: bool) -> float:
+        return self._update(key, lambda tat: gcra(tat, now, limit, cost, reserve))
+
+    def hold(self, key: str, now: float, limit: Limit, retry_after: float) -> None:
+        self._update(key, lambda tat: (hold_tat(tat, now, limit, retry_after), 0.0))
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class RateLimiter:
+    """
+    Token buckets per (platform, account, action).
+
+    Args:
+        limits: Limits by (platform, action), with ``"*"`` wildcards;
+            DEFAULT_LIMITS if omitted. Extend rather than replace with
+            ``{**DEFAULT_LIMITS, ...}``.
+        store: Bucket state; a private MemoryStore by default. Pass a shared
+            store (SQLiteStore) to limit across worker processes.
+        clock: Wall clock. Shared stores need a clock all workers agree on.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[tuple[str, str], Limit] | None = None,
+        *,
+        store: RateLimitStore | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.limits = dict(DEFAULT_LIMITS if limits is None else limits)
+        self.store = store if store is not None else MemoryStore()
+        self._clock = clock
+
+    def limit_for(self, platform: str, action: str) -> Limit:
+        """The most specific configured limit for a platform and action."""
+        for key in (
+            (platform, action),
+            (platform, WILDCARD),
+            (WILDCARD, action),
+            (WILDCARD, WILDCARD),
+        ):
+            limit = self.limits.get(key)
+            if limit is not None:
+                return limit
+        raise KeyError(f"No rate limit configured for {platform}/{action}")
+
+    @staticmethod
+    def key(platform: str, account: str, action: str) -> str:
+        return f"{platform}:{account}:{action}"
+
+    def try_acquire(self, platform: str, account: str, action: str, cost: int = 1) -> float:
+        """
+        Take ``cost`` tokens if they are available now.
+
+        Returns:
+            0.0 if the action may run, otherwise seconds until it could.
+        """
+        limit = self.limit_for(platform, action)
+        wait = self.store.step(
+            self.key(platform, account, action), self._clock(), limit, cost, False
+        )
+        return max(wait, 0.0)
+
+    def acquire(self, platform: str, account: str, action: str, cost: int = 1) -> None:
+        """
+        Take ``cost`` tokens now.
+
+        Raises:
+            RateLimitError: If the bucket is empty; ``retry_after`` says when to retry.
+        """
+        wait = self.try_acquire(platform, account, action, cost)
+        if wait > 0:
+            raise RateLimitError(f"{platform} {action} rate limit exceeded for {account}", wait)
+
+    def reserve(
+        self,
+        platform: str,
+        account: str,
+        action: str,
+        cost: int = 1,
+        *,
+        max_delay: float | None = None,
+    ) -> float:
+        """
+        Reserve the earliest slot for an action.
+
+        Returns:
+            Seconds to wait before running the action (0.0 for now).
+
+        Raises:
+            RateLimitError: If the slot is more than ``max_delay`` away; nothing
+                is reserved in that case.
+        """
+        if max_delay is not None:
+            wait = self.try_acquire(platform, account, action, cost)
+            if wait == 0.0:
+                return 0.0
+            if wait > max_delay:
+                raise RateLimitError(f"{platform} {action} rate limit exceeded for {account}", wait)
+        limit = self.limit_for(platform, action)
+        wait = self.store.step(
+            self.key(platform, account, action), self._clock(), limit, cost, True
+        )
+        return max(wait, 0.0)
+
+    def penalize(self, platform: str, account: str, action: str, retry_after: float) -> None:
+        """Block a bucket until ``retry_after`` seconds from now (a platform 429)."""
+        limit = self.limit_for(platform, action)
+        self.store.hold(self.key(platform, account, action), self._clock(), limit, retry_after)
+
+    async def wait(self, platform: str, account: str, action: str, cost: int = 1) -> float:
+        """Reserve a slot and sleep until it; returns the time waited."""
+        delay = self.reserve(platform, account, action, cost)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+@dataclass
+class DelayQueueStats:
+    """Counters describing DelayQueue behaviour since creation."""
+
+    scheduled: int = 0
+    delayed: int = 0
+    completed: int = 0
+    failed: int = 0
+    retried: int = 0
+    rejected: int = 0
+    total_delay: float = 0.0
+
+
+class DelayQueue:
+    """
+    Runs rate-limited actions at the earliest permitted time.
+
+    ``submit`` reserves the action's slot immediately and the action runs
+    when the slot comes due, so workers never sleep blindly on a 429. If
+    the platform still answers with RateLimitError, every worker's bucket is
+    held for ``retry_after`` and the action is rescheduled.
+
+    Must be used from a running asyncio event loop. Synchronous actions run
+    in worker threads.
+
+    Args:
+        limiter: RateLimiter whose buckets gate the actions.
+        max_delay: Reject actions whose slot is further away than this.
+        max_retries: Reschedules allowed after platform rate-limit errors.
+    """
+
+    def __init__(self, limiter: RateLimiter, *, max_delay: float = 3600.0, max_retries: int = 3):
+        self.limiter = limiter
+        self.max_delay = max_delay
+        self.max_retries = max_retries
+        self.stats = DelayQueueStats()
+        self._heap: list[tuple[float, int, _Action]] = []
+        self._seq = itertools.count()
+        self._wake: asyncio.Event | None = None
+        self._runner: asyncio.Task[None] | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def submit(
+        self,
+        platform: str,
+        account: str,
+        action: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        cost: int = 1,
+        **kwargs: Any,
+    ) -> asyncio.Future[Any]:
+        """
+        Schedule ``fn(*args, **kwargs)`` for the earliest permitted time.
+
+        Returns:
+            Future resolving to the action's result.
+
+        Raises:
+            RateLimitError: If the earliest slot is more than ``max_delay`` away.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            delay = self.limiter.reserve(platform, account, action, cost, max_delay=self.max_delay)
+        except RateLimitError:
+            self.stats.rejected += 1
+            raise
+        job = _Action(platform, account, action, fn, args, kwargs, cost, loop.create_future())
+        self._push(job, delay)
+        return job.future
+
+    async def drain(self) -> None:
+        """Wait until every scheduled action has finished."""
+        while self._heap or self._tasks:
+            if self._tasks:
+                await asyncio.wait(set(self._tasks))
+            else:
+                await asyncio.sleep(min(0.05, max(0.0, self._heap[0][0] - time.monotonic())))
+
+    def _push(self, job: "_Action", delay: float) -> None:
+        self.stats.scheduled += 1
+        if delay > 0:
+            self.stats.delayed += 1
+            self.stats.total_delay += delay
+        heapq.heappush(self._heap, (time.monotonic() + delay, next(self._seq), job))
+        wake = self._wake
+        if wake is None or self._runner is None or self._runner.done():
+            wake = self._wake = asyncio.Event()
+            self._runner = asyncio.get_running_loop().create_task(self._run(wake))
+        wake.set()
+
+    async def _run(self, wake: asyncio.Event) -> None:
+        while self._heap:
+            due, _, job = self._heap[0]
+            delay = due - time.monotonic()
+            if delay > 0:
+                wake.clear()
+                try:
+                    await asyncio.wait_for(wake.wait(), delay)
+                except TimeoutError:
+                    pass
+                continue
+            heapq.heappop(self._heap)
+            task = asyncio.get_running_loop().create_task(self._execute(job))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _execute(self, job: "_Action") -> None:
+        if job.future.done():
+            return
+        try:
+            if inspect.iscoroutinefunction(job.fn):
+                result = await job.fn(*job.args, **job.kwargs)
+            else:
+                result = await asyncio.to_thread(job.fn, *job.args, **job.kwargs)
+        except RateLimitError as exc:
+            self.limiter.penalize(job.platform, job.account, job.action, exc.retry_after)
+            if job.attempts >= self.max_retries:
+                self.stats.failed += 1
+                job.future.set_exception(exc)
+                return
+            job.attempts += 1
+            self.stats.retried += 1
+            try:
+                delay = self.limiter.reserve(
+                    job.platform, job.account, job.action, job.cost, max_delay=self.max_delay
+                )
+            except RateLimitError as rejected:
+                self.stats.failed += 1
+                job.future.set_exception(rejected)
+                return
+            self._push(job, delay)
+        except Exception as exc:
+            self.stats.failed += 1
+            job.future.set_exception(exc)
+        else:
+            self.stats.completed += 1
+            job.future.set_result(result)
+
+
+@dataclass
+class _Action:
+    platform: str
+    account: str
+    action: str
+    fn: Callable[..., Any]
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+    cost: int
+    future: asyncio.Future[Any]
+    attempts: int = 0
@@ -0,0 +1,474 @@
+"""
+Retries with jittered backoff, per-dependency circuit breakers and a retry budget.
+
+Reference: specs/openclaw_integration.md §9.1 (error codes), §9.2 (retry_policy),
+specs/technical.md §2.2 (tasks.retry_count, max_retries)
+
+``RetryExecutor`` runs calls against named dependencies, such as a trend
+source or the escrow contract.
+
+- A failed call is retried if its error is retryable. That means either
+  an error ``code`` in ``retryable_errors`` (OC001, OC005 by default) or
+  one of ``retry_on`` (timeouts and connection errors). The delay grows
+  exponentially from ``initial_delay_seconds`` up to ``max_delay_seconds``
+  with jitter. It is never shorter than the error's own ``retry_after``.
+- Retries that are waiting sit in one heap served by a single timer task.
+  A thousand pending retries cost a thousand heap entries, not a thousand
+  sleeping coroutines.
+- Each dependency has a CircuitBreaker. After ``failure_threshold``
+  retryable failures in a row it opens, and calls fail at once with
+  CircuitOpenError instead of taking a worker slot. After ``reset_timeout``
+  it lets one probe call through (half-open). The probe's outcome closes or
+  re-opens it. Calls refused by an open breaker are not retried; their
+  ``retry_after`` tells the caller when the probe will be allowed.
+- A RetryBudget caps retries at a fraction of first attempts, so an outage
+  does not multiply upstream load by ``max_retries``.
+
+    executor = RetryExecutor(RetryPolicy.from_dict(openclaw_config))
+    status = await executor.call("escrow", verify_escrow, job_id)
+"""
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import random
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import asdict, dataclass
+from typing import Any, Literal
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a dependency whose breaker is open."""
+
+    code = "CIRCUIT_OPEN"
+
+    def __init__(self, dependency: str, retry_after: float):
+        super().__init__(f"Circuit for {dependency!r} is open; retry in {retry_after:.1f}s")
+        self.dependency = dependency
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    The ``retry_policy`` block of specs/openclaw_integration.md §9.2.
+
+    Attempt ``n`` (0 for the first retry) waits a random time between half
+    and all of ``min(initial_delay_seconds * multiplier**n, max_delay_seconds)``.
+    """
+
+    max_retries: int = 3
+    backoff_type: Literal["exponential", "constant"] = "exponential"
+    initial_delay_seconds: float = 5.0
+    max_delay_seconds: float = 300.0
+    retryable_errors: frozenset[str] = frozenset({"OC001", "OC005"})
+    retry_on: tuple[type[BaseException], ...] = (TimeoutError, ConnectionError)
+    multiplier: float = 2.0
+
+    def __post_init__(self) -> None:
+        if self.max_retries < 0 or self.initial_delay_seconds < 0:
+            raise ValueError("max_retries and initial_delay_seconds must be >= 0")
+        if self.max_delay_seconds < self.initial_delay_seconds:
+            raise ValueError("max_delay_seconds must be at least initial_delay_seconds")
+        if self.backoff_type not in ("exponential", "constant"):
+            raise ValueError(f"Unknown backoff_type: {self.backoff_type!r}")
+
+    @classmethod
+    def from_dict(cls, config: Mapping[str, Any]) -> "RetryPolicy":
+        """Read the block itself or a document containing ``retry_policy``."""
+        block = dict(config.get("retry_policy", config))
+        if "retryable_errors" in block:
+            block["retryable_errors"] = frozenset(block["retryable_errors"])
+        fields = ("max_retries", "backoff_type", "initial_delay_seconds", "max_delay_seconds")
+        return cls(**{key: block[key] for key in (*fields, "retryable_errors") if key in block})
+
+    def is_retryable(self, error: BaseException) -> bool:
+        if isinstance(error, CircuitOpenError):
+            return False
+        return getattr(error, "code", None) in self.retryable_errors or isinstance(
+            error, self.retry_on
+        )
+
+    def delay(self, retry: int, rng: random.Random | None = None) -> float:
+        """Seconds to wait before retry number ``retry`` (counting from 0)."""
+        growth = self.multiplier**retry if self.backoff_type == "exponential" else 1.0
+        ceiling = min(self.initial_delay_seconds * growth, self.max_delay_seconds)
+        return (rng or random).uniform(ceiling / 2, ceiling)
+
+
+class CircuitBreaker:
+    """
+    Closed, open and half-open states for one dependency.
+
+    Thread-safe.
+
+    Args:
+        name: Dependency name.
+        failure_threshold: Consecutive failures that open the breaker.
+        reset_timeout: Seconds the breaker stays open before a probe.
+        half_open_calls: Probe calls let through while half-open.
+        clock: Monotonic clock in seconds.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if failure_threshold < 1 or half_open_calls < 1 or reset_timeout < 0:
+            raise ValueError(
+                "failure_threshold and half_open_calls must be at least 1, reset_timeout >= 0"
+            )
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_calls = half_open_calls
+        self.opened = 0
+        self.rejected = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state: BreakerState = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+    def _current(self, now: float) -> BreakerState:
+        if self._state == "open" and now - self._opened_at >= self.reset_timeout:
+            self._state = "half_open"
+            self._probes = 0
+        return self._state
+
+    @property
+    def state(self) -> BreakerState:
+        with self._lock:
+            return self._current(self._clock())
+
+    def before_call(self) -> None:
+        """
+        Claim permission for one call.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with its
+                probes already out.
+        """
+        now = self._clock()
+        with self._lock:
+            state = self._current(now)
+            if state == "closed":
+                return
+            if state == "half_open" and self._probes < self.half_open_calls:
+                self._probes += 1
+                return
+            self.rejected += 1
+            retry_after = max(self._opened_at + self.reset_timeout - now, 0.0)
+        raise CircuitOpenError(self.name, retry_after)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = "closed"
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        now = self._clock()
+        with self._lock:
+            self._failures += 1
+            state = self._current(now)
+            if state == "half_open" or (
+                state == "closed" and self._failures >= self.failure_threshold
+            ):
+                self._state = "open"
+                self._opened_at = now
+                self.opened += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self._current(self._clock()),
+                "consecutive_failures": self._failures,
+                "opened": self.opened,
+                "rejected": self.rejected,
+            }
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries to a share of first attempts.
+
+    Each first attempt adds ``ratio`` tokens and each retry spends one. A
+    trickle of ``min_per_second`` keeps rare retries possible at low
+    traffic. The balance is capped at ``burst``. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        *,
+        min_per_second: float = 1.0,
+        burst: float = 20.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if ratio < 0 or min_per_second < 0 or burst < 1:
+            raise ValueError("ratio and min_per_second must be >= 0 and burst at least 1")
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.burst = burst
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = burst
+        self._updated = clock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(now - self._updated, 0.0)
+        self._tokens = min(self._tokens + elapsed * self.min_per_second, self.burst)
+        self._updated = now
+
+    def deposit(self) -> None:
+        """Record a first attempt."""
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens = min(self._tokens + self.ratio, self.burst)
+
+    def try_spend(self) -> bool:
+        """Take one retry token; False if the budget is exhausted."""
+        with self._lock:
+            self._refill(self._clock())
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill(self._clock())
+            return self._tokens
+
+
+@dataclass
+class RetryStats:
+    """Executor counters since creation, overall or for one dependency."""
+
+    calls: int = 0
+    attempts: int = 0
+    retries: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    budget_exhausted: int = 0
+    breaker_rejected: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+@dataclass
+class _Call:
+    dependency: str
+    fn: Callable[..., Any]
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+    timeout: float | None
+    future: asyncio.Future[Any]
+    retries: int = 0
+
+
+class RetryExecutor:
+    """
+    Runs calls with retries, behind a circuit breaker per dependency.
+
+    Must be used from a running asyncio event loop. Synchronous callables
+    run in worker threads.
+
+    Args:
+        policy: Retry policy; the §9.2 defaults if omitted.
+        budget: Retry budget shared by all dependencies; a default
+            RetryBudget if omitted.
+        breaker_factory: Builds the breaker for a new dependency name.
+        seed: Seed for backoff jitter.
+    """
+
+    def __init__(
+        self,
+        policy: RetryPolicy | None = None,
+        *,
+        budget: RetryBudget | None = None,
+        breaker_factory: Callable[[str], CircuitBreaker] = CircuitBreaker,
+        seed: int | None = None,
+    ):
+        self.policy = policy if policy is not None else RetryPolicy()
+        self.budget = budget if budget is not None else RetryBudget()
+        self.stats = RetryStats()
+        self._breaker_factory = breaker_factory
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._by_dependency: dict[str, RetryStats] = {}
+        self._rng = random.Random(seed)
+        self._heap: list[tuple[float, int, _Call]] = []
+        self._seq = itertools.count()
+        self._wake: asyncio.Event | None = None
+        self._timer: asyncio.Task[None] | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def breaker(self, dependency: str) -> CircuitBreaker:
+        """The dependency's breaker, created on first use."""
+        breaker = self._breakers.get(dependency)
+        if breaker is None:
+            breaker = self._breakers[dependency] = self._breaker_factory(dependency)
+        return breaker
+
+    def _count(self, dependency: str, name: str) -> None:
+        setattr(self.stats, name, getattr(self.stats, name) + 1)
+        stats = self._by_dependency.setdefault(dependency, RetryStats())
+        setattr(stats, name, getattr(stats, name) + 1)
+
+    def submit(
+        self,
+        dependency: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> asyncio.Future[Any]:
+        """
+        Start ``fn(*args, **kwargs)`` now, retrying as the policy allows.
+
+        Args:
+            dependency: Name of the upstream ``fn`` calls; selects the breaker.
+            fn: Coroutine function or plain callable.
+            timeout: Per-attempt timeout in seconds; a timeout is retryable.
+
+        Returns:
+            Future resolving to the first successful result. It fails with
+            the last error once retries, or the retry budget, run out, and
+            with CircuitOpenError while the breaker is open.
+        """
+        loop = asyncio.get_running_loop()
+        call = _Call(dependency, fn, args, kwargs, timeout, loop.create_future())
+        self._count(dependency, "calls")
+        self.budget.deposit()
+        self._start(call)
+        return call.future
+
+    async def call(
+        self,
+        dependency: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """``submit`` and wait for the result."""
+        return await self.submit(dependency, fn, *args, timeout=timeout, **kwargs)
+
+    def _start(self, call: _Call) -> None:
+        task = asyncio.get_running_loop().create_task(self._attempt(call))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _attempt(self, call: _Call) -> None:
+        if call.future.done():
+            return
+        breaker = self.breaker(call.dependency)
+        try:
+            breaker.before_call()
+        except CircuitOpenError as exc:
+            self._count(call.dependency, "breaker_rejected")
+            self._fail(call, exc)
+            return
+        self._count(call.dependency, "attempts")
+        try:
+            result = await self._invoke(call)
+        except Exception as exc:
+            if not self.policy.is_retryable(exc):
+                # The dependency answered; the request itself was refused.
+                breaker.record_success()
+                self._fail(call, exc)
+                return
+            breaker.record_failure()
+            self._retry(call, exc)
+        else:
+            breaker.record_success()
+            self._count(call.dependency, "succeeded")
+            if not call.future.done():
+                call.future.set_result(result)
+
+    async def _invoke(self, call: _Call) -> Any:
+        if inspect.iscoroutinefunction(call.fn) or inspect.iscoroutinefunction(
+            getattr(call.fn, "__call__", None)
+        ):
+            pending = call.fn(*call.args, **call.kwargs)
+        else:
+            pending = asyncio.to_thread(call.fn, *call.args, **call.kwargs)
+        return await asyncio.wait_for(pending, call.timeout)
+
+    def _retry(self, call: _Call, error: Exception) -> None:
+        if call.retries >= self.policy.max_retries:
+            self._fail(call, error)
+            return
+        if not self.budget.try_spend():
+            self._count(call.dependency, "budget_exhausted")
+            self._fail(call, error)
+            return
+        delay = max(
+            self.policy.delay(call.retries, self._rng), getattr(error, "retry_after", 0.0) or 0.0
+        )
+        call.retries += 1
+        self._count(call.dependency, "retries")
+        heapq.heappush(self._heap, (time.monotonic() + delay, next(self._seq), call))
+        wake = self._wake
+        if wake is None or self._timer is None or self._timer.done():
+            wake = self._wake = asyncio.Event()
+            self._timer = asyncio.get_running_loop().create_task(self._run(wake))
+        wake.set()
+
+    def _fail(self, call: _Call, error: BaseException) -> None:
+        self._count(call.dependency, "failed")
+        if not call.future.done():
+            call.future.set_exception(error)
+
+    async def _run(self, wake: asyncio.Event) -> None:
+        while self._heap:
+            due = self._heap[0][0]
+            delay = due - time.monotonic()
+            if delay > 0:
+                wake.clear()
+                try:
+                    await asyncio.wait_for(wake.wait(), delay)
+                except TimeoutError:
+                    pass
+                continue
+            self._start(heapq.heappop(self._heap)[2])
+
+    def __len__(self) -> int:
+        """Retries waiting for their delay to pass."""
+        return len(self._heap)
+
+    async def drain(self) -> None:
+        """Wait until every submitted call has succeeded or failed."""
+        while self._heap or self._tasks:
+            if self._tasks:
+                await asyncio.wait(set(self._tasks))
+            else:
+                await asyncio.sleep(min(0.05, max(0.0, self._heap[0][0] - time.monotonic())))
+
+    def snapshot(self) -> dict[str, Any]:
+        """Retry counters and breaker states, overall and per dependency."""
+        return {
+            **self.stats.as_dict(),
+            "pending_retries": len(self._heap),
+            "budget_tokens": round(self.budget.tokens, 3),
+            "dependencies": {
+                name: {
+                    **self._by_dependency.get(name, RetryStats()).as_dict(),
+                    "breaker": breaker.snapshot(),
+                }
+                for name, breaker in sorted(self._breakers.items())
+            },
+        }
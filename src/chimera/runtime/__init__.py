@@ -0,0 +1,58 @@
+"""
+Asyncio Planner-Worker-Judge task runtime.
+
+Reference: specs/technical.md §3.1 (Task Queue Message), §6.2, §6.3
+
+Planners submit Tasks to a WorkerPool. The pool queues them by priority,
+up to the spec's depth limit, and dispatches them to the skill entry
+points with per-task timeouts. It passes each TaskResult to an optional
+Judge hook.
+
+    async with WorkerPool(on_result=judge) as pool:
+        future = pool.submit_nowait(Task("fetch_trends", payload, priority="high"))
+        result = await future
+
+CPU-bound handlers marked ``@cpu_bound`` (or skill handlers passed in
+``default_handlers(cpu_bound=[...])``) run in a warm ProcessRunner when the
+pool is given one.
+
+``python -m chimera.runtime.loadgen`` drives a pool with synthetic tasks
+and reports throughput and queue latency percentiles.
+"""
+
+from .handlers import SkillHandler, default_handlers, skill_input, skill_task_types
+from .pool import PoolStats, WorkerPool, latency_summary
+from .processes import (
+    ProcessRunner,
+    SharedRef,
+    configure_process_runner,
+    cpu_bound,
+    is_cpu_bound,
+    run_cpu_stage,
+)
+from .queue import DEFAULT_MAX_DEPTH, QueuedTask, QueueFullError, QueueStats, TaskQueue
+from .tasks import Priority, Task, TaskResult
+
+__all__ = [
+    "DEFAULT_MAX_DEPTH",
+    "PoolStats",
+    "Priority",
+    "ProcessRunner",
+    "QueueFullError",
+    "QueueStats",
+    "QueuedTask",
+    "SharedRef",
+    "SkillHandler",
+    "Task",
+    "TaskQueue",
+    "TaskResult",
+    "WorkerPool",
+    "configure_process_runner",
+    "cpu_bound",
+    "default_handlers",
+    "is_cpu_bound",
+    "latency_summary",
+    "run_cpu_stage",
+    "skill_input",
+    "skill_task_types",
+]
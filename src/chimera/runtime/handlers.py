@@ -0,0 +1,106 @@
+"""
+Task type to skill entry point dispatch.
+
+Reference: skills/README.md, specs/technical.md §3.1 (task ``type``)
+
+A skill's task type is its entry point name, the ``x-entrypoint`` of its
+input schema. Handlers dispatch through the process-wide
+``chimera.skills`` registry: the input is validated before the skill is
+imported, and the skill is imported on its first task. To start a worker
+from a snapshot, call ``configure_registry(SkillRegistry.warm_start(path))``
+before building the pool.
+
+A handler is any callable taking the task payload: a coroutine function
+runs on the event loop, and a plain function runs in the worker pool's
+thread executor. The skill entry points are synchronous, so they take the
+thread path.
+
+The default handlers accept either a complete skill input
+(``{"skill_name": ..., "parameters": {...}}``) or a §3.1 payload
+(``{"topic", "platform", "parameters"}``). The second form is converted
+into the skill's input.
+
+Handlers are SkillHandler instances rather than closures, so they pickle
+by reference and can be routed to a ProcessRunner. None is process-bound
+by default: a worker process has its own copy of each skill's module
+state (configured sources and backends, caches, engagement aggregates),
+set up by the runner's initializers rather than shared with the parent.
+Pass ``cpu_bound=[...]`` to ``default_handlers`` for the task types whose
+skills are configured that way.
+"""
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from chimera.skills import get_registry
+
+Handler = Callable[[dict[str, Any]], Any]
+
+# Spec task types served by a skill entry point, with their fixed parameters.
+TASK_ALIASES: dict[str, tuple[str, dict[str, Any]]] = {
+    "analyze": ("manage_engagement", {"action": "analyze"}),
+}
+
+
+def skill_task_types() -> dict[str, str]:
+    """Task type -> skill name, for every skill in the registry."""
+    registry = get_registry()
+    return {registry.spec(name).entrypoint: name for name in registry.names()}
+
+
+def skill_input(skill: str, payload: dict[str, Any], **defaults: Any) -> dict[str, Any]:
+    """Convert a task payload into the input for ``skill``."""
+    if "skill_name" in payload:
+        return payload
+    parameters = {**defaults, **payload.get("parameters", {})}
+    for key in ("topic", "platform"):
+        if key in payload:
+            parameters.setdefault(key, payload[key])
+    return {"skill_name": skill, "parameters": parameters}
+
+
+@dataclass(frozen=True)
+class SkillHandler:
+    """
+    Picklable handler calling one skill entry point.
+
+    Args:
+        task_type: A skill's entry point name (see skill_task_types).
+        defaults: Parameters fixed for this handler (e.g. a spec alias's action).
+        cpu_bound: Route to the WorkerPool's ProcessRunner, when it has one.
+    """
+
+    task_type: str
+    defaults: dict[str, Any] = field(default_factory=dict)
+    cpu_bound: bool = False
+
+    @property
+    def __chimera_cpu_bound__(self) -> bool:
+        return self.cpu_bound
+
+    def __call__(self, payload: dict[str, Any]) -> Any:
+        registry = get_registry()
+        skill = registry.by_entrypoint(self.task_type).name
+        return registry.invoke(skill, skill_input(skill, payload, **self.defaults))
+
+
+def default_handlers(cpu_bound: Iterable[str] = ()) -> dict[str, Handler]:
+    """
+    Handlers for every skill entry point and spec alias; skills import on first use.
+
+    Args:
+        cpu_bound: Task types (entry points or aliases) to mark ``@cpu_bound``.
+    """
+    routed = set(cpu_bound)
+    task_types = skill_task_types()
+    unknown = routed - task_types.keys() - TASK_ALIASES.keys()
+    if unknown:
+        raise KeyError(f"Unknown task types: {sorted(unknown)}")
+    handlers: dict[str, Handler] = {
+        task_type: SkillHandler(task_type, cpu_bound=task_type in routed)
+        for task_type in task_types
+    }
+    for alias, (task_type, defaults) in TASK_ALIASES.items():
+        handlers[alias] = SkillHandler(task_type, dict(defaults), cpu_bound=alias in routed)
+    return handlers
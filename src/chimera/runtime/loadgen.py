@@ -0,0 +1,181 @@
+"""
+Synthetic load generator for the task runtime.
+
+Reference: specs/technical.md §6.2 (100 tasks/s sustained, burst 500)
+
+Submits tasks at a steady rate with a mix of priorities, adds one
+instantaneous burst halfway through, and reports throughput together with
+P50/P95/P99 queue latency, overall and per priority.
+
+    python -m chimera.runtime.loadgen --rate 100 --burst 500 --duration 10
+    python -m chimera.runtime.loadgen --skills   # real skill entry points, fake backends
+
+By default tasks go to a synthetic handler that awaits ``service_ms`` of
+simulated I/O. ``--skills`` routes them to ``generate_content`` (with a
+FakeBackend) and to engagement ``analyze`` instead.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from .handlers import default_handlers
+from .pool import WorkerPool, latency_summary
+from .queue import QueueFullError, TaskQueue
+from .tasks import Priority, Task, TaskResult
+
+# Share of tasks at each priority.
+PRIORITY_MIX = {
+    Priority.LOW: 0.4,
+    Priority.MEDIUM: 0.4,
+    Priority.HIGH: 0.15,
+    Priority.CRITICAL: 0.05,
+}
+
+
+def synthetic_handler(
+    service_ms: float, jitter: float = 0.5
+) -> Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]:
+    """Handler awaiting ``service_ms`` (plus or minus ``jitter``) of simulated I/O."""
+
+    async def handle(payload: dict[str, Any]) -> dict[str, Any]:
+        await asyncio.sleep(service_ms / 1e3 * random.uniform(1 - jitter, 1 + jitter))
+        return {"ok": True}
+
+    return handle
+
+
+def skill_handlers(item_latency: float = 0.002) -> dict[str, Any]:
+    """The skill entry points, with a FakeBackend configured for content generation."""
+    from skills.content_generator import FakeBackend, configure_backend
+
+    configure_backend(FakeBackend(item_latency=item_latency))
+    return default_handlers()
+
+
+def _skill_task(rng: random.Random, priority: Priority) -> Task:
+    if rng.random() < 0.5:
+        return Task(
+            "generate_content",
+            {
+                "topic": f"Topic {rng.randint(1, 50)}",
+                "platform": "instagram",
+                "parameters": {"content_type": "text", "tier": "filler"},
+            },
+            priority=priority,
+        )
+    return Task(
+        "analyze",
+        {"platform": "instagram", "parameters": {"post_id": f"post_{rng.randint(1, 20)}"}},
+        priority=priority,
+    )
+
+
+async def generate_load(
+    pool: WorkerPool,
+    *,
+    rate: float = 100.0,
+    burst: int = 500,
+    duration: float = 5.0,
+    use_skills: bool = False,
+    seed: int = 7,
+) -> dict[str, Any]:
+    """
+    Drive ``pool`` and report what happened.
+
+    Args:
+        pool: Runtime under test; it is started, drained and closed.
+        rate: Steady submissions per second.
+        burst: Tasks submitted at once halfway through the run.
+        duration: Length of the steady phase in seconds.
+        use_skills: Submit skill tasks instead of synthetic ones.
+        seed: Seed for the priority mix.
+
+    Returns:
+        Dict with submitted, rejected, completed, failed, elapsed_seconds,
+        throughput_per_second and queue/run latency summaries.
+    """
+    rng = random.Random(seed)
+    priorities, weights = zip(*PRIORITY_MIX.items(), strict=True)
+    futures: list[tuple[Priority, asyncio.Future[TaskResult]]] = []
+    rejected = 0
+
+    def submit() -> None:
+        nonlocal rejected
+        priority = rng.choices(priorities, weights)[0]
+        task = _skill_task(rng, priority) if use_skills else Task("synthetic", priority=priority)
+        try:
+            futures.append((priority, pool.submit_nowait(task)))
+        except QueueFullError:
+            rejected += 1
+
+    pool.start()
+    total = int(rate * duration)
+    start = time.perf_counter()
+    for i in range(total):
+        if i == total // 2:
+            for _ in range(burst):
+                submit()
+        submit()
+        delay = start + (i + 1) / rate - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        elif i % 64 == 0:
+            await asyncio.sleep(0)
+    results = [(priority, await future) for priority, future in futures]
+    elapsed = time.perf_counter() - start
+    await pool.close()
+
+    by_priority: dict[str, list[float]] = defaultdict(list)
+    for priority, result in results:
+        by_priority[priority.name.lower()].append(result.queue_ms)
+    return {
+        "submitted": total + burst,
+        "rejected": rejected,
+        "completed": sum(result.ok for _, result in results),
+        "failed": sum(not result.ok for _, result in results),
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_per_second": round(len(results) / elapsed, 1),
+        "queue_ms": latency_summary([result.queue_ms for _, result in results]),
+        "queue_ms_by_priority": {
+            name: latency_summary(samples) for name, samples in sorted(by_priority.items())
+        },
+        "run_ms": latency_summary([result.run_ms for _, result in results]),
+        "max_queue_depth": pool.queue.stats.max_depth,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rate", type=float, default=100.0, help="steady tasks per second")
+    parser.add_argument("--burst", type=int, default=500, help="tasks submitted at once mid-run")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds of steady load")
+    parser.add_argument("--concurrency", type=int, default=64, help="worker coroutines")
+    parser.add_argument("--max-depth", type=int, default=10_000, help="queue depth limit")
+    parser.add_argument("--service-ms", type=float, default=20.0, help="synthetic task latency")
+    parser.add_argument("--skills", action="store_true", help="run the skill entry points")
+    args = parser.parse_args(argv)
+
+    handlers = (
+        skill_handlers() if args.skills else {"synthetic": synthetic_handler(args.service_ms)}
+    )
+    pool = WorkerPool(handlers, queue=TaskQueue(args.max_depth), concurrency=args.concurrency)
+    report = asyncio.run(
+        generate_load(
+            pool,
+            rate=args.rate,
+            burst=args.burst,
+            duration=args.duration,
+            use_skills=args.skills,
+        )
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
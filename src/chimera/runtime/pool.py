@@ -0,0 +1,315 @@
+"""
+Asyncio worker pool executing queued tasks.
+
+Reference: specs/technical.md §3.1 (timeout_seconds), §6.2 (100 tasks/s, burst 500)
+
+Planners submit tasks. ``concurrency`` worker coroutines take them off the
+TaskQueue in priority order and dispatch them to handlers. Each task gets
+its own ``timeout_seconds``. A result hook (the Judge) receives every
+TaskResult. Handlers that are coroutine functions run on the event loop.
+Plain functions, including the skill entry points, run in a bounded
+thread executor so they cannot stall it. Handlers marked ``@cpu_bound``
+run in a ProcessRunner when the pool has one (see processes.py).
+
+A thread cannot be cancelled, so a synchronous handler that overruns its
+timeout keeps its thread until it returns. The task is reported as timed
+out straight away and the thread is counted as abandoned. Its slot moves to
+one of ``spare_threads`` extra executor threads, so other tasks are not
+starved. Once the spares are all held by abandoned threads, a further
+overrun keeps its slot until its thread finishes. Capacity then shrinks
+visibly (``threads_abandoned`` in ``snapshot()``) instead of tasks queueing
+silently behind stuck threads. Handlers that may overrun are better written
+as coroutines.
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from chimera import metrics
+
+from .handlers import Handler, default_handlers
+from .processes import ProcessRunner, is_cpu_bound
+from .queue import QueuedTask, TaskQueue
+from .tasks import Task, TaskResult
+
+logger = logging.getLogger(__name__)
+
+_QUEUE_SECONDS = metrics.histogram(
+    "chimera_task_queue_seconds", "Time tasks waited in the queue.", ["type"]
+)
+_RUN_SECONDS = metrics.histogram(
+    "chimera_task_run_seconds", "Time task handlers ran, including timeouts.", ["type"]
+)
+_TASKS = metrics.counter("chimera_tasks_total", "Tasks finished, by outcome.", ["type", "status"])
+
+ResultHook = Callable[[TaskResult], Any]
+
+
+@dataclass
+class PoolStats:
+    """Counters describing WorkerPool behaviour since creation."""
+
+    completed: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    threads_abandoned: int = 0
+
+
+def latency_summary(samples: "deque[float] | list[float]") -> dict[str, float]:
+    """P50/P95/P99 and max of ``samples`` in milliseconds."""
+    if not samples:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    values = np.fromiter(samples, dtype=np.float64, count=len(samples))
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "p50": round(float(p50), 3),
+        "p95": round(float(p95), 3),
+        "p99": round(float(p99), 3),
+        "max": round(float(values.max()), 3),
+    }
+
+
+class WorkerPool:
+    """
+    Task runtime: a bounded priority queue drained by worker coroutines.
+
+    Args:
+        handlers: Task type to handler; defaults to the skill entry points.
+        queue: Queue to drain; a TaskQueue at the spec's depth limit by default.
+        concurrency: Worker coroutines, i.e. tasks in flight at once.
+        thread_workers: Synchronous handlers running at once; defaults to ``concurrency``.
+        spare_threads: Extra executor threads that take over the slots of
+            synchronous handlers still running after their timeout;
+            defaults to ``thread_workers``.
+        on_result: Called with every TaskResult (sync or async), e.g. the Judge.
+        processes: Runner for ``@cpu_bound`` handlers; without one they run
+            in the thread executor like any other synchronous handler.
+        latency_window: Recent tasks kept for latency percentiles.
+    """
+
+    def __init__(
+        self,
+        handlers: Mapping[str, Handler] | None = None,
+        *,
+        queue: TaskQueue | None = None,
+        concurrency: int = 64,
+        thread_workers: int | None = None,
+        spare_threads: int | None = None,
+        on_result: ResultHook | None = None,
+        processes: ProcessRunner | None = None,
+        latency_window: int = 100_000,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.handlers = dict(default_handlers() if handlers is None else handlers)
+        self.queue = queue if queue is not None else TaskQueue()
+        self.concurrency = concurrency
+        self.on_result = on_result
+        self.processes = processes
+        self.stats = PoolStats()
+        self._thread_workers = thread_workers or concurrency
+        self._spare_threads = self._thread_workers if spare_threads is None else spare_threads
+        self._executor: ThreadPoolExecutor | None = None
+        self._thread_slots: asyncio.Semaphore | None = None
+        self._abandoned = 0
+        self._workers: list[asyncio.Task[None]] = []
+        self._queue_ms: deque[float] = deque(maxlen=latency_window)
+        self._run_ms: deque[float] = deque(maxlen=latency_window)
+        self._clock = time.monotonic
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    def start(self) -> None:
+        """Start the worker coroutines; must be called from the event loop."""
+        if self._workers:
+            return
+        self._executor = ThreadPoolExecutor(
+            self._thread_workers + self._spare_threads, thread_name_prefix="chimera-task"
+        )
+        self._thread_slots = asyncio.Semaphore(self._thread_workers)
+        loop = asyncio.get_running_loop()
+        self._workers = [loop.create_task(self._work()) for _ in range(self.concurrency)]
+
+    def submit_nowait(self, task: Task) -> asyncio.Future[TaskResult]:
+        """
+        Queue a task without waiting.
+
+        Returns:
+            Future resolving to the task's TaskResult.
+
+        Raises:
+            QueueFullError: If the queue is at its depth limit.
+            KeyError: If no handler is registered for ``task.type``.
+        """
+        self._check_type(task)
+        self.start()
+        return self.queue.put_nowait(task)
+
+    async def submit(self, task: Task, timeout: float | None = None) -> asyncio.Future[TaskResult]:
+        """
+        Queue a task, waiting up to ``timeout`` seconds while the queue is full.
+
+        Raises:
+            QueueFullError: If the queue is still full after ``timeout``.
+            KeyError: If no handler is registered for ``task.type``.
+        """
+        self._check_type(task)
+        self.start()
+        return await self.queue.put(task, timeout)
+
+    async def run(self, task: Task) -> TaskResult:
+        """Queue a task and wait for its result."""
+        return await (await self.submit(task))
+
+    async def close(self, *, drain: bool = True) -> None:
+        """
+        Stop the workers.
+
+        Args:
+            drain: Finish every queued task first; otherwise queued tasks
+                fail with "runtime closed" and in-flight ones are cancelled.
+        """
+        if drain and self._workers:
+            await self.queue.join()
+        else:
+            self.queue.cancel_pending()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def __aenter__(self) -> "WorkerPool":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Queue depth, counters and latency percentiles (milliseconds)."""
+        return {
+            "queue_depth": self.queue.qsize(),
+            "threads_abandoned_now": self._abandoned,
+            "under_pressure": self.queue.under_pressure,
+            **self.queue.stats.as_dict(),
+            **self.stats.__dict__,
+            "queue_ms": latency_summary(self._queue_ms),
+            "run_ms": latency_summary(self._run_ms),
+        }
+
+    def _check_type(self, task: Task) -> None:
+        if task.type not in self.handlers:
+            raise KeyError(f"No handler registered for task type {task.type!r}")
+
+    async def _work(self) -> None:
+        while True:
+            entry = await self.queue.get()
+            try:
+                await self._execute(entry)
+            finally:
+                self.queue.task_done()
+
+    async def _execute(self, entry: QueuedTask) -> None:
+        task = entry.task
+        started = self._clock()
+        queue_ms = (started - entry.enqueued_at) * 1e3
+        status, output, error = "completed", None, None
+        try:
+            output = await asyncio.wait_for(self._call(task), task.timeout_seconds)
+        except TimeoutError:
+            status, error = "timeout", f"Task exceeded {task.timeout_seconds}s"
+        except asyncio.CancelledError:
+            if not entry.future.done():
+                entry.future.set_result(
+                    TaskResult(task.task_id, task.type, "failed", error="cancelled")
+                )
+            raise
+        except Exception as exc:
+            status, error = "failed", f"{type(exc).__name__}: {exc}"
+        run_ms = (self._clock() - started) * 1e3
+        self._queue_ms.append(queue_ms)
+        self._run_ms.append(run_ms)
+        _QUEUE_SECONDS.labels(task.type).observe(queue_ms / 1e3)
+        _RUN_SECONDS.labels(task.type).observe(run_ms / 1e3)
+        _TASKS.labels(task.type, status).inc()
+        if status == "completed":
+            self.stats.completed += 1
+        elif status == "timeout":
+            self.stats.timed_out += 1
+        else:
+            self.stats.failed += 1
+
+        result = TaskResult(task.task_id, task.type, status, output, error, queue_ms, run_ms)
+        if self.on_result is not None:
+            try:
+                hooked = self.on_result(result)
+                if inspect.isawaitable(hooked):
+                    await hooked
+            except Exception as exc:
+                result.error = result.error or f"result hook failed: {exc}"
+        if not entry.future.done():
+            entry.future.set_result(result)
+
+    async def _call(self, task: Task) -> Any:
+        handler = self.handlers[task.type]
+        if inspect.iscoroutinefunction(handler):
+            return await handler(task.payload)
+        if self.processes is not None and is_cpu_bound(handler):
+            return await asyncio.wrap_future(self.processes.submit(handler, task.payload))
+        return await self._call_in_thread(handler, task.payload)
+
+    async def _call_in_thread(self, handler: Handler, payload: Any) -> Any:
+        assert self._executor is not None and self._thread_slots is not None
+        slots = self._thread_slots
+        await slots.acquire()
+        future: Future[Any] = self._executor.submit(handler, payload)
+        try:
+            return await asyncio.wrap_future(future)
+        finally:
+            if future.done():
+                slots.release()
+            else:
+                self._abandon(future, slots)
+
+    def _abandon(self, future: "Future[Any]", slots: asyncio.Semaphore) -> None:
+        # The handler overran its timeout (or the pool is closing) and its
+        # thread cannot be stopped.
+        loop = asyncio.get_running_loop()
+        self.stats.threads_abandoned += 1
+        if self._abandoned < self._spare_threads:
+            # A spare thread absorbs it: free the slot now.
+            self._abandoned += 1
+            slots.release()
+            finished = self._reclaim
+        else:
+            logger.warning(
+                "All %d spare task threads are held by overrunning handlers; "
+                "a task slot stays blocked until its handler returns",
+                self._spare_threads,
+            )
+            finished = slots.release
+
+        def done(_: "Future[Any]") -> None:
+            try:
+                loop.call_soon_threadsafe(finished)
+            except RuntimeError:  # the event loop is already closed
+                pass
+
+        future.add_done_callback(done)
+
+    def _reclaim(self) -> None:
+        self._abandoned -= 1
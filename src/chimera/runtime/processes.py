@@ -0,0 +1,196 @@
+"""
+Process-pool execution for CPU-bound skills and skill stages.
+
+Reference: src/chimera/runtime/pool.py, specs/technical.md §6.2
+
+Trend scoring, de-duplication, safety checks and persona-alignment scoring
+hold the GIL. Run on the event loop or on its thread executor, they stall
+every I/O-bound task. Handlers decorated with ``@cpu_bound`` are routed
+to a ProcessRunner instead.
+
+- Warm workers: each process imports the skill modules once at start-up.
+  Importing chimera.validation compiles every schema. Optional
+  initializers load models or configure backends. ``warm()`` starts every
+  process before traffic arrives.
+- Compact payloads: large read-mostly objects (persona packs, lexicons,
+  embeddings) are put in shared memory once with ``share()``. Tasks carry
+  only the small SharedRef, and each worker unpickles the object on
+  first use and caches it.
+
+Synchronous skill code routes individual stages through ``run_cpu_stage``.
+The stage runs in the configured runner, or inline when there is none or
+when already inside a worker.
+"""
+
+import hashlib
+import multiprocessing
+import os
+import pickle
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from importlib import import_module
+from multiprocessing import shared_memory
+from typing import Any, TypeVar
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# Modules imported by every worker at start-up.
+DEFAULT_PRELOAD: tuple[str, ...] = (
+    "chimera.validation",
+    "skills.trend_fetcher",
+    "skills.content_generator",
+    "skills.engagement_manager",
+)
+
+_in_worker = False
+_shared_cache: dict[str, Any] = {}
+_runner: "ProcessRunner | None" = None
+
+
+def cpu_bound(fn: _F) -> _F:
+    """
+    Mark a handler or stage as CPU-bound.
+
+    WorkerPool then runs it in its ProcessRunner. It must be a module-level
+    function so that it pickles by reference.
+    """
+    setattr(fn, "__chimera_cpu_bound__", True)
+    return fn
+
+
+def is_cpu_bound(fn: Callable[..., Any]) -> bool:
+    return getattr(fn, "__chimera_cpu_bound__", False)
+
+
+def _buffer(block: shared_memory.SharedMemory) -> memoryview:
+    if block.buf is None:
+        raise RuntimeError(f"shared memory block {block.name} is closed")
+    return block.buf
+
+
+@dataclass(frozen=True)
+class SharedRef:
+    """Handle to an object published in shared memory by ``ProcessRunner.share``."""
+
+    name: str
+    size: int
+    digest: str
+
+    def resolve(self) -> Any:
+        """The shared object, unpickled once per process."""
+        try:
+            return _shared_cache[self.digest]
+        except KeyError:
+            pass
+        block = shared_memory.SharedMemory(name=self.name)
+        try:
+            value = pickle.loads(_buffer(block)[: self.size])
+        finally:
+            block.close()
+        _shared_cache[self.digest] = value
+        return value
+
+
+def _initialize(preload: tuple[str, ...], initializers: tuple[Callable[[], Any], ...]) -> None:
+    global _in_worker
+    _in_worker = True
+    for module in preload:
+        import_module(module)
+    for initializer in initializers:
+        initializer()
+
+
+def _ping(delay: float) -> int:
+    time.sleep(delay)
+    return os.getpid()
+
+
+class ProcessRunner:
+    """
+    Warm process pool for CPU-bound work.
+
+    Args:
+        max_workers: Worker processes; defaults to the CPU count.
+        preload: Modules each worker imports at start-up.
+        initializers: Module-level callables each worker runs after the
+            imports (load models, configure backends).
+        mp_context: multiprocessing start method. "spawn" avoids forking a
+            process that is already running threads.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        *,
+        preload: Iterable[str] = DEFAULT_PRELOAD,
+        initializers: Iterable[Callable[[], Any]] = (),
+        mp_context: str = "spawn",
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            self.max_workers,
+            mp_context=multiprocessing.get_context(mp_context),
+            initializer=_initialize,
+            initargs=(tuple(preload), tuple(initializers)),
+        )
+        self._blocks: dict[str, tuple[shared_memory.SharedMemory, SharedRef]] = {}
+
+    def warm(self, timeout: float | None = 60.0) -> set[int]:
+        """Start every worker process now; returns their pids."""
+        futures = [self._executor.submit(_ping, 0.05) for _ in range(self.max_workers)]
+        return {future.result(timeout) for future in futures}
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future[Any]:
+        """Run ``fn(*args, **kwargs)`` in a worker process."""
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def share(self, value: Any) -> SharedRef:
+        """
+        Publish ``value`` in shared memory; identical values share one block.
+
+        The block lives until ``close()``.
+        """
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        if digest in self._blocks:
+            return self._blocks[digest][1]
+        block = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+        _buffer(block)[: len(data)] = data
+        ref = SharedRef(block.name, len(data), digest)
+        self._blocks[digest] = (block, ref)
+        return ref
+
+    def close(self, *, wait: bool = True) -> None:
+        """Shut the workers down and release shared memory."""
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+        for block, ref in self._blocks.values():
+            _shared_cache.pop(ref.digest, None)
+            block.close()
+            block.unlink()
+        self._blocks.clear()
+
+    def __enter__(self) -> "ProcessRunner":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def configure_process_runner(runner: ProcessRunner | None) -> None:
+    """Set the process-wide runner used by ``run_cpu_stage``; None runs stages inline."""
+    global _runner
+    _runner = runner
+
+
+def run_cpu_stage(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run one CPU-bound stage of synchronous skill code.
+
+    The stage runs in the configured ProcessRunner. It runs inline when no
+    runner is configured, or when the caller is already a worker process.
+    """
+    if _runner is None or _in_worker:
+        return fn(*args, **kwargs)
+    return _runner.submit(fn, *args, **kwargs).result()
@@ -0,0 +1,182 @@
+"""
+Bounded priority queue with admission control and backpressure.
+
+Reference: specs/technical.md §6.3 (task queue depth 10,000, reject new tasks)
+
+Tasks are dequeued highest priority first, FIFO within a priority. Once
+the queue reaches ``maxsize``, ``put_nowait`` rejects new tasks with
+QueueFullError. Producers that would rather wait use ``put``.
+
+Backpressure has hysteresis. The queue reports pressure once its depth
+reaches the high watermark, and keeps reporting it until the depth falls
+back to the low watermark. Producers can check ``under_pressure`` or
+``await relieved()`` to slow down before they are rejected.
+"""
+
+import asyncio
+import itertools
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from .tasks import Task, TaskResult
+
+DEFAULT_MAX_DEPTH = 10_000
+
+
+class QueueFullError(RuntimeError):
+    """Raised when a task is submitted to a queue at its depth limit."""
+
+    def __init__(self, depth: int):
+        super().__init__(f"Task queue is full ({depth} tasks); rejecting new tasks")
+        self.depth = depth
+
+
+@dataclass
+class QueuedTask:
+    """A task waiting in the queue, with the future its result resolves."""
+
+    task: Task
+    enqueued_at: float
+    future: asyncio.Future[TaskResult] = field(repr=False)
+
+
+@dataclass
+class QueueStats:
+    """Counters describing TaskQueue behaviour since creation."""
+
+    accepted: int = 0
+    rejected: int = 0
+    dequeued: int = 0
+    max_depth: int = 0
+    pressure_events: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return dict(self.__dict__)
+
+
+class TaskQueue:
+    """
+    Priority queue of tasks bounded at ``maxsize``.
+
+    Args:
+        maxsize: Depth at which new tasks are rejected.
+        high_watermark: Fraction of ``maxsize`` at which backpressure starts.
+        low_watermark: Fraction of ``maxsize`` at which backpressure ends.
+        clock: Monotonic clock used to time queue waits.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAX_DEPTH,
+        *,
+        high_watermark: float = 0.8,
+        low_watermark: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if not 0 <= low_watermark <= high_watermark <= 1:
+            raise ValueError("watermarks must satisfy 0 <= low <= high <= 1")
+        self.maxsize = maxsize
+        self.high = max(1, int(maxsize * high_watermark))
+        self.low = int(maxsize * low_watermark)
+        self.stats = QueueStats()
+        self._clock = clock
+        self._queue: asyncio.PriorityQueue[tuple[int, int, QueuedTask]] = asyncio.PriorityQueue(
+            maxsize
+        )
+        self._seq = itertools.count()
+        self._relieved = asyncio.Event()
+        self._relieved.set()
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def under_pressure(self) -> bool:
+        """True between crossing the high watermark and draining to the low one."""
+        return not self._relieved.is_set()
+
+    async def relieved(self) -> None:
+        """Wait until the queue is not under pressure."""
+        await self._relieved.wait()
+
+    def put_nowait(self, task: Task) -> asyncio.Future[TaskResult]:
+        """
+        Enqueue a task, rejecting it if the queue is full.
+
+        Returns:
+            Future resolving to the task's TaskResult.
+
+        Raises:
+            QueueFullError: If the queue is at ``maxsize``.
+        """
+        entry = self._entry(task)
+        try:
+            self._queue.put_nowait((-task.priority, next(self._seq), entry))
+        except asyncio.QueueFull:
+            self.stats.rejected += 1
+            raise QueueFullError(self.maxsize) from None
+        self._accepted()
+        return entry.future
+
+    async def put(self, task: Task, timeout: float | None = None) -> asyncio.Future[TaskResult]:
+        """
+        Enqueue a task, waiting up to ``timeout`` seconds for room.
+
+        Returns:
+            Future resolving to the task's TaskResult.
+
+        Raises:
+            QueueFullError: If there is still no room after ``timeout``.
+        """
+        entry = self._entry(task)
+        item = (-task.priority, next(self._seq), entry)
+        try:
+            await asyncio.wait_for(self._queue.put(item), timeout)
+        except TimeoutError:
+            self.stats.rejected += 1
+            raise QueueFullError(self.maxsize) from None
+        self._accepted()
+        return entry.future
+
+    async def get(self) -> QueuedTask:
+        """Remove and return the highest-priority task, waiting if empty."""
+        _, _, entry = await self._queue.get()
+        self.stats.dequeued += 1
+        if self.under_pressure and self._queue.qsize() <= self.low:
+            self._relieved.set()
+        return entry
+
+    def task_done(self) -> None:
+        self._queue.task_done()
+
+    async def join(self) -> None:
+        """Wait until every dequeued task has been marked done."""
+        await self._queue.join()
+
+    def cancel_pending(self, reason: str = "runtime closed") -> int:
+        """Fail every queued task; returns how many were dropped."""
+        dropped = 0
+        while not self._queue.empty():
+            _, _, entry = self._queue.get_nowait()
+            self._queue.task_done()
+            if not entry.future.done():
+                entry.future.set_result(
+                    TaskResult(entry.task.task_id, entry.task.type, "failed", error=reason)
+                )
+            dropped += 1
+        self._relieved.set()
+        return dropped
+
+    def _entry(self, task: Task) -> QueuedTask:
+        return QueuedTask(task, self._clock(), asyncio.get_running_loop().create_future())
+
+    def _accepted(self) -> None:
+        self.stats.accepted += 1
+        depth = self._queue.qsize()
+        self.stats.max_depth = max(self.stats.max_depth, depth)
+        if depth >= self.high and not self.under_pressure:
+            self.stats.pressure_events += 1
+            self._relieved.clear()
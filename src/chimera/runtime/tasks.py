@@ -0,0 +1,111 @@
+"""
+Task and result records for the task runtime.
+
+Reference: specs/technical.md §3.1 (Task Queue Message)
+"""
+
+import uuid
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import IntEnum
+from typing import Any
+
+
+class Priority(IntEnum):
+    """Task priority; higher values are dequeued first."""
+
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+    CRITICAL = 3
+
+    @classmethod
+    def parse(cls, value: "int | str | Priority") -> "Priority":
+        """Accept a Priority, its integer value or its (case-insensitive) name."""
+        if isinstance(value, str):
+            try:
+                return cls[value.upper()]
+            except KeyError:
+                raise ValueError(f"Unknown priority: {value!r}") from None
+        return cls(value)
+
+
+@dataclass
+class Task:
+    """
+    A unit of work for the worker pool.
+
+    ``type`` selects the handler (see chimera.runtime.handlers); ``payload``
+    is passed to it unchanged.
+    """
+
+    type: str
+    payload: dict[str, Any] = field(default_factory=dict)
+    priority: Priority = Priority.MEDIUM
+    agent_id: str | None = None
+    task_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    created_at: str = field(
+        default_factory=lambda: datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+    )
+    timeout_seconds: float = 300.0
+    retry_count: int = 0
+
+    def __post_init__(self) -> None:
+        self.priority = Priority.parse(self.priority)
+        if self.timeout_seconds <= 0:
+            raise ValueError("timeout_seconds must be positive")
+
+    @classmethod
+    def from_message(cls, message: dict[str, Any]) -> "Task":
+        """Build a task from a Task Queue message (technical.md §3.1)."""
+        metadata = message.get("metadata", {})
+        task = cls(
+            type=message["type"],
+            payload=message.get("payload", {}),
+            priority=message.get("priority", Priority.MEDIUM),
+            agent_id=message.get("agent_id"),
+            timeout_seconds=metadata.get("timeout_seconds", 300.0),
+            retry_count=metadata.get("retry_count", 0),
+        )
+        if "task_id" in message:
+            task.task_id = message["task_id"]
+        if "created_at" in metadata:
+            task.created_at = metadata["created_at"]
+        return task
+
+    def to_message(self) -> dict[str, Any]:
+        """The Task Queue message for this task."""
+        return {
+            "task_id": self.task_id,
+            "type": self.type,
+            "priority": int(self.priority),
+            "agent_id": self.agent_id,
+            "payload": self.payload,
+            "metadata": {
+                "created_at": self.created_at,
+                "timeout_seconds": self.timeout_seconds,
+                "retry_count": self.retry_count,
+            },
+        }
+
+
+@dataclass
+class TaskResult:
+    """
+    Outcome of one task.
+
+    ``status`` is ``completed``, ``failed`` or ``timeout``; ``output`` is the
+    handler's return value and ``error`` a description of the failure.
+    """
+
+    task_id: str
+    type: str
+    status: str
+    output: Any = None
+    error: str | None = None
+    queue_ms: float = 0.0
+    run_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "completed"
@@ -0,0 +1,397 @@
+"""
+Safety scanning of generated text: flags with match offsets, and a score.
+
+Reference: specs/technical.md §1.2 (Generate Text ``safety_flags``), §2
+(``contents.safety_flags``), specs/functional.md US-010 (no profanity or
+hate speech), skills/*/output_schema.json (``metadata.safety_score``)
+
+Every rule is a term or a regular expression, with the flag it raises and
+a severity in (0, 1]. All terms, and a literal anchor taken from each
+regular expression, are compiled into one Aho-Corasick automaton. A text
+is scanned once, whatever the number of rules. A regular expression is
+only run on texts where its anchor was found. ``scan_many`` joins a whole
+batch and scans it in one pass.
+
+Text is normalised before scanning, so that obfuscated terms still match:
+- accents are stripped, and case and compatibility forms are folded;
+- Cyrillic and Greek lookalikes map to Latin letters ("сrypto" -> "crypto");
+- leetspeak digits and symbols next to letters map to letters ("sh1t", "@ss");
+- inside a hashtag, terms match without word boundaries or spaces, so
+  "#GetRichQuickNow" matches "get rich quick".
+
+Match offsets always refer to the original text.
+
+The score is the product of ``1 - severity`` over the raised flags, using
+each flag's most severe match. Clean text scores 1.0. The Judge holds
+anything below ``min_safety`` (0.90) for review, and always reviews the
+sensitive flags (politics, health_advice, ...).
+
+    engine = SafetyEngine(DEFAULT_RULES)  # or get_engine() for the shared one
+    result = engine.scan("guaranteed returns, DM me")
+    result.score, result.flags, result.matches
+
+The automaton is immutable once built, so threads share one engine, and
+worker processes receive it with the rest of the module state.
+"""
+
+import json
+import re
+import threading
+import unicodedata
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+# Anchors shorter than this would match too often to filter anything.
+MIN_ANCHOR_LENGTH = 3
+
+# fmt: off
+_CONFUSABLES = str.maketrans(
+    {
+        # Cyrillic
+        "а": "a", "в": "b", "е": "e", "ё": "e", "к": "k", "м": "m", "н": "h", "о": "o",
+        "р": "p", "с": "c", "т": "t", "у": "y", "х": "x", "і": "i", "ї": "i", "ј": "j",
+        "ѕ": "s", "ԁ": "d", "ԛ": "q", "ԝ": "w", "һ": "h", "ɡ": "g",
+        # Greek
+        "α": "a", "β": "b", "ε": "e", "η": "n", "ι": "i", "κ": "k", "ν": "v", "ο": "o",
+        "ρ": "p", "τ": "t", "υ": "u", "χ": "x", "ω": "w",
+    }
+)
+_LEET = str.maketrans(
+    {"0": "o", "1": "i", "3": "e", "4": "a", "5": "s", "7": "t", "@": "a", "$": "s"}
+)
+# fmt: on
+# A run of leetspeak characters touching a letter.
+_LEET_RUN = re.compile(r"(?<=[^\W\d_])[013457@$]+|[013457@$]+(?=[^\W\d_])")
+_HASHTAG = re.compile(r"#\w+")
+_REGEX_META = frozenset("\\.^$*+?{}[]()|")
+# How an automaton key relates to its rule.
+_TERM, _ANCHOR, _HASHTAG_TERM = range(3)
+
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    One blocklist entry.
+
+    Args:
+        flag: Flag raised on a match, e.g. ``profanity`` or ``financial_advice``.
+        pattern: The term, or a regular expression if ``regex`` is set.
+        severity: Score penalty in (0, 1]; 1.0 means never publish.
+        regex: Treat ``pattern`` as a regular expression, run on normalised text.
+        anchor: Literal every match contains, used to skip texts without it.
+            Defaults to the pattern's literal prefix. A regular expression
+            without one is run on every text.
+    """
+
+    flag: str
+    pattern: str
+    severity: float = 0.5
+    regex: bool = False
+    anchor: str | None = None
+
+    def __post_init__(self) -> None:
+        if not 0 < self.severity <= 1:
+            raise ValueError(f"severity must be in (0, 1], got {self.severity}")
+        if not self.pattern:
+            raise ValueError("pattern must not be empty")
+
+
+@dataclass(frozen=True)
+class SafetyMatch:
+    """A rule match; ``start`` and ``end`` index the original text."""
+
+    flag: str
+    start: int
+    end: int
+    text: str
+    severity: float
+
+
+@dataclass(frozen=True)
+class SafetyResult:
+    """Outcome of scanning one text."""
+
+    score: float
+    flags: list[str] = field(default_factory=list)
+    matches: list[SafetyMatch] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def normalize(text: str) -> tuple[str, list[int] | None]:
+    """
+    Fold ``text`` for matching.
+
+    Returns:
+        ``(normalised, origins)``. ``origins[i]`` is the index in ``text``
+        of normalised character ``i``, or None when the two line up one to
+        one, as they do for ASCII text.
+    """
+    if text.isascii():
+        folded = text.lower()
+        origins = None
+    else:
+        chars: list[str] = []
+        origins = []
+        for index, char in enumerate(text):
+            for part in unicodedata.normalize("NFKD", char):
+                if unicodedata.combining(part):
+                    continue
+                for piece in part.casefold().translate(_CONFUSABLES):
+                    chars.append(piece)
+                    origins.append(index)
+        folded = "".join(chars)
+    return _LEET_RUN.sub(lambda m: m.group().translate(_LEET), folded), origins
+
+
+def _literal_prefix(pattern: str) -> str:
+    prefix: list[str] = []
+    for char in pattern.removeprefix(r"\b"):
+        if char in _REGEX_META:
+            # A quantifier applies to the character before it.
+            if char in "*+?{" and prefix:
+                prefix.pop()
+            break
+        prefix.append(char)
+    return "".join(prefix).strip()
+
+
+class _Automaton:
+    """Aho-Corasick automaton over the normalised keys."""
+
+    def __init__(self, keys: Sequence[str]):
+        self.goto: list[dict[str, int]] = [{}]
+        self.fail = [0]
+        # Per state: (key index, key length) for every key ending there.
+        self.out: list[tuple[tuple[int, int], ...]] = [()]
+        for index, key in enumerate(keys):
+            state = 0
+            for char in key:
+                nxt = self.goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][char] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append(())
+                state = nxt
+            self.out[state] += ((index, len(key)),)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self.goto[state].items():
+                queue.append(nxt)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                self.out[nxt] += self.out[self.fail[nxt]]
+
+    def search(self, text: str) -> Iterator[tuple[int, tuple[tuple[int, int], ...]]]:
+        """Yield ``(end, keys)`` for each position where keys end."""
+        goto, fail, out = self.goto, self.fail, self.out
+        root = goto[0]
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state:
+                nxt = goto[state].get(char)
+                if nxt is not None:
+                    state = nxt
+                    break
+                state = fail[state]
+            else:
+                state = root.get(char, 0)
+            if out[state]:
+                yield end, out[state]
+
+
+class SafetyEngine:
+    """
+    Scans texts against a fixed rule set.
+
+    Args:
+        rules: Terms and regular expressions; duplicates are allowed.
+    """
+
+    def __init__(self, rules: Iterable[Rule]):
+        self.rules = list(rules)
+        keys: list[str] = []
+        # Per automaton key: (rule index, _TERM, _ANCHOR or _HASHTAG_TERM).
+        self._key_rules: list[list[tuple[int, int]]] = []
+        key_index: dict[str, int] = {}
+        self._unanchored: list[int] = []
+        self._compiled: dict[int, re.Pattern[str]] = {}
+
+        def add(key: str, index: int, kind: int) -> None:
+            if key not in key_index:
+                key_index[key] = len(keys)
+                keys.append(key)
+                self._key_rules.append([])
+            self._key_rules[key_index[key]].append((index, kind))
+
+        for index, rule in enumerate(self.rules):
+            if rule.regex:
+                self._compiled[index] = re.compile(rule.pattern)
+                key = normalize(rule.anchor or _literal_prefix(rule.pattern))[0]
+                if len(key) < MIN_ANCHOR_LENGTH:
+                    self._unanchored.append(index)
+                else:
+                    add(key, index, _ANCHOR)
+                continue
+            key = normalize(rule.pattern)[0]
+            add(key, index, _TERM)
+            if " " in key:
+                add(key.replace(" ", ""), index, _HASHTAG_TERM)
+        self._automaton = _Automaton(keys)
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "SafetyEngine":
+        """
+        Build an engine from a rules document.
+
+        ``{"rules": [{"flag": ..., "severity": ..., "terms": [...]},
+        {"flag": ..., "severity": ..., "regex": ..., "anchor": ...}]}``
+        """
+        rules = []
+        for entry in config["rules"]:
+            severity = entry.get("severity", 0.5)
+            for term in entry.get("terms", ()):
+                rules.append(Rule(entry["flag"], term, severity))
+            if "regex" in entry:
+                rules.append(
+                    Rule(entry["flag"], entry["regex"], severity, True, entry.get("anchor"))
+                )
+        return cls(rules)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "SafetyEngine":
+        """Build an engine from a JSON rules document (see ``from_config``)."""
+        return cls.from_config(json.loads(Path(path).read_text()))
+
+    @property
+    def unanchored_rules(self) -> int:
+        """Regular expressions run on every text, for want of an anchor."""
+        return len(self._unanchored)
+
+    def scan(self, text: str) -> SafetyResult:
+        """Scan one text."""
+        return self.scan_many([text])[0]
+
+    def scan_many(self, texts: Sequence[str]) -> list[SafetyResult]:
+        """
+        Scan a batch of texts in one pass.
+
+        Returns:
+            One SafetyResult per text, in order.
+        """
+        normalized = [normalize(text) for text in texts]
+        starts = []
+        offset = 0
+        for folded, _ in normalized:
+            starts.append(offset)
+            offset += len(folded) + 1
+        # NUL is in no key, so a match never spans two texts.
+        joined = "\0".join(folded for folded, _ in normalized)
+
+        found: list[list[SafetyMatch]] = [[] for _ in texts]
+        anchored: list[set[int]] = [set() for _ in texts]
+        hashtags: list[list[tuple[int, int]] | None] = [None] * len(texts)
+        for end, keys in self._automaton.search(joined):
+            which = bisect_right(starts, end - 1) - 1
+            local_end = end - starts[which]
+            folded, origins = normalized[which]
+            for key, length in keys:
+                local_start = local_end - length
+                for index, kind in self._key_rules[key]:
+                    if kind == _ANCHOR:
+                        anchored[which].add(index)
+                        continue
+                    spans = hashtags[which]
+                    if spans is None:
+                        spans = hashtags[which] = [m.span() for m in _HASHTAG.finditer(folded)]
+                    if _in_hashtag(local_start, local_end, spans) or (
+                        kind == _TERM and _whole_word(folded, local_start, local_end)
+                    ):
+                        found[which].append(
+                            self._match(index, texts[which], origins, local_start, local_end)
+                        )
+
+        results = []
+        for which, text in enumerate(texts):
+            folded, origins = normalized[which]
+            for index in sorted(anchored[which].union(self._unanchored)):
+                for m in self._compiled[index].finditer(folded):
+                    if m.end() > m.start():
+                        found[which].append(self._match(index, text, origins, *m.span()))
+            results.append(_result(found[which]) if found[which] else SafetyResult(1.0))
+        return results
+
+    def _match(
+        self, index: int, text: str, origins: list[int] | None, start: int, end: int
+    ) -> SafetyMatch:
+        if origins is not None:
+            start, end = origins[start], origins[end - 1] + 1
+        rule = self.rules[index]
+        return SafetyMatch(rule.flag, start, end, text[start:end], rule.severity)
+
+
+def _whole_word(folded: str, start: int, end: int) -> bool:
+    return (start == 0 or not folded[start - 1].isalnum()) and (
+        end == len(folded) or not folded[end].isalnum()
+    )
+
+
+def _in_hashtag(start: int, end: int, hashtags: list[tuple[int, int]]) -> bool:
+    return any(tag_start < start and end <= tag_end for tag_start, tag_end in hashtags)
+
+
+def _result(matches: list[SafetyMatch]) -> SafetyResult:
+    worst: dict[str, float] = {}
+    for match in matches:
+        worst[match.flag] = max(worst.get(match.flag, 0.0), match.severity)
+    score = 1.0
+    for severity in worst.values():
+        score *= 1 - severity
+    matches.sort(key=lambda m: (m.start, m.end, m.flag))
+    return SafetyResult(round(score, 4), sorted(worst), matches)
+
+
+# A small built-in rule set; deployments load their own lists with SafetyEngine.load().
+DEFAULT_RULES: tuple[Rule, ...] = (
+    *(Rule("profanity", term, 0.3) for term in ("fuck", "fucking", "shit", "bullshit", "bitch")),
+    *(Rule("harassment", term, 0.9) for term in ("kill yourself", "kys", "go die")),
+    Rule("hate_speech", r"\b(?:all|those) \w+ (?:are|should be) vermin\b", 0.95, True, "vermin"),
+    Rule("hate_speech", r"\b(?:all|those) \w+ (?:are|should be) animals\b", 0.95, True, "animals"),
+    Rule("financial_advice", r"\bguaranteed (?:returns?|profits?|gains?)\b", 0.2, True),
+    Rule("financial_advice", "get rich quick", 0.2),
+    Rule("health_advice", r"\b(?:miracle|natural) cure\b", 0.2, True, "cure"),
+    Rule("health_advice", "cures cancer", 0.2),
+    Rule("politics", r"\b(?:vote|voting) (?:for|against)\b", 0.1, True, "vot"),
+    Rule("politics", "election fraud", 0.1),
+    Rule("legal_claims", "not liable", 0.1),
+)
+
+_engine: SafetyEngine | None = None
+_engine_lock = threading.Lock()
+
+
+def configure_engine(engine: SafetyEngine | None) -> None:
+    """Set the process-wide engine; None goes back to DEFAULT_RULES."""
+    global _engine
+    _engine = engine
+
+
+def get_engine() -> SafetyEngine:
+    """Return the process-wide engine, building the default one on first use."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = SafetyEngine(DEFAULT_RULES)
+    return _engine
@@ -0,0 +1,315 @@
+"""
+Lazy registry of runtime skills, with a warm-start snapshot for workers.
+
+Reference: skills/README.md (Skill Registry), specs/technical.md §6.2
+Traceability: skills/*/input_schema.json (``x-entrypoint``)
+
+Importing a skill package pulls in NumPy and the skill's whole dependency
+tree, about 200ms each, and a worker may never be given a task for most of
+them. The registry finds skills from their contracts instead:
+- A skill is a directory under ``skills/`` with an ``input_schema.json``.
+  The schema's ``x-entrypoint`` names the function that runs it.
+- The package ``skills.<name>`` is imported on the first ``invoke`` of that
+  skill, not before.
+- Inputs are validated before the import, so a malformed task never pays
+  for it.
+
+``save`` writes the parsed schemas, the compiled validator code and the
+skill list to one ``marshal`` file. ``warm_start`` loads that file when it
+is still current, which skips reading the JSON, generating the validators
+and even importing ``json``. The snapshot is only valid for the Python
+version that wrote it, and is rebuilt when any schema file changes or a
+skill is added.
+
+    registry = SkillRegistry.warm_start("/var/cache/chimera/skills.snapshot")
+    configure_registry(registry)
+    registry.invoke("engagement_manager", task_input)
+
+``python -m chimera.skills <path>`` writes the snapshot, e.g. when building
+the worker image.
+"""
+
+import importlib
+import marshal
+import os
+import sys
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from types import CodeType
+from typing import Any, NamedTuple
+
+from chimera import validation
+from chimera.validation import SchemaKey, SchemaKind, Validator
+
+SNAPSHOT_FORMAT = 1
+ENTRYPOINT_KEY = "x-entrypoint"
+_SCHEMA_FILES = ("input_schema.json", "output_schema.json")
+
+
+# A NamedTuple rather than a dataclass: importing dataclasses costs a
+# warm-started worker about half of its import time.
+class SkillSpec(NamedTuple):
+    """A discovered skill: where its code lives and what runs it."""
+
+    name: str
+    module: str
+    entrypoint: str
+    description: str = ""
+
+
+class SkillRegistry:
+    """
+    Skills found under ``skills_dir``, imported on first use.
+
+    Thread-safe.
+
+    Args:
+        skills_dir: Directory holding one subdirectory per skill.
+        package: Import path of ``skills_dir``.
+    """
+
+    def __init__(self, skills_dir: str | Path = validation.SKILLS_DIR, *, package: str = "skills"):
+        self.skills_dir = Path(skills_dir)
+        self.package = package
+        self._specs: dict[str, SkillSpec] = {}
+        self._schemas: dict[SchemaKey, dict[str, Any]] = {}
+        self._code: dict[SchemaKey, tuple[str, CodeType, dict[str, Any]]] = {}
+        self._validators: dict[SchemaKey, Validator] = {}
+        self._entrypoints: dict[str, Callable[..., Any]] = {}
+        self._by_entrypoint: dict[str, SkillSpec] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def discover(
+        cls, skills_dir: str | Path = validation.SKILLS_DIR, *, package: str = "skills"
+    ) -> "SkillRegistry":
+        """
+        Scan ``skills_dir`` and compile every skill's schemas.
+
+        Raises:
+            ValueError: If an input schema has no ``x-entrypoint``.
+        """
+        registry = cls(skills_dir, package=package)
+        registry._schemas = validation.load_schemas(registry.skills_dir)
+        for (name, kind), schema in registry._schemas.items():
+            if kind != "input":
+                continue
+            if ENTRYPOINT_KEY not in schema:
+                raise ValueError(f"{name}/input_schema.json has no {ENTRYPOINT_KEY!r}")
+            registry._specs[name] = SkillSpec(
+                name,
+                f"{package}.{name}",
+                schema[ENTRYPOINT_KEY],
+                schema.get("description", ""),
+            )
+        registry._code = {
+            key: validation.compile_schema_code(schema) for key, schema in registry._schemas.items()
+        }
+        registry._bind()
+        return registry
+
+    @classmethod
+    def load(
+        cls,
+        path: str | Path,
+        skills_dir: str | Path = validation.SKILLS_DIR,
+        *,
+        package: str = "skills",
+    ) -> "SkillRegistry | None":
+        """
+        Load a snapshot written by ``save``.
+
+        Returns:
+            The registry, or None if the snapshot is missing, unreadable,
+            from another Python version, or older than the schema files.
+        """
+        registry = cls(skills_dir, package=package)
+        try:
+            with open(path, "rb") as f:
+                snapshot = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(snapshot, dict) or snapshot.get("format") != SNAPSHOT_FORMAT:
+            return None
+        if snapshot.get("cache_tag") != sys.implementation.cache_tag:
+            return None
+        if snapshot.get("package") != package or snapshot.get("sources") != registry._sources():
+            return None
+        registry._specs = {fields[0]: SkillSpec(*fields) for fields in snapshot["skills"]}
+        registry._schemas = snapshot["schemas"]
+        registry._code = snapshot["code"]
+        registry._bind()
+        return registry
+
+    @classmethod
+    def warm_start(
+        cls,
+        path: str | Path,
+        skills_dir: str | Path = validation.SKILLS_DIR,
+        *,
+        package: str = "skills",
+    ) -> "SkillRegistry":
+        """
+        Load the snapshot at ``path``, or discover and write it if it is stale.
+
+        A snapshot that cannot be written (read-only image) is not an error.
+        """
+        registry = cls.load(path, skills_dir, package=package)
+        if registry is None:
+            registry = cls.discover(skills_dir, package=package)
+            try:
+                registry.save(path)
+            except OSError:
+                pass
+        return registry
+
+    def save(self, path: str | Path) -> None:
+        """Write the snapshot atomically, so concurrent workers never read half of it."""
+        snapshot = {
+            "format": SNAPSHOT_FORMAT,
+            "cache_tag": sys.implementation.cache_tag,
+            "package": self.package,
+            "sources": self._sources(),
+            "skills": [tuple(spec) for spec in self._specs.values()],
+            "schemas": self._schemas,
+            "code": self._code,
+        }
+        path = Path(path)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            marshal.dump(snapshot, f)
+        os.replace(tmp, path)
+
+    def _sources(self) -> dict[str, tuple[int, int]]:
+        """``(mtime_ns, size)`` of every schema file, by path relative to skills_dir."""
+        sources: dict[str, tuple[int, int]] = {}
+        with os.scandir(self.skills_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                for filename in _SCHEMA_FILES:
+                    try:
+                        stat = os.stat(os.path.join(entry.path, filename))
+                    except FileNotFoundError:
+                        continue
+                    sources[f"{entry.name}/{filename}"] = (stat.st_mtime_ns, stat.st_size)
+        return sources
+
+    def _bind(self) -> None:
+        """Build the validators and lookup tables from the loaded specs and code."""
+        self._by_entrypoint = {spec.entrypoint: spec for spec in self._specs.values()}
+        self._validators = {
+            key: validation.bind_schema_code(*code) for key, code in self._code.items()
+        }
+
+    def install(self) -> None:
+        """Serve this registry's schemas and validators from ``chimera.validation``."""
+        validation.install(self._schemas, self._validators)
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._specs
+
+    def names(self) -> list[str]:
+        return sorted(self._specs)
+
+    def spec(self, name: str) -> SkillSpec:
+        try:
+            return self._specs[name]
+        except KeyError:
+            raise KeyError(f"Unknown skill {name!r}") from None
+
+    def by_entrypoint(self, entrypoint: str) -> SkillSpec:
+        """The skill whose ``x-entrypoint`` is ``entrypoint`` (a worker task type)."""
+        try:
+            return self._by_entrypoint[entrypoint]
+        except KeyError:
+            raise KeyError(f"No skill has entry point {entrypoint!r}") from None
+
+    def schema(self, name: str, kind: SchemaKind) -> dict[str, Any]:
+        try:
+            return self._schemas[(name, kind)]
+        except KeyError:
+            raise KeyError(f"No {kind} schema registered for skill {name!r}") from None
+
+    def validator(self, name: str, kind: SchemaKind) -> Validator:
+        try:
+            return self._validators[(name, kind)]
+        except KeyError:
+            raise KeyError(f"No {kind} schema registered for skill {name!r}") from None
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether the skill's code has been imported by this registry."""
+        return name in self._entrypoints
+
+    def entrypoint(self, name: str) -> Callable[..., Any]:
+        """The skill's entry point function, importing its package on first call."""
+        function = self._entrypoints.get(name)
+        if function is None:
+            spec = self.spec(name)
+            with self._lock:
+                function = self._entrypoints.get(name)
+                if function is None:
+                    function = getattr(importlib.import_module(spec.module), spec.entrypoint)
+                    self._entrypoints[name] = function
+        return function
+
+    def invoke(self, name: str, input_data: Any, **kwargs: Any) -> Any:
+        """
+        Validate ``input_data`` and run the skill.
+
+        Raises:
+            SchemaValidationError: If input_data violates the input schema;
+                the skill is not imported.
+            KeyError: If the skill is unknown.
+        """
+        error = self.validator(name, "input")(input_data)
+        if error is not None:
+            raise validation.SchemaValidationError(name, "input", error)
+        return self.entrypoint(name)(input_data, **kwargs)
+
+
+_registry: SkillRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def configure_registry(registry: SkillRegistry | None) -> None:
+    """
+    Set the process-wide registry and serve its compiled schemas.
+
+    None resets it; the next ``get_registry`` discovers ``skills/`` again.
+    """
+    global _registry
+    with _registry_lock:
+        _registry = registry
+        if registry is not None:
+            registry.install()
+
+
+def get_registry() -> SkillRegistry:
+    """The process-wide registry, discovered from ``skills/`` on first use."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = SkillRegistry.discover()
+    return _registry
+
+
+def main(argv: list[str] | None = None) -> None:
+    import argparse  # only the CLI needs it; keep it out of worker start-up
+
+    parser = argparse.ArgumentParser(description="Write the skill registry snapshot.")
+    parser.add_argument("path", help="Snapshot file to write")
+    parser.add_argument("--skills-dir", default=str(validation.SKILLS_DIR))
+    args = parser.parse_args(argv)
+    registry = SkillRegistry.discover(args.skills_dir)
+    registry.save(args.path)
+    print(f"{len(registry)} skills -> {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,466 @@
+"""
+Optimistic-concurrency state store for agent and task status.
+
+Reference: specs/technical.md §2.2 (agents.status, tasks.status)
+
+Workers and the Judge move agents and tasks through their state machines
+concurrently. No row lock is held for a read-validate-write cycle. Each
+transition reads the row, checks the state machine, and writes with a
+compare-and-swap on the row's ``version``:
+
+    UPDATE states SET status = :to, version = version + 1
+    WHERE kind = :kind AND id = :id AND version = :seen
+
+If another writer got there first, the update matches no row. The
+transition then re-reads and retries with a little jittered backoff,
+unless the caller pinned a version or an expected status.
+``transition_many`` commits a whole batch of compare-and-swaps in one
+backend transaction. Rows that lost a race are retried in a later round.
+
+Backends:
+- ``MemoryBackend``: one process. Compare-and-swaps take a striped lock,
+  held for a dict update.
+- ``SQLiteBackend``: a local stand-in for Postgres. The SQL above ports
+  unchanged.
+"""
+
+import json
+import random
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Callable, Collection, Mapping, Sequence
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Protocol
+
+AGENT_TRANSITIONS: dict[str, frozenset[str]] = {
+    "idle": frozenset({"planning", "paused"}),
+    "planning": frozenset({"working", "idle", "paused"}),
+    "working": frozenset({"judging", "planning", "idle", "paused"}),
+    "judging": frozenset({"idle", "planning", "working", "paused"}),
+    "paused": frozenset({"idle"}),
+}
+
+TASK_TRANSITIONS: dict[str, frozenset[str]] = {
+    "pending": frozenset({"queued", "failed"}),
+    "queued": frozenset({"running", "failed"}),
+    "running": frozenset({"review", "queued", "failed"}),
+    "review": frozenset({"approved", "rejected"}),
+    "rejected": frozenset({"queued", "failed"}),
+    "approved": frozenset(),
+    "failed": frozenset(),
+}
+
+STATE_MACHINES: dict[str, dict[str, frozenset[str]]] = {
+    "agents": AGENT_TRANSITIONS,
+    "tasks": TASK_TRANSITIONS,
+}
+INITIAL_STATUS = {"agents": "idle", "tasks": "pending"}
+
+
+class InvalidTransitionError(ValueError):
+    """Raised when the state machine does not allow a transition."""
+
+    def __init__(self, kind: str, id: str, current: str, target: str):
+        super().__init__(f"{kind}/{id}: cannot move from {current!r} to {target!r}")
+        self.current = current
+        self.target = target
+
+
+class VersionConflictError(RuntimeError):
+    """Raised when a compare-and-swap keeps losing, or its expectation is stale."""
+
+    def __init__(self, kind: str, id: str, record: "StateRecord | None"):
+        super().__init__(f"{kind}/{id}: concurrent update (now {record and record.status!r})")
+        self.record = record
+
+
+@dataclass(frozen=True)
+class StateRecord:
+    """One row: status, version and free-form fields (e.g. retry_count, error_message)."""
+
+    kind: str
+    id: str
+    status: str
+    version: int
+    updated_at: float
+    fields: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class CompareAndSwap:
+    """Set ``status`` (and merge ``fields``) if the row is still at ``version``."""
+
+    kind: str
+    id: str
+    version: int
+    status: str
+    fields: Mapping[str, Any] | None = None
+
+
+class StateBackend(Protocol):
+    """Storage for state rows; every compare-and-swap must be atomic per row."""
+
+    def insert(self, record: StateRecord) -> None: ...
+
+    def get_many(self, kind: str, ids: Sequence[str]) -> list[StateRecord | None]: ...
+
+    def compare_and_swap(self, swaps: Sequence[CompareAndSwap], now: float) -> list[bool]: ...
+
+
+class MemoryBackend:
+    """In-process rows with striped locks around each compare-and-swap."""
+
+    def __init__(self, stripes: int = 64):
+        self._rows: dict[tuple[str, str], StateRecord] = {}
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def _lock(self, kind: str, id: str) -> threading.Lock:
+        return self._locks[zlib.crc32(f"{kind}/{id}".encode()) % len(self._locks)]
+
+    def insert(self, record: StateRecord) -> None:
+        with self._lock(record.kind, record.id):
+            key = (record.kind, record.id)
+            if key in self._rows:
+                raise KeyError(f"{record.kind}/{record.id} already exists")
+            self._rows[key] = record
+
+    def get_many(self, kind: str, ids: Sequence[str]) -> list[StateRecord | None]:
+        rows = self._rows
+        return [rows.get((kind, id)) for id in ids]
+
+    def compare_and_swap(self, swaps: Sequence[CompareAndSwap], now: float) -> list[bool]:
+        results = []
+        for swap in swaps:
+            key = (swap.kind, swap.id)
+            with self._lock(swap.kind, swap.id):
+                current = self._rows.get(key)
+                if current is None or current.version != swap.version:
+                    results.append(False)
+                    continue
+                fields = {**current.fields, **swap.fields} if swap.fields else current.fields
+                self._rows[key] = replace(
+                    current,
+                    status=swap.status,
+                    version=current.version + 1,
+                    updated_at=now,
+                    fields=fields,
+                )
+            results.append(True)
+        return results
+
+
+class SQLiteBackend:
+    """
+    Rows in a SQLite table, shared by every process that opens the file.
+
+    A compare-and-swap is a single conditional UPDATE. A batch runs inside
+    one transaction, so it costs one commit.
+    """
+
+    def __init__(self, path: str | Path = ":memory:", *, timeout: float = 5.0):
+        self._db = sqlite3.connect(
+            str(path), timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS states ("
+            " kind TEXT NOT NULL, id TEXT NOT NULL, status TEXT NOT NULL,"
+            " version INTEGER NOT NULL, updated_at REAL NOT NULL, fields TEXT NOT NULL,"
+            " PRIMARY KEY (kind, id))"
+        )
+        self._lock = threading.Lock()
+
+    def insert(self, record: StateRecord) -> None:
+        with self._lock:
+            try:
+                self._db.execute(
+                    "INSERT INTO states VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        record.kind,
+                        record.id,
+                        record.status,
+                        record.version,
+                        record.updated_at,
+                        json.dumps(record.fields),
+                    ),
+                )
+            except sqlite3.IntegrityError:
+                raise KeyError(f"{record.kind}/{record.id} already exists") from None
+
+    def get_many(self, kind: str, ids: Sequence[str]) -> list[StateRecord | None]:
+        found: dict[str, StateRecord] = {}
+        with self._lock:
+            for start in range(0, len(ids), 500):
+                chunk = list(ids[start : start + 500])
+                rows = self._db.execute(
+                    "SELECT id, status, version, updated_at, fields FROM states "
+                    f"WHERE kind = ? AND id IN ({','.join('?' * len(chunk))})",
+                    (kind, *chunk),
+                ).fetchall()
+                for id, status, version, updated_at, fields in rows:
+                    found[id] = StateRecord(
+                        kind, id, status, version, updated_at, json.loads(fields)
+                    )
+        return [found.get(id) for id in ids]
+
+    def compare_and_swap(self, swaps: Sequence[CompareAndSwap], now: float) -> list[bool]:
+        results = []
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                for swap in swaps:
+                    if swap.fields:
+                        cursor = self._db.execute(
+                            "UPDATE states SET status = ?, version = version + 1,"
+                            " updated_at = ?, fields = json_patch(fields, ?)"
+                            " WHERE kind = ? AND id = ? AND version = ?",
+                            (
+                                swap.status,
+                                now,
+                                json.dumps(swap.fields),
+                                swap.kind,
+                                swap.id,
+                                swap.version,
+                            ),
+                        )
+                    else:
+                        cursor = self._db.execute(
+                            "UPDATE states SET status = ?, version = version + 1, updated_at = ?"
+                            " WHERE kind = ? AND id = ? AND version = ?",
+                            (swap.status, now, swap.kind, swap.id, swap.version),
+                        )
+                    results.append(cursor.rowcount == 1)
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return results
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+@dataclass
+class StateStats:
+    """Counters describing StateStore behaviour since creation."""
+
+    transitions: int = 0
+    conflicts: int = 0
+    retries: int = 0
+    invalid: int = 0
+    commits: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return dict(self.__dict__)
+
+
+@dataclass(frozen=True)
+class TransitionRequest:
+    """One entry for ``StateStore.transition_many``."""
+
+    kind: str
+    id: str
+    status: str
+    fields: Mapping[str, Any] | None = None
+    expect: Collection[str] | None = None
+
+
+class StateStore:
+    """
+    Transition API over a StateBackend.
+
+    Args:
+        backend: Row storage; a MemoryBackend by default.
+        machines: Allowed transitions per kind; defaults to STATE_MACHINES.
+        max_retries: Compare-and-swap attempts before VersionConflictError.
+        backoff: Base seconds of jittered backoff between attempts.
+        clock: Wall clock stored in ``updated_at``.
+    """
+
+    def __init__(
+        self,
+        backend: StateBackend | None = None,
+        *,
+        machines: Mapping[str, Mapping[str, Collection[str]]] = STATE_MACHINES,
+        max_retries: int = 16,
+        backoff: float = 0.0005,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.machines = machines
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.stats = StateStats()
+        self._clock = clock
+
+    def create(self, kind: str, id: str, status: str | None = None, **fields: Any) -> StateRecord:
+        """
+        Insert a row at version 1.
+
+        Raises:
+            KeyError: If the row exists or ``kind`` has no state machine.
+            ValueError: If ``status`` is not a state of ``kind``.
+        """
+        machine = self.machines[kind]
+        status = status or INITIAL_STATUS.get(kind) or next(iter(machine))
+        if status not in machine:
+            raise ValueError(f"{status!r} is not a {kind} status")
+        record = StateRecord(kind, id, status, 1, self._clock(), fields)
+        self.backend.insert(record)
+        return record
+
+    def get(self, kind: str, id: str) -> StateRecord:
+        """
+        Raises:
+            KeyError: If the row does not exist.
+        """
+        (record,) = self.backend.get_many(kind, [id])
+        if record is None:
+            raise KeyError(f"{kind}/{id} does not exist")
+        return record
+
+    def transition(
+        self,
+        kind: str,
+        id: str,
+        status: str,
+        *,
+        fields: Mapping[str, Any] | None = None,
+        expect: str | Collection[str] | None = None,
+        version: int | None = None,
+    ) -> StateRecord:
+        """
+        Move a row to ``status``, retrying on concurrent updates.
+
+        Args:
+            kind: "agents" or "tasks" (or any configured machine).
+            id: Row id.
+            status: Target status.
+            fields: Fields to merge into the row.
+            expect: Status(es) the caller believes the row is in. If another
+                writer moved it elsewhere, fail instead of retrying.
+            version: Exact version to swap from; a single attempt.
+
+        Returns:
+            The updated record.
+
+        Raises:
+            KeyError: If the row does not exist.
+            InvalidTransitionError: If the state machine forbids the move.
+            VersionConflictError: If ``expect``/``version`` are stale, or
+                every retry lost a race.
+        """
+        (result,) = self.transition_many(
+            [TransitionRequest(kind, id, status, fields, _expected(expect))],
+            version=version,
+        )
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def transition_many(
+        self, requests: Sequence[TransitionRequest], *, version: int | None = None
+    ) -> list[StateRecord | Exception]:
+        """
+        Apply many transitions with one backend commit per round.
+
+        Each row is compare-and-swapped independently; rows that lose a race
+        are re-read and retried in the next round.
+
+        Returns:
+            Per request, in order: the updated record, or the exception
+            ``transition`` would have raised.
+        """
+        results: list[StateRecord | Exception | None] = [None] * len(requests)
+        pending = list(range(len(requests)))
+        for attempt in range(self.max_retries):
+            if attempt:
+                self.stats.retries += len(pending)
+                time.sleep(self.backoff * random.uniform(0.5, 1.5) * min(attempt, 8))
+            swaps: list[CompareAndSwap] = []
+            swapped: list[tuple[int, StateRecord]] = []
+            for i, record in zip(pending, self._read(requests, pending), strict=True):
+                request = requests[i]
+                if record is None:
+                    results[i] = KeyError(f"{request.kind}/{request.id} does not exist")
+                    continue
+                error = self._check(request, record, version, attempt)
+                if error is not None:
+                    results[i] = error
+                    continue
+                swaps.append(
+                    CompareAndSwap(
+                        request.kind, request.id, record.version, request.status, request.fields
+                    )
+                )
+                swapped.append((i, record))
+            if not swaps:
+                break
+            now = self._clock()
+            outcomes = self.backend.compare_and_swap(swaps, now)
+            self.stats.commits += 1
+            pending = []
+            for (i, record), ok in zip(swapped, outcomes, strict=True):
+                if ok:
+                    self.stats.transitions += 1
+                    request = requests[i]
+                    fields = (
+                        {**record.fields, **request.fields} if request.fields else record.fields
+                    )
+                    results[i] = replace(
+                        record,
+                        status=request.status,
+                        version=record.version + 1,
+                        updated_at=now,
+                        fields=fields,
+                    )
+                else:
+                    self.stats.conflicts += 1
+                    pending.append(i)
+            if not pending:
+                break
+        for i in pending:
+            if results[i] is None:
+                request = requests[i]
+                results[i] = VersionConflictError(request.kind, request.id, None)
+        return results  # type: ignore[return-value]
+
+    def _read(
+        self, requests: Sequence[TransitionRequest], pending: list[int]
+    ) -> list[StateRecord | None]:
+        by_kind: dict[str, list[int]] = {}
+        for i in pending:
+            by_kind.setdefault(requests[i].kind, []).append(i)
+        records: dict[int, StateRecord | None] = {}
+        for kind, indices in by_kind.items():
+            rows = self.backend.get_many(kind, [requests[i].id for i in indices])
+            records.update(zip(indices, rows, strict=True))
+        return [records[i] for i in pending]
+
+    def _check(
+        self,
+        request: TransitionRequest,
+        record: StateRecord,
+        version: int | None,
+        attempt: int,
+    ) -> Exception | None:
+        stale = request.expect is not None and record.status not in request.expect
+        if stale or (version is not None and record.version != version):
+            if not attempt:
+                self.stats.conflicts += 1
+            return VersionConflictError(request.kind, request.id, record)
+        if request.status not in self.machines[request.kind].get(record.status, ()):
+            self.stats.invalid += 1
+            return InvalidTransitionError(request.kind, request.id, record.status, request.status)
+        return None
+
+
+def _expected(expect: str | Collection[str] | None) -> Collection[str] | None:
+    if isinstance(expect, str):
+        return frozenset({expect})
+    return expect
@@ -0,0 +1,536 @@
+"""
+Append-only columnar store partitioned into time chunks.
+
+Reference: specs/technical.md §2.2 (``contents`` TimescaleDB hypertable on
+``created_at``), specs/functional.md US-002 (fleet health)
+
+A local stand-in for the hypertable, for tests and for analytics that
+should not scan Postgres. Rows are split by their time into chunks of
+``chunk_seconds``. Each chunk is a directory of flat column files mapped
+with ``np.memmap``. Its rows are all inside the chunk's time range.
+
+    store/
+      timeseries.json           column types and chunk width
+      dictionaries/<col>.jsonl  one value per line; the line number is its code
+      chunks/<index>/<col>.bin  one file per column
+
+String columns are dictionary-encoded as ``uint32`` codes. There is one
+dictionary per column for the whole store, so codes mean the same in
+every chunk and group-by keys can be combined across chunks without
+decoding. The time column is written last, like ``created_at`` in a
+memory segment (src/chimera/memory/segment.py). The row count is
+recovered from it, and a write that was cut short is ignored on reopen.
+
+``aggregate`` runs a range query with a group-by. Chunks outside the
+range are skipped, and only chunks at the edges of the range are filtered
+row by row. Group keys combine the dictionary codes and the time bucket
+into one integer per row, and are summed with ``np.bincount``. ``scan``
+returns the raw columns of a range. ``drop_chunks`` is the retention
+policy: it deletes whole chunks older than a cutoff.
+
+    store = TimeSeriesStore("/var/lib/chimera/contents", CONTENTS_COLUMNS)
+    store.append({"created_at": times, "agent_id": agents, "persona_alignment": scores, ...})
+    store.aggregate(start, end, by=["platform"], aggregates=[("mean", "persona_alignment")])
+
+All methods take ``lock``. A query reads each chunk's row count and
+column arrays under the lock, so rows appended after the query started
+are not seen.
+"""
+
+import json
+import os
+import re
+import shutil
+import threading
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+FORMAT_VERSION = 1
+STRING = "str"
+DAY = 86_400.0
+
+# Columns of specs/technical.md §2.2 ``contents`` worth aggregating, with
+# the engagement counts the analytics read.
+CONTENTS_COLUMNS: dict[str, str] = {
+    "agent_id": STRING,
+    "platform": STRING,
+    "type": STRING,
+    "confidence": "f4",
+    "persona_alignment": "f4",
+    "safety_score": "f4",
+    "likes": "u4",
+    "comments": "u4",
+    "shares": "u4",
+    "cost_usdc": "f8",
+}
+
+AGGREGATES = frozenset({"count", "sum", "mean", "min", "max"})
+# Group slots kept in dense arrays; beyond this, keys are made unique per chunk.
+DENSE_GROUPS = 1 << 22
+
+_NAME = re.compile(r"[A-Za-z_]\w*")
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
+class _Dictionary:
+    """Value <-> code mapping of one string column, appended to a JSON-lines file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.values: list[str] = []
+        if path.exists():
+            for line in path.read_text().splitlines():
+                self.values.append(json.loads(line))
+        self.codes = {value: code for code, value in enumerate(self.values)}
+
+    def encode(self, values: Sequence[str]) -> np.ndarray:
+        try:
+            return np.fromiter(map(self.codes.__getitem__, values), np.uint32, len(values))
+        except KeyError:
+            pass
+        added = [value for value in dict.fromkeys(values) if value not in self.codes]
+        with open(self.path, "a") as file:
+            file.write("".join(json.dumps(value) + "\n" for value in added))
+        for value in added:
+            self.codes[value] = len(self.values)
+            self.values.append(value)
+        return np.fromiter(map(self.codes.__getitem__, values), np.uint32, len(values))
+
+    def lookup(self, values: Iterable[str]) -> np.ndarray:
+        """Codes of the values already known; unknown values are left out."""
+        return np.array([self.codes[v] for v in values if v in self.codes], dtype=np.uint32)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        values: np.ndarray = np.array(self.values, dtype=object)[codes]
+        return values
+
+
+class _Chunk:
+    """The rows of one time chunk: one memory-mapped file per column."""
+
+    def __init__(self, path: Path, dtypes: Mapping[str, np.dtype], time_column: str, capacity: int):
+        self.path = path
+        self.dtypes = dtypes
+        self.time_column = time_column
+        path.mkdir(parents=True, exist_ok=True)
+        time_file = path / f"{time_column}.bin"
+        rows = time_file.stat().st_size // 8 if time_file.exists() else 0
+        self._map(max(rows, capacity))
+        empty = np.flatnonzero(self.columns[time_column] == 0)
+        self.count = int(empty[0]) if len(empty) else self.capacity
+
+    def _map(self, capacity: int) -> None:
+        self.columns: dict[str, np.memmap] = {}
+        for name, dtype in self.dtypes.items():
+            file = self.path / f"{name}.bin"
+            file.touch()
+            if file.stat().st_size < capacity * dtype.itemsize:
+                os.truncate(file, capacity * dtype.itemsize)
+            self.columns[name] = np.memmap(file, dtype, "r+", shape=(capacity,))
+        self.capacity = capacity
+
+    def append(self, columns: Mapping[str, np.ndarray], n: int) -> None:
+        if self.count + n > self.capacity:
+            self.flush()
+            self._map(max(self.capacity * 2, self.count + n))
+        rows = slice(self.count, self.count + n)
+        for name, values in columns.items():
+            if name != self.time_column:
+                self.columns[name][rows] = values
+        self.columns[self.time_column][rows] = columns[self.time_column]
+        self.count += n
+
+    def view(self) -> dict[str, np.ndarray]:
+        return {name: column[: self.count] for name, column in self.columns.items()}
+
+    def flush(self) -> None:
+        for column in self.columns.values():
+            column.flush()
+
+
+class TimeSeriesStore:
+    """
+    Columnar rows partitioned by time, on disk under one directory.
+
+    Args:
+        path: Store directory; created if missing.
+        columns: Column name to type: a NumPy numeric dtype string
+            (``"f4"``, ``"u4"``, ``"i8"``, ...) or ``"str"``. Reopening with
+            other columns raises ValueError.
+        time_column: Name of the ``float64`` epoch-seconds time column.
+        chunk_seconds: Time range covered by one chunk.
+        initial_capacity: Rows preallocated in a new chunk. The files
+            double when full; unused rows are sparse on disk.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        columns: Mapping[str, str],
+        *,
+        time_column: str = "created_at",
+        chunk_seconds: float = DAY,
+        initial_capacity: int = 4096,
+    ):
+        for name in [time_column, *columns]:
+            if not _NAME.fullmatch(name):
+                raise ValueError(f"invalid column name {name!r}")
+        if time_column in columns:
+            raise ValueError(f"{time_column!r} is the time column")
+        self.path = Path(path)
+        self.columns = dict(columns)
+        self.time_column = time_column
+        self.chunk_seconds = chunk_seconds
+        self.initial_capacity = initial_capacity
+        self.lock = threading.RLock()
+
+        self._dtypes: dict[str, np.dtype] = {time_column: np.dtype("<f8")}
+        for name, kind in self.columns.items():
+            dtype = np.dtype("<u4" if kind == STRING else kind)
+            if dtype.kind not in "iuf":
+                raise ValueError(f"column {name!r}: {kind!r} is not numeric or 'str'")
+            self._dtypes[name] = dtype.newbyteorder("<")
+
+        header = {
+            "format": FORMAT_VERSION,
+            "time_column": time_column,
+            "chunk_seconds": chunk_seconds,
+            "columns": self.columns,
+        }
+        header_file = self.path / "timeseries.json"
+        if header_file.exists():
+            existing = json.loads(header_file.read_text())
+            if existing != header:
+                raise ValueError(f"{self.path} was created with {existing}, not {header}")
+        else:
+            (self.path / "chunks").mkdir(parents=True, exist_ok=True)
+            (self.path / "dictionaries").mkdir(exist_ok=True)
+            _write_atomic(header_file, json.dumps(header))
+
+        self._dictionaries = {
+            name: _Dictionary(self.path / "dictionaries" / f"{name}.jsonl")
+            for name, kind in self.columns.items()
+            if kind == STRING
+        }
+        self._chunks: dict[int, _Chunk] = {}
+        for directory in sorted((self.path / "chunks").iterdir()):
+            index = int(directory.name)
+            self._chunks[index] = _Chunk(directory, self._dtypes, time_column, initial_capacity)
+
+    def __len__(self) -> int:
+        with self.lock:
+            return sum(chunk.count for chunk in self._chunks.values())
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self._chunks)
+
+    def append(self, rows: Mapping[str, Any]) -> int:
+        """
+        Append a batch of rows given column by column.
+
+        Args:
+            rows: Every column, and the time column, as equal-length
+                sequences. Times are positive epoch seconds, in any order.
+
+        Returns:
+            The number of rows appended.
+        """
+        missing = {self.time_column, *self.columns} - rows.keys()
+        if missing:
+            raise ValueError(f"missing columns: {sorted(missing)}")
+        times = np.asarray(rows[self.time_column], dtype=np.float64)
+        n = len(times)
+        if n == 0:
+            return 0
+        if not (times > 0).all():
+            raise ValueError(f"{self.time_column} must be positive epoch seconds")
+        with self.lock:
+            arrays = {self.time_column: times}
+            for name in self.columns:
+                values = rows[name]
+                if len(values) != n:
+                    raise ValueError(f"column {name!r} has {len(values)} values, not {n}")
+                dictionary = self._dictionaries.get(name)
+                if dictionary is not None:
+                    arrays[name] = dictionary.encode(values)
+                else:
+                    arrays[name] = np.asarray(values, dtype=self._dtypes[name])
+
+            indexes = (times // self.chunk_seconds).astype(np.int64)
+            first = indexes[0]
+            if (indexes == first).all():
+                self._chunk(int(first)).append(arrays, n)
+                return n
+            order = np.argsort(indexes, kind="stable")
+            indexes = indexes[order]
+            bounds = np.flatnonzero(np.diff(indexes)) + 1
+            for part in np.split(np.arange(n), bounds):
+                rows_in_chunk = order[part]
+                chunk = self._chunk(int(indexes[part[0]]))
+                chunk.append({k: v[rows_in_chunk] for k, v in arrays.items()}, len(part))
+            return n
+
+    def _chunk(self, index: int) -> _Chunk:
+        chunk = self._chunks.get(index)
+        if chunk is None:
+            chunk = self._chunks[index] = _Chunk(
+                self.path / "chunks" / f"{index:012d}",
+                self._dtypes,
+                self.time_column,
+                self.initial_capacity,
+            )
+        return chunk
+
+    def _filters(self, where: Mapping[str, str | Sequence[str]] | None) -> dict[str, np.ndarray]:
+        filters = {}
+        for name, wanted in (where or {}).items():
+            if name not in self._dictionaries:
+                raise ValueError(f"where: {name!r} is not a string column")
+            filters[name] = self._dictionaries[name].lookup(
+                [wanted] if isinstance(wanted, str) else wanted
+            )
+        return filters
+
+    def _snapshot(self, start: float, end: float) -> list[tuple[int, dict[str, np.ndarray]]]:
+        """Columns of each non-empty chunk overlapping [start, end); call with ``lock`` held."""
+        return [
+            (index, chunk.view())
+            for index, chunk in sorted(self._chunks.items())
+            if chunk.count
+            and (index + 1) * self.chunk_seconds > start
+            and index * self.chunk_seconds < end
+        ]
+
+    def _select(
+        self,
+        index: int,
+        columns: dict[str, np.ndarray],
+        names: Iterable[str],
+        start: float,
+        end: float,
+        filters: Mapping[str, np.ndarray],
+    ) -> dict[str, np.ndarray]:
+        """``names`` columns of one chunk, keeping only the rows in range and matching."""
+        mask = None
+        if index * self.chunk_seconds < start or (index + 1) * self.chunk_seconds > end:
+            times = columns[self.time_column]
+            mask = (times >= start) & (times < end)
+        for name, codes in filters.items():
+            matches = np.isin(columns[name], codes)
+            mask = matches if mask is None else mask & matches
+        if mask is None:
+            return {name: columns[name] for name in names}
+        return {name: columns[name][mask] for name in names}
+
+    def scan(
+        self,
+        start: float,
+        end: float,
+        columns: Sequence[str] | None = None,
+        *,
+        where: Mapping[str, str | Sequence[str]] | None = None,
+    ) -> dict[str, np.ndarray]:
+        """
+        Rows with ``start <= time < end``, column by column, in chunk order.
+
+        Args:
+            columns: Columns to return; defaults to all, with the time column.
+            where: Keep rows whose string column equals a value, or is one
+                of a list of values.
+
+        Returns:
+            Column name to array. String columns are decoded to object arrays.
+        """
+        names = list(columns or [self.time_column, *self.columns])
+        unknown = set(names) - self._dtypes.keys()
+        if unknown:
+            raise ValueError(f"unknown columns: {sorted(unknown)}")
+        filters = self._filters(where)
+        with self.lock:
+            chunks = self._snapshot(start, end)
+            decode = {name: self._dictionaries[name].decode for name in self._dictionaries}
+        parts: dict[str, list[np.ndarray]] = {name: [] for name in names}
+        for index, view in chunks:
+            for name, values in self._select(index, view, names, start, end, filters).items():
+                parts[name].append(np.array(values))
+        out = {}
+        for name in names:
+            values = np.concatenate(parts[name]) if parts[name] else np.empty(0, self._dtypes[name])
+            out[name] = decode[name](values) if name in decode else values
+        return out
+
+    def aggregate(
+        self,
+        start: float,
+        end: float,
+        *,
+        by: Sequence[str] = (),
+        aggregates: Sequence[tuple[str, str]] = (),
+        bucket: float | None = None,
+        where: Mapping[str, str | Sequence[str]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Group rows with ``start <= time < end`` and aggregate them.
+
+        Args:
+            by: String columns to group by.
+            aggregates: ``(function, column)`` pairs; functions are
+                ``count``, ``sum``, ``mean``, ``min`` and ``max``.
+            bucket: Also group by time, in buckets of this many seconds
+                aligned to the epoch (TimescaleDB ``time_bucket``).
+            where: As in ``scan``.
+
+        Returns:
+            One dict per non-empty group, sorted by its group values: the
+            ``by`` values, ``bucket`` (bucket start) if bucketed, ``count``,
+            and ``<function>_<column>`` for each other aggregate.
+        """
+        for name in by:
+            if name not in self._dictionaries:
+                raise ValueError(f"by: {name!r} is not a string column")
+        for function, name in aggregates:
+            if function not in AGGREGATES:
+                raise ValueError(f"unknown aggregate {function!r}")
+            if function != "count" and (name not in self.columns or name in self._dictionaries):
+                raise ValueError(f"{function}({name}): not a numeric column")
+        values = sorted({name for function, name in aggregates if function != "count"})
+        filters = self._filters(where)
+
+        with self.lock:
+            chunks = self._snapshot(start, end)
+            shape = [max(1, len(self._dictionaries[name].values)) for name in by]
+            decode = [self._dictionaries[name].decode for name in by]
+        first_bucket = 0
+        if bucket is not None:
+            first_bucket = int(start // bucket)
+            shape.append(max(1, int(np.ceil(end / bucket)) - first_bucket))
+        size = int(np.prod(shape, dtype=np.float64)) if shape else 1
+        if size >= 1 << 62:
+            raise ValueError("too many groups; group by fewer columns or wider buckets")
+        dense = size <= DENSE_GROUPS
+
+        totals = _Totals(size if dense else 0, aggregates)
+        partials: list[tuple[np.ndarray, _Totals]] = []
+        names = {self.time_column, *by, *values}
+        for index, view in chunks:
+            rows = self._select(index, view, names, start, end, filters)
+            n = len(rows[self.time_column])
+            if n == 0:
+                continue
+            # Row-major index into ``shape``; a chunk inside one bucket adds a constant.
+            parts: list[np.ndarray | int] = [rows[name] for name in by]
+            if bucket is not None:
+                chunk_bucket = int(index * self.chunk_seconds // bucket)
+                if (index + 1) * self.chunk_seconds <= (chunk_bucket + 1) * bucket:
+                    parts.append(chunk_bucket - first_bucket)
+                else:
+                    times = rows[self.time_column]
+                    parts.append((times // bucket).astype(np.int64) - first_bucket)
+            keys = np.zeros(n, dtype=np.int64)
+            for part, width in zip(parts, shape, strict=True):
+                keys *= width
+                keys += part
+            if dense:
+                totals.add_rows(keys, rows)
+            else:
+                unique, inverse = np.unique(keys, return_inverse=True)
+                partial = _Totals(len(unique), aggregates)
+                partial.add_rows(inverse, rows)
+                partials.append((unique, partial))
+
+        if dense:
+            keys = np.flatnonzero(totals.count)
+            slots = keys
+        else:
+            if not partials:
+                return []
+            keys, inverse = np.unique(
+                np.concatenate([unique for unique, _ in partials]), return_inverse=True
+            )
+            totals = _Totals(len(keys), aggregates)
+            offset = 0
+            for unique, partial in partials:
+                totals.merge(inverse[offset : offset + len(unique)], partial)
+                offset += len(unique)
+            slots = np.arange(len(keys))
+
+        coordinates = np.unravel_index(keys, shape) if shape else ()
+        labels = [decode[j](coordinates[j]) for j in range(len(by))]
+        results = []
+        for i, slot in enumerate(slots.tolist()):
+            row: dict[str, Any] = {name: labels[j][i] for j, name in enumerate(by)}
+            if bucket is not None:
+                row["bucket"] = (first_bucket + int(coordinates[-1][i])) * bucket
+            row["count"] = int(totals.count[slot])
+            for function, name in aggregates:
+                if function != "count":
+                    row[f"{function}_{name}"] = totals.value(function, name, slot)
+            results.append(row)
+        if by:
+            results.sort(key=lambda row: tuple(row[name] for name in by))
+        return results
+
+    def drop_chunks(self, older_than: float) -> int:
+        """Delete every chunk that ends at or before ``older_than``; return how many."""
+        with self.lock:
+            expired = [
+                index for index in self._chunks if (index + 1) * self.chunk_seconds <= older_than
+            ]
+            for index in expired:
+                chunk = self._chunks.pop(index)
+                del chunk.columns
+                shutil.rmtree(chunk.path)
+            return len(expired)
+
+    def flush(self) -> None:
+        with self.lock:
+            for chunk in self._chunks.values():
+                chunk.flush()
+
+
+class _Totals:
+    """Per group slot: row count and the sum, min and max of each value column."""
+
+    def __init__(self, size: int, aggregates: Sequence[tuple[str, str]]):
+        self.size = size
+        self.count = np.zeros(size, dtype=np.int64)
+        self.sums = {c: np.zeros(size) for f, c in aggregates if f in ("sum", "mean")}
+        self.mins = {c: np.full(size, np.inf) for f, c in aggregates if f == "min"}
+        self.maxs = {c: np.full(size, -np.inf) for f, c in aggregates if f == "max"}
+
+    def add_rows(self, slots: np.ndarray, rows: Mapping[str, np.ndarray]) -> None:
+        self.count += np.bincount(slots, minlength=self.size)
+        for name, sums in self.sums.items():
+            sums += np.bincount(slots, weights=rows[name], minlength=self.size)
+        # ufunc.at only takes its fast path when no casting is needed.
+        for name, mins in self.mins.items():
+            np.minimum.at(mins, slots, rows[name].astype(np.float64))
+        for name, maxs in self.maxs.items():
+            np.maximum.at(maxs, slots, rows[name].astype(np.float64))
+
+    def merge(self, slots: np.ndarray, other: "_Totals") -> None:
+        np.add.at(self.count, slots, other.count)
+        for name, sums in self.sums.items():
+            np.add.at(sums, slots, other.sums[name])
+        for name, mins in self.mins.items():
+            np.minimum.at(mins, slots, other.mins[name])
+        for name, maxs in self.maxs.items():
+            np.maximum.at(maxs, slots, other.maxs[name])
+
+    def value(self, function: str, name: str, slot: int) -> float:
+        if function == "sum":
+            return float(self.sums[name][slot])
+        if function == "mean":
+            return float(self.sums[name][slot] / self.count[slot])
+        if function == "min":
+            return float(self.mins[name][slot])
+        return float(self.maxs[name][slot])
@@ -0,0 +1,333 @@
+"""
+Compiled skill contract validation.
+
+Reference: skills/README.md (Contract Validation), specs/technical.md §6.2
+Traceability: skills/*/input_schema.json, skills/*/output_schema.json
+
+Every skill schema is read from disk exactly once, on first use, and
+compiled into a specialised Python function the first time that skill is
+validated: required keys, ``const``/``enum`` membership against a frozenset
+and numeric bounds are emitted inline, so validating a message never walks or
+interprets the schema dictionary again. ``install`` takes schemas and
+validators that were already loaded and compiled, which is how
+``chimera.skills`` warm-starts a worker from a snapshot.
+
+Only the draft-07 keywords used by the skill contracts are supported:
+``type``, ``const``, ``enum``, ``required``, ``properties``, ``items``,
+``minimum``/``maximum`` and ``additionalProperties: false``. ``format`` is
+treated as an annotation, as draft-07 does by default.
+"""
+
+import threading
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from types import CodeType
+from typing import Any, Literal
+
+SKILLS_DIR = Path(__file__).resolve().parents[2] / "skills"
+
+SchemaKind = Literal["input", "output"]
+SchemaKey = tuple[str, str]
+Validator = Callable[[Any], str | None]
+
+_TYPE_TESTS: dict[str, str] = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "boolean": "isinstance({v}, bool)",
+    "integer": "(isinstance({v}, int) and not isinstance({v}, bool))",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "null": "{v} is None",
+}
+_SCALAR_TYPES = frozenset({"string", "integer", "number", "boolean"})
+_NUMERIC_TYPES = frozenset({"integer", "number"})
+
+
+class SchemaValidationError(ValueError):
+    """Raised when a payload does not satisfy a skill contract."""
+
+    def __init__(self, skill_name: str, kind: str, message: str):
+        super().__init__(f"{skill_name} {kind}: {message}")
+        self.skill_name = skill_name
+        self.kind = kind
+        self.detail = message
+
+
+def _literal(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def _is_member(value: Any, allowed: frozenset[Any]) -> bool:
+    try:
+        return value in allowed
+    except TypeError:
+        return False
+
+
+class _Emitter:
+    """Generates the source of one specialised validator function."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self.namespace: dict[str, Any] = {"_is_member": _is_member}
+        self._counter = 0
+
+    def name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def constant(self, value: Any) -> str:
+        name = self.name("_c")
+        self.namespace[name] = value
+        return name
+
+    def fail(self, indent: str, path: str, message: str) -> None:
+        self.lines.append(f"{indent}return f{(path + ': ' + message)!r}")
+
+    def node(self, schema: dict[str, Any], var: str, path: str, indent: str) -> None:
+        expected = schema.get("type")
+        names = [] if expected is None else [expected] if isinstance(expected, str) else expected
+        if names:
+            test = " or ".join(_TYPE_TESTS[name].format(v=var) for name in names)
+            self.lines.append(f"{indent}if not ({test}):")
+            self.fail(
+                indent + "    ",
+                path,
+                f"expected {_literal(' or '.join(names))}, got {{type({var}).__name__}}",
+            )
+
+        if "const" in schema:
+            const = self.constant(schema["const"])
+            self.lines.append(f"{indent}if {var} != {const}:")
+            self.fail(indent + "    ", path, f"must equal {_literal(repr(schema['const']))}")
+
+        if "enum" in schema:
+            allowed = self.constant(frozenset(schema["enum"]))
+            listed = _literal(str(sorted(map(str, schema["enum"]))))
+            if names and set(names) <= _SCALAR_TYPES:
+                self.lines.append(f"{indent}if {var} not in {allowed}:")
+            else:
+                self.lines.append(f"{indent}if not _is_member({var}, {allowed}):")
+            self.fail(indent + "    ", path, f"{{{var}!r}} is not one of {listed}")
+
+        minimum, maximum = schema.get("minimum"), schema.get("maximum")
+        if minimum is not None or maximum is not None:
+            bounds = []
+            if minimum is not None:
+                bounds.append(f"{var} < {minimum!r}")
+            if maximum is not None:
+                bounds.append(f"{var} > {maximum!r}")
+            test = " or ".join(bounds)
+            if not (names and set(names) <= _NUMERIC_TYPES):
+                numeric = _TYPE_TESTS["number"].format(v=var)
+                test = f"{numeric} and ({test})"
+            self.lines.append(f"{indent}if {test}:")
+            if maximum is None:
+                expected_range = f">= {minimum!r}"
+            elif minimum is None:
+                expected_range = f"<= {maximum!r}"
+            else:
+                expected_range = f"within [{minimum!r}, {maximum!r}]"
+            self.fail(indent + "    ", path, f"{{{var}!r}} is not {expected_range}")
+
+        properties = schema.get("properties", {})
+        required = schema.get("required", [])
+        closed = schema.get("additionalProperties") is False
+        if properties or required or closed:
+            body = indent
+            if names != ["object"]:
+                self.lines.append(f"{indent}if isinstance({var}, dict):")
+                body = indent + "    "
+            for prop in required:
+                self.lines.append(f"{body}if {prop!r} not in {var}:")
+                self.fail(body + "    ", path, f"missing required property {_literal(repr(prop))}")
+            for prop, sub in properties.items():
+                child = self.name("v")
+                self.lines.append(f"{body}if {prop!r} in {var}:")
+                self.lines.append(f"{body}    {child} = {var}[{prop!r}]")
+                before = len(self.lines)
+                self.node(sub, child, f"{path}.{_literal(prop)}", body + "    ")
+                if len(self.lines) == before:
+                    del self.lines[-2:]
+            if closed:
+                known = self.constant(frozenset(properties))
+                self.lines.append(f"{body}if not {known}.issuperset({var}):")
+                self.fail(
+                    body + "    ",
+                    path,
+                    f"unexpected properties {{sorted(set({var}) - {known})}}",
+                )
+
+        if isinstance(schema.get("items"), dict):
+            index, item = self.name("i"), self.name("v")
+            body = indent
+            if names != ["array"]:
+                self.lines.append(f"{indent}if isinstance({var}, list):")
+                body = indent + "    "
+            self.lines.append(f"{body}for {index}, {item} in enumerate({var}):")
+            before = len(self.lines)
+            self.node(schema["items"], item, f"{path}[{{{index}}}]", body + "    ")
+            if len(self.lines) == before:
+                del self.lines[-1]
+
+
+def compile_schema_code(schema: dict[str, Any]) -> tuple[str, CodeType, dict[str, Any]]:
+    """
+    Translate a draft-07 schema into validator source and compile it.
+
+    The result is plain data (``marshal`` can store it), so compiled
+    validators can be cached across processes; ``bind_schema_code`` turns
+    it back into a function.
+
+    Returns:
+        ``(source, code, constants)``: the generated source, its module code
+        object, and the enum sets and ``const`` values the code refers to.
+    """
+    emitter = _Emitter()
+    emitter.node(schema, "data", "$", "    ")
+    source = "\n".join(["def validate(data):", *emitter.lines, "    return None"])
+    filename = f"<schema {schema.get('title', 'anonymous')}>"
+    constants = {k: v for k, v in emitter.namespace.items() if k != "_is_member"}
+    return source, compile(source, filename, "exec"), constants
+
+
+def bind_schema_code(source: str, code: CodeType, constants: dict[str, Any]) -> Validator:
+    """Create the validator function from ``compile_schema_code`` output."""
+    namespace = {"_is_member": _is_member, **constants}
+    exec(code, namespace)
+    validate: Validator = namespace["validate"]
+    validate.source = source  # type: ignore[attr-defined]
+    return validate
+
+
+def compile_schema(schema: dict[str, Any]) -> Validator:
+    """
+    Compile a draft-07 schema into a specialised validator function.
+
+    The schema is translated once into straight-line Python source with the
+    property names, bounds and enum sets inlined, then ``exec``-ed.
+
+    Args:
+        schema: Parsed JSON schema.
+
+    Returns:
+        Callable ``(instance) -> error message | None``.
+    """
+    return bind_schema_code(*compile_schema_code(schema))
+
+
+def load_schemas(skills_dir: Path) -> dict[SchemaKey, dict[str, Any]]:
+    """Parse every ``<skill>/input_schema.json`` and ``output_schema.json``."""
+    # Imported here: workers warm-started from a snapshot never parse JSON.
+    import json
+
+    schemas: dict[SchemaKey, dict[str, Any]] = {}
+    for schema_path in sorted(skills_dir.glob("*/*_schema.json")):
+        kind = schema_path.stem.removesuffix("_schema")
+        if kind in ("input", "output"):
+            with open(schema_path) as f:
+                schemas[(schema_path.parent.name, kind)] = json.load(f)
+    return schemas
+
+
+# Filled from SKILLS_DIR on first use, or by install().
+SCHEMAS: dict[SchemaKey, dict[str, Any]] = {}
+_VALIDATORS: dict[SchemaKey, Validator] = {}
+_loaded = False
+_lock = threading.Lock()
+
+
+def install(
+    schemas: Mapping[SchemaKey, dict[str, Any]],
+    validators: Mapping[SchemaKey, Validator] | None = None,
+) -> None:
+    """
+    Serve these schemas (and already compiled validators) instead of SKILLS_DIR.
+
+    Schemas without a validator here are compiled on first use.
+    """
+    global _loaded
+    with _lock:
+        SCHEMAS.clear()
+        SCHEMAS.update(schemas)
+        _VALIDATORS.clear()
+        _VALIDATORS.update(validators or {})
+        _loaded = True
+
+
+def _schemas() -> dict[SchemaKey, dict[str, Any]]:
+    global _loaded
+    if not _loaded:
+        with _lock:
+            if not _loaded:
+                SCHEMAS.update(load_schemas(SKILLS_DIR))
+                _loaded = True
+    return SCHEMAS
+
+
+def get_schema(skill_name: str, kind: SchemaKind) -> dict[str, Any]:
+    """Return the parsed schema, loaded once."""
+    try:
+        return _schemas()[(skill_name, kind)]
+    except KeyError:
+        raise KeyError(f"No {kind} schema registered for skill {skill_name!r}") from None
+
+
+def _validator(skill_name: str, kind: SchemaKind) -> Validator:
+    key = (skill_name, kind)
+    validate = _VALIDATORS.get(key)
+    if validate is None:
+        validate = _VALIDATORS.setdefault(key, compile_schema(get_schema(skill_name, kind)))
+    return validate
+
+
+def check(skill_name: str, kind: SchemaKind, payload: Any) -> str | None:
+    """
+    Validate a payload without raising.
+
+    Returns:
+        The first contract violation found, or None if the payload is valid.
+    """
+    return _validator(skill_name, kind)(payload)
+
+
+def validate_input(skill_name: str, payload: Any) -> None:
+    """
+    Validate a skill input against ``skills/<skill_name>/input_schema.json``.
+
+    Raises:
+        SchemaValidationError: If the payload violates the contract.
+        KeyError: If the skill has no input schema.
+    """
+    error = _validator(skill_name, "input")(payload)
+    if error is not None:
+        raise SchemaValidationError(skill_name, "input", error)
+
+
+def validate_output(skill_name: str, payload: Any) -> None:
+    """
+    Validate a skill output against ``skills/<skill_name>/output_schema.json``.
+
+    Raises:
+        SchemaValidationError: If the payload violates the contract.
+        KeyError: If the skill has no output schema.
+    """
+    error = _validator(skill_name, "output")(payload)
+    if error is not None:
+        raise SchemaValidationError(skill_name, "output", error)
+
+
+def validate_batch(
+    skill_name: str, payloads: Iterable[Any], kind: SchemaKind = "input"
+) -> list[str | None]:
+    """
+    Validate many payloads for one skill in a single pass.
+
+    The validator is resolved once for the whole batch; invalid payloads do
+    not stop the pass.
+
+    Returns:
+        One entry per payload: None when valid, otherwise the first violation.
+    """
+    validate = _validator(skill_name, kind)
+    return [validate(payload) for payload in payloads]
@@ -0,0 +1,33 @@
+"""
+Shared helpers for the test suite.
+
+Reference: tests/
+"""
+
+from typing import Any
+
+
+class FakeClock:
+    """Settable clock; pass it wherever a module takes ``clock=``."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def content_input(topic: str = "Sustainable Fashion Trends", **parameters: Any) -> dict[str, Any]:
+    """A valid content_generator input; keyword arguments override parameters."""
+    base = {
+        "content_type": "text",
+        "platform": "instagram",
+        "topic": topic,
+        "persona_constraints": ["Witty", "Sustainability-focused"],
+        "tier": "regular",
+    }
+    base.update(parameters)
+    return {"skill_name": "content_generator", "parameters": base}
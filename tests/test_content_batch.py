@@ -0,0 +1,133 @@
+"""
+Test suite for batched content generation.
+
+Reference: skills/content_generator/__init__.py, skills/content_generator/backends.py
+Traceability: specs/functional.md US-005, skills/content_generator/output_schema.json
+"""
+
+import unittest
+
+from chimera.validation import SchemaValidationError, validate_output
+from skills.content_generator import (
+    FakeBackend,
+    configure_backend,
+    generate_content,
+    generate_content_batch,
+)
+from skills.content_generator.backends import build_prompt_context, group_key
+from tests.helpers import content_input
+
+
+class TestGenerateContent(unittest.TestCase):
+    """Test the single-request entry point."""
+
+    def tearDown(self):
+        configure_backend(None)
+
+    def test_output_matches_schema(self):
+        """Test that a generated post validates against output_schema.json."""
+        result = generate_content(content_input(content_type="image"), backend=FakeBackend())
+        validate_output("content_generator", result)
+        self.assertEqual(result["content"]["media_type"], "image")
+        self.assertEqual(result["metadata"]["batch_size"], 1)
+
+    def test_uses_configured_backend(self):
+        """Test the process-wide backend."""
+        backend = FakeBackend()
+        configure_backend(backend)
+        generate_content(content_input())
+        self.assertEqual(backend.calls, 1)
+
+    def test_requires_backend(self):
+        """Test that a missing backend is reported clearly."""
+        with self.assertRaises(RuntimeError):
+            generate_content(content_input())
+
+    def test_invalid_input_raises(self):
+        """Test input validation on the single-request path."""
+        with self.assertRaises(SchemaValidationError):
+            generate_content(content_input(platform="myspace"), backend=FakeBackend())
+
+    def test_backend_error_raises(self):
+        """Test that a per-item backend failure is raised for single requests."""
+        with self.assertRaises(ValueError):
+            generate_content(content_input("bad"), backend=FakeBackend(fail_topics=["bad"]))
+
+
+class TestGenerateContentBatch(unittest.TestCase):
+    """Test grouping, chunking, ordering and error isolation."""
+
+    def test_grouping_amortises_setup(self):
+        """Test that requests sharing persona/platform/tier share backend calls."""
+        backend = FakeBackend(max_batch_size=8)
+        inputs = [content_input(f"topic {i}") for i in range(20)]
+        inputs += [content_input(f"hero {i}", tier="hero") for i in range(4)]
+        items = list(generate_content_batch(inputs, backend=backend))
+        self.assertEqual(len(items), 24)
+        self.assertTrue(all(item.ok for item in items))
+        # 20 regular in chunks of 8 -> 3 calls, 4 hero -> 1 call.
+        self.assertEqual(backend.calls, 4)
+
+    def test_results_in_input_order(self):
+        """Test that results stream back in input order across groups."""
+        inputs = [
+            content_input(f"topic {i}", platform=["twitter", "instagram"][i % 2]) for i in range(10)
+        ]
+        items = list(generate_content_batch(inputs, backend=FakeBackend(max_batch_size=3)))
+        self.assertEqual([item.index for item in items], list(range(10)))
+        for i, item in enumerate(items):
+            self.assertTrue(item.output["content"]["text"].startswith(f"topic {i}:"))
+
+    def test_errors_isolated(self):
+        """Test that invalid inputs and backend failures only fail their own item."""
+        inputs = [
+            content_input("ok 1"),
+            content_input("bad"),
+            {"skill_name": "content_generator", "parameters": {}},
+            content_input("ok 2"),
+        ]
+        items = list(generate_content_batch(inputs, backend=FakeBackend(fail_topics=["bad"])))
+        self.assertEqual([item.ok for item in items], [True, False, False, True])
+        self.assertIsInstance(items[1].error, ValueError)
+
+    def test_malformed_backend_results_isolated(self):
+        """Test that a short result list fails only its chunk, and a bad result only itself."""
+
+        class SloppyBackend(FakeBackend):
+            def generate(self, context, requests):
+                results = super().generate(context, requests)
+                if context.content_type == "image":
+                    return results[1:]
+                results[0] = {"text": "no scores"}
+                return results
+
+        inputs = [
+            content_input("a"),
+            content_input("b", content_type="image"),
+            content_input("c"),
+            content_input("d", content_type="image"),
+        ]
+        items = list(generate_content_batch(inputs, backend=SloppyBackend()))
+        self.assertEqual([item.ok for item in items], [False, False, True, False])
+        self.assertIn("2 requests", str(items[1].error))
+        self.assertIn("invalid backend output", str(items[0].error))
+
+    def test_batch_size_override(self):
+        """Test explicit chunk size."""
+        backend = FakeBackend(max_batch_size=100)
+        list(
+            generate_content_batch(
+                [content_input() for _ in range(10)], backend=backend, batch_size=2
+            )
+        )
+        self.assertEqual(backend.calls, 5)
+
+    def test_prompt_context_built_once_per_group(self):
+        """Test that prompt contexts are cached per group key."""
+        key = group_key(content_input()["parameters"])
+        self.assertIs(build_prompt_context(key), build_prompt_context(key))
+        self.assertEqual(build_prompt_context(key).max_length, 2200)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,193 @@
+"""
+Test suite for the content_generator generation cache.
+
+Reference: skills/content_generator/cache.py
+Traceability: specs/functional.md US-005, specs/technical.md §1.2 (budget_limit_usdc)
+"""
+
+import os
+import tempfile
+import unittest
+
+from chimera.validation import validate_output
+from skills.content_generator import FakeBackend, generate_content, generate_content_batch
+from skills.content_generator.cache import GenerationCache, cache_key, jaccard, shingles
+from tests.helpers import content_input
+
+
+class RecordingBackend(FakeBackend):
+    """FakeBackend that keeps the requests it was sent."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.requests = []
+
+    def generate(self, context, requests):
+        self.requests.extend(requests)
+        return super().generate(context, requests)
+
+
+class TestCacheKey(unittest.TestCase):
+    """Test canonical hashing of parameters."""
+
+    def test_normalised_topic_and_persona(self):
+        """Test that case, punctuation, hashtags and trait order do not matter."""
+        a = content_input("Sustainable Fashion Trends")["parameters"]
+        b = content_input(
+            "#sustainable  fashion trends!", persona_constraints=["sustainability focused", "witty"]
+        )["parameters"]
+        self.assertEqual(cache_key(a), cache_key(b))
+
+    def test_budget_ignored_content_parameters_not(self):
+        """Test which parameters are part of the key."""
+        base = content_input()["parameters"]
+        self.assertEqual(cache_key(base), cache_key({**base, "budget_limit_usdc": 9.0}))
+        self.assertNotEqual(cache_key(base), cache_key({**base, "tier": "hero"}))
+        self.assertNotEqual(cache_key(base), cache_key({**base, "platform": "twitter"}))
+
+    def test_shingle_similarity(self):
+        """Test the similarity measure on the motivating example."""
+        similarity = jaccard(
+            shingles("sustainable fashion trends"), shingles("sustainable fashion trends 2026")
+        )
+        self.assertGreater(similarity, 0.8)
+
+
+class TestGenerationCache(unittest.TestCase):
+    """Test lookups, eviction and persistence."""
+
+    def setUp(self):
+        self.output = generate_content(content_input(), backend=FakeBackend())
+
+    def test_exact_near_seed_and_miss(self):
+        """Test each lookup status."""
+        cache = GenerationCache()
+        cache.store(content_input()["parameters"], self.output)
+        self.assertEqual(
+            cache.lookup(content_input("sustainable fashion trends")["parameters"]).status, "hit"
+        )
+        near = cache.lookup(content_input("sustainable fashion trends 2026")["parameters"])
+        self.assertEqual(near.status, "near")
+        self.assertGreaterEqual(near.similarity, 0.8)
+        self.assertEqual(
+            cache.lookup(content_input("Sustainable Fashion Tips")["parameters"]).status, "seed"
+        )
+        self.assertEqual(
+            cache.lookup(content_input("Street Style Week")["parameters"]).status, "miss"
+        )
+
+    def test_near_duplicates_scoped_to_partition(self):
+        """Test that a different persona never reuses a prior post."""
+        cache = GenerationCache()
+        cache.store(content_input()["parameters"], self.output)
+        lookup = cache.lookup(
+            content_input("sustainable fashion trends 2026", persona_constraints=["Serious"])[
+                "parameters"
+            ]
+        )
+        self.assertEqual(lookup.status, "miss")
+
+    def test_lru_eviction(self):
+        """Test the in-memory size bound."""
+        cache = GenerationCache(maxsize=2)
+        for topic in ("alpha", "bravo", "charlie"):
+            cache.store(content_input(topic)["parameters"], self.output)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats.evictions, 1)
+        self.assertEqual(cache.lookup(content_input("alpha")["parameters"]).status, "miss")
+
+    def test_persistent_store(self):
+        """Test that entries survive a reopen and the disk bound is enforced."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "generations.sqlite3")
+            cache = GenerationCache(path=path, maxsize=1, max_disk_entries=2)
+            for topic in ("alpha", "bravo", "charlie"):
+                cache.store(content_input(topic)["parameters"], self.output)
+            cache.close()
+
+            reopened = GenerationCache(path=path)
+            self.assertEqual(len(reopened), 2)
+            self.assertEqual(reopened.lookup(content_input("Charlie")["parameters"]).status, "hit")
+            self.assertEqual(reopened.lookup(content_input("charlie!")["parameters"]).status, "hit")
+            self.assertEqual(reopened.lookup(content_input("alpha")["parameters"]).status, "miss")
+            reopened.close()
+
+
+class TestCachedGeneration(unittest.TestCase):
+    """Test the cache wired into generate_content_batch."""
+
+    def test_hits_are_free_and_marked(self):
+        """Test cost_usdc 0 and cache metadata on reused output."""
+        cache = GenerationCache()
+        backend = FakeBackend()
+        (first,) = generate_content_batch([content_input()], backend=backend, cache=cache)
+        (again, near) = generate_content_batch(
+            [
+                content_input("sustainable fashion trends"),
+                content_input("Sustainable Fashion Trends 2026"),
+            ],
+            backend=backend,
+            cache=cache,
+        )
+        self.assertEqual(backend.calls, 1)
+        self.assertEqual(first.output["metadata"]["cache"], {"status": "miss"})
+        for item, status in ((again, "hit"), (near, "near")):
+            metadata = item.output["metadata"]
+            validate_output("content_generator", item.output)
+            self.assertEqual(metadata["cost_usdc"], 0.0)
+            self.assertEqual(metadata["cache"]["status"], status)
+            self.assertEqual(
+                metadata["cache"]["source_generation_id"], first.output["metadata"]["generation_id"]
+            )
+            self.assertNotEqual(
+                metadata["generation_id"], first.output["metadata"]["generation_id"]
+            )
+        self.assertEqual(cache.stats.saved_usdc, 1.0)
+
+    def test_duplicates_in_one_batch_generated_once(self):
+        """Test that repeated requests in a batch share one generation."""
+        cache = GenerationCache()
+        backend = FakeBackend()
+        items = list(generate_content_batch([content_input()] * 5, backend=backend, cache=cache))
+        self.assertEqual(backend.items, 1)
+        self.assertEqual(
+            [item.output["metadata"]["cost_usdc"] for item in items], [0.5] + [0.0] * 4
+        )
+        self.assertEqual(cache.stats.hits, 4)
+        self.assertEqual(cache.stats.misses, 1)
+
+    def test_duplicates_share_failures(self):
+        """Test that duplicates of a failed request fail too and nothing is cached."""
+        cache = GenerationCache()
+        backend = FakeBackend(fail_topics=["bad"])
+        items = list(
+            generate_content_batch([content_input("bad")] * 2, backend=backend, cache=cache)
+        )
+        self.assertFalse(any(item.ok for item in items))
+        self.assertEqual(len(cache), 0)
+
+    def test_related_result_seeds_backend(self):
+        """Test that a related prior post is sent to the backend as a seed."""
+        cache = GenerationCache()
+        backend = RecordingBackend()
+        list(generate_content_batch([content_input()], backend=backend, cache=cache))
+        (item,) = generate_content_batch(
+            [content_input("Sustainable Fashion Tips")], backend=backend, cache=cache
+        )
+        self.assertEqual(item.output["metadata"]["cache"], {"status": "seed"})
+        self.assertNotIn("seed", backend.requests[0])
+        self.assertTrue(
+            backend.requests[1]["seed"]["text"].startswith("Sustainable Fashion Trends")
+        )
+
+    def test_cached_output_isolated_from_callers(self):
+        """Test that mutating a returned post does not change the cache."""
+        cache = GenerationCache()
+        (first,) = generate_content_batch([content_input()], backend=FakeBackend(), cache=cache)
+        first.output["content"]["text"] = "edited"
+        (again,) = generate_content_batch([content_input()], backend=FakeBackend(), cache=cache)
+        self.assertNotEqual(again.output["content"]["text"], "edited")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+"""
+Test suite for the tier-aware content_generator scheduler.
+
+Reference: skills/content_generator/scheduler.py
+Traceability: specs/technical.md §6.3 (daily budget per agent), skills/content_generator/README.md
+"""
+
+import asyncio
+import threading
+import unittest
+from datetime import UTC, datetime
+
+from chimera.validation import SchemaValidationError
+from skills.content_generator import FakeBackend, GenerationCache
+from skills.content_generator.scheduler import BudgetExceededError, TierScheduler
+from tests.helpers import content_input
+
+NOON = datetime(2026, 3, 2, 12, 0, tzinfo=UTC).timestamp()
+TWO_AM = datetime(2026, 3, 2, 2, 0, tzinfo=UTC).timestamp()
+
+
+class ConcurrencyBackend(FakeBackend):
+    """FakeBackend that records the most calls it saw at once per tier."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._lock = threading.Lock()
+        self.active = {}
+        self.peak = {}
+
+    def generate(self, context, requests):
+        with self._lock:
+            self.active[context.tier] = self.active.get(context.tier, 0) + 1
+            self.peak[context.tier] = max(self.peak.get(context.tier, 0), self.active[context.tier])
+        try:
+            return super().generate(context, requests)
+        finally:
+            with self._lock:
+                self.active[context.tier] -= 1
+
+
+class TestTierScheduler(unittest.IsolatedAsyncioTestCase):
+    """Test tier ordering, filler batching, concurrency caps and budgets."""
+
+    def scheduler(self, backend=None, **kwargs):
+        kwargs.setdefault("wall_clock", lambda: NOON)
+        return TierScheduler(backend=backend or FakeBackend(item_latency=0.005), **kwargs)
+
+    async def test_hero_runs_before_queued_regular(self):
+        """Test that hero work is not stuck behind a regular backlog."""
+        finished = []
+        async with self.scheduler(max_concurrency=1) as scheduler:
+            futures = [
+                scheduler.submit(content_input(f"regular {i}"), agent_id="a") for i in range(5)
+            ]
+            futures.append(scheduler.submit(content_input("hero", tier="hero"), agent_id="a"))
+            for future in futures:
+                future.add_done_callback(lambda f: finished.append(f.result()["content"]["text"]))
+            await asyncio.gather(*futures)
+        self.assertTrue(finished[0].startswith("hero"))
+
+    async def test_priority_within_tier(self):
+        """Test that higher priority runs first inside one tier."""
+        finished = []
+        async with self.scheduler(max_concurrency=1) as scheduler:
+            low = scheduler.submit(content_input("low"), agent_id="a")
+            high = scheduler.submit(content_input("high"), agent_id="a", priority=5)
+            for future in (low, high):
+                future.add_done_callback(lambda f: finished.append(f.result()["content"]["text"]))
+            await asyncio.gather(low, high)
+        self.assertTrue(finished[0].startswith("high"))
+
+    async def test_filler_held_for_bulk_batch_at_peak(self):
+        """Test that peak-hour filler waits for a full batch and runs as one call."""
+        backend = FakeBackend()
+        scheduler = self.scheduler(backend, filler_batch_size=4, filler_max_wait=3600)
+        filler = [
+            scheduler.submit(content_input(f"filler {i}", tier="filler"), agent_id="a")
+            for i in range(3)
+        ]
+        await asyncio.sleep(0.05)
+        self.assertFalse(any(future.done() for future in filler))
+        self.assertEqual(scheduler.stats()["filler"]["queue_depth"], 3)
+
+        filler.append(scheduler.submit(content_input("filler 3", tier="filler"), agent_id="a"))
+        await asyncio.gather(*filler)
+        self.assertEqual(backend.calls, 1)
+        await scheduler.close()
+
+    async def test_filler_flushed_after_max_wait(self):
+        """Test that held filler is sent once the oldest job has waited long enough."""
+        scheduler = self.scheduler(filler_batch_size=100, filler_max_wait=0.05)
+        future = scheduler.submit(content_input(tier="filler"), agent_id="a")
+        result = await asyncio.wait_for(future, 1.0)
+        self.assertEqual(result["metadata"]["batch_size"], 1)
+        self.assertGreaterEqual(scheduler.stats()["filler"]["wait_ms"]["max"], 50)
+        await scheduler.close()
+
+    async def test_filler_sent_immediately_off_peak(self):
+        """Test that off-peak filler is not held."""
+        scheduler = self.scheduler(filler_batch_size=100, wall_clock=lambda: TWO_AM)
+        await asyncio.wait_for(scheduler.submit(content_input(tier="filler"), agent_id="a"), 1.0)
+        await scheduler.close()
+
+    async def test_close_flushes_held_filler(self):
+        """Test that closing the scheduler completes held filler."""
+        scheduler = self.scheduler(filler_batch_size=100, filler_max_wait=3600)
+        future = scheduler.submit(content_input(tier="filler"), agent_id="a")
+        await scheduler.close()
+        self.assertTrue(future.done())
+
+    async def test_per_tier_concurrency_cap(self):
+        """Test that no tier exceeds its concurrency cap."""
+        backend = ConcurrencyBackend(item_latency=0.02)
+        async with self.scheduler(backend, concurrency={"hero": 2}) as scheduler:
+            await asyncio.gather(
+                *(
+                    scheduler.submit(content_input(f"hero {i}", tier="hero"), agent_id="a")
+                    for i in range(6)
+                )
+            )
+        self.assertEqual(backend.peak["hero"], 2)
+
+    async def test_daily_budget_blocks_jobs(self):
+        """Test that an agent cannot spend past its daily budget."""
+        async with self.scheduler(daily_budget_usdc=1.0) as scheduler:
+            futures = [scheduler.submit(content_input(f"t{i}"), agent_id="a") for i in range(3)]
+            results = await asyncio.gather(*futures, return_exceptions=True)
+            self.assertIsInstance(results[2], BudgetExceededError)
+            self.assertEqual(scheduler.spent_today("a"), 1.0)
+            self.assertEqual(scheduler.remaining_budget("b"), 1.0)
+            with self.assertRaises(BudgetExceededError):
+                scheduler.submit(content_input("more"), agent_id="a")
+            stats = scheduler.stats()["regular"]
+        self.assertEqual((stats["completed"], stats["rejected"]), (2, 2))
+        self.assertEqual(stats["spend_usdc"], 1.0)
+
+    async def test_budget_limit_reserved_and_cache_hits_refunded(self):
+        """Test reservation at budget_limit_usdc and settlement at actual cost."""
+        async with self.scheduler(cache=GenerationCache(), daily_budget_usdc=10.0) as scheduler:
+            await scheduler.submit(content_input(budget_limit_usdc=5.0), agent_id="a")
+            await scheduler.submit(content_input(budget_limit_usdc=5.0), agent_id="a")
+            self.assertEqual(scheduler.spent_today("a"), 0.5)
+            self.assertEqual(scheduler.remaining_budget("a"), 9.5)
+
+    async def test_failures_and_validation(self):
+        """Test backend failures and invalid input."""
+        backend = FakeBackend(fail_topics=["bad"])
+        async with self.scheduler(backend) as scheduler:
+            with self.assertRaises(SchemaValidationError):
+                scheduler.submit(content_input(platform="myspace"), agent_id="a")
+            with self.assertRaises(ValueError):
+                await scheduler.submit(content_input("bad"), agent_id="a")
+            self.assertEqual(scheduler.stats()["regular"]["failed"], 1)
+            self.assertEqual(scheduler.remaining_budget("a"), 50.0)
+
+    async def test_settlement_errors_fail_only_their_job(self):
+        """Test that a job failing to settle neither leaks its slot nor its hold."""
+
+        class CostBackend(FakeBackend):
+            def generate(self, context, requests):
+                results = super().generate(context, requests)
+                for request, result in zip(requests, results, strict=True):
+                    result["cost_usdc"] = {"junk": "n/a", "pricey": 5.0}.get(
+                        request["topic"], result["cost_usdc"]
+                    )
+                return results
+
+        async with self.scheduler(
+            CostBackend(), daily_budget_usdc=2.0, concurrency={"regular": 1}
+        ) as scheduler:
+            for topic, error in (("junk", ValueError), ("pricey", BudgetExceededError)):
+                with self.assertRaises(error):
+                    await scheduler.submit(content_input(topic), agent_id="a")
+            await asyncio.wait_for(scheduler.submit(content_input("ok"), agent_id="a"), 5)
+            stats = scheduler.stats()["regular"]
+            self.assertEqual((stats["failed"], stats["completed"], stats["running"]), (2, 1, 0))
+            self.assertEqual(scheduler.remaining_budget("a"), 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+"""
+Test suite for streaming engagement aggregates and the analyze action.
+
+Reference: skills/engagement_manager/aggregates.py, skills/engagement_manager/sentiment.py
+Traceability: skills/engagement_manager/output_schema.json (analysis_data)
+"""
+
+import unittest
+
+from chimera.validation import validate_output
+from skills.engagement_manager import (
+    EngagementAggregator,
+    EngagementEvent,
+    classify_sentiment,
+    get_aggregator,
+    manage_engagement,
+)
+from skills.engagement_manager.sentiment import dominant_sentiment
+from tests.helpers import FakeClock
+
+
+class TestSentiment(unittest.TestCase):
+    """Test the lexicon classifier."""
+
+    def test_classification(self):
+        """Test positive, negative, neutral, emoji and negation."""
+        self.assertEqual(classify_sentiment("Love this look! Where can I get it?"), "positive")
+        self.assertEqual(classify_sentiment("This is overpriced trash"), "negative")
+        self.assertEqual(classify_sentiment("Where is this from?"), "neutral")
+        self.assertEqual(classify_sentiment("😍😍"), "positive")
+        self.assertEqual(classify_sentiment("not great"), "negative")
+
+    def test_dominant(self):
+        """Test the overall label for a tally."""
+        self.assertEqual(dominant_sentiment((0, 0, 0)), "neutral")
+        self.assertEqual(dominant_sentiment((8, 1, 1)), "positive")
+        self.assertEqual(dominant_sentiment((4, 2, 4)), "mixed")
+
+
+class TestEngagementAggregator(unittest.TestCase):
+    """Test lifetime counters, windows and row management."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.aggregator = EngagementAggregator(
+            bucket_seconds=60, window_buckets=5, clock=self.clock
+        )
+
+    def test_totals(self):
+        """Test likes and comment sentiment counts."""
+        self.aggregator.record_like("p1", 10)
+        self.aggregator.record_comment("p1", "love it")
+        self.aggregator.record_comment("p1", "hate it")
+        self.aggregator.record_comment("p1", sentiment="neutral")
+        totals = self.aggregator.totals("p1")
+        self.assertEqual((totals.likes, totals.comments, totals.total_engagement), (10, 3, 13))
+        self.assertEqual(
+            totals.sentiment_breakdown(),
+            {"positive": 0.3333, "neutral": 0.3333, "negative": 0.3333},
+        )
+
+    def test_unknown_post_is_empty(self):
+        """Test reads for a post with no events."""
+        self.assertEqual(self.aggregator.totals("nope").total_engagement, 0)
+        self.assertEqual(self.aggregator.window("nope").total_engagement, 0)
+
+    def test_sliding_window_expires_old_buckets(self):
+        """Test that the window forgets events older than window_buckets buckets."""
+        self.aggregator.record_like("p1", 5)
+        self.clock.now += 120
+        self.aggregator.record_like("p1", 3)
+        self.assertEqual(self.aggregator.window("p1").likes, 8)
+        self.assertEqual(self.aggregator.current_bucket("p1").likes, 3)
+
+        self.clock.now += 4 * 60
+        self.assertEqual(self.aggregator.window("p1").likes, 3)
+        self.assertEqual(self.aggregator.current_bucket("p1").likes, 0)
+        self.clock.now += 10 * 60
+        self.assertEqual(self.aggregator.window("p1").likes, 0)
+        self.assertEqual(self.aggregator.totals("p1").likes, 8)
+
+    def test_late_events(self):
+        """Test out-of-order events inside and outside the window."""
+        now = self.clock.now
+        self.aggregator.ingest(
+            [
+                EngagementEvent("p1", "like", now),
+                EngagementEvent("p1", "like", now - 120),
+                EngagementEvent("p1", "like", now - 3600),
+            ]
+        )
+        self.assertEqual(self.aggregator.totals("p1").likes, 3)
+        self.assertEqual(self.aggregator.window("p1").likes, 2)
+
+    def test_batch_matches_event_by_event(self):
+        """Test that a batched ingest equals the same events one at a time."""
+        events = [
+            EngagementEvent(
+                f"p{i % 7}",
+                "comment" if i % 3 else "like",
+                self.clock.now - (i % 400),
+                text=["love", "meh", "ok"][i % 3],
+            )
+            for i in range(500)
+        ]
+        batched = EngagementAggregator(bucket_seconds=60, window_buckets=5, clock=self.clock)
+        self.assertEqual(batched.ingest(events), 500)
+        for event in events:
+            self.aggregator.ingest([event])
+        for post in (f"p{i}" for i in range(7)):
+            self.assertEqual(batched.totals(post), self.aggregator.totals(post))
+            self.assertEqual(batched.window(post), self.aggregator.window(post))
+
+    def test_growth_and_forget(self):
+        """Test row growth past the initial capacity and row recycling."""
+        self.aggregator.ingest(EngagementEvent(f"p{i}", "like") for i in range(300))
+        self.assertEqual(len(self.aggregator), 300)
+        self.assertEqual(self.aggregator.totals("p0").likes, 1)
+        self.assertEqual(self.aggregator.totals("p299").likes, 1)
+
+        self.assertTrue(self.aggregator.forget("p0"))
+        self.aggregator.record_like("new")
+        self.assertEqual(self.aggregator.totals("new").likes, 1)
+        self.clock.now += 3600
+        self.assertEqual(self.aggregator.forget_idle(1800), 300)
+        self.assertEqual(len(self.aggregator), 0)
+
+    def test_unknown_kind(self):
+        """Test that unknown events are rejected."""
+        with self.assertRaises(ValueError):
+            self.aggregator.ingest([EngagementEvent("p1", "share")])
+
+
+class TestAnalyzeAction(unittest.TestCase):
+    """Test manage_engagement(action="analyze")."""
+
+    def request(self, **parameters):
+        base = {"action": "analyze", "platform": "instagram", "post_id": "post_12345"}
+        base.update(parameters)
+        return {"skill_name": "engagement_manager", "parameters": base}
+
+    def test_analyze_reads_aggregates(self):
+        """Test that analyze output matches the aggregates and the schema."""
+        aggregator = EngagementAggregator()
+        aggregator.record_like("post_12345", 40)
+        for text in ["Love this!", "Stunning 😍", "Where is it from?", "So overpriced"]:
+            aggregator.record_comment("post_12345", text)
+        result = manage_engagement(self.request(), aggregator=aggregator)
+        validate_output("engagement_manager", result)
+        analysis = result["response"]["analysis_data"]
+        self.assertEqual(result["response"]["action_taken"], "analyze")
+        self.assertEqual(analysis["total_engagement"], 44)
+        self.assertEqual(analysis["sentiment_breakdown"]["positive"], 0.5)
+        self.assertEqual(result["metadata"]["sentiment_detected"], "positive")
+        self.assertEqual(result["metadata"]["safety_score"], 0.75)
+        self.assertEqual(result["metadata"]["persona_alignment"], 0.625)
+        self.assertFalse(result["metadata"]["requires_hitl"])
+
+    def test_hostile_reception_requires_review(self):
+        """Test that a mostly negative comment section lowers scores and asks for HITL."""
+        aggregator = EngagementAggregator()
+        for text in ["So overpriced", "This is trash", "Love it"]:
+            aggregator.record_comment("post_12345", text)
+        metadata = manage_engagement(self.request(), aggregator=aggregator)["metadata"]
+        self.assertLess(metadata["safety_score"], 0.5)
+        self.assertLess(metadata["persona_alignment"], 0.5)
+        self.assertTrue(metadata["requires_hitl"])
+
+    def test_empty_aggregator_is_used(self):
+        """Test that an explicit but empty aggregator is not swapped for the default."""
+        self.addCleanup(get_aggregator().forget, "post_12345")
+        get_aggregator().record_like("post_12345", 5)
+        result = manage_engagement(self.request(), aggregator=EngagementAggregator())
+        self.assertEqual(result["response"]["analysis_data"]["total_engagement"], 0)
+
+    def test_analyze_requires_post_id(self):
+        """Test the post_id requirement."""
+        request = self.request()
+        del request["parameters"]["post_id"]
+        with self.assertRaises(ValueError):
+            manage_engagement(request)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,228 @@
+"""
+Test suite for the engagement_manager bulk reply pipeline.
+
+Reference: skills/engagement_manager/replies.py
+Traceability: skills/engagement_manager/output_schema.json, skills/engagement_manager/README.md
+"""
+
+import unittest
+
+from chimera.validation import validate_output
+from skills.engagement_manager import (
+    FakeReplyGenerator,
+    ReplyPipeline,
+    configure_reply_generator,
+    manage_engagement,
+    reply_batch,
+)
+from skills.engagement_manager.replies import template_key, triage
+
+
+def reply_input(comment_text, persona_id="chimera_fashion_001", **parameters):
+    base = {
+        "action": "reply",
+        "platform": "instagram",
+        "post_id": "post_12345",
+        "comment_text": comment_text,
+        "persona_id": persona_id,
+    }
+    base.update(parameters)
+    return {"skill_name": "engagement_manager", "parameters": base}
+
+
+class FailingGenerator(FakeReplyGenerator):
+    def generate(self, persona_id, platform, comments):
+        super().generate(persona_id, platform, comments)
+        raise RuntimeError("generator down")
+
+
+class TestTriage(unittest.TestCase):
+    """Test the cheap pre-generation checks."""
+
+    def test_triage(self):
+        """Test spam, emoji-only, empty and genuine comments."""
+        self.assertEqual(triage("Love this! Where can I get it?"), ("reply", None))
+        self.assertEqual(triage("😍😍🔥"), ("like", "emoji_only"))
+        self.assertEqual(triage("   "), ("skipped", "empty"))
+        self.assertEqual(triage("Follow me for a giveaway!"), ("skipped", "spam"))
+        self.assertEqual(triage("cheap bags at https://spam.example"), ("skipped", "spam"))
+        self.assertEqual(triage("@a @b @c look"), ("skipped", "spam"))
+
+    def test_template_key(self):
+        """Test that near-identical comments share a key."""
+        self.assertEqual(template_key("Love this!!"), "love this")
+        self.assertEqual(template_key("love this 😍"), "love this")
+        self.assertEqual(template_key("LOOOVE this"), "love this")
+        self.assertNotEqual(template_key("Love this"), template_key("Hate this"))
+
+    def test_template_key_keeps_doubles_and_digits(self):
+        """Test that only stretched letters collapse, not real doubles or numbers."""
+        self.assertEqual(template_key("so goooood"), "so god")
+        self.assertNotEqual(template_key("good"), template_key("god"))
+        self.assertNotEqual(template_key("100% yes"), template_key("10% yes"))
+
+
+class TestReplyPipeline(unittest.TestCase):
+    """Test batching, template reuse, ordering and error isolation."""
+
+    def test_batching_and_template_reuse(self):
+        """Test that replies are generated once per distinct comment, in batches."""
+        generator = FakeReplyGenerator(max_batch_size=4)
+        pipeline = ReplyPipeline(generator)
+        inputs = [reply_input(f"Do you ship to city {i}?") for i in range(10)]
+        inputs += [reply_input("Love this!!"), reply_input("love this 😍")]
+        items = list(pipeline.process(inputs))
+        self.assertTrue(all(item.ok for item in items))
+        self.assertEqual(generator.items, 11)
+        self.assertEqual(generator.calls, 3)
+        self.assertEqual(items[10].output["response"]["text"], items[11].output["response"]["text"])
+        self.assertTrue(items[11].output["metadata"]["template_reused"])
+
+        # The template is reused across batches too.
+        (again,) = pipeline.process([reply_input("LOVE THIS")])
+        self.assertEqual(generator.calls, 3)
+        self.assertTrue(again.output["metadata"]["template_reused"])
+        self.assertEqual(pipeline.stats.template_hits, 2)
+
+    def test_templates_are_per_persona(self):
+        """Test that personas never share replies."""
+        generator = FakeReplyGenerator()
+        pipeline = ReplyPipeline(generator)
+        list(pipeline.process([reply_input("Love this", "a"), reply_input("Love this", "b")]))
+        self.assertEqual(generator.items, 2)
+
+    def test_templates_are_per_post(self):
+        """Test that a reply written for one post is not reused on another."""
+        generator = FakeReplyGenerator()
+        pipeline = ReplyPipeline(generator)
+        list(pipeline.process([reply_input("Love this", post_id="p1")]))
+        (other,) = pipeline.process([reply_input("Love this", post_id="p2")])
+        self.assertFalse(other.output["metadata"]["template_reused"])
+        self.assertEqual(generator.items, 2)
+
+    def test_short_circuits(self):
+        """Test skipped and like outcomes, including re-delivered comments."""
+        generator = FakeReplyGenerator()
+        pipeline = ReplyPipeline(generator)
+        items = list(
+            pipeline.process(
+                [
+                    reply_input("Follow me for a giveaway", comment_id="c1"),
+                    reply_input("😍", comment_id="c2"),
+                    reply_input("😡", comment_id="c3"),
+                    reply_input("Where is this from?", comment_id="c4"),
+                    reply_input("Where is this from?", comment_id="c4"),
+                ]
+            )
+        )
+        actions = [item.output["response"]["action_taken"] for item in items]
+        self.assertEqual(actions, ["skipped", "like", "skipped", "reply", "skipped"])
+        self.assertEqual(items[4].output["metadata"]["triage_reason"], "duplicate")
+        for item in items:
+            validate_output("engagement_manager", item.output)
+        self.assertEqual(generator.items, 1)
+        self.assertEqual(pipeline.stats.as_dict()["calls_avoided"], 4)
+
+    def test_order_and_errors(self):
+        """Test input order across personas and per-item failures."""
+        pipeline = ReplyPipeline(FakeReplyGenerator(max_batch_size=2))
+        inputs = [reply_input(f"question {i}?", persona_id=f"p{i % 3}") for i in range(9)]
+        inputs.insert(4, {"skill_name": "engagement_manager", "parameters": {}})
+        inputs.insert(5, reply_input("hi", action="like"))
+        items = list(pipeline.process(inputs))
+        self.assertEqual([item.index for item in items], list(range(11)))
+        self.assertEqual([item.ok for item in items].count(False), 2)
+
+    def test_generator_failure_allows_redelivery(self):
+        """Test that a failed comment is not treated as a duplicate on retry."""
+        pipeline = ReplyPipeline(FailingGenerator())
+        (item,) = pipeline.process([reply_input("Where?", comment_id="c1")])
+        self.assertIsInstance(item.error, RuntimeError)
+        pipeline.generator = FakeReplyGenerator()
+        (retry,) = pipeline.process([reply_input("Where?", comment_id="c1")])
+        self.assertEqual(retry.output["response"]["action_taken"], "reply")
+
+
+class TestReplyAction(unittest.TestCase):
+    """Test manage_engagement(action="reply") and reply_batch."""
+
+    def tearDown(self):
+        configure_reply_generator(None)
+
+    def test_reply_action(self):
+        """Test a single reply through the configured generator."""
+        configure_reply_generator(FakeReplyGenerator())
+        result = manage_engagement(reply_input("Love this look! Where can I get it?"))
+        validate_output("engagement_manager", result)
+        self.assertEqual(result["response"]["action_taken"], "reply")
+        self.assertEqual(result["metadata"]["sentiment_detected"], "positive")
+        self.assertEqual(len(list(reply_batch([reply_input("a?"), reply_input("b?")]))), 2)
+
+    def test_reply_requires_generator_and_fields(self):
+        """Test missing configuration and missing reply fields."""
+        with self.assertRaises(RuntimeError):
+            manage_engagement(reply_input("hi"))
+        configure_reply_generator(FakeReplyGenerator())
+        request = reply_input("hi")
+        del request["parameters"]["persona_id"]
+        with self.assertRaises(ValueError):
+            manage_engagement(request)
+
+
+class TestOtherActions(unittest.TestCase):
+    """Test manage_engagement like, follow and dm."""
+
+    def tearDown(self):
+        configure_reply_generator(None)
+
+    def request(self, action, **parameters):
+        return {
+            "skill_name": "engagement_manager",
+            "parameters": {"action": action, "platform": "instagram", **parameters},
+        }
+
+    def test_like(self):
+        """Test that likes go through and spam or negative comments are skipped."""
+        liked = manage_engagement(self.request("like", comment_id="c1", comment_text="Love it"))
+        validate_output("engagement_manager", liked)
+        self.assertEqual(liked["response"]["action_taken"], "like")
+        self.assertTrue(liked["response"]["platform_response_id"].startswith("like_"))
+        spam = manage_engagement(
+            self.request("like", comment_id="c2", comment_text="giveaway! dm me")
+        )
+        self.assertEqual(spam["metadata"]["triage_reason"], "spam")
+        negative = manage_engagement(
+            self.request("like", comment_id="c3", comment_text="This is overpriced trash")
+        )
+        self.assertEqual(negative["response"]["action_taken"], "skipped")
+        with self.assertRaises(ValueError):
+            manage_engagement(self.request("like"))
+
+    def test_follow(self):
+        """Test that follow needs a user_id."""
+        result = manage_engagement(self.request("follow", user_id="u1"))
+        validate_output("engagement_manager", result)
+        self.assertEqual(result["response"]["action_taken"], "follow")
+        with self.assertRaises(ValueError):
+            manage_engagement(self.request("follow"))
+
+    def test_dm_is_drafted_for_review(self):
+        """Test that a DM is generated but held for HITL and never reused across users."""
+        generator = FakeReplyGenerator()
+        configure_reply_generator(generator)
+        message = {"comment_text": "Where can I buy it?", "persona_id": "chimera_fashion_001"}
+        first = manage_engagement(self.request("dm", user_id="u1", **message))
+        validate_output("engagement_manager", first)
+        self.assertEqual(first["response"]["action_taken"], "dm")
+        self.assertIn("text", first["response"])
+        self.assertNotIn("platform_response_id", first["response"])
+        self.assertTrue(first["metadata"]["requires_hitl"])
+        second = manage_engagement(self.request("dm", user_id="u2", **message))
+        self.assertFalse(second["metadata"]["template_reused"])
+        self.assertEqual(generator.items, 2)
+        with self.assertRaises(ValueError):
+            manage_engagement(self.request("dm", **message))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+Test suite for the Judge confidence-routing fast path.
+
+Reference: src/chimera/judge.py
+Traceability: specs/functional.md US-011, specs/technical.md §3.2
+"""
+
+import asyncio
+import random
+import unittest
+
+from chimera.judge import Judge, Thresholds, route_one
+
+
+def review(confidence, *, safety=0.98, alignment=0.9, flags=(), task_id="t"):
+    return {
+        "task_id": task_id,
+        "content_id": "c",
+        "result": {"text": "post", "media_urls": [], "confidence": confidence},
+        "validation": {
+            "persona_alignment": alignment,
+            "safety_score": safety,
+            "flags": list(flags),
+        },
+        "worker_id": "w1",
+        "completed_at": "2026-01-01T00:00:00Z",
+    }
+
+
+class TestRouting(unittest.TestCase):
+    """Test the US-011 routing rules."""
+
+    def test_confidence_bands(self):
+        """Test the approve / HITL / reject bands and their boundaries."""
+        cases = [(0.95, "approve"), (0.90, "hitl"), (0.70, "hitl"), (0.69, "reject")]
+        judge = Judge()
+        batch = judge.route([review(confidence) for confidence, _ in cases])
+        self.assertEqual([d["route"] for d in batch.decisions()], [route for _, route in cases])
+        for confidence, route in cases:
+            self.assertEqual(route_one(review(confidence))[0], route)
+
+    def test_overrides(self):
+        """Test sensitive topics, weak validation scores, flags and bad messages."""
+        messages = [
+            review(0.5, flags=["politics"]),
+            review(0.99, safety=0.5),
+            review(0.99, alignment=0.2),
+            review(0.99, flags=["off_brand"]),
+            review(0.99, safety=None),
+            {"task_id": "broken"},
+            "not a message",
+        ]
+        decisions = Judge().route(messages).decisions()
+        self.assertEqual(
+            [(d["route"], d["reason"]) for d in decisions],
+            [
+                ("hitl", "sensitive"),
+                ("hitl", "low_safety"),
+                ("hitl", "low_alignment"),
+                ("hitl", "flagged"),
+                ("hitl", "low_safety"),
+                ("hitl", "invalid"),
+                ("hitl", "invalid"),
+            ],
+        )
+
+    def test_vectorised_matches_scalar(self):
+        """Test that batch routing agrees with route_one on random messages."""
+        rng = random.Random(5)
+        flag_choices = [(), (), (), ("off_brand",), ("health_advice",)]
+        messages = [
+            review(
+                rng.random(),
+                safety=rng.random(),
+                alignment=rng.random(),
+                flags=rng.choice(flag_choices),
+            )
+            for _ in range(2000)
+        ]
+        thresholds = Thresholds(min_safety=0.5, min_alignment=0.3)
+        batch = Judge(thresholds).route(messages)
+        expected = [route_one(message, thresholds) for message in messages]
+        actual = [(d["route"], d["reason"]) for d in batch.decisions()]
+        self.assertEqual(actual, expected)
+
+        # Well-formed but mistyped scores must not be coerced by the batch path.
+        mistyped = [
+            review("0.99", safety=True, alignment="0.9"),
+            review(0.99, safety=True),
+            review(0.99, alignment="0.9"),
+            review(1, safety=1, alignment=1),
+        ]
+        batch = Judge().route(mistyped)
+        expected = [route_one(message) for message in mistyped]
+        self.assertEqual([(d["route"], d["reason"]) for d in batch.decisions()], expected)
+        self.assertEqual(
+            expected,
+            [
+                ("hitl", "invalid"),
+                ("hitl", "low_safety"),
+                ("hitl", "low_alignment"),
+                ("approve", "confident"),
+            ],
+        )
+
+    def test_counters(self):
+        """Test the per-route and per-reason counters."""
+        judge = Judge()
+        judge.route([review(0.95), review(0.8), review(0.1)])
+        judge.route([])
+        stats = judge.stats.as_dict()
+        self.assertEqual(stats["routes"], {"approve": 1, "hitl": 1, "reject": 1})
+        self.assertEqual(stats["reasons"]["review_band"], 1)
+        self.assertEqual((stats["batches"], stats["messages"]), (2, 3))
+        self.assertAlmostEqual(stats["hitl_rate"], 1 / 3, places=4)
+
+    def test_unknown_sink(self):
+        """Test that sinks must name a route."""
+        with self.assertRaises(ValueError):
+            Judge(sinks={"publish": print})
+
+
+class TestConsume(unittest.IsolatedAsyncioTestCase):
+    """Test micro-batched consumption from a queue."""
+
+    async def test_consume_dispatches_batches(self):
+        """Test that queued messages are batched and handed to the route sinks."""
+        approved, escalated = [], []
+
+        async def hitl(messages):
+            escalated.extend(messages)
+
+        judge = Judge(sinks={"approve": approved.extend, "hitl": hitl}, batch_size=64)
+        queue = asyncio.Queue()
+        for i in range(200):
+            queue.put_nowait(review(0.95 if i % 4 else 0.8, task_id=str(i)))
+        queue.put_nowait(None)
+        await asyncio.wait_for(judge.consume(queue), 5)
+        self.assertEqual(len(approved), 150)
+        self.assertEqual(len(escalated), 50)
+        self.assertEqual(judge.stats.batches, 4)
+        self.assertEqual(approved[0]["task_id"], "1")
+
+
+if __name__ == "__main__":
+    unittest.main()
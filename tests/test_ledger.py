@@ -0,0 +1,151 @@
+"""
+Test suite for the wallet budget ledger.
+
+Reference: src/chimera/ledger.py
+Traceability: specs/technical.md §1.4 (get_balance), §6.3 (daily budget per agent)
+"""
+
+import random
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+from datetime import UTC, datetime
+
+from chimera.ledger import BudgetExceededError, Journal, Ledger, to_micros
+from tests.helpers import FakeClock
+
+NOON = datetime(2026, 3, 2, 12, 0, tzinfo=UTC).timestamp()
+
+
+class TestLedger(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock(NOON)
+        self.ledger = Ledger(clock=self.clock)
+
+    def test_to_micros(self):
+        """Test that numbers and decimal strings convert exactly."""
+        self.assertEqual(to_micros("23.50"), 23_500_000)
+        self.assertEqual(to_micros(0.1), 100_000)
+        self.assertEqual(to_micros(2), 2_000_000)
+
+    def test_reserve_commit_release(self):
+        """Test that holds count against the limit until settled."""
+        first = self.ledger.reserve("a", 30)
+        self.assertEqual(self.ledger.remaining("a"), 20.0)
+        with self.assertRaises(BudgetExceededError) as ctx:
+            self.ledger.reserve("a", 25)
+        self.assertEqual(ctx.exception.remaining, 20.0)
+        self.assertFalse(self.ledger.check("a", 25))
+        self.ledger.commit(first, 12.5)
+        self.assertEqual(self.ledger.spent_today("a"), 12.5)
+        second = self.ledger.reserve("a", 25)
+        self.ledger.release(second)
+        self.assertEqual(self.ledger.remaining("a"), 37.5)
+        with self.assertRaises(KeyError):
+            self.ledger.commit(second)
+        self.assertEqual(
+            self.ledger.balance("a"),
+            {"pending_out": "0.00", "daily_spend": "12.50", "daily_limit": "50.00"},
+        )
+
+    def test_commit_above_hold_checked_against_limit(self):
+        """Test that settling above the hold cannot take an agent over its limit."""
+        small = self.ledger.reserve("a", 1)
+        other = self.ledger.reserve("a", 40)
+        with self.assertRaises(BudgetExceededError) as ctx:
+            self.ledger.commit(small, 60)
+        self.assertEqual(ctx.exception.remaining, 10.0)
+        self.assertEqual(self.ledger.remaining("a"), 9.0)
+        self.ledger.commit(small, 10)
+        self.assertEqual(self.ledger.remaining("a"), 0.0)
+        with self.assertRaises(ValueError):
+            self.ledger.commit(other, -1)
+        self.ledger.release(other)
+
+    def test_journal_write_error_reaches_waiters(self):
+        """Test that a failed fsync fails durable commits instead of hanging them."""
+        with tempfile.TemporaryDirectory() as tmp:
+            journal = Journal(tmp)
+            with mock.patch("chimera.ledger.os.fsync", side_effect=OSError("disk full")):
+                ledger = Ledger(journal, clock=self.clock)
+                with self.assertRaises(OSError):
+                    ledger.spend("a", 1, durable=True)
+            ledger.spend("a", 2, durable=True)
+            ledger.close()
+            self.assertEqual(ledger.spent_today("a"), 3.0)
+
+    def test_per_agent_limits(self):
+        """Test that a per-agent limit overrides the default."""
+        ledger = Ledger(limits={"vip": 200}, clock=self.clock)
+        ledger.spend("vip", 150)
+        self.assertEqual(ledger.remaining("vip"), 50.0)
+        self.assertEqual(ledger.remaining("other"), 50.0)
+
+    def test_day_rollover(self):
+        """Test that spend resets at UTC midnight and late commits go to their day."""
+        held = self.ledger.reserve("a", 10)
+        self.ledger.spend("a", 40)
+        self.assertEqual(self.ledger.remaining("a"), 0.0)
+        self.clock.advance(86400)
+        self.assertEqual(self.ledger.remaining("a"), 50.0)
+        self.ledger.commit(held)
+        self.assertEqual(self.ledger.spent_today("a"), 0.0)
+
+    def test_journal_replay(self):
+        """Test that committed spend survives a restart; reservations do not."""
+        with tempfile.TemporaryDirectory() as tmp:
+            with Ledger(tmp, clock=self.clock) as ledger:
+                ledger.spend("a", 20, ref="0xabc", durable=True)
+                ledger.spend("a", 5)
+                ledger.reserve("a", 10)
+            with Ledger(tmp, clock=self.clock) as ledger:
+                self.assertEqual(ledger.spent_today("a"), 25.0)
+                self.assertEqual(ledger.remaining("a"), 25.0)
+            self.clock.advance(86400)
+            with Ledger(tmp, clock=self.clock) as ledger:
+                self.assertEqual(ledger.spent_today("a"), 0.0)
+            records = list(Journal(tmp).replay("2026-03-02"))
+            self.assertEqual(records[0]["ref"], "0xabc")
+
+    def test_concurrent_reservations_never_overspend(self):
+        """Stress: many threads reserving for a few agents never exceed the limit."""
+        ledger = Ledger(daily_limit_usdc=50, clock=self.clock)
+        agents = ["a", "b", "c", "d"]
+        committed = dict.fromkeys(agents, 0)
+        tally = threading.Lock()
+
+        def worker(seed: int) -> None:
+            rng = random.Random(seed)
+            for _ in range(2000):
+                agent = rng.choice(agents)
+                ledger.check(agent, 0.25)
+                try:
+                    reservation = ledger.reserve(agent, rng.choice([0.01, 0.1, 0.25, 1.0]))
+                except BudgetExceededError:
+                    continue
+                if rng.random() < 0.3:
+                    ledger.release(reservation)
+                    continue
+                ledger.commit(reservation)
+                with tally:
+                    committed[agent] += reservation.micros
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(16)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        for agent in agents:
+            self.assertLessEqual(committed[agent], to_micros(50))
+            self.assertEqual(ledger.spent_today(agent), committed[agent] / 1_000_000)
+            self.assertEqual(ledger.balance(agent)["pending_out"], "0.00")
+        self.assertGreater(ledger.stats.rejected, 0)
+        self.assertGreater(ledger.stats.checks / elapsed, 5_000)
+
+
+if __name__ == "__main__":
+    unittest.main()
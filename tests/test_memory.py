@@ -0,0 +1,173 @@
+"""
+Test suite for agent long-term memory.
+
+Reference: src/chimera/memory/
+Traceability: specs/technical.md §4.1, §4.2 (store_memory, search_memory), §6.3
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from chimera.memory import (
+    HashingEmbedder,
+    MemoryStore,
+    Segment,
+    configure_memory_store,
+    recent_memories,
+    search_memory,
+    store_memory,
+)
+from tests.helpers import FakeClock
+
+
+def clustered(n: int, dim: int, clusters: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim))
+    labels = rng.integers(clusters, size=n)
+    return centers[labels] + 0.3 * rng.standard_normal((n, dim)), centers
+
+
+class TestMemoryStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.clock = FakeClock()
+        self.store = self.make_store()
+
+    def make_store(self, **kwargs) -> MemoryStore:
+        kwargs.setdefault("dim", 64)
+        store = MemoryStore(self.tmp.name, clock=self.clock, **kwargs)
+        self.addCleanup(store.close)
+        return store
+
+    def test_store_and_search(self):
+        """Test that the matching memory ranks first and ids are sequential."""
+        ids = self.store.store_many(
+            "agent-1",
+            [
+                "sunrise reel on the beach did well",
+                "followers asked about vegan recipes",
+                "sponsor wants a sneaker unboxing",
+            ],
+            [["engagement"], ["audience"], ["brand"]],
+        )
+        self.assertEqual(ids, [1, 2, 3])
+        hits = self.store.search("agent-1", "vegan recipes", limit=2)
+        self.assertEqual(hits[0].content, "followers asked about vegan recipes")
+        self.assertEqual(hits[0].tags, ("audience",))
+        self.assertGreater(hits[0].score, hits[1].score)
+        self.assertEqual(self.store.search("agent-1", "vegan", tags=["brand"])[0].id, 3)
+        self.assertEqual(self.store.search("unknown-agent", "vegan"), [])
+
+    def test_recent_newest_first(self):
+        """Test the recent view, with and without a tag filter."""
+        for i in range(10):
+            self.store.store("agent-1", f"note {i}", ["even" if i % 2 == 0 else "odd"])
+        self.assertEqual(
+            [m.content for m in self.store.recent("agent-1", 3)], ["note 9", "note 8", "note 7"]
+        )
+        self.assertEqual(
+            [m.content for m in self.store.recent("agent-1", 2, tags=["even"])],
+            ["note 8", "note 6"],
+        )
+
+    def test_reopen_recovers_rows(self):
+        """Test that a new store over the same directory sees every memory."""
+        self.store.store_many("agent-1", [f"memory {i}" for i in range(50)])
+        usage = self.store.usage("agent-1")
+        self.store.close()
+        store = self.make_store()
+        self.assertEqual(store.usage("agent-1"), usage)
+        self.assertEqual(store.recent("agent-1", 1)[0].id, 50)
+        self.assertEqual(store.store("agent-1", "one more"), 51)
+
+    def test_ivf_recall(self):
+        """Test that the IVF index finds nearly all exact top-10 neighbours."""
+        store = self.make_store(dim=32, train_threshold=500, nprobe=8)
+        vectors, centers = clustered(4000, 32, 40)
+        store.store_many("agent-1", [f"m{i}" for i in range(4000)], embeddings=vectors)
+        exact = self.make_store(dim=32, train_threshold=10**9)
+        exact.store_many("agent-2", [f"m{i}" for i in range(4000)], embeddings=vectors)
+        recall = []
+        for query in centers[:20] + 0.1:
+            got = {m.id for m in store.search("agent-1", "", embedding=query)}
+            want = {m.id for m in exact.search("agent-2", "", embedding=query)}
+            recall.append(len(got & want) / 10)
+        self.assertGreaterEqual(np.mean(recall), 0.9)
+
+    def test_budget_prunes_low_retention_first(self):
+        """Test that stores past the budget evict old, unimportant memories first."""
+        store = self.make_store(budget_bytes=15_000, half_life=86400)
+        store.store_many("agent-1", [f"old trivia {i}" for i in range(40)], importance=[0.1] * 40)
+        store.store("agent-1", "old but vital", importance=1.0)
+        self.clock.now += 7200
+        for i in range(80):
+            store.store("agent-1", f"fresh note {i}")
+        self.assertLessEqual(store.usage("agent-1"), 15_000)
+        self.assertGreater(store.stats.pruned, 0)
+        contents = {m.content for m in store.recent("agent-1", 1000)}
+        self.assertIn("old but vital", contents)
+        self.assertIn("fresh note 79", contents)
+        self.assertFalse(any(c.startswith("old trivia") for c in contents))
+
+    def test_compaction_preserves_memories(self):
+        """Test that compaction reclaims evicted rows and keeps search working."""
+        store = self.make_store(budget_bytes=20_000, compact_fraction=0.1)
+        for i in range(400):
+            store.store("agent-1", f"note {i}")
+        self.assertGreater(store.stats.compactions, 0)
+        generations = [p.name for p in (Path(self.tmp.name) / "agent-1").glob("gen-*")]
+        self.assertEqual(len(generations), 1)
+        self.assertEqual(store.search("agent-1", "note 399", limit=1)[0].content, "note 399")
+
+    def test_lru_bounds_open_segments(self):
+        """Test that only max_open segments stay mapped and closed ones reopen."""
+        store = self.make_store(max_open=2)
+        for agent in ("a", "b", "c"):
+            store.store(agent, f"hello from {agent}")
+        self.assertEqual(store.stats.segments_closed, 1)
+        self.assertEqual(store.recent("a", 1)[0].content, "hello from a")
+
+    def test_rejects_bad_input(self):
+        """Test validation of agent ids, importance and embedding width."""
+        self.store.store("agent-1", "valid")
+        with self.assertRaises(ValueError):
+            self.store.store("../escape", "x")
+        with self.assertRaises(ValueError):
+            self.store.store("agent-1", "x", importance=2)
+        with self.assertRaises(ValueError):
+            self.store.store("agent-1", "x", embedding=np.ones(8))
+        self.store.close()
+        with self.assertRaises(ValueError):
+            Segment(Path(self.tmp.name) / "agent-1", 128)
+
+    def test_mcp_tools(self):
+        """Test the module-level MCP tool functions."""
+        configure_memory_store(None)
+        with self.assertRaises(RuntimeError):
+            search_memory("agent-1", "x")
+        configure_memory_store(self.store)
+        self.addCleanup(configure_memory_store, None)
+        saved = store_memory("agent-1", "remember the launch date", ["plan"])
+        self.assertEqual(saved["memory_id"], 1)
+        self.assertEqual(
+            search_memory("agent-1", "launch date")[0]["content"], "remember the launch date"
+        )
+        self.assertEqual(recent_memories("agent-1")[0]["tags"], ["plan"])
+
+
+class TestHashingEmbedder(unittest.TestCase):
+    def test_unit_length_and_deterministic(self):
+        """Test that embeddings are normalised, repeatable, and zero for empty text."""
+        embed = HashingEmbedder(32)
+        vectors = embed(["Hello world", "Hello world", ""])
+        self.assertAlmostEqual(float(np.linalg.norm(vectors[0])), 1.0, places=5)
+        np.testing.assert_array_equal(vectors[0], vectors[1])
+        self.assertFalse(vectors[2].any())
+
+
+if __name__ == "__main__":
+    unittest.main()
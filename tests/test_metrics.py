@@ -0,0 +1,163 @@
+"""
+Test suite for latency histograms, counters and the exporters.
+
+Reference: src/chimera/metrics.py
+Traceability: specs/technical.md §6.1, §7.1
+"""
+
+import asyncio
+import gc
+import threading
+import unittest
+
+from chimera import metrics
+from chimera.metrics import Counter, Gauge, Histogram, Registry, bucket_bounds, bucket_index
+from skills.content_generator import FakeBackend, generate_content
+from tests.helpers import content_input
+
+
+class TestHistogram(unittest.TestCase):
+    def test_buckets_hold_their_values(self):
+        """Test that every value falls in its bucket, within 1/32 relative width."""
+        for micros in [0, 1, 63, 64, 65, 127, 1000, 123_456, 10**9, 2**33 - 1]:
+            lower, upper = bucket_bounds(bucket_index(micros))
+            self.assertLessEqual(lower, micros)
+            self.assertLess(micros, upper)
+            self.assertLessEqual(upper - lower, max(1, lower // 32))
+        self.assertEqual(bucket_index(-5), 0)
+        self.assertEqual(bucket_index(2**40), metrics.BUCKETS - 1)
+
+    def test_summary_percentiles(self):
+        """Test that percentiles land within a bucket of the exact values."""
+        histogram = Histogram()
+        for ms in range(1, 1001):
+            histogram.observe(ms / 1000)
+        summary = histogram.summary()
+        self.assertEqual(summary["count"], 1000)
+        self.assertAlmostEqual(summary["sum"], 500.5)
+        for key, exact in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99), ("max", 1.0)):
+            self.assertAlmostEqual(summary[key], exact, delta=exact / 32)
+        self.assertEqual(Histogram().summary()["p99"], 0.0)
+
+    def test_threads_record_into_their_own_shards(self):
+        """Test that per-thread counts are merged, and kept after their thread exits."""
+        histogram = Histogram()
+        counter = Counter()
+
+        def record():
+            for _ in range(1000):
+                histogram.observe_micros(250)
+                counter.inc()
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        del threads, thread
+        gc.collect()
+        self.assertEqual(histogram.summary()["count"], 4000)
+        self.assertEqual(counter.value, 4000)
+        self.assertEqual(len(histogram._shards._live), 0)
+
+    def test_timer_counts_errors(self):
+        """Test that a timed block is recorded whether or not it raises."""
+        histogram, errors = Histogram(), Counter()
+        with metrics.Timer(histogram, errors):
+            pass
+        with self.assertRaises(KeyError), metrics.Timer(histogram, errors):
+            raise KeyError("x")
+        self.assertEqual(histogram.summary()["count"], 2)
+        self.assertEqual(errors.value, 1)
+
+
+class TestRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = Registry()
+
+    def test_families_and_labels(self):
+        """Test that children are per label values and families cannot be redefined."""
+        tasks = self.registry.counter("tasks_total", "Tasks.", ["type", "status"])
+        tasks.labels("analyze", "completed").inc(2)
+        self.assertIs(tasks.labels("analyze", "completed"), tasks.labels("analyze", "completed"))
+        self.assertIs(self.registry.counter("tasks_total", "Tasks.", ["type", "status"]), tasks)
+        with self.assertRaises(ValueError):
+            tasks.labels("analyze")
+        with self.assertRaises(ValueError):
+            self.registry.gauge("tasks_total", "Tasks.")
+        with self.assertRaises(ValueError):
+            tasks.labels("analyze", "completed").inc(-1)
+
+        depth = self.registry.gauge("depth", "Queue depth.").labels()
+        depth.inc(3)
+        depth.dec()
+        self.assertEqual(depth.value, 2)
+        depth.set_function(lambda: 7.5)
+        self.assertEqual(depth.value, 7.5)
+        self.assertIsInstance(depth, Gauge)
+
+    def test_prometheus_text(self):
+        """Test the exposition format, with cumulative buckets and escaped labels."""
+        latency = self.registry.histogram("op_seconds", "Op latency.", ["op"])
+        for seconds in (0.0004, 0.003, 0.003, 2.5):
+            latency.labels('say "hi"').observe(seconds)
+        self.registry.counter("errors_total", "Errors.").labels().inc(3)
+        lines = metrics.render_prometheus(self.registry).splitlines()
+        self.assertEqual(
+            lines[:2], ["# HELP op_seconds Op latency.", "# TYPE op_seconds histogram"]
+        )
+        self.assertIn('op_seconds_bucket{op="say \\"hi\\"",le="0.0005"} 1', lines)
+        self.assertIn('op_seconds_bucket{op="say \\"hi\\"",le="0.005"} 3', lines)
+        self.assertIn('op_seconds_bucket{op="say \\"hi\\"",le="2"} 3', lines)
+        self.assertIn('op_seconds_bucket{op="say \\"hi\\"",le="+Inf"} 4', lines)
+        self.assertIn('op_seconds_count{op="say \\"hi\\""} 4', lines)
+        self.assertIn('op_seconds_sum{op="say \\"hi\\""} 2.5064', lines)
+        self.assertEqual(lines[-2:], ["# TYPE errors_total counter", "errors_total 3"])
+
+    def test_snapshot(self):
+        """Test that the JSON snapshot carries summaries and values per series."""
+        self.registry.histogram("op_seconds", "Op latency.", ["op"]).labels("a").observe(0.01)
+        self.registry.counter("errors_total", "Errors.").labels().inc()
+        report = metrics.snapshot(self.registry)
+        series = report["op_seconds"]["series"][0]
+        self.assertEqual(series["labels"], {"op": "a"})
+        self.assertEqual(series["count"], 1)
+        self.assertEqual(report["errors_total"]["series"], [{"labels": {}, "value": 1}])
+
+
+class TestInstrumentation(unittest.TestCase):
+    def count(self, operation):
+        return metrics.OPERATION_SECONDS.labels(operation).summary()["count"]
+
+    def test_timed_functions_and_coroutines(self):
+        """Test that @timed records calls and failures of sync and async functions."""
+
+        @metrics.timed("test.sync")
+        def double(x):
+            if x is None:
+                raise TypeError("x")
+            return 2 * x
+
+        @metrics.timed("test.async")
+        async def triple(x):
+            return 3 * x
+
+        self.assertEqual(double(2), 4)
+        with self.assertRaises(TypeError):
+            double(None)
+        self.assertEqual(asyncio.run(triple(2)), 6)
+        self.assertEqual(double.__name__, "double")
+        self.assertEqual(self.count("test.sync"), 2)
+        self.assertEqual(metrics.OPERATION_ERRORS.labels("test.sync").value, 1)
+        self.assertEqual(self.count("test.async"), 1)
+
+    def test_skill_stages_are_recorded(self):
+        """Test that generate_content records its entry point and pipeline stages."""
+        before = {op: self.count(op) for op in ("generate_content", "content_generator.backend")}
+        generate_content(content_input("Metrics Coverage"), backend=FakeBackend())
+        for operation, count in before.items():
+            self.assertEqual(self.count(operation), count + 1, operation)
+
+
+if __name__ == "__main__":
+    unittest.main()
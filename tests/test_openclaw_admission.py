@@ -0,0 +1,178 @@
+"""
+Test suite for OpenClaw job admission control.
+
+Reference: src/chimera/openclaw/admission.py
+Traceability: specs/openclaw_integration.md §5.1, §5.2, §9.1
+"""
+
+import asyncio
+import unittest
+
+from chimera.openclaw import AdmissionController, AdmissionError, CapacityConfig
+from chimera.openclaw.simulate import simulate
+from tests.helpers import FakeClock
+
+
+class TestAdmissionController(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.signals = []
+        self.controller = AdmissionController(
+            CapacityConfig(max_concurrent_external_jobs=10, reserved_capacity_internal=0.3),
+            capacity=10,
+            on_load=self.signals.append,
+            clock=self.clock,
+        )
+
+    def test_from_dict(self):
+        """Test that the §5.2 block is read with or without its wrapper."""
+        config = CapacityConfig.from_dict(
+            {"capacity_config": {"max_concurrent_external_jobs": 4, "queue_timeout_seconds": 60}}
+        )
+        self.assertEqual(config.max_concurrent_external_jobs, 4)
+        self.assertEqual(config.reserved_capacity_internal, 0.3)
+        self.assertEqual(
+            CapacityConfig.from_dict({"auto_scale_threshold": 0.5}).auto_scale_threshold, 0.5
+        )
+        self.assertEqual(CapacityConfig().default_capacity(), 15)
+        with self.assertRaises(ValueError):
+            CapacityConfig(reserved_capacity_internal=1.0)
+
+    def test_reserved_capacity_is_kept_for_internal_work(self):
+        """Test that external jobs stay out of the reserved slots and internal work goes first."""
+        external = [self.controller.submit(f"e{i}") for i in range(8)]
+        self.assertEqual([t.state for t in external].count("running"), 7)
+        self.assertEqual(external[7].state, "queued")
+        internal = [self.controller.submit(f"i{i}", internal=True) for i in range(4)]
+        self.assertEqual([t.state for t in internal], ["running"] * 3 + ["queued"])
+        self.clock.advance(30)
+        self.controller.release(external[0])
+        self.assertEqual(internal[3].state, "running")
+        self.assertEqual(internal[3].waited, 30)
+        self.assertEqual(external[7].state, "queued")
+        # Internal demand is now 4, so only 6 external slots remain.
+        self.controller.release(external[1])
+        self.assertEqual(external[7].state, "running")
+        self.assertEqual(self.controller.snapshot()["external_running"], 6)
+
+    def test_rejects_jobs_that_would_miss_the_queue_timeout(self):
+        """Test that retry_after comes from the observed service rate."""
+        for i in range(7 + 35):
+            self.controller.submit(f"e{i}")
+        with self.assertRaises(AdmissionError) as ctx:
+            self.controller.submit("late")
+        # The 36th queued job would start after 36 * 60 / 7 = 308.6s.
+        self.assertAlmostEqual(ctx.exception.retry_after, 60 / 7)
+        self.assertEqual(
+            ctx.exception.to_error(),
+            {
+                "code": "OC001",
+                "message": ctx.exception.message,
+                "retry_after": 9,
+            },
+        )
+        self.assertEqual(self.controller.stats.rejected, 1)
+        self.assertEqual(self.controller.retry_after(), ctx.exception.retry_after)
+
+    def test_service_time_is_learned(self):
+        """Test that completed external jobs update the service estimate."""
+        ticket = self.controller.submit("e")
+        self.clock.advance(10)
+        self.controller.release(ticket)
+        self.assertAlmostEqual(self.controller.service_seconds, 60 + 0.2 * (10 - 60))
+        with self.assertRaises(ValueError):
+            self.controller.release(ticket)
+
+    def test_queued_jobs_expire_at_their_deadline(self):
+        """Test that earlier deadlines are served first and passed ones are dropped."""
+        notified = []
+        for i in range(7):
+            self.controller.submit(f"e{i}")
+        late = self.controller.submit("late", notify=notified.append)
+        early = self.controller.submit("early", deadline=self.clock() + 100)
+        self.assertEqual(early.deadline, self.clock() + 100)
+        self.clock.advance(101)
+        self.assertEqual(self.controller.expire(), [early])
+        self.assertEqual(early.state, "expired")
+        self.assertEqual(self.controller.stats.expired, 1)
+        self.controller.release(self.controller.submit("i", internal=True))
+        self.assertEqual(late.state, "queued")
+        self.assertTrue(self.controller.withdraw(late))
+        self.assertFalse(self.controller.withdraw(late))
+        self.assertEqual(notified, [])
+
+    def test_load_signal_at_threshold(self):
+        """Test that crossing auto_scale_threshold signals once each way."""
+        tickets = [self.controller.submit(f"i{i}", internal=True) for i in range(9)]
+        self.assertEqual([(s.scale_up, s.load) for s in self.signals], [(True, 0.8)])
+        self.controller.release(tickets.pop())
+        self.assertEqual(len(self.signals), 1)
+        self.controller.release(tickets.pop())
+        self.assertEqual([s.scale_up for s in self.signals], [True, False])
+        self.assertEqual(self.controller.stats.scale_signals, 2)
+
+
+class TestAdmit(unittest.TestCase):
+    def test_admit_waits_for_a_slot(self):
+        """Test that a queued job is admitted when a slot frees up."""
+
+        async def scenario():
+            controller = AdmissionController(
+                CapacityConfig(max_concurrent_external_jobs=1, reserved_capacity_internal=0.0),
+                capacity=1,
+                service_seconds=0.01,
+            )
+            first = await controller.admit("first")
+            waiting = asyncio.create_task(controller.admit("second"))
+            await asyncio.sleep(0.01)
+            self.assertFalse(waiting.done())
+            controller.release(first)
+            second = await waiting
+            self.assertEqual(second.state, "running")
+
+        asyncio.run(scenario())
+
+    def test_admit_raises_after_the_deadline(self):
+        """Test that a job still queued at its deadline is turned away."""
+
+        async def scenario():
+            controller = AdmissionController(
+                CapacityConfig(
+                    max_concurrent_external_jobs=1,
+                    reserved_capacity_internal=0.0,
+                    queue_timeout_seconds=0.05,
+                ),
+                capacity=1,
+                service_seconds=0.01,
+            )
+            await controller.admit("first")
+            with self.assertRaises(AdmissionError):
+                await controller.admit("second")
+            self.assertEqual(controller.stats.expired, 1)
+            self.assertEqual(controller.snapshot()["external_waiting"], 0)
+
+        asyncio.run(scenario())
+
+
+class TestSimulation(unittest.TestCase):
+    def test_every_external_job_is_accounted_for(self):
+        """Test that external jobs are started, rejected or expired, and internal waits shrink."""
+        reserved = simulate(duration=900)
+        unreserved = simulate(
+            CapacityConfig(reserved_capacity_internal=0.0, max_concurrent_external_jobs=20),
+            duration=900,
+        )
+        for report in (reserved, unreserved):
+            external = report["external"]
+            self.assertEqual(
+                external["started"] + external["rejected"] + external["expired"],
+                external["arrived"],
+            )
+        self.assertLess(
+            reserved["internal"]["wait_seconds"]["p50"],
+            unreserved["internal"]["wait_seconds"]["p50"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
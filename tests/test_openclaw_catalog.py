@@ -0,0 +1,216 @@
+"""
+Test suite for the OpenClaw provider catalog.
+
+Reference: src/chimera/openclaw/catalog.py
+Traceability: specs/openclaw_integration.md §3.1, §3.2, §4.2, §6.1, §6.2
+"""
+
+import unittest
+
+import numpy as np
+
+from chimera.openclaw import (
+    Provider,
+    ProviderCatalog,
+    configure_catalog,
+    discover_services,
+    reputation_score,
+)
+
+CAPABILITIES = ["video_generation", "image_generation", "trend_analysis", "voice_synthesis"]
+ENTRY = {
+    "agent_id": "videomaster_001",
+    "agent_name": "VideoMaster Pro",
+    "service_id": "svc_video_gen_v2",
+    "capabilities": ["video_generation"],
+    "pricing": {"base_price": "8.00", "currency": "USDC"},
+    "reputation": {
+        "score": 0.94,
+        "total_jobs": 1523,
+        "success_rate": 0.97,
+        "avg_latency_seconds": 45.2,
+    },
+    "sla": {"max_latency_seconds": 120, "availability": 0.995},
+}
+
+
+def _providers(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        Provider(
+            agent_id=f"agent_{i // 2}",
+            service_id=f"svc_{i}",
+            capabilities=tuple(
+                CAPABILITIES[j] for j in np.flatnonzero(rng.random(len(CAPABILITIES)) < 0.4)
+            ),
+            base_price=float(rng.integers(100, 3000)) / 100,
+            completion_rate=float(rng.random()),
+            quality=float(rng.random()),
+            latency_adherence=float(rng.random()),
+            response_time=float(rng.random()),
+            dispute_rate=float(rng.random() / 5),
+            avg_latency_seconds=float(rng.random() * 100),
+            sla_max_latency_seconds=60.0,
+            sla_availability=float(rng.random()),
+        )
+        for i in range(n)
+    ]
+
+
+def _reference(catalog, capability, min_reputation, budget_max, limit):
+    """Scan every provider and sort in Python, from the catalog's current values."""
+    table = catalog._table
+    matches = []
+    for service_id, row in catalog._by_service.items():
+        provider, values = catalog._providers[row], table[row]
+        if capability is not None and capability not in provider.capabilities:
+            continue
+        if values["score"] < min_reputation:
+            continue
+        if budget_max is not None and values["price"] > budget_max:
+            continue
+        key = (
+            -values["score"],
+            -values["completion_rate"],
+            values["avg_latency"],
+            -values["availability"],
+            values["price"],
+        )
+        matches.append((key, service_id))
+    matches.sort()
+    return [service_id for _, service_id in matches[:limit]], len(matches)
+
+
+class TestProvider(unittest.TestCase):
+    def test_from_dict(self):
+        """Test reading a §3.2 entry, and that a score-only entry keeps its score."""
+        provider = Provider.from_dict(ENTRY)
+        self.assertEqual(provider.base_price, 8.0)
+        self.assertEqual(provider.completion_rate, 0.97)
+        score_only = Provider.from_dict({**ENTRY, "reputation": {"score": 0.94}})
+        self.assertAlmostEqual(score_only.score, 0.94)
+        self.assertAlmostEqual(
+            provider.score, reputation_score(0.97, 0.94, 0.94, 0.94, 0.06), places=12
+        )
+
+
+class TestProviderCatalog(unittest.TestCase):
+    def setUp(self):
+        self.catalog = ProviderCatalog(initial_capacity=4)
+        self.catalog.register_many(_providers(1500))
+
+    def _check(self, queries):
+        for query in queries:
+            expected, total = _reference(self.catalog, *query)
+            capability, min_reputation, budget_max, limit = query
+            data = self.catalog.discover(
+                capability, min_reputation=min_reputation, budget_max=budget_max, limit=limit
+            )
+            self.assertEqual(data["total_results"], total, query)
+            self.assertEqual([p["service_id"] for p in data["providers"]], expected, query)
+
+    def test_discover_matches_reference(self):
+        """Test every query plan against a full scan, before and after updates."""
+        queries = [
+            ("video_generation", 0.0, None, 5),
+            ("image_generation", 0.6, 12.0, 10),
+            ("trend_analysis", 0.0, 1.5, 3),
+            (None, 0.7, None, 20),
+            (None, 0.0, 2.0, 1000),
+            ("voice_synthesis", 0.99, None, 5),
+            ("unknown", 0.0, None, 5),
+        ]
+        self._check(queries)
+
+        rng = np.random.default_rng(1)
+        for i in range(300):
+            agent_id = f"agent_{rng.integers(0, 750)}"
+            if i % 2:
+                self.catalog.record_rating(
+                    agent_id, {"rating": {"quality": int(rng.integers(0, 6)), "speed": 5}}
+                )
+            else:
+                self.catalog.record_job(
+                    agent_id,
+                    {"status": "completed", "metrics": {"actual_latency_seconds": 90.0}},
+                )
+        self.assertTrue(self.catalog.remove("svc_3"))
+        self.catalog.register(Provider("agent_new", "svc_7", ("video_generation",), 0.5))
+        self.catalog.register(Provider("agent_new", "svc_new", ("trend_analysis",), 0.6))
+        self._check(queries)
+        self.assertGreater(self.catalog.stats.resorts, 0)
+        self.assertEqual(len(self.catalog), 1500)
+
+    def test_cache_invalidated_per_capability(self):
+        """Test that an event only invalidates answers for the provider's capabilities."""
+        video = Provider("video_agent", "svc_video", ("video_generation",), 5.0, quality=0.0)
+        self.catalog.register(video)
+        self.catalog.discover("video_generation")
+        self.catalog.discover("image_generation")
+        self.catalog.record_rating("video_agent", {"rating": {"quality": 5, "speed": 5}})
+        self.catalog.discover("image_generation")
+        self.assertEqual(self.catalog.stats.cache_hits, 1)
+        data = self.catalog.discover("video_generation", limit=1500)
+        self.assertEqual(self.catalog.stats.cache_hits, 1)
+        entry = next(p for p in data["providers"] if p["service_id"] == "svc_video")
+        self.assertGreater(entry["reputation"]["score"], video.score)
+
+    def test_answers_are_copies(self):
+        """Test that editing an answer does not change later (cached) answers."""
+        first = self.catalog.discover(None)
+        first["providers"][0]["pricing"]["base_price"] = "0.00"
+        first["providers"].clear()
+        first["total_results"] = -1
+        second = self.catalog.discover(None)
+        self.assertEqual(self.catalog.stats.cache_hits, 1)
+        self.assertEqual(second["total_results"], 1500)
+        self.assertEqual(len(second["providers"]), 10)
+        self.assertNotEqual(second["providers"][0]["pricing"]["base_price"], "0.00")
+        with self.assertRaises(ValueError):
+            self.catalog.discover(None, limit=0)
+
+    def test_events(self):
+        """Test §4.2 job updates and §6.2 ratings as running means."""
+        self.catalog.register(Provider.from_dict(ENTRY))
+        self.catalog.record_job(
+            "videomaster_001",
+            {"status": "failed", "metrics": {"actual_latency_seconds": 240.0}},
+        )
+        self.catalog.record_job("videomaster_001", {"status": "in_progress"})
+        entry = self.catalog.discover("video_generation", min_reputation=0.0, limit=1500)
+        (entry,) = [p for p in entry["providers"] if p["service_id"] == "svc_video_gen_v2"]
+        self.assertEqual(entry["reputation"]["total_jobs"], 1524)
+        self.assertAlmostEqual(entry["reputation"]["success_rate"], 0.97 * 1523 / 1524, places=4)
+        self.assertEqual(entry["pricing"], {"base_price": "8.00", "currency": "USDC"})
+        with self.assertRaises(KeyError):
+            self.catalog.record_rating("nobody", {"rating": {"quality": 5}})
+
+
+class TestDiscoverServices(unittest.TestCase):
+    def tearDown(self):
+        configure_catalog(None)
+
+    def test_tool(self):
+        """Test the §3.1 request and §3.2 response shapes."""
+        with self.assertRaises(RuntimeError):
+            discover_services({"capability": "video_generation"})
+        catalog = ProviderCatalog()
+        catalog.register(Provider.from_dict(ENTRY))
+        configure_catalog(catalog)
+        params = {
+            "capability": "video_generation",
+            "requirements": {"min_reputation": 0.85},
+            "budget_max": "15.00",
+            "currency": "USDC",
+        }
+        response = discover_services(params)
+        self.assertTrue(response["success"])
+        self.assertEqual(response["data"]["total_results"], 1)
+        self.assertEqual(response["data"]["providers"][0]["sla"]["availability"], 0.995)
+        self.assertEqual(
+            discover_services({**params, "budget_max": "7.99"})["data"]["providers"], []
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
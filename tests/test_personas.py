@@ -0,0 +1,125 @@
+"""
+Test suite for the persona registry.
+
+Reference: src/chimera/personas.py
+Traceability: specs/technical.md §1.2 (persona_alignment), src/chimera/judge.py (min_alignment)
+"""
+
+import unittest
+
+import numpy as np
+
+from chimera.judge import Thresholds
+from chimera.personas import NEUTRAL, Persona, PersonaRegistry, configure_registry, get_registry
+from skills.content_generator import FakeBackend, generate_content
+from skills.engagement_manager import FakeReplyGenerator, ReplyPipeline
+from tests.helpers import content_input
+
+FASHION = Persona(
+    "chimera_fashion_001",
+    ("witty", "sustainability-focused"),
+    vocabulary=("capsule wardrobe",),
+    avoid=("politics",),
+)
+TEXTS = [
+    "Thank you so much!",
+    "Thrifted this jacket, honestly so sustainable lol #CapsuleWardrobe",
+    "Who are you voting for? Politics time",
+]
+
+
+class TestPersona(unittest.TestCase):
+    def test_from_constraints(self):
+        """Test that 'never' constraints become avoid topics, and the id ignores order."""
+        persona = Persona.from_constraints(["Witty", "Never discuss politics"])
+        self.assertEqual(persona.voice_traits, ("witty",))
+        self.assertEqual(persona.avoid, ("politics",))
+        self.assertEqual(
+            persona.persona_id,
+            Persona.from_constraints(["never discuss politics", "witty"]).persona_id,
+        )
+
+
+class TestPersonaRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = PersonaRegistry(capacity=1)
+        self.registry.register(FASHION)
+
+    def test_scores(self):
+        """Test neutral, on-voice and avoided-topic text against the Judge threshold."""
+        neutral, on_voice, avoided = self.registry.score(FASHION.persona_id, TEXTS)
+        self.assertAlmostEqual(neutral, NEUTRAL, places=6)
+        self.assertGreater(on_voice, 0.9)
+        self.assertLess(avoided, Thresholds().min_alignment)
+        with self.assertRaises(KeyError):
+            self.registry.score("unknown", TEXTS)
+
+    def test_vectors_rebuilt_only_on_change(self):
+        """Test that re-registering an unchanged persona is a no-op, and a change rebuilds."""
+        self.assertFalse(self.registry.register(Persona.from_dict(FASHION.__dict__)))
+        self.assertEqual(self.registry.stats.builds, 1)
+        self.assertEqual(self.registry.stats.unchanged, 1)
+
+        before = self.registry.score(FASHION.persona_id, TEXTS)
+        self.assertTrue(self.registry.register(Persona(FASHION.persona_id, avoid=("jacket",))))
+        after = self.registry.score(FASHION.persona_id, TEXTS)
+        self.assertEqual(len(self.registry), 1)
+        self.assertLess(after[1], before[1])
+        self.assertGreater(after[2], before[2])
+
+    def test_batch_matches_per_item(self):
+        """Test mixed-persona batches, array growth and row reuse."""
+        other = Persona("chimera_tech_001", ("technical",), avoid=("crypto",))
+        self.registry.register(other)
+        self.registry.register(Persona("temporary"))
+        self.assertTrue(self.registry.remove("temporary"))
+        self.registry.register(Persona("reused", ("empathetic",)))
+        self.assertEqual(len(self.registry), 3)
+
+        ids = [FASHION.persona_id, other.persona_id, "reused"] * len(TEXTS)
+        texts = [text for text in TEXTS for _ in range(3)]
+        batched = self.registry.score_pairs(ids, texts)
+        single = [self.registry.score(p, [t])[0] for p, t in zip(ids, texts, strict=True)]
+        np.testing.assert_allclose(batched, single, rtol=1e-6)
+
+
+class TestSkillIntegration(unittest.TestCase):
+    def setUp(self):
+        configure_registry(None)
+
+    def tearDown(self):
+        configure_registry(None)
+
+    def test_content_alignment_from_constraints(self):
+        """Test that generated content is scored against its persona_constraints."""
+        request = content_input("Politics", persona_constraints=["Witty", "Never discuss politics"])
+        result = generate_content(request, backend=FakeBackend())
+        self.assertLess(result["metadata"]["persona_alignment"], Thresholds().min_alignment)
+        self.assertEqual(get_registry().stats.builds, 1)
+        generate_content(content_input("Fashion"), backend=FakeBackend())
+        self.assertEqual(get_registry().stats.builds, 2)
+
+    def test_replies_scored_for_registered_personas(self):
+        """Test that replies use the registry for registered personas only."""
+        get_registry().register(Persona("chimera_fashion_001", ("witty",)))
+        pipeline = ReplyPipeline(FakeReplyGenerator())
+        items = pipeline.process(
+            [
+                {
+                    "skill_name": "engagement_manager",
+                    "parameters": {
+                        "action": "reply",
+                        "platform": "instagram",
+                        "comment_text": "Nice fit",
+                        "persona_id": persona_id,
+                    },
+                }
+                for persona_id in ("chimera_fashion_001", "unregistered")
+            ]
+        )
+        alignments = [item.output["metadata"]["persona_alignment"] for item in items]
+        self.assertEqual(alignments, [NEUTRAL, 0.9])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,202 @@
+"""
+Test suite for per-platform rate limiting and the delay queue.
+
+Reference: src/chimera/ratelimit.py
+Traceability: specs/technical.md §1.1 (RATE_LIMITED), §6.2 (publication rate)
+"""
+
+import asyncio
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from chimera.ratelimit import (
+    DEFAULT_LIMITS,
+    DelayQueue,
+    Limit,
+    MemoryStore,
+    RateLimiter,
+    RateLimitError,
+    SQLiteStore,
+)
+from tests.helpers import FakeClock
+
+
+class TestLimit(unittest.TestCase):
+    """Test limit construction and lookup."""
+
+    def test_per(self):
+        """Test rate and burst derived from a count per period."""
+        limit = Limit.per(60, 60, burst=120)
+        self.assertEqual(limit.rate, 1.0)
+        self.assertEqual(limit.burst, 120)
+        with self.assertRaises(ValueError):
+            Limit(0, 1)
+
+    def test_lookup_falls_back_to_wildcards(self):
+        """Test the (platform, action) -> wildcard lookup order."""
+        limiter = RateLimiter({**DEFAULT_LIMITS, ("twitter", "reply"): Limit(1, 1)})
+        self.assertEqual(limiter.limit_for("twitter", "reply"), Limit(1, 1))
+        self.assertEqual(limiter.limit_for("instagram", "dm"), DEFAULT_LIMITS["instagram", "*"])
+        self.assertEqual(limiter.limit_for("mastodon", "publish"), Limit.per(60, 60, burst=120))
+        self.assertEqual(limiter.limit_for("mastodon", "boost"), Limit.per(60, 60))
+        with self.assertRaises(KeyError):
+            RateLimiter({}).limit_for("x", "like")
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test token bucket behaviour."""
+
+    def setUp(self):
+        self.clock = FakeClock(1000.0)
+        self.limiter = RateLimiter(
+            {("*", "publish"): Limit(1.0, 3), ("*", "*"): Limit(1.0, 1)}, clock=self.clock
+        )
+
+    def test_burst_then_refill(self):
+        """Test that the burst is allowed and tokens refill at the rate."""
+        for _ in range(3):
+            self.assertEqual(self.limiter.try_acquire("twitter", "a", "publish"), 0.0)
+        self.assertAlmostEqual(self.limiter.try_acquire("twitter", "a", "publish"), 1.0)
+        self.clock.now += 1.0
+        self.assertEqual(self.limiter.try_acquire("twitter", "a", "publish"), 0.0)
+
+    def test_buckets_are_per_platform_account_action(self):
+        """Test that exhausting one bucket leaves the others untouched."""
+        for _ in range(3):
+            self.limiter.acquire("twitter", "a", "publish")
+        with self.assertRaises(RateLimitError) as ctx:
+            self.limiter.acquire("twitter", "a", "publish")
+        self.assertEqual(ctx.exception.to_error()["code"], "RATE_LIMITED")
+        self.assertEqual(ctx.exception.to_error()["retry_after"], 1)
+        self.limiter.acquire("twitter", "b", "publish")
+        self.limiter.acquire("threads", "a", "publish")
+        self.limiter.acquire("twitter", "a", "reply")
+
+    def test_reserve_schedules_future_slots(self):
+        """Test that reservations queue up one interval apart."""
+        delays = [self.limiter.reserve("twitter", "a", "publish") for _ in range(5)]
+        self.assertEqual(delays[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(delays[3], 1.0)
+        self.assertAlmostEqual(delays[4], 2.0)
+        with self.assertRaises(RateLimitError):
+            self.limiter.reserve("twitter", "a", "publish", max_delay=1.0)
+        # The rejected reservation took nothing.
+        self.assertAlmostEqual(self.limiter.reserve("twitter", "a", "publish"), 3.0)
+
+    def test_penalize_holds_bucket(self):
+        """Test that a platform retry_after blocks the bucket until it passes."""
+        self.limiter.penalize("twitter", "a", "publish", 30)
+        self.assertAlmostEqual(self.limiter.try_acquire("twitter", "a", "publish"), 30.0)
+        self.clock.now += 30
+        self.assertEqual(self.limiter.try_acquire("twitter", "a", "publish"), 0.0)
+
+    def test_threads_never_exceed_burst(self):
+        """Test the in-memory store under concurrent acquisition."""
+        limiter = RateLimiter({("*", "*"): Limit(1e-6, 100)}, clock=self.clock)
+        granted = []
+
+        def worker():
+            for _ in range(100):
+                granted.append(limiter.try_acquire("x", "a", "like") == 0.0)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sum(granted), 100)
+
+    def test_memory_store_prune(self):
+        """Test that refilled buckets are forgotten."""
+        store = MemoryStore()
+        limiter = RateLimiter({("*", "*"): Limit(1.0, 5)}, store=store, clock=self.clock)
+        limiter.acquire("x", "a", "like")
+        self.assertEqual(store.prune(self.clock.now), 0)
+        self.assertEqual(store.prune(self.clock.now + 1), 1)
+
+
+class TestSQLiteStore(unittest.TestCase):
+    """Test a bucket shared by several limiter instances (worker replicas)."""
+
+    def test_replicas_share_budget(self):
+        """Test that five workers on one file share one bucket."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "buckets.db"
+            clock = FakeClock(1000.0)
+            stores = [SQLiteStore(path) for _ in range(5)]
+            workers = [
+                RateLimiter({("*", "publish"): Limit(1.0, 10)}, store=store, clock=clock)
+                for store in stores
+            ]
+            granted = sum(
+                worker.try_acquire("instagram", "acct", "publish") == 0.0
+                for _ in range(4)
+                for worker in workers
+            )
+            self.assertEqual(granted, 10)
+            workers[0].penalize("instagram", "acct", "publish", 60)
+            clock.now += 30
+            self.assertGreater(workers[4].try_acquire("instagram", "acct", "publish"), 0)
+            for store in stores:
+                store.close()
+
+
+class TestDelayQueue(unittest.IsolatedAsyncioTestCase):
+    """Test scheduling at the earliest permitted time."""
+
+    async def test_actions_run_in_slot_order(self):
+        """Test that over-limit actions are delayed rather than rejected."""
+        limiter = RateLimiter({("*", "publish"): Limit(50.0, 2)})
+        queue = DelayQueue(limiter)
+        loop = asyncio.get_running_loop()
+        started = []
+
+        async def publish(n):
+            started.append((n, loop.time()))
+            return n
+
+        futures = [queue.submit("twitter", "a", "publish", publish, n) for n in range(5)]
+        self.assertEqual(await asyncio.gather(*futures), [0, 1, 2, 3, 4])
+        self.assertEqual([n for n, _ in started], [0, 1, 2, 3, 4])
+        self.assertGreaterEqual(started[4][1] - started[0][1], 0.05)
+        self.assertEqual(queue.stats.delayed, 3)
+        self.assertEqual(queue.stats.completed, 5)
+
+    async def test_platform_rate_limit_is_retried(self):
+        """Test that a RateLimitError action is rescheduled after retry_after."""
+        limiter = RateLimiter({("*", "*"): Limit(1000.0, 10)})
+        queue = DelayQueue(limiter, max_retries=1)
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RateLimitError("429", 0.02)
+            return "ok"
+
+        self.assertEqual(await queue.submit("tiktok", "a", "like", flaky), "ok")
+        self.assertEqual(queue.stats.retried, 1)
+
+        def always_limited():
+            raise RateLimitError("429", 0.01)
+
+        with self.assertRaises(RateLimitError):
+            await queue.submit("tiktok", "b", "like", always_limited)
+        self.assertEqual(queue.stats.failed, 1)
+
+    async def test_rejects_beyond_max_delay(self):
+        """Test that actions too far in the future are refused up front."""
+        limiter = RateLimiter({("*", "*"): Limit(1.0, 1)})
+        queue = DelayQueue(limiter, max_delay=0.5)
+        first = queue.submit("x", "a", "like", lambda: 1)
+        with self.assertRaises(RateLimitError):
+            queue.submit("x", "a", "like", lambda: 2)
+        self.assertEqual(await first, 1)
+        await queue.drain()
+        self.assertEqual(queue.stats.rejected, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
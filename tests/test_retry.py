@@ -0,0 +1,280 @@
+"""
+Test suite for the retry executor, circuit breakers and retry budget.
+
+Reference: src/chimera/retry.py
+Traceability: specs/openclaw_integration.md §9.1, §9.2
+"""
+
+import asyncio
+import random
+import time
+import unittest
+
+from chimera.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryBudget,
+    RetryExecutor,
+    RetryPolicy,
+)
+from tests.helpers import FakeClock
+
+FAST = RetryPolicy(initial_delay_seconds=0.001, max_delay_seconds=0.004)
+
+
+class OpenClawError(Exception):
+    def __init__(self, code: str, retry_after: float = 0.0):
+        super().__init__(code)
+        self.code = code
+        self.retry_after = retry_after
+
+
+class FlakyDependency:
+    """Local stand-in that fails its first ``failures`` calls with ``error``."""
+
+    def __init__(self, failures: int = 0, error: Exception | None = None):
+        self.failures = failures
+        self.error = error if error is not None else OpenClawError("OC001")
+        self.calls = 0
+
+    async def __call__(self, value: int) -> int:
+        self.calls += 1
+        await asyncio.sleep(0)
+        if self.calls <= self.failures:
+            raise self.error
+        return value * 2
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_from_dict(self):
+        """Test that the §9.2 block is read with or without its wrapper."""
+        policy = RetryPolicy.from_dict(
+            {
+                "retry_policy": {
+                    "max_retries": 5,
+                    "backoff_type": "exponential",
+                    "initial_delay_seconds": 1,
+                    "max_delay_seconds": 60,
+                    "retryable_errors": ["OC001"],
+                }
+            }
+        )
+        self.assertEqual(policy.max_retries, 5)
+        self.assertEqual(policy.retryable_errors, frozenset({"OC001"}))
+        self.assertEqual(RetryPolicy.from_dict({}), RetryPolicy())
+        with self.assertRaises(ValueError):
+            RetryPolicy(backoff_type="linear")
+
+    def test_jittered_exponential_delay(self):
+        """Test that delays double from 5s, are jittered, and stop at 300s."""
+        policy = RetryPolicy()
+        rng = random.Random(1)
+        for retry, ceiling in [(0, 5), (1, 10), (2, 20), (6, 300), (20, 300)]:
+            delays = [policy.delay(retry, rng) for _ in range(200)]
+            self.assertTrue(all(ceiling / 2 <= d <= ceiling for d in delays))
+            self.assertGreater(max(delays) - min(delays), ceiling / 4)
+
+    def test_retryable(self):
+        """Test that OC001/OC005, timeouts and connection errors are retryable."""
+        policy = RetryPolicy()
+        self.assertTrue(policy.is_retryable(OpenClawError("OC005")))
+        self.assertTrue(policy.is_retryable(TimeoutError()))
+        self.assertTrue(policy.is_retryable(ConnectionResetError()))
+        self.assertFalse(policy.is_retryable(OpenClawError("OC004")))
+        self.assertFalse(policy.is_retryable(ValueError()))
+        self.assertFalse(policy.is_retryable(CircuitOpenError("escrow", 1.0)))
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_open_half_open_closed(self):
+        """Test that failures open the breaker and one probe closes it."""
+        clock = FakeClock()
+        breaker = CircuitBreaker("escrow", failure_threshold=2, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "closed")
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "open")
+        clock.advance(4)
+        with self.assertRaises(CircuitOpenError) as ctx:
+            breaker.before_call()
+        self.assertEqual(ctx.exception.retry_after, 6)
+        clock.advance(6)
+        self.assertEqual(breaker.state, "half_open")
+        breaker.before_call()
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "open")
+        clock.advance(10)
+        breaker.before_call()
+        breaker.record_success()
+        self.assertEqual(
+            breaker.snapshot(),
+            {"state": "closed", "consecutive_failures": 0, "opened": 2, "rejected": 2},
+        )
+
+
+class TestRetryBudget(unittest.TestCase):
+    def test_budget_refills_from_requests_and_time(self):
+        """Test that retries are limited to a share of requests plus a trickle."""
+        clock = FakeClock()
+        budget = RetryBudget(0.5, min_per_second=0.1, burst=2, clock=clock)
+        self.assertTrue(budget.try_spend())
+        self.assertTrue(budget.try_spend())
+        self.assertFalse(budget.try_spend())
+        budget.deposit()
+        budget.deposit()
+        self.assertTrue(budget.try_spend())
+        clock.advance(10)
+        self.assertTrue(budget.try_spend())
+        self.assertFalse(budget.try_spend())
+
+
+class TestRetryExecutor(unittest.TestCase):
+    def run_async(self, coro):
+        return asyncio.run(coro)
+
+    def test_retries_until_success(self):
+        """Test that retryable failures are retried and counted."""
+
+        async def scenario():
+            executor = RetryExecutor(FAST, seed=1)
+            dependency = FlakyDependency(failures=2)
+            self.assertEqual(await executor.call("trends", dependency, 21), 42)
+            self.assertEqual(dependency.calls, 3)
+            snapshot = executor.snapshot()
+            self.assertEqual(snapshot["retries"], 2)
+            self.assertEqual(snapshot["dependencies"]["trends"]["succeeded"], 1)
+            self.assertEqual(snapshot["dependencies"]["trends"]["breaker"]["state"], "closed")
+
+        self.run_async(scenario())
+
+    def test_gives_up(self):
+        """Test that non-retryable errors fail at once and retries run out."""
+
+        async def scenario():
+            executor = RetryExecutor(FAST, seed=1)
+            refused = FlakyDependency(failures=9, error=OpenClawError("OC004"))
+            with self.assertRaises(OpenClawError):
+                await executor.call("quality", refused, 1)
+            self.assertEqual(refused.calls, 1)
+            down = FlakyDependency(failures=9)
+            with self.assertRaises(OpenClawError):
+                await executor.call("escrow", down, 1)
+            self.assertEqual(down.calls, 4)
+            self.assertEqual(executor.stats.failed, 2)
+
+        self.run_async(scenario())
+
+    def test_honours_retry_after(self):
+        """Test that an error's retry_after stretches the backoff."""
+
+        async def scenario():
+            executor = RetryExecutor(FAST, seed=1)
+            dependency = FlakyDependency(failures=1, error=OpenClawError("OC001", 0.05))
+            start = time.perf_counter()
+            await executor.call("provider", dependency, 1)
+            self.assertGreaterEqual(time.perf_counter() - start, 0.05)
+
+        self.run_async(scenario())
+
+    def test_timeouts_are_retried(self):
+        """Test that an attempt over its timeout is retried."""
+
+        async def scenario():
+            executor = RetryExecutor(FAST, seed=1)
+            calls = []
+
+            async def slow_once():
+                calls.append(1)
+                if len(calls) == 1:
+                    await asyncio.sleep(1)
+                return "ok"
+
+            self.assertEqual(await executor.call("slow", slow_once, timeout=0.02), "ok")
+            self.assertEqual(len(calls), 2)
+
+        self.run_async(scenario())
+
+    def test_open_breaker_fails_fast(self):
+        """Test that a failing upstream stops being called once its breaker opens."""
+
+        async def scenario():
+            executor = RetryExecutor(
+                RetryPolicy(max_retries=0),
+                breaker_factory=lambda name: CircuitBreaker(name, failure_threshold=3),
+            )
+            dependency = FlakyDependency(failures=100, error=ConnectionError())
+            results = [
+                await asyncio.gather(executor.call("source", dependency, 1), return_exceptions=True)
+                for _ in range(10)
+            ]
+            errors = [type(result[0]) for result in results]
+            self.assertEqual(errors, [ConnectionError] * 3 + [CircuitOpenError] * 7)
+            self.assertEqual(dependency.calls, 3)
+            breaker = executor.snapshot()["dependencies"]["source"]
+            self.assertEqual(breaker["breaker_rejected"], 7)
+            self.assertEqual(breaker["breaker"]["state"], "open")
+
+        self.run_async(scenario())
+
+    def test_budget_prevents_retry_storms(self):
+        """Test that an outage across many calls spends only the retry budget."""
+
+        async def scenario():
+            budget = RetryBudget(0.1, min_per_second=0, burst=5)
+            executor = RetryExecutor(
+                FAST,
+                budget=budget,
+                breaker_factory=lambda name: CircuitBreaker(name, failure_threshold=10_000),
+            )
+            dependency = FlakyDependency(failures=10_000)
+            futures = [executor.submit("escrow", dependency, i) for i in range(100)]
+            await asyncio.gather(*futures, return_exceptions=True)
+            self.assertLessEqual(executor.stats.retries, 5 + 10)
+            self.assertGreater(executor.stats.budget_exhausted, 80)
+            self.assertEqual(dependency.calls, 100 + executor.stats.retries)
+
+        self.run_async(scenario())
+
+    def test_pending_retries_share_one_timer(self):
+        """Test that waiting retries are heap entries, not sleeping tasks."""
+
+        async def scenario():
+            executor = RetryExecutor(
+                RetryPolicy(initial_delay_seconds=0.05, max_delay_seconds=0.05),
+                budget=RetryBudget(1.0, burst=1000),
+                breaker_factory=lambda name: CircuitBreaker(name, failure_threshold=10_000),
+            )
+            dependency = FlakyDependency(failures=1000)
+            futures = [executor.submit("source", dependency, i) for i in range(1000)]
+            await asyncio.sleep(0.01)
+            self.assertEqual(len(executor), 1000)
+            self.assertLessEqual(len(asyncio.all_tasks()), 3)
+            dependency.failures = 0
+            results = await asyncio.gather(*futures)
+            self.assertEqual(results, [i * 2 for i in range(1000)])
+
+        self.run_async(scenario())
+
+    def test_sync_callables_run_in_threads(self):
+        """Test that plain functions are retried too."""
+
+        async def scenario():
+            executor = RetryExecutor(FAST)
+            attempts = []
+
+            def lookup(key):
+                attempts.append(key)
+                if len(attempts) < 2:
+                    raise TimeoutError
+                return key.upper()
+
+            self.assertEqual(await executor.call("db", lookup, "k"), "K")
+            await executor.drain()
+
+        self.run_async(scenario())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,237 @@
+"""
+Test suite for the asyncio task runtime.
+
+Reference: src/chimera/runtime/
+Traceability: specs/technical.md §3.1 (Task Queue Message), §6.2, §6.3
+"""
+
+import asyncio
+import threading
+import unittest
+
+from chimera.runtime import (
+    Priority,
+    QueueFullError,
+    Task,
+    TaskQueue,
+    WorkerPool,
+    skill_input,
+)
+from chimera.runtime.loadgen import generate_load, synthetic_handler
+from skills.content_generator import FakeBackend, configure_backend
+
+
+class TestTask(unittest.TestCase):
+    """Test task records and Task Queue messages."""
+
+    def test_message_round_trip(self):
+        """Test conversion to and from the §3.1 message."""
+        task = Task("generate_content", {"topic": "x"}, priority="high", timeout_seconds=30)
+        again = Task.from_message(task.to_message())
+        self.assertEqual(again, task)
+        self.assertEqual(task.to_message()["priority"], 2)
+
+    def test_priority_parse(self):
+        """Test names, integers and invalid values."""
+        self.assertEqual(Priority.parse("critical"), Priority.CRITICAL)
+        self.assertEqual(Priority.parse(1), Priority.MEDIUM)
+        with self.assertRaises(ValueError):
+            Priority.parse("urgent")
+        with self.assertRaises(ValueError):
+            Task("x", timeout_seconds=0)
+
+    def test_skill_input(self):
+        """Test that §3.1 payloads become skill inputs."""
+        converted = skill_input(
+            "content_generator",
+            {"topic": "t", "platform": "twitter", "parameters": {"content_type": "text"}},
+        )
+        self.assertEqual(
+            converted,
+            {
+                "skill_name": "content_generator",
+                "parameters": {"content_type": "text", "topic": "t", "platform": "twitter"},
+            },
+        )
+        already = {"skill_name": "trend_fetcher", "parameters": {}}
+        self.assertIs(skill_input("trend_fetcher", already), already)
+
+
+class TestTaskQueue(unittest.IsolatedAsyncioTestCase):
+    """Test priority order, admission control and backpressure."""
+
+    async def test_priority_then_fifo(self):
+        """Test that higher priorities come first, FIFO within a priority."""
+        queue = TaskQueue(10)
+        for name, priority in [("a", "low"), ("b", "critical"), ("c", "low"), ("d", "high")]:
+            queue.put_nowait(Task(name, priority=priority))
+        order = [(await queue.get()).task.type for _ in range(4)]
+        self.assertEqual(order, ["b", "d", "a", "c"])
+
+    async def test_rejects_at_depth_limit(self):
+        """Test that new tasks are rejected once the queue is full."""
+        queue = TaskQueue(2)
+        queue.put_nowait(Task("a"))
+        queue.put_nowait(Task("b"))
+        with self.assertRaises(QueueFullError):
+            queue.put_nowait(Task("c"))
+        with self.assertRaises(QueueFullError):
+            await queue.put(Task("c"), timeout=0.01)
+        self.assertEqual(queue.stats.rejected, 2)
+
+    async def test_backpressure_hysteresis(self):
+        """Test that pressure starts at the high watermark and ends at the low one."""
+        queue = TaskQueue(10, high_watermark=0.8, low_watermark=0.5)
+        for _ in range(7):
+            queue.put_nowait(Task("x"))
+        self.assertFalse(queue.under_pressure)
+        queue.put_nowait(Task("x"))
+        self.assertTrue(queue.under_pressure)
+        relieved = asyncio.ensure_future(queue.relieved())
+        for _ in range(2):
+            await queue.get()
+        self.assertTrue(queue.under_pressure)
+        await queue.get()
+        await asyncio.wait_for(relieved, 1)
+        self.assertFalse(queue.under_pressure)
+        self.assertEqual(queue.stats.pressure_events, 1)
+
+
+class TestWorkerPool(unittest.IsolatedAsyncioTestCase):
+    """Test dispatch, timeouts, failures and the result hook."""
+
+    async def test_dispatch_and_result_hook(self):
+        """Test async and sync handlers and the Judge hook."""
+        judged = []
+
+        async def double(payload):
+            return payload["n"] * 2
+
+        async with WorkerPool(
+            {"double": double, "square": lambda payload: payload["n"] ** 2},
+            on_result=judged.append,
+        ) as pool:
+            first = await pool.run(Task("double", {"n": 3}))
+            second = await pool.run(Task("square", {"n": 4}))
+        self.assertEqual((first.output, second.output), (6, 16))
+        self.assertTrue(first.ok)
+        self.assertEqual(len(judged), 2)
+        self.assertFalse(pool.running)
+
+    async def test_timeout_and_failure(self):
+        """Test that timeouts and exceptions become results, not crashes."""
+
+        async def slow(payload):
+            await asyncio.sleep(1)
+
+        def broken(payload):
+            raise ValueError("bad payload")
+
+        async with WorkerPool({"slow": slow, "broken": broken}) as pool:
+            timed_out = await pool.run(Task("slow", timeout_seconds=0.01))
+            failed = await pool.run(Task("broken"))
+        self.assertEqual(timed_out.status, "timeout")
+        self.assertEqual(failed.status, "failed")
+        self.assertIn("bad payload", failed.error)
+        snapshot = pool.snapshot()
+        self.assertEqual((snapshot["timed_out"], snapshot["failed"]), (1, 1))
+
+    async def test_overrunning_sync_handler_does_not_starve_threads(self):
+        """Test that a sync handler past its timeout hands its slot to a spare thread."""
+        release = threading.Event()
+        self.addCleanup(release.set)
+        handlers = {"stuck": lambda payload: release.wait(5), "quick": lambda payload: "ok"}
+
+        async with WorkerPool(handlers, concurrency=2, thread_workers=1) as pool:
+            stuck = await pool.run(Task("stuck", timeout_seconds=0.05))
+            quick = await pool.run(Task("quick", timeout_seconds=1))
+            self.assertEqual((stuck.status, quick.status), ("timeout", "completed"))
+            self.assertEqual(pool.snapshot()["threads_abandoned_now"], 1)
+            release.set()
+            await asyncio.sleep(0.05)
+            self.assertEqual(pool.snapshot()["threads_abandoned_now"], 0)
+        self.assertEqual(pool.stats.threads_abandoned, 1)
+
+    async def test_overruns_beyond_spares_hold_their_slot(self):
+        """Test that with no spare threads the slot is only freed when the thread ends."""
+        release = threading.Event()
+        self.addCleanup(release.set)
+        handlers = {"stuck": lambda payload: release.wait(5), "quick": lambda payload: "ok"}
+
+        async with WorkerPool(handlers, thread_workers=1, spare_threads=0) as pool:
+            await pool.run(Task("stuck", timeout_seconds=0.05))
+            blocked = await pool.run(Task("quick", timeout_seconds=0.05))
+            self.assertEqual(blocked.status, "timeout")
+            release.set()
+            later = await pool.run(Task("quick", timeout_seconds=1))
+            self.assertEqual(later.status, "completed")
+
+    async def test_unknown_type_rejected_at_submit(self):
+        """Test that tasks without a handler never enter the queue."""
+        pool = WorkerPool({})
+        with self.assertRaises(KeyError):
+            pool.submit_nowait(Task("nope"))
+        await pool.close()
+
+    async def test_priority_under_load(self):
+        """Test that a critical task overtakes queued low-priority work."""
+        order = []
+
+        async def record(payload):
+            order.append(payload["name"])
+
+        pool = WorkerPool({"record": record}, concurrency=1)
+        futures = [pool.submit_nowait(Task("record", {"name": f"low{i}"}, "low")) for i in range(3)]
+        futures.append(pool.submit_nowait(Task("record", {"name": "urgent"}, "critical")))
+        await asyncio.gather(*futures)
+        await pool.close()
+        self.assertEqual(order[0], "urgent")
+
+    async def test_close_without_drain(self):
+        """Test that queued tasks fail when the runtime closes without draining."""
+
+        async def slow(payload):
+            await asyncio.sleep(1)
+
+        pool = WorkerPool({"slow": slow}, concurrency=1)
+        futures = [pool.submit_nowait(Task("slow")) for _ in range(3)]
+        await asyncio.sleep(0)
+        await pool.close(drain=False)
+        results = await asyncio.gather(*futures)
+        self.assertTrue(all(result.status == "failed" for result in results))
+
+    async def test_skill_entry_points(self):
+        """Test default dispatch to the skills."""
+        configure_backend(FakeBackend())
+        try:
+            async with WorkerPool() as pool:
+                result = await pool.run(
+                    Task(
+                        "generate_content",
+                        {
+                            "topic": "Denim",
+                            "platform": "instagram",
+                            "parameters": {"content_type": "text"},
+                        },
+                    )
+                )
+                analysis = await pool.run(
+                    Task("analyze", {"parameters": {"platform": "instagram", "post_id": "p1"}})
+                )
+        finally:
+            configure_backend(None)
+        self.assertTrue(result.ok, result.error)
+        self.assertIn("content", result.output)
+        self.assertTrue(analysis.ok, analysis.error)
+
+    async def test_load_generator(self):
+        """Test a short run at the spec's sustained rate with a burst."""
+        pool = WorkerPool({"synthetic": synthetic_handler(2.0)}, concurrency=32)
+        report = await generate_load(pool, rate=200, burst=100, duration=0.5)
+        self.assertEqual(report["submitted"], 200)
+        self.assertEqual(report["completed"], 200)
+        self.assertEqual(set(report["queue_ms"]), {"p50", "p95", "p99", "max"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Test suite for process-pool execution of CPU-bound work.
+
+Reference: src/chimera/runtime/processes.py, src/chimera/runtime/pool.py
+Traceability: specs/technical.md §6.2
+"""
+
+import os
+import pickle
+import sys
+import unittest
+
+from chimera.runtime import (
+    ProcessRunner,
+    Task,
+    WorkerPool,
+    configure_process_runner,
+    cpu_bound,
+    default_handlers,
+    is_cpu_bound,
+    run_cpu_stage,
+)
+from skills.trend_fetcher.scoring import score_topics
+
+
+def worker_state(_payload=None):
+    return os.getpid(), "chimera.validation" in sys.modules
+
+
+@cpu_bound
+def pid_handler(payload):
+    return {"pid": os.getpid(), "n": payload["n"]}
+
+
+def resolve_and_sum(payload):
+    return sum(payload["ref"].resolve()["weights"])
+
+
+class TestMarkers(unittest.TestCase):
+    """Test CPU-bound declarations and inline execution."""
+
+    def test_cpu_bound(self):
+        """Test the decorator and the skills' declared stages."""
+        self.assertTrue(is_cpu_bound(pid_handler))
+        self.assertFalse(is_cpu_bound(worker_state))
+        self.assertTrue(is_cpu_bound(score_topics))
+
+    def test_default_handlers_are_routable(self):
+        """Test that skill handlers pickle and can be marked for the process pool."""
+        handlers = default_handlers(cpu_bound=["fetch_trends", "analyze"])
+        for task_type, handler in handlers.items():
+            self.assertEqual(pickle.loads(pickle.dumps(handler)), handler)
+            self.assertEqual(is_cpu_bound(handler), task_type in ("fetch_trends", "analyze"))
+        self.assertFalse(any(map(is_cpu_bound, default_handlers().values())))
+        with self.assertRaises(KeyError):
+            default_handlers(cpu_bound=["publish"])
+
+    def test_run_cpu_stage_inline(self):
+        """Test that stages run in-process when no runner is configured."""
+        self.assertEqual(run_cpu_stage(worker_state)[0], os.getpid())
+
+
+class TestProcessRunner(unittest.IsolatedAsyncioTestCase):
+    """Test warm workers, shared payloads and WorkerPool routing."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.runner = ProcessRunner(2)
+        cls.pids = cls.runner.warm()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.runner.close()
+
+    def test_workers_are_warm(self):
+        """Test that workers start up front with the skill modules loaded."""
+        self.assertEqual(len(self.pids), 2)
+        self.assertNotIn(os.getpid(), self.pids)
+        pid, preloaded = self.runner.submit(worker_state).result(30)
+        self.assertIn(pid, self.pids)
+        self.assertTrue(preloaded)
+
+    def test_shared_payload(self):
+        """Test that a shared object is published once and resolved in workers."""
+        weights = {"weights": list(range(1000))}
+        ref = self.runner.share(weights)
+        self.assertIs(self.runner.share(dict(weights)), ref)
+        result = self.runner.submit(resolve_and_sum, {"ref": ref}).result(30)
+        self.assertEqual(result, sum(range(1000)))
+        self.assertEqual(ref.resolve(), weights)
+
+    def test_run_cpu_stage_uses_runner(self):
+        """Test that synchronous skill stages are routed to the runner."""
+        configure_process_runner(self.runner)
+        try:
+            pid, _ = run_cpu_stage(worker_state)
+        finally:
+            configure_process_runner(None)
+        self.assertIn(pid, self.pids)
+
+    async def test_pool_routes_cpu_bound_handlers(self):
+        """Test that only @cpu_bound handlers leave the event loop process."""
+        handlers = {"cpu": pid_handler, "io": lambda payload: {"pid": os.getpid()}}
+        async with WorkerPool(handlers, processes=self.runner) as pool:
+            cpu = await pool.run(Task("cpu", {"n": 7}))
+            io = await pool.run(Task("io"))
+        self.assertEqual(cpu.output["n"], 7)
+        self.assertIn(cpu.output["pid"], self.pids)
+        self.assertEqual(io.output["pid"], os.getpid())
+
+    async def test_pool_routes_marked_skill_handlers(self):
+        """Test that a skill handler marked cpu_bound runs through the runner."""
+        submitted = []
+        original = self.runner.submit
+
+        def spy(fn, *args, **kwargs):
+            submitted.append(fn)
+            return original(fn, *args, **kwargs)
+
+        self.runner.submit = spy
+        try:
+            handlers = default_handlers(cpu_bound=["fetch_trends"])
+            async with WorkerPool(handlers, processes=self.runner) as pool:
+                payload = {"parameters": {"region": "kenya", "category": "fashion"}}
+                result = await pool.run(Task("fetch_trends", payload, timeout_seconds=30))
+        finally:
+            del self.runner.submit
+        self.assertTrue(result.ok, result.error)
+        self.assertEqual(result.output["metadata"]["source_count"], 0)
+        self.assertEqual(submitted, [handlers["fetch_trends"]])
+
+    async def test_pool_without_runner_runs_inline(self):
+        """Test that CPU-bound handlers fall back to the thread executor."""
+        async with WorkerPool({"cpu": pid_handler}) as pool:
+            result = await pool.run(Task("cpu", {"n": 1}))
+        self.assertEqual(result.output["pid"], os.getpid())
+
+
+if __name__ == "__main__":
+    unittest.main()
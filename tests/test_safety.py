@@ -0,0 +1,126 @@
+"""
+Test suite for the safety scanner.
+
+Reference: src/chimera/safety.py
+Traceability: specs/functional.md US-010, specs/technical.md §1.2 (safety_flags)
+"""
+
+import json
+import re
+import tempfile
+import unittest
+from pathlib import Path
+
+from chimera.safety import Rule, SafetyEngine, get_engine, normalize
+from skills.engagement_manager import FakeReplyGenerator, ReplyPipeline
+
+RULES = [
+    Rule("profanity", "shit", 0.3),
+    Rule("harassment", "kill yourself", 0.9),
+    Rule("financial_advice", r"\bguaranteed (?:returns?|profits?)\b", 0.2, regex=True),
+    Rule("politics", r"\bvot(?:e|ing) for\b", 0.1, regex=True, anchor="vot"),
+    Rule("spam", r"(\w)\1{5,}", 0.1, regex=True),
+]
+
+
+class ProfaneGenerator(FakeReplyGenerator):
+    def generate(self, persona_id, platform, comments):
+        return [{"text": "This is the sh1t!", "safety_score": 0.99} for _ in comments]
+
+
+class TestNormalize(unittest.TestCase):
+    def test_folds_leetspeak_and_confusables(self):
+        """Test that obfuscations fold to plain letters while offsets still line up."""
+        self.assertEqual(normalize("SH1T and $500")[0], "shit and $500")
+        self.assertEqual(normalize("@ss 2024")[0], "ass 2024")
+        folded, origins = normalize("ﬁne сrypto fück")
+        self.assertEqual(folded, "fine crypto fuck")
+        self.assertEqual(origins[:3], [0, 0, 1])
+
+
+class TestSafetyEngine(unittest.TestCase):
+    def setUp(self):
+        self.engine = SafetyEngine(RULES)
+
+    def test_terms_match_whole_words_with_offsets(self):
+        """Test that terms report offsets in the original text, and skip inner words."""
+        text = "Well, Sh1t. Shitake is fine."
+        result = self.engine.scan(text)
+        self.assertEqual(result.flags, ["profanity"])
+        self.assertEqual([(m.start, m.end, m.text) for m in result.matches], [(6, 10, "Sh1t")])
+        self.assertEqual(result.score, 0.7)
+        confusable = self.engine.scan("ok ѕhit")
+        self.assertEqual(confusable.matches[0].text, "ѕhit")
+
+    def test_hashtags_are_split(self):
+        """Test that terms match inside hashtags, with or without their spaces."""
+        result = self.engine.scan("#KillYourself #holyshit")
+        self.assertEqual(result.flags, ["harassment", "profanity"])
+        self.assertEqual([m.text for m in result.matches], ["KillYourself", "shit"])
+        self.assertEqual(self.engine.scan("killyourself").flags, [])
+
+    def test_regex_rules_and_score(self):
+        """Test anchored and unanchored regexes, and the score across flags."""
+        self.assertEqual(self.engine.unanchored_rules, 1)
+        result = self.engine.scan("Guaranteed returns if you're voting for us!")
+        self.assertEqual(result.flags, ["financial_advice", "politics"])
+        self.assertEqual(result.score, round(0.8 * 0.9, 4))
+        self.assertEqual(self.engine.scan("sooooooo good").flags, ["spam"])
+        self.assertEqual(self.engine.scan("guaranteed fun").score, 1.0)
+
+    def test_batch_matches_single_scans(self):
+        """Test that a batch scan gives the same results as scanning texts one by one."""
+        texts = ["clean", "sh1t", "", "#voting for shit", "shit", "Guaranteed profit"]
+        self.assertEqual(self.engine.scan_many(texts), [self.engine.scan(t) for t in texts])
+        self.assertEqual(self.engine.scan_many(["shi", "t"])[0].flags, [])
+
+    def test_many_rules(self):
+        """Test that every one of many terms is found, against a per-rule regex scan."""
+        terms = [f"term{n:05d}x" for n in range(2000)]
+        engine = SafetyEngine(Rule("blocked", term) for term in terms)
+        texts = [f"say {terms[n]} and term{n:05d}y now" for n in range(0, 2000, 97)]
+        for text, result in zip(texts, engine.scan_many(texts), strict=True):
+            expected = [t for t in terms if re.search(rf"\b{t}\b", text)]
+            self.assertEqual([m.text for m in result.matches], expected)
+
+    def test_load(self):
+        """Test that a JSON rules document builds the same engine."""
+        config = {
+            "rules": [
+                {"flag": "profanity", "severity": 0.3, "terms": ["shit"]},
+                {"flag": "financial_advice", "severity": 0.2, "regex": r"\bguaranteed returns\b"},
+            ]
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "rules.json"
+            path.write_text(json.dumps(config))
+            engine = SafetyEngine.load(path)
+        self.assertEqual(engine.scan("shit, guaranteed returns").score, round(0.7 * 0.8, 4))
+        with self.assertRaises(ValueError):
+            Rule("x", "y", severity=0)
+
+
+class TestSkillIntegration(unittest.TestCase):
+    def test_replies_carry_safety_flags(self):
+        """Test that generated replies are scanned and their score lowered."""
+        pipeline = ReplyPipeline(ProfaneGenerator())
+        (item,) = pipeline.process(
+            [
+                {
+                    "skill_name": "engagement_manager",
+                    "parameters": {
+                        "action": "reply",
+                        "platform": "instagram",
+                        "comment_text": "Nice fit",
+                        "persona_id": "chimera_fashion_001",
+                    },
+                }
+            ]
+        )
+        metadata = item.output["metadata"]
+        self.assertEqual(metadata["safety_flags"], ["profanity"])
+        self.assertEqual(metadata["safety_score"], get_engine().scan("sh1t").score)
+
+
+if __name__ == "__main__":
+    unittest.main()
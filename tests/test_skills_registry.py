@@ -0,0 +1,145 @@
+"""
+Test suite for the lazy skill registry.
+
+Reference: src/chimera/skills.py
+Traceability: skills/README.md (Skill Registry), skills/*/input_schema.json
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+from chimera import validation
+from chimera.runtime import default_handlers, skill_task_types
+from chimera.skills import SkillRegistry, configure_registry, get_registry
+from chimera.validation import SchemaValidationError
+
+PACKAGE = "registry_test_skills"
+ECHO_SCHEMA = {
+    "title": "echo Input Schema",
+    "description": "Echoes its message",
+    "x-entrypoint": "echo",
+    "type": "object",
+    "required": ["skill_name", "message"],
+    "properties": {"skill_name": {"const": "echo"}, "message": {"type": "string"}},
+}
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class TestSkillRegistry(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        sys.path.insert(0, self._tmp.name)
+        self.skills_dir = Path(self._tmp.name) / PACKAGE
+        (self.skills_dir / "echo").mkdir(parents=True)
+        (self.skills_dir / "__init__.py").touch()
+        (self.skills_dir / "echo" / "__init__.py").write_text(
+            "def echo(input_data, suffix=''):\n    return input_data['message'] + suffix\n"
+        )
+        self._write_schema("echo", ECHO_SCHEMA)
+        self.snapshot = Path(self._tmp.name) / "skills.snapshot"
+
+    def tearDown(self):
+        sys.path.remove(self._tmp.name)
+        for name in [m for m in sys.modules if m.startswith(PACKAGE)]:
+            del sys.modules[name]
+        configure_registry(SkillRegistry.discover())
+        configure_registry(None)
+        self._tmp.cleanup()
+
+    def _write_schema(self, skill, schema, kind="input"):
+        (self.skills_dir / skill / f"{kind}_schema.json").write_text(json.dumps(schema))
+
+    def test_imports_on_first_invoke(self):
+        """Test that discovery and input validation never import the skill."""
+        registry = SkillRegistry.discover(self.skills_dir, package=PACKAGE)
+        self.assertEqual(registry.names(), ["echo"])
+        self.assertEqual(registry.spec("echo").description, "Echoes its message")
+        with self.assertRaises(SchemaValidationError):
+            registry.invoke("echo", {"skill_name": "echo"})
+        self.assertNotIn(f"{PACKAGE}.echo", sys.modules)
+        self.assertFalse(registry.is_loaded("echo"))
+
+        message = {"skill_name": "echo", "message": "hi"}
+        self.assertEqual(registry.invoke("echo", message, suffix="!"), "hi!")
+        self.assertTrue(registry.is_loaded("echo"))
+        with self.assertRaises(KeyError):
+            registry.invoke("missing", message)
+
+        (self.skills_dir / "broken").mkdir()
+        self._write_schema("broken", {"type": "object"})
+        with self.assertRaises(ValueError):
+            SkillRegistry.discover(self.skills_dir, package=PACKAGE)
+
+    def test_snapshot_round_trip_and_staleness(self):
+        """Test that a snapshot is used while current, and rebuilt after schema changes."""
+        SkillRegistry.warm_start(self.snapshot, self.skills_dir, package=PACKAGE)
+        loaded = SkillRegistry.load(self.snapshot, self.skills_dir, package=PACKAGE)
+        self.assertIsNotNone(loaded)
+        self.assertEqual(loaded.schema("echo", "input"), ECHO_SCHEMA)
+        self.assertIn("message", loaded.validator("echo", "input")({"skill_name": "echo"}))
+        self.assertIsNone(SkillRegistry.load(self.snapshot, self.skills_dir, package="other"))
+
+        (self.skills_dir / "shout").mkdir()
+        self._write_schema("shout", {**ECHO_SCHEMA, "x-entrypoint": "shout"})
+        self.assertIsNone(SkillRegistry.load(self.snapshot, self.skills_dir, package=PACKAGE))
+        rebuilt = SkillRegistry.warm_start(self.snapshot, self.skills_dir, package=PACKAGE)
+        self.assertEqual(rebuilt.names(), ["echo", "shout"])
+        self.assertIsNotNone(SkillRegistry.load(self.snapshot, self.skills_dir, package=PACKAGE))
+
+        self.snapshot.write_bytes(b"\x00garbage")
+        self.assertIsNone(SkillRegistry.load(self.snapshot, self.skills_dir, package=PACKAGE))
+
+    def test_configure_installs_validators(self):
+        """Test that chimera.validation serves the configured registry's contracts."""
+        configure_registry(SkillRegistry.discover(self.skills_dir, package=PACKAGE))
+        self.assertIsNone(validation.check("echo", "input", {"skill_name": "echo", "message": ""}))
+        with self.assertRaises(KeyError):
+            validation.get_schema("trend_fetcher", "input")
+        configure_registry(None)
+        self.assertEqual(
+            get_registry().names(), ["content_generator", "engagement_manager", "trend_fetcher"]
+        )
+
+    def test_worker_handlers_dispatch_through_registry(self):
+        """Test that worker task types and dispatch come from the configured registry."""
+        configure_registry(SkillRegistry.discover(self.skills_dir, package=PACKAGE))
+        handlers = default_handlers()
+        self.assertEqual(skill_task_types(), {"echo": "echo"})
+        with self.assertRaises(SchemaValidationError):
+            handlers["echo"]({"skill_name": "echo"})
+        self.assertNotIn(f"{PACKAGE}.echo", sys.modules)
+        self.assertEqual(handlers["echo"]({"skill_name": "echo", "message": "hi"}), "hi")
+        self.assertTrue(get_registry().is_loaded("echo"))
+
+    def test_warm_worker_imports_nothing_extra(self):
+        """Test that a warm-started worker imports neither json nor any skill package."""
+        SkillRegistry.discover().save(self.snapshot)
+        script = textwrap.dedent(
+            f"""
+            import sys
+            from chimera.skills import SkillRegistry, configure_registry
+            from chimera.validation import check
+            configure_registry(SkillRegistry.warm_start({str(self.snapshot)!r}))
+            assert check("trend_fetcher", "input", {{"skill_name": "trend_fetcher"}})
+            print("\\n".join(sorted(sys.modules)))
+            """
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(ROOT / "src"), str(ROOT)])}
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True
+        )
+        modules = result.stdout.split()
+        self.assertIn("chimera.validation", modules)
+        self.assertNotIn("json", modules)
+        self.assertNotIn("numpy", modules)
+        self.assertFalse([m for m in modules if m == "skills" or m.startswith("skills.")])
+
+
+if __name__ == "__main__":
+    unittest.main()
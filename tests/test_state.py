@@ -0,0 +1,139 @@
+"""
+Test suite for the optimistic-concurrency state store.
+
+Reference: src/chimera/state.py
+Traceability: specs/technical.md §2.2 (agents, tasks)
+"""
+
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from chimera.state import (
+    InvalidTransitionError,
+    MemoryBackend,
+    SQLiteBackend,
+    StateStore,
+    TransitionRequest,
+    VersionConflictError,
+)
+
+AGENT_CYCLE = {"idle": "planning", "planning": "working", "working": "judging", "judging": "idle"}
+
+
+class StateStoreTests:
+    """Behaviour shared by every backend; subclasses provide make_backend."""
+
+    def make_backend(self):
+        raise NotImplementedError
+
+    def setUp(self):
+        self.store = StateStore(self.make_backend())
+
+    def test_create_and_get(self):
+        """Test initial status, version and fields."""
+        record = self.store.create("tasks", "t1", type="generate_content")
+        self.assertEqual((record.status, record.version), ("pending", 1))
+        self.assertEqual(self.store.get("tasks", "t1").fields, {"type": "generate_content"})
+        with self.assertRaises(KeyError):
+            self.store.create("tasks", "t1")
+        with self.assertRaises(KeyError):
+            self.store.get("tasks", "missing")
+        with self.assertRaises(ValueError):
+            self.store.create("agents", "a1", "sleeping")
+
+    def test_task_lifecycle(self):
+        """Test a task through its state machine with field updates."""
+        self.store.create("tasks", "t1")
+        for status in ("queued", "running", "review"):
+            record = self.store.transition("tasks", "t1", status)
+        record = self.store.transition("tasks", "t1", "rejected", fields={"retry_count": 1})
+        self.assertEqual(record.version, 5)
+        self.assertEqual(self.store.get("tasks", "t1"), record)
+        self.assertEqual(record.fields, {"retry_count": 1})
+        with self.assertRaises(InvalidTransitionError):
+            self.store.transition("tasks", "t1", "approved")
+
+    def test_stale_expectations(self):
+        """Test that pinned versions and expected statuses fail instead of retrying."""
+        self.store.create("agents", "a1")
+        self.store.transition("agents", "a1", "planning", version=1)
+        with self.assertRaises(VersionConflictError):
+            self.store.transition("agents", "a1", "paused", version=1)
+        with self.assertRaises(VersionConflictError) as ctx:
+            self.store.transition("agents", "a1", "paused", expect="idle")
+        self.assertEqual(ctx.exception.record.status, "planning")
+        self.store.transition("agents", "a1", "paused", expect={"planning", "working"})
+
+    def test_transition_many(self):
+        """Test a batch with successes and per-request errors in one commit."""
+        for i in range(5):
+            self.store.create("tasks", f"t{i}")
+        commits = self.store.stats.commits
+        results = self.store.transition_many(
+            [TransitionRequest("tasks", f"t{i}", "queued") for i in range(5)]
+            + [
+                TransitionRequest("tasks", "t0", "approved"),
+                TransitionRequest("tasks", "missing", "queued"),
+            ]
+        )
+        self.assertEqual([r.status for r in results[:5]], ["queued"] * 5)
+        self.assertIsInstance(results[5], InvalidTransitionError)
+        self.assertIsInstance(results[6], KeyError)
+        self.assertEqual(self.store.stats.commits, commits + 1)
+
+    def test_concurrent_workers_never_lose_updates(self):
+        """Test that contended transitions are all applied exactly once."""
+        self.store.create("agents", "hot")
+        per_thread, threads = 50, 8
+
+        def worker():
+            for _ in range(per_thread):
+                while True:
+                    record = self.store.get("agents", "hot")
+                    try:
+                        self.store.transition(
+                            "agents", "hot", AGENT_CYCLE[record.status], expect=record.status
+                        )
+                        break
+                    except VersionConflictError:
+                        continue
+
+        pool = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+        record = self.store.get("agents", "hot")
+        self.assertEqual(record.version, 1 + per_thread * threads)
+        self.assertEqual(self.store.stats.transitions, per_thread * threads)
+
+
+class TestMemoryBackend(StateStoreTests, unittest.TestCase):
+    def make_backend(self):
+        return MemoryBackend()
+
+
+class TestSQLiteBackend(StateStoreTests, unittest.TestCase):
+    def make_backend(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        backend = SQLiteBackend(Path(self.tmp.name) / "state.db")
+        self.addCleanup(backend.close)
+        return backend
+
+    def test_two_connections_share_rows(self):
+        """Test compare-and-swap across two connections to one file (two workers)."""
+        other = StateStore(SQLiteBackend(Path(self.tmp.name) / "state.db"))
+        self.store.create("tasks", "t1")
+        seen = self.store.get("tasks", "t1")
+        other.transition("tasks", "t1", "queued")
+        with self.assertRaises(VersionConflictError):
+            self.store.transition("tasks", "t1", "queued", version=seen.version)
+        self.assertEqual(self.store.transition("tasks", "t1", "running").version, 3)
+        other.backend.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
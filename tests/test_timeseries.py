@@ -0,0 +1,158 @@
+"""
+Test suite for the columnar time-series store.
+
+Reference: src/chimera/timeseries.py
+Traceability: specs/technical.md §2.2 (contents hypertable), specs/functional.md US-002
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+from chimera import timeseries
+from chimera.timeseries import DAY, TimeSeriesStore
+
+COLUMNS = {"agent_id": "str", "platform": "str", "persona_alignment": "f4", "likes": "u4"}
+START = 20_000 * DAY
+
+
+def _rows(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        "created_at": START + rng.random(n) * 5 * DAY,
+        "agent_id": [f"agent_{i}" for i in rng.integers(0, 7, n)],
+        "platform": [["twitter", "tiktok", "instagram"][i] for i in rng.integers(0, 3, n)],
+        "persona_alignment": rng.random(n).astype(np.float32),
+        "likes": rng.integers(0, 1000, n),
+    }
+
+
+class TestTimeSeriesStore(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "contents"
+        self.store = TimeSeriesStore(self.path, COLUMNS, initial_capacity=8)
+        self.rows = _rows(2000)
+        self.store.append(self.rows)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_scan_round_trip_and_reopen(self):
+        """Test that rows land in daily chunks and survive a reopen, codes included."""
+        self.assertEqual(self.store.chunk_count, 5)
+        self.store.append({**_rows(1, seed=9), "agent_id": ["new agent"]})
+        self.store.flush()
+        reopened = TimeSeriesStore(self.path, COLUMNS)
+        self.assertEqual(len(reopened), 2001)
+
+        end = START + 2 * DAY + 0.5 * DAY
+        scanned = reopened.scan(START + DAY / 3, end, where={"platform": ["tiktok", "x"]})
+        times = self.rows["created_at"]
+        expected = np.flatnonzero(
+            (times >= START + DAY / 3)
+            & (times < end)
+            & (np.array(self.rows["platform"]) == "tiktok")
+        )
+        order = np.argsort(scanned["created_at"])
+        np.testing.assert_array_equal(scanned["created_at"][order], np.sort(times[expected]))
+        by_time = np.argsort(times[expected])
+        np.testing.assert_array_equal(
+            scanned["agent_id"][order], np.array(self.rows["agent_id"])[expected][by_time]
+        )
+        self.assertEqual(reopened.scan(0, 1e12, where={"agent_id": "new agent"})["likes"].size, 1)
+
+    def test_aggregate_matches_reference(self):
+        """Test group-by with time buckets against numpy, on the dense and sparse paths."""
+        start, end = START + 0.75 * DAY, START + 3.25 * DAY
+        times = self.rows["created_at"]
+        platforms, agents = np.array(self.rows["platform"]), np.array(self.rows["agent_id"])
+        keep = (times >= start) & (times < end) & (agents != "agent_0")
+        expected = {}
+        for platform in np.unique(platforms[keep]):
+            for bucket in np.unique((times[keep] // DAY) * DAY):
+                rows = keep & (platforms == platform) & ((times // DAY) * DAY == bucket)
+                if rows.any():
+                    expected[(platform, bucket)] = (
+                        int(rows.sum()),
+                        float(self.rows["likes"][rows].sum()),
+                        float(self.rows["persona_alignment"][rows].astype(np.float64).mean()),
+                        float(self.rows["likes"][rows].max()),
+                    )
+        where = {"agent_id": [f"agent_{i}" for i in range(1, 7)]}
+        query = dict(
+            by=["platform"],
+            aggregates=[
+                ("count", "*"),
+                ("sum", "likes"),
+                ("mean", "persona_alignment"),
+                ("max", "likes"),
+            ],
+            bucket=DAY,
+            where=where,
+        )
+        dense = self.store.aggregate(start, end, **query)
+        with mock.patch.object(timeseries, "DENSE_GROUPS", 1):
+            sparse = self.store.aggregate(start, end, **query)
+        self.assertEqual(len(dense), len(expected))
+        for results in (dense, sparse):
+            got = {
+                (row["platform"], row["bucket"]): (
+                    row["count"],
+                    row["sum_likes"],
+                    row["mean_persona_alignment"],
+                    row["max_likes"],
+                )
+                for row in results
+            }
+            self.assertEqual(got.keys(), expected.keys())
+            for key, values in expected.items():
+                np.testing.assert_allclose(got[key], values, rtol=1e-9)
+        self.assertEqual([row["platform"] for row in dense], sorted(r["platform"] for r in dense))
+
+        quarter = DAY / 4
+        in_range = times[(times >= start) & (times < end)]
+        buckets, counts = np.unique((in_range // quarter) * quarter, return_counts=True)
+        quarters = self.store.aggregate(start, end, bucket=quarter)
+        self.assertEqual(
+            [(row["bucket"], row["count"]) for row in quarters],
+            list(zip(buckets.tolist(), counts.tolist(), strict=True)),
+        )
+
+    def test_torn_write_ignored_on_reopen(self):
+        """Test that a row whose time was never written is not counted."""
+        chunk = sorted((self.path / "chunks").iterdir())[-1]
+        count = self.store._chunks[int(chunk.name)].count
+        self.store.flush()
+        times = np.memmap(chunk / "created_at.bin", np.float64, "r+")
+        times[count - 1] = 0
+        times.flush()
+        del times
+        self.assertEqual(len(TimeSeriesStore(self.path, COLUMNS)), 1999)
+
+    def test_drop_chunks(self):
+        """Test that retention drops whole chunks that end before the cutoff."""
+        self.assertEqual(self.store.drop_chunks(START + 2.5 * DAY), 2)
+        self.assertEqual(self.store.chunk_count, 3)
+        self.assertEqual(len(self.store), int((self.rows["created_at"] >= START + 2 * DAY).sum()))
+        self.assertEqual(len(TimeSeriesStore(self.path, COLUMNS)), len(self.store))
+
+    def test_errors(self):
+        """Test schema mismatches, missing columns and invalid aggregates."""
+        with self.assertRaises(ValueError):
+            TimeSeriesStore(self.path, {**COLUMNS, "shares": "u4"})
+        with self.assertRaises(ValueError):
+            self.store.append({"created_at": [START]})
+        with self.assertRaises(ValueError):
+            self.store.aggregate(START, START + DAY, aggregates=[("mean", "platform")])
+        with self.assertRaises(ValueError):
+            self.store.aggregate(START, START + DAY, by=["likes"])
+        with self.assertRaises(ValueError):
+            TimeSeriesStore(Path(self._tmp.name) / "other", {"label": "U8"})
+
+
+if __name__ == "__main__":
+    unittest.main()
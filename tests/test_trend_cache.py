@@ -0,0 +1,213 @@
+"""
+Test suite for the trend_fetcher result cache.
+
+Reference: skills/trend_fetcher/cache.py
+Traceability: specs/functional.md US-003 ("Results cached for 15 minutes"), specs/technical.md §1.1
+"""
+
+import threading
+import time
+import unittest
+
+from skills.trend_fetcher import fetch_trends
+from skills.trend_fetcher.cache import TrendCache, trend_key
+from tests.helpers import FakeClock
+
+
+def snapshot(label="v1"):
+    return {
+        "trends": [
+            {"topic": f"{label}-high", "engagement_score": 0.9, "relevance_score": 0.95},
+            {"topic": f"{label}-low", "engagement_score": 0.4, "relevance_score": 0.5},
+        ],
+        "fetched_at": "2026-02-05T10:30:00Z",
+        "source_count": 2,
+        "confidence": 0.9,
+    }
+
+
+def trend_input(**parameters):
+    base = {"region": "ethiopia", "category": "fashion"}
+    base.update(parameters)
+    return {"skill_name": "trend_fetcher", "parameters": base}
+
+
+class TestTrendKey(unittest.TestCase):
+    """Test parameter normalisation for cache keys."""
+
+    def test_key_normalisation(self):
+        """Test case/whitespace folding and the timeframe default."""
+        self.assertEqual(
+            trend_key({"region": " Ethiopia ", "category": "FASHION"}),
+            ("ethiopia", "fashion", 24),
+        )
+
+    def test_threshold_not_in_key(self):
+        """Test that relevance_threshold does not split cache entries."""
+        self.assertEqual(
+            trend_key({"region": "a", "category": "b", "relevance_threshold": 0.1}),
+            trend_key({"region": "a", "category": "b", "relevance_threshold": 0.9}),
+        )
+
+
+class TestTrendCache(unittest.TestCase):
+    """Test TTL, LRU, stale-while-revalidate and single-flight behaviour."""
+
+    def setUp(self):
+        self.clock = FakeClock(0.0)
+        self.calls = []
+
+    def loader(self, key):
+        self.calls.append(key)
+        return snapshot(f"v{len(self.calls)}")
+
+    def test_hit_then_expiry(self):
+        """Test that entries are fresh for ttl seconds and reloaded afterwards."""
+        cache = TrendCache(self.loader, ttl=900, stale_ttl=0, clock=self.clock)
+        key = ("ethiopia", "fashion", 24)
+        self.assertEqual(cache.get(key)[1], "miss")
+        self.clock.now = 899
+        self.assertEqual(cache.get(key)[1], "hit")
+        self.clock.now = 900
+        value, status = cache.get(key)
+        self.assertEqual(status, "miss")
+        self.assertEqual(value["trends"][0]["topic"], "v2-high")
+
+    def test_lru_eviction(self):
+        """Test that the least recently used key is evicted at maxsize."""
+        cache = TrendCache(self.loader, maxsize=2, clock=self.clock)
+        a, b, c = ("a", "x", 24), ("b", "x", 24), ("c", "x", 24)
+        cache.get(a)
+        cache.get(b)
+        cache.get(a)
+        cache.get(c)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats.evictions, 1)
+        self.assertEqual(cache.get(a)[1], "hit")
+        self.assertEqual(cache.get(b)[1], "miss")
+
+    def test_stale_while_revalidate(self):
+        """Test that stale entries are served immediately while one refresh runs."""
+        release = threading.Event()
+
+        def slow_loader(key):
+            if self.calls:
+                release.wait(5)
+            return self.loader(key)
+
+        cache = TrendCache(slow_loader, ttl=10, stale_ttl=10, clock=self.clock)
+        key = ("ethiopia", "fashion", 24)
+        cache.get(key)
+        self.clock.now = 15
+        first, status = cache.get(key)
+        self.assertEqual(status, "stale")
+        self.assertEqual(first["trends"][0]["topic"], "v1-high")
+        self.assertEqual(cache.get(key)[1], "stale")
+        self.assertEqual(cache.stats.refreshes, 1)
+
+        release.set()
+        cache.close()
+        value, status = cache.get(key)
+        self.assertEqual(status, "hit")
+        self.assertEqual(value["trends"][0]["topic"], "v2-high")
+
+    def test_single_flight(self):
+        """Test that concurrent misses for one key trigger exactly one upstream fetch."""
+
+        def slow_loader(key):
+            time.sleep(0.05)
+            return self.loader(key)
+
+        cache = TrendCache(slow_loader)
+        key = ("ethiopia", "fashion", 24)
+        statuses = []
+        barrier = threading.Barrier(50)
+
+        def worker():
+            barrier.wait()
+            statuses.append(cache.get(key)[1])
+
+        threads = [threading.Thread(target=worker) for _ in range(50)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(statuses.count("miss"), 1)
+        self.assertEqual(statuses.count("miss") + statuses.count("coalesced"), 50)
+
+    def test_failed_load_not_cached(self):
+        """Test that loader errors propagate and are retried on the next call."""
+        attempts = []
+
+        def flaky(key):
+            attempts.append(key)
+            if len(attempts) == 1:
+                raise ConnectionError("upstream down")
+            return snapshot()
+
+        cache = TrendCache(flaky)
+        key = ("ethiopia", "fashion", 24)
+        with self.assertRaises(ConnectionError):
+            cache.get(key)
+        self.assertEqual(cache.get(key)[1], "miss")
+
+    def test_partial_snapshot_cached_briefly(self):
+        """Test that a snapshot with missing sources expires after partial_ttl."""
+        partial = {**snapshot(), "source_count": 1, "missing_sources": {"news": "timeout"}}
+        cache = TrendCache(
+            lambda key: partial, ttl=900, partial_ttl=60, stale_ttl=0, clock=self.clock
+        )
+        key = ("ethiopia", "fashion", 24)
+        cache.get(key)
+        self.clock.advance(59)
+        self.assertEqual(cache.get(key)[1], "hit")
+        self.clock.advance(2)
+        self.assertEqual(cache.get(key)[1], "miss")
+
+    def test_zero_coverage_snapshot_not_cached(self):
+        """Test that a fan-out where every source failed is not stored over a good entry."""
+        failed = {
+            **snapshot(),
+            "trends": [],
+            "source_count": 0,
+            "confidence": 0.0,
+            "missing_sources": {"twitter": "ConnectionError"},
+        }
+        results = [snapshot("good"), failed, failed]
+        cache = TrendCache(lambda key: results.pop(0), ttl=10, stale_ttl=0, clock=self.clock)
+        key = ("ethiopia", "fashion", 24)
+        cache.get(key)
+        self.clock.advance(11)
+        self.assertEqual(cache.get(key), (failed, "miss"))
+        self.assertEqual(cache.get(key), (failed, "miss"))
+        self.assertEqual(cache.stats.uncached, 2)
+
+
+class TestFetchTrendsCaching(unittest.TestCase):
+    """Test fetch_trends reading through the cache."""
+
+    def test_threshold_applied_after_cache(self):
+        """Test that different thresholds share one entry and filter independently."""
+        calls = []
+
+        def loader(key):
+            calls.append(key)
+            return snapshot()
+
+        cache = TrendCache(loader)
+        strict = fetch_trends(trend_input(relevance_threshold=0.9), cache=cache)
+        loose = fetch_trends(trend_input(relevance_threshold=0.1), cache=cache)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([t["topic"] for t in strict["trends"]], ["v1-high"])
+        self.assertEqual(len(loose["trends"]), 2)
+        self.assertEqual(loose["metadata"]["cache"]["status"], "hit")
+        self.assertEqual(loose["metadata"]["cache"]["hits"], 1)
+        self.assertEqual(loose["metadata"]["cache"]["misses"], 1)
+        self.assertEqual(loose["metadata"]["cache_ttl"], 900)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,11 +9,12 @@ Tests are expected to FAIL until implementation is complete.
 """
 
 import unittest
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any
 
+from chimera.validation import get_schema, validate_input
+
 # Attempt to import trend_fetcher skill (will fail until implemented)
 # Reference: skills/trend_fetcher/README.md
 try:
@@ -38,11 +39,7 @@ class TestTrendFetcherInputValidation(unittest.TestCase):
 
     def setUp(self):
         """Load input schema for reference."""
-        if INPUT_SCHEMA_PATH.exists():
-            with open(INPUT_SCHEMA_PATH, 'r') as f:
-                self.input_schema = json.load(f)
-        else:
-            self.input_schema = None
+        self.input_schema = get_schema("trend_fetcher", "input")
 
     def test_valid_input_structure(self):
         """
@@ -68,6 +65,7 @@ class TestTrendFetcherInputValidation(unittest.TestCase):
         )
         
         # Validate input structure matches schema
+        validate_input("trend_fetcher", valid_input)
         if self.input_schema:
             self.assertEqual(valid_input["skill_name"], "trend_fetcher")
             self.assertIn("region", valid_input["parameters"])
@@ -82,13 +80,9 @@ class TestTrendFetcherInputValidation(unittest.TestCase):
         
     def test_schema_is_valid_json(self):
         """Test that the schema is valid JSON."""
-        if INPUT_SCHEMA_PATH.exists():
-            with open(INPUT_SCHEMA_PATH, 'r') as f:
-                schema = json.load(f)
-            self.assertIn("$schema", schema)
-            self.assertIn("properties", schema)
-        else:
-            self.fail("Schema file does not exist")
+        schema = get_schema("trend_fetcher", "input")
+        self.assertIn("$schema", schema)
+        self.assertIn("properties", schema)
 
 
 class TestTrendFetcherOutputValidation(unittest.TestCase):
@@ -101,11 +95,7 @@ class TestTrendFetcherOutputValidation(unittest.TestCase):
 
     def setUp(self):
         """Load output schema for reference."""
-        if OUTPUT_SCHEMA_PATH.exists():
-            with open(OUTPUT_SCHEMA_PATH, 'r') as f:
-                self.output_schema = json.load(f)
-        else:
-            self.output_schema = None
+        self.output_schema = get_schema("trend_fetcher", "output")
 
     def test_output_schema_exists(self):
         """Test that the output schema file exists."""
@@ -142,27 +132,20 @@ class TestTrendFetcherExecution(unittest.TestCase):
     Test actual execution of trend_fetcher skill.
     
     Reference: skills/trend_fetcher/README.md
-    These tests will FAIL until implementation is complete.
     """
 
-    @unittest.expectedFailure
     def test_fetch_trends_returns_trends(self):
         """
         Test that fetch_trends returns valid trend data.
-        
-        Expected failure until implementation.
         """
         self.assertIsNotNone(
             fetch_trends,
             "fetch_trends must be implemented - TDD: this test defines the goal"
         )
         
-    @unittest.expectedFailure
     def test_fetch_trends_with_valid_input(self):
         """
         Test fetch_trends with valid input parameters.
-        
-        Expected failure until implementation.
         """
         if fetch_trends is None:
             self.fail("fetch_trends not yet implemented - this is the TDD goal")
@@ -0,0 +1,107 @@
+"""
+Test suite for vectorised trend merging and scoring.
+
+Reference: skills/trend_fetcher/scoring.py, skills/trend_fetcher/output_schema.json
+Traceability: specs/functional.md US-003 (relevance score 0.0-1.0)
+"""
+
+import unittest
+
+from chimera.validation import validate_output
+from skills.trend_fetcher.scoring import TopicBatch, normalise_topic, score_topics
+from skills.trend_fetcher.sources import RawTopic
+
+NOW = 1_770_000_000.0
+HOUR = 3600.0
+
+
+def raw(topic, volume, source="twitter://trending/ethiopia", age_hours=0.0):
+    return RawTopic(topic, volume, source, NOW - age_hours * HOUR)
+
+
+class TestNormalisation(unittest.TestCase):
+    """Test duplicate detection keys."""
+
+    def test_hashtag_and_case_variants_collapse(self):
+        """Test that hashtag, camelCase and spacing variants normalise together."""
+        variants = ["#SustainableFashion", "sustainable fashion", "Sustainable  Fashion!"]
+        self.assertEqual({normalise_topic(v) for v in variants}, {"sustainable fashion"})
+
+    def test_acronyms_split(self):
+        """Test camelCase splitting around acronyms."""
+        self.assertEqual(normalise_topic("#AIArt"), "ai art")
+
+
+class TestScoreTopics(unittest.TestCase):
+    """Test merging, scoring and top-k selection."""
+
+    def score(self, observations, **kwargs):
+        return score_topics(TopicBatch.from_raw(observations), 24, now=NOW, **kwargs)
+
+    def test_duplicates_merged_across_sources(self):
+        """Test that near-duplicates merge and keep every contributing source."""
+        trends = self.score(
+            [
+                raw("#SustainableFashion", 900),
+                raw("sustainable fashion", 100, source="news://fashion/latest"),
+                raw("Habesha Kemis", 50),
+            ]
+        )
+        self.assertEqual(len(trends), 2)
+        top = trends[0]
+        self.assertEqual(top["topic"], "SustainableFashion")
+        self.assertEqual(top["sources"], ["news://fashion/latest", "twitter://trending/ethiopia"])
+        self.assertEqual(top["engagement_score"], 1.0)
+
+    def test_sorted_and_schema_valid(self):
+        """Test descending relevance order and output schema compliance."""
+        trends = self.score([raw(f"topic {i}", 10 * (i + 1)) for i in range(50)])
+        scores = [t["relevance_score"] for t in trends]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        validate_output(
+            "trend_fetcher",
+            {
+                "trends": trends,
+                "metadata": {
+                    "fetched_at": "2026-02-05T10:30:00Z",
+                    "source_count": 1,
+                    "confidence": 1.0,
+                },
+            },
+        )
+
+    def test_top_k_matches_full_sort(self):
+        """Test that argpartition top-k equals the head of the full ranking."""
+        observations = [raw(f"topic {i}", (i * 7919) % 1000 + 1) for i in range(500)]
+        full = self.score(observations)
+        top = self.score(observations, limit=10)
+        self.assertEqual(
+            [t["relevance_score"] for t in top], [t["relevance_score"] for t in full[:10]]
+        )
+
+    def test_growth_rate(self):
+        """Test growth from the older to the recent half of the window."""
+        trends = self.score(
+            [
+                raw("rising", 90, age_hours=1),
+                raw("rising", 10, age_hours=20),
+                raw("falling", 10, age_hours=1),
+                raw("falling", 90, age_hours=20),
+            ]
+        )
+        growth = {t["topic"]: t["growth_rate"] for t in trends}
+        self.assertEqual(growth, {"rising": "+80%", "falling": "-80%"})
+        self.assertEqual(trends[0]["topic"], "rising")
+
+    def test_outside_timeframe_ignored(self):
+        """Test that observations older than timeframe_hours are dropped."""
+        self.assertEqual(self.score([raw("old news", 1000, age_hours=30)]), [])
+
+    def test_empty_and_zero_limit(self):
+        """Test degenerate inputs."""
+        self.assertEqual(self.score([]), [])
+        self.assertEqual(self.score([raw("a", 1)], limit=0), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Test suite for concurrent trend source fan-out.
+
+Reference: skills/trend_fetcher/sources.py, skills/trend_fetcher/README.md (Error Handling)
+Traceability: specs/technical.md §4.1 (Resources), §6.1 (Trend fetch latency targets)
+"""
+
+import asyncio
+import time
+import unittest
+
+from chimera.validation import validate_output
+from skills.trend_fetcher import configure_sources, fetch_trends, get_cache
+from skills.trend_fetcher.sources import StaticSource, fan_out
+
+
+def twitter(**kwargs):
+    topics = kwargs.pop("topics", [("#SustainableFashion", 900), ("Habesha Kemis", 300)])
+    return StaticSource("twitter", "twitter://trending/{region}", topics, **kwargs)
+
+
+def news(**kwargs):
+    topics = kwargs.pop("topics", [("sustainable fashion", 600)])
+    return StaticSource("news", "news://{category}/latest", topics, **kwargs)
+
+
+class TestFanOut(unittest.TestCase):
+    """Test concurrency, per-source timeouts and the overall deadline."""
+
+    def test_latency_is_max_not_sum(self):
+        """Test that sources are queried concurrently."""
+        sources = [twitter(latency=0.2), news(latency=0.2), news(latency=0.2)]
+        start = time.perf_counter()
+        result = asyncio.run(fan_out(sources, "ethiopia", "fashion", 24))
+        elapsed = time.perf_counter() - start
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(len(result.answered), 3)
+
+    def test_per_source_timeout(self):
+        """Test that a slow source is dropped at its timeout while others answer."""
+        sources = [twitter(), news(latency=1.0)]
+        result = asyncio.run(fan_out(sources, "ethiopia", "fashion", 24, source_timeout=0.05))
+        self.assertEqual(result.answered, ["twitter"])
+        self.assertEqual(result.missing, {"news": "timeout"})
+        self.assertAlmostEqual(result.coverage, 0.5)
+
+    def test_overall_deadline(self):
+        """Test that the deadline cancels sources with a longer own timeout."""
+        sources = [twitter(), news(latency=1.0, timeout=5.0)]
+        start = time.perf_counter()
+        result = asyncio.run(fan_out(sources, "ethiopia", "fashion", 24, deadline=0.1))
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(result.missing, {"news": "deadline"})
+
+    def test_failing_source_is_isolated(self):
+        """Test that a source error does not fail the fan-out."""
+        sources = [twitter(), news(error=ConnectionError("down"))]
+        result = asyncio.run(fan_out(sources, "ethiopia", "fashion", 24))
+        self.assertEqual(result.missing, {"news": "ConnectionError"})
+        self.assertEqual(len(result.topics), 2)
+
+    def test_weighted_coverage(self):
+        """Test that source weights drive coverage."""
+        sources = [twitter(weight=3.0), news(weight=1.0, error=RuntimeError())]
+        result = asyncio.run(fan_out(sources, "ethiopia", "fashion", 24))
+        self.assertAlmostEqual(result.coverage, 0.75)
+
+
+class TestFetchTrendsWithSources(unittest.TestCase):
+    """Test fetch_trends end to end against stand-in sources."""
+
+    def tearDown(self):
+        configure_sources([])
+
+    def fetch(self, **parameters):
+        base = {"region": "ethiopia", "category": "fashion", "relevance_threshold": 0.0}
+        base.update(parameters)
+        return fetch_trends({"skill_name": "trend_fetcher", "parameters": base})
+
+    def test_merged_output_matches_schema(self):
+        """Test that merged trends validate and are sorted by relevance."""
+        configure_sources([twitter(), news()])
+        result = self.fetch()
+        validate_output("trend_fetcher", result)
+        self.assertEqual(result["metadata"]["source_count"], 2)
+        self.assertEqual(result["metadata"]["confidence"], 1.0)
+        top = result["trends"][0]
+        self.assertEqual(top["topic"], "SustainableFashion")
+        self.assertEqual(len(top["sources"]), 2)
+        scores = [trend["relevance_score"] for trend in result["trends"]]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_partial_result_lowers_confidence(self):
+        """Test that a missing source reduces confidence and is reported."""
+        configure_sources([twitter(), news(latency=1.0)], source_timeout=0.05)
+        result = self.fetch()
+        self.assertEqual(result["metadata"]["source_count"], 1)
+        self.assertEqual(result["metadata"]["confidence"], 0.5)
+        self.assertEqual(result["metadata"]["missing_sources"], {"news": "timeout"})
+
+    def test_failed_fan_out_not_cached(self):
+        """Test that a fan-out where every source failed is retried, not served as a hit."""
+        configure_sources([twitter(error=ConnectionError()), news(error=ConnectionError())])
+        failed = self.fetch()
+        self.assertEqual(failed["metadata"]["confidence"], 0.0)
+        self.assertEqual(self.fetch()["metadata"]["cache"]["status"], "miss")
+
+    def test_no_sources_returns_empty_low_confidence(self):
+        """Test the README contract for no trends found."""
+        configure_sources([])
+        result = self.fetch()
+        self.assertEqual(result["trends"], [])
+        self.assertEqual(result["metadata"]["confidence"], 0.0)
+
+    def test_configure_sources_invalidates_cache(self):
+        """Test that reconfiguring sources drops cached snapshots."""
+        configure_sources([twitter()])
+        self.fetch()
+        configure_sources([news()])
+        self.assertEqual(len(get_cache()), 0)
+
+    def test_called_from_event_loop(self):
+        """Test that fetch_trends works when invoked inside a running loop."""
+        configure_sources([twitter()])
+
+        async def call():
+            return self.fetch(region="kenya")
+
+        result = asyncio.run(call())
+        self.assertEqual(result["metadata"]["source_count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+"""
+Test suite for compiled skill contract validation.
+
+Reference: src/chimera/validation.py, skills/*/input_schema.json, skills/*/output_schema.json
+Traceability: skills/README.md (Contract Validation), specs/technical.md §6.2
+"""
+
+import unittest
+
+from chimera.validation import (
+    SchemaValidationError,
+    check,
+    compile_schema,
+    get_schema,
+    validate_batch,
+    validate_input,
+    validate_output,
+)
+
+
+def trend_input(**parameters):
+    base = {"region": "ethiopia", "category": "fashion"}
+    base.update(parameters)
+    return {"skill_name": "trend_fetcher", "parameters": base}
+
+
+class TestInputValidation(unittest.TestCase):
+    """
+    Test input contracts compiled from skills/*/input_schema.json.
+
+    Reference: skills/trend_fetcher/input_schema.json
+    """
+
+    def test_valid_inputs_pass(self):
+        """Test that the README example inputs validate for every skill."""
+        validate_input("trend_fetcher", trend_input(timeframe_hours=24, relevance_threshold=0.75))
+        validate_input(
+            "content_generator",
+            {
+                "skill_name": "content_generator",
+                "parameters": {
+                    "content_type": "multimodal",
+                    "platform": "instagram",
+                    "topic": "Sustainable Fashion Trends",
+                    "persona_constraints": ["Witty"],
+                    "tier": "hero",
+                    "budget_limit_usdc": 25.0,
+                },
+            },
+        )
+        validate_input(
+            "engagement_manager",
+            {
+                "skill_name": "engagement_manager",
+                "parameters": {"action": "reply", "platform": "instagram"},
+            },
+        )
+
+    def test_missing_required_parameter(self):
+        """Test that parameters.category is required."""
+        payload = {"skill_name": "trend_fetcher", "parameters": {"region": "ethiopia"}}
+        with self.assertRaises(SchemaValidationError) as ctx:
+            validate_input("trend_fetcher", payload)
+        self.assertIn("category", ctx.exception.detail)
+
+    def test_skill_name_const(self):
+        """Test that skill_name must match the skill."""
+        payload = trend_input()
+        payload["skill_name"] = "content_generator"
+        self.assertIsNotNone(check("trend_fetcher", "input", payload))
+
+    def test_timeframe_bounds(self):
+        """Test timeframe_hours bounds 1-168 and integer type."""
+        self.assertIsNone(check("trend_fetcher", "input", trend_input(timeframe_hours=168)))
+        self.assertIsNotNone(check("trend_fetcher", "input", trend_input(timeframe_hours=0)))
+        self.assertIsNotNone(check("trend_fetcher", "input", trend_input(timeframe_hours=169)))
+        self.assertIsNotNone(check("trend_fetcher", "input", trend_input(timeframe_hours=24.5)))
+        self.assertIsNotNone(check("trend_fetcher", "input", trend_input(timeframe_hours=True)))
+
+    def test_relevance_threshold_bounds(self):
+        """Test relevance_threshold bounds 0.0-1.0."""
+        self.assertIsNone(check("trend_fetcher", "input", trend_input(relevance_threshold=0)))
+        self.assertIsNotNone(check("trend_fetcher", "input", trend_input(relevance_threshold=1.5)))
+
+    def test_enum_membership(self):
+        """Test that content_generator platform is restricted to its enum."""
+        payload = {
+            "skill_name": "content_generator",
+            "parameters": {"content_type": "text", "platform": "myspace", "topic": "x"},
+        }
+        error = check("content_generator", "input", payload)
+        self.assertIn("$.parameters.platform", error)
+
+    def test_unknown_skill(self):
+        """Test that unknown skills raise KeyError."""
+        with self.assertRaises(KeyError):
+            validate_input("no_such_skill", {})
+
+
+class TestOutputValidation(unittest.TestCase):
+    """
+    Test output contracts compiled from skills/*/output_schema.json.
+
+    Reference: skills/trend_fetcher/output_schema.json
+    """
+
+    def setUp(self):
+        self.output = {
+            "trends": [
+                {
+                    "topic": "Sustainable Fashion",
+                    "engagement_score": 0.87,
+                    "growth_rate": "+15%",
+                    "sources": ["news://fashion/latest"],
+                    "relevance_score": 0.92,
+                }
+            ],
+            "metadata": {
+                "fetched_at": "2026-02-05T10:30:00Z",
+                "source_count": 3,
+                "confidence": 0.89,
+            },
+        }
+
+    def test_valid_output_passes(self):
+        """Test that the README example output validates."""
+        validate_output("trend_fetcher", self.output)
+
+    def test_nested_item_error_path(self):
+        """Test that errors inside array items report the item index."""
+        self.output["trends"][0]["sources"] = ["ok", 3]
+        with self.assertRaises(SchemaValidationError) as ctx:
+            validate_output("trend_fetcher", self.output)
+        self.assertIn("$.trends[0].sources[1]", ctx.exception.detail)
+
+
+class TestBatchAndCompilation(unittest.TestCase):
+    """Test batch validation and the schema compiler."""
+
+    def test_batch_reports_per_payload(self):
+        """Test that one invalid payload does not stop the batch."""
+        results = validate_batch(
+            "trend_fetcher", [trend_input(), {"skill_name": "trend_fetcher"}, trend_input()]
+        )
+        self.assertIsNone(results[0])
+        self.assertIn("parameters", results[1])
+        self.assertIsNone(results[2])
+
+    def test_schemas_loaded_once(self):
+        """Test that schemas are served from the load-once cache."""
+        self.assertIs(
+            get_schema("trend_fetcher", "input"), get_schema("trend_fetcher", "input")
+        )
+
+    def test_additional_properties_false(self):
+        """Test the closed-object keyword."""
+        validate = compile_schema(
+            {
+                "type": "object",
+                "properties": {"a": {"type": "string"}},
+                "additionalProperties": False,
+            }
+        )
+        self.assertIsNone(validate({"a": "x"}))
+        self.assertIn("unexpected", validate({"a": "x", "b": 1}))
+
+    def test_enum_without_type_handles_unhashable(self):
+        """Test that enum checks tolerate unhashable values."""
+        validate = compile_schema({"enum": ["a", "b"]})
+        self.assertIsNone(validate("a"))
+        self.assertIsNotNone(validate(["a"]))
+
+
+if __name__ == "__main__":
+    unittest.main()